@@ -4659,7 +4659,7 @@ class AddCards(AddMethods):
         self._add_dtable_object(dtable)
         return dtable
 
-    def add_tabled1(self, tid, x, y, xaxis='LINEAR', yaxis='LINEAR', comment=''):
+    def add_tabled1(self, tid, x, y, xaxis='LINEAR', yaxis='LINEAR', extrap=0, comment=''):
         """
         Creates a TABLED1, which is a dynamic load card that is applied
         by the DAREA card
@@ -4676,10 +4676,14 @@ class AddCards(AddMethods):
             LINEAR, LOG
         yaxis : str
             LINEAR, LOG
+        extrap : int; default=0
+            0 : linearly extrapolate the end segments
+            1 : use the end values outside the table
         comment : str; default=''
             a comment for the card
         """
-        table = TABLED1(tid, x, y, xaxis=xaxis, yaxis=yaxis, comment=comment)
+        table = TABLED1(tid, x, y, xaxis=xaxis, yaxis=yaxis, extrap=extrap,
+                        comment=comment)
         self._add_tabled_object(table)
         return table
 
@@ -73,6 +73,7 @@ class AddMethods(BDFAttributes):
     def _add_node_object(self, node, allow_overwrites=False):
         # type: (Any, bool) -> None
         """adds a GRID card"""
+        self._spline_matrix_cache.clear()
         key = node.nid
         if key in self.nodes and not allow_overwrites:
             if not node == self.nodes[key]:
@@ -472,6 +473,7 @@ class AddMethods(BDFAttributes):
     def _add_coord_object(self, coord, allow_overwrites=False):
         # type: (Any, bool) -> None
         """adds a CORDx object"""
+        self._spline_matrix_cache.clear()
         key = coord.cid
         assert coord.cid > -1, 'cid=%s coord=\n%s' % (key, coord)
         if key in self.coords:
@@ -485,6 +487,7 @@ class AddMethods(BDFAttributes):
     def _add_load_combination_object(self, load):
         # type: (Any) -> None
         """adds a load object to a load case"""
+        self._reduced_loads_cache.clear()
         key = load.sid
         if key in self.load_combinations:
             self.load_combinations[key].append(load)
@@ -495,6 +498,7 @@ class AddMethods(BDFAttributes):
     def _add_load_object(self, load):
         # type: (Any) -> None
         """adds a load object to a load case"""
+        self._reduced_loads_cache.clear()
         key = load.sid
         if key in self.loads:
             self.loads[key].append(load)
@@ -505,6 +509,7 @@ class AddMethods(BDFAttributes):
     def _add_dload_object(self, load):
         # type: (Any) -> None
         """adds a dload object to a load case"""
+        self._reduced_loads_cache.clear()
         key = load.sid
         if key in self.dloads:
             self.dloads[key].append(load)
@@ -515,6 +520,7 @@ class AddMethods(BDFAttributes):
     def _add_dload_entry(self, dload):
         # type: (Any) -> None
         """adds a sub-dload object to a load case"""
+        self._reduced_loads_cache.clear()
         key = dload.sid
         if key in self.dload_entries:
             self.dload_entries[key].append(dload)
@@ -525,6 +531,7 @@ class AddMethods(BDFAttributes):
     def _add_lseq_object(self, load):
         # type: (Any) -> None
         """adds a LSEQ object to a load case"""
+        self._reduced_loads_cache.clear()
         key = load.sid
         if key in self.load_combinations:
             self.load_combinations[key].append(load)
@@ -534,6 +541,7 @@ class AddMethods(BDFAttributes):
 
     def _add_thermal_load_object(self, load):  # same function at the moment...
         # type: (Any) -> None
+        self._reduced_loads_cache.clear()
         key = load.sid
         assert key > 0, 'key=%s; load=%s\n' % (key, load)
         if key in self.loads:
@@ -723,6 +731,7 @@ class AddMethods(BDFAttributes):
     def _add_aelist_object(self, aelist):
         # type: (Any) -> None
         """adds an AELIST object"""
+        self._spline_matrix_cache.clear()
         key = aelist.sid
         assert key not in self.aelists, 'AELIST.sid=%s\nold=\n%snew=\n%s' % (key, self.aelists[key], aelist)
         assert key >= 0
@@ -799,6 +808,7 @@ class AddMethods(BDFAttributes):
     def _add_caero_object(self, caero):
         # type: (Any) -> None
         """adds an CAERO1/CAERO2/CAERO3/CAERO4/CAERO5 object"""
+        self._spline_matrix_cache.clear()
         key = caero.eid
         assert key not in self.caeros, '\ncaero=\n%r old_caero=\n%r' % (
             caero, self.caeros[key])
@@ -828,6 +838,7 @@ class AddMethods(BDFAttributes):
     def _add_spline_object(self, spline):
         # type: (Any) -> None
         """adds an SPLINE1/SPLINE2/SPLINE3/SPLINE4/SPLINE5 object"""
+        self._spline_matrix_cache.clear()
         assert spline.eid not in self.splines
         assert spline.eid > 0
         key = spline.eid
@@ -1051,6 +1062,7 @@ class AddMethods(BDFAttributes):
 
     def _add_set_object(self, set_obj):
         """adds an SET1/SET3 object"""
+        self._spline_matrix_cache.clear()
         key = set_obj.sid
         assert key >= 0
         if key in self.sets:
@@ -324,6 +324,10 @@ class BDFAttributes(object):
         # stores ACSRCE, RLOAD1, RLOAD2, TLOAD1, TLOAD2, and ACSRCE,
         #        and QVECT entries.
         self.dload_entries = {}    # type: Dict[int, Any]
+        #: the reduced LOAD/DLOAD combinations; see ``get_reduced_loads``
+        self._reduced_loads_cache = {}    # type: Dict[Any, Any]
+        #: the per SPLINEx interpolation blocks; see ``build_spline_matrix``
+        self._spline_matrix_cache = {}    # type: Dict[int, Any]
 
         #self.gusts = {}  # Case Control GUST = 100
         #self.random = {} # Case Control RANDOM = 100
@@ -35,7 +35,6 @@ defines various methods to access high level BDF data:
 # pylint: disable=C0103
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
-from copy import deepcopy
 from collections import defaultdict
 from typing import List, Dict, Set, Optional, Any
 from six import string_types, iteritems, iterkeys, itervalues
@@ -1208,8 +1207,7 @@ class GetCard(GetMethods):
             raise TypeError(msg)
 
         try:
-            load_case = self.Load(
-                load_case_id, consider_load_combinations=consider_load_combinations, msg=msg)
+            self.Load(load_case_id, consider_load_combinations=consider_load_combinations, msg=msg)
         except KeyError:
             if stop_on_failure:
                 raise
@@ -1217,52 +1215,124 @@ class GetCard(GetMethods):
                 self.log.error("could not find expected LOAD/LOADSET id=%s" % load_case_id)
                 return []
 
-        loads, scale_factors, is_grav = self._reduce_load_case(load_case, scale=scale)
+        if consider_load_combinations:
+            reduced = self._get_reduced_loads_cache('LOAD')
+        else:
+            reduced = self._get_reduced_loads_cache('LOADSET')
+        loads, scale_factors, is_grav = self._reduce_load_set(
+            load_case_id, reduced, [load_case_id], 'LOAD',
+            consider_load_combinations=consider_load_combinations, msg=msg)
         assert len(loads) == len(scale_factors)
-        return loads, scale_factors, is_grav
+        return list(loads), [scale * scale_factor for scale_factor in scale_factors], is_grav
+
+    def _get_reduced_loads_cache(self, cache_type):
+        """
+        Gets the reduced LOAD/DLOAD sets, which are filled as the
+        combination DAG is walked.  A set is only reduced again when its
+        cards change, so reducing all the load cases rescales the cached
+        lists.
+
+        Each reduced set is stored with the key of its cards (the card
+        ids and the combination scale factors/load ids), which is checked
+        on every call, so in-place edits (e.g., ``load.scale = 5.``,
+        ``model.loads[10].pop()``) are picked up.  The cache is also
+        cleared when a load card is added.
+        """
+        return self._reduced_loads_cache.setdefault(cache_type, {})
+
+    def _reduce_load_set(self, load_id, reduced, trace, combination_type,
+                         consider_load_combinations=True, msg='', checked=None):
+        """
+        Reduces a LOAD/DLOAD set to the referenced loads using the
+        already reduced sets
+
+        Parameters
+        ----------
+        load_id : int
+            the LOAD/DLOAD id
+        reduced : Dict[int] = (key, sets, (loads, scale_factors, is_grav))
+            the reduced sets (for a unit scale factor) with the key of
+            their cards and the reduced sets they reference
+        trace : List[int]
+            the set ids from the load case to load_id; used to detect cycles
+        combination_type : str
+            LOAD, DLOAD
+        checked : Set[int]; default=None
+            the sets that were checked against their cards on this call
+
+        Returns
+        -------
+        loads : List[loads]
+            a series of load objects
+        scale_factors : List[float]
+            the associated scale factors
+        is_grav : bool
+            is there a gravity card
+        """
+        if checked is None:
+            checked = set()
+        if load_id in checked:
+            return reduced[load_id][2]
+
+        if combination_type == 'DLOAD':
+            load_case = self._get_dload_case(load_id, msg=msg)
+        else:
+            load_case = self.Load(
+                load_id, consider_load_combinations=consider_load_combinations, msg=msg)
+
+        # the key of the cards and the reduced sets they reference
+        key = []
+        sets = []
+        for load in load_case:
+            if load.type != combination_type:
+                key.append(id(load))
+                continue
+
+            load_ids = [load.LoadID(load_idi) for load_idi in load.load_ids]
+            key.append((id(load), load.scale, tuple(load.scale_factors), tuple(load_ids)))
+            for unused_scale_factor, load_idi in zip(load.scale_factors, load_ids):
+                # prevents recursion
+                if load_idi in trace:
+                    msg = 'There is a recursion error.  %s trace=%s; load_id=%s' % (
+                        combination_type, trace, load_idi)
+                    raise RuntimeError(msg)
+                trace.append(load_idi)
+                sets.append(self._reduce_load_set(
+                    load_idi, reduced, trace, combination_type,
+                    consider_load_combinations=consider_load_combinations, msg=msg,
+                    checked=checked))
+                trace.pop()
+        checked.add(load_id)
+
+        if load_id in reduced:
+            keyi, setsi, reduced_set = reduced[load_id]
+            if keyi == key and len(setsi) == len(sets) and all(
+                    seti is setj for seti, setj in zip(setsi, sets)):
+                return reduced_set
 
-    def _reduce_load_case(self, load_case, scale=1., consider_load_combinations=True,
-                          unallowed_load_ids=None, msg=''):
-        """reduces a load case"""
-        scale_factors_out = []
         loads_out = []
+        scale_factors_out = []
         is_grav_out = False
-        if unallowed_load_ids is None:
-            unallowed_load_ids = []
-
+        isets = iter(sets)
         for load in load_case:
-            if load.type == 'LOAD':
-                load_ids = load.get_load_ids()
-                load_scale = load.scale * scale
-                scale_factors = load.scale_factors
-                scale_factors_temp = [load_scale * scalei for scalei in scale_factors]
-                for load_idi, scalei in zip(load_ids, scale_factors_temp):
-                    # prevents recursion
-                    if load_idi in unallowed_load_ids:
-                        msg = 'There is a recursion error.  LOAD trace=%s; load_id=%s' % (
-                            unallowed_load_ids, load_idi)
-                        raise RuntimeError(msg)
-                    unallowed_load_ids2 = deepcopy(unallowed_load_ids)
-                    unallowed_load_ids2.append(load_idi)
-
-                    load_casei = self.Load(
-                        load_idi, consider_load_combinations=consider_load_combinations, msg=msg)
-                    loadsi, scale_factorsi, is_gravi = self._reduce_load_case(
-                        load_casei, scale=scalei,
-                        consider_load_combinations=consider_load_combinations,
-                        unallowed_load_ids=unallowed_load_ids2)
-                    if is_gravi:
-                        is_grav_out = True
-                    scale_factors_out += scale_factorsi
-                    loads_out += loadsi
-            elif load.type in 'GRAV':
-                scale_factors_out.append(scale)
-                loads_out.append(load)
-                is_grav_out = True
-            else:
-                scale_factors_out.append(scale)
+            if load.type != combination_type:
                 loads_out.append(load)
-        return loads_out, scale_factors_out, is_grav_out
+                scale_factors_out.append(1.)
+                if load.type == 'GRAV':
+                    is_grav_out = True
+                continue
+
+            load_ids = [load.LoadID(load_idi) for load_idi in load.load_ids]
+            for scale_factor, unused_load_id in zip(load.scale_factors, load_ids):
+                loadsi, scale_factorsi, is_gravi = next(isets)
+                scale = load.scale * scale_factor
+                loads_out += loadsi
+                scale_factors_out += [scale * scalei for scalei in scale_factorsi]
+                is_grav_out = is_grav_out or is_gravi
+
+        reduced_set = (loads_out, scale_factors_out, is_grav_out)
+        reduced[load_id] = (key, sets, reduced_set)
+        return reduced_set
 
     def _get_loads_and_scale_factors(self, load_case):
         """account for scale factors"""
@@ -1307,41 +1377,20 @@ class GetCard(GetMethods):
 
         .. warning:: assumes xref=True
         """
-        dload_case = self.DLoad(dload_id, msg=msg)
-        dloads, scale_factors = self._reduce_dload_case(dload_case, scale=scale, msg=msg)
-        return dloads, scale_factors
+        self._get_dload_case(dload_id, msg=msg)
+        reduced = self._get_reduced_loads_cache('DLOAD')
+        dloads, scale_factors = self._reduce_load_set(
+            dload_id, reduced, [dload_id], 'DLOAD', msg=msg)[:2]
+        return list(dloads), [scale * scale_factor for scale_factor in scale_factors]
 
-    def _reduce_dload_case(self, dload_case, scale=1., unallowed_dload_ids=None, msg=''):
-        """reduces a dload case"""
-        scale_factors_out = []
-        dloads_out = []
-        if unallowed_dload_ids is None:
-            unallowed_dload_ids = []
-
-        for dload in dload_case:
-            if dload.type == 'DLOAD':
-                dload_ids = dload.get_load_ids()
-                load_scale = dload.scale * scale
-                scale_factors = dload.scale_factors
-                scale_factors_temp = [load_scale * scalei for scalei in scale_factors]
-                for dload_idi, scalei in zip(dload_ids, scale_factors_temp):
-                    # prevents recursion
-                    if dload_idi in unallowed_dload_ids:
-                        msg = 'There is a recursion error.  DLOAD trace=%s; dload_id=%s' % (
-                            unallowed_dload_ids, dload_idi)
-                        raise RuntimeError(msg)
-                    unallowed_dload_ids2 = deepcopy(unallowed_dload_ids)
-                    unallowed_dload_ids2.append(dload_idi)
-
-                    dload_casei = self.DLoad(dload_idi, msg=msg)
-                    dloadsi, scale_factorsi = self._reduce_dload_case(
-                        dload_casei, scale=scalei, unallowed_dload_ids=unallowed_dload_ids2, )
-                    scale_factors_out += scale_factorsi
-                    dloads_out += dloadsi
-            else:
-                scale_factors_out.append(scale)
-                dloads_out.append(dload)
-        return dloads_out, scale_factors_out
+    def _get_dload_case(self, dload_id, msg=''):
+        """
+        gets a DLOAD combination or, if the id is only used by
+        RLOADx/TLOADx/ACSRCE cards, the dynamic load entries
+        """
+        if dload_id not in self.dloads and dload_id in self.dload_entries:
+            return self.get_dload_entries(dload_id, msg=msg)
+        return self.DLoad(dload_id, msg=msg)
 
     def get_rigid_elements_with_node_ids(self, node_ids):
         """
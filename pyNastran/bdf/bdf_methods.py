@@ -28,6 +28,15 @@ from pyNastran.bdf.mesh_utils.mass_properties import (
     _mass_properties, _mass_properties_new)
 from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
 from pyNastran.bdf.mesh_utils.skin_solid_elements import write_skin_solid_faces
+from pyNastran.bdf.mesh_utils.element_geometry import get_element_geometry
+from pyNastran.bdf.mesh_utils.element_quality import get_element_quality
+from pyNastran.bdf.mesh_utils.optimization_responses import get_responses
+from pyNastran.bdf.mesh_utils.design_vector import apply_design_vector
+from pyNastran.bdf.mesh_utils.dynamic_loads import get_dynamic_load_matrix
+from pyNastran.bdf.mesh_utils.pressure_loads import get_pressure_arrays
+from pyNastran.bdf.mesh_utils.aero_panels import get_caero_panels
+from pyNastran.bdf.mesh_utils.splines import build_spline_matrix
+from pyNastran.bdf.mesh_utils.laminates import get_laminate_properties
 
 
 class BDFMethods(BDFAttributes):
@@ -41,6 +50,16 @@ class BDFMethods(BDFAttributes):
             include_grav=False, xyz_cid0=None)
         sum_forces_moments(p0, loadcase_id, include_grav=False,
             xyz_cid0=None)
+        get_element_geometry(element_ids=None, quantities=(...))
+        get_element_quality(element_ids=None)
+        get_responses(op2_model, dresp_ids=None)
+        apply_design_vector(desvar_values, design_map=None)
+        get_dynamic_load_matrix(dload_id, freqs_or_times, loadset_id=None,
+            is_sparse=False)
+        get_pressure_arrays(load_case_ids=None, xyz_cid0=None, node_ids=None)
+        get_caero_panels(caero_ids=None)
+        build_spline_matrix(spline_ids=None)
+        get_laminate_properties(property_ids=None)
     """
 
     def __init__(self):
@@ -585,6 +604,238 @@ class BDFMethods(BDFAttributes):
                                              include_grav=include_grav, xyz_cid0=xyz_cid0)
         return forces, moments
 
+    def get_element_geometry(self, element_ids=None,
+                             quantities=('centroid', 'area', 'normal', 'volume', 'length'),
+                             xyz_cid0=None, node_ids=None):
+        """
+        Gets the centroid/area/normal/volume/length for many elements
+        at once using vectorized calculations by element type.
+
+        Parameters
+        ----------
+        element_ids : List[int] / None
+            the element ids to consider
+            default=None -> all elements
+        quantities : List[str]; default=all
+            the quantities to calculate
+            {centroid, area, normal, volume, length}
+        xyz_cid0 : (nnodes, 3) float ndarray; default=None
+            the node locations in the global frame; calculated if None
+        node_ids : (nnodes, ) int ndarray; default=None
+            the node ids corresponding to xyz_cid0
+
+        Returns
+        -------
+        geometry : Dict[str] = ndarray
+            the sorted element_id/element_type and the requested
+            quantities; quantities that don't apply to an element
+            type (e.g., the area of a CHEXA) are nan
+
+        .. seealso:: pyNastran.bdf.mesh_utils.element_geometry.get_element_geometry
+        """
+        return get_element_geometry(self, element_ids=element_ids, quantities=quantities,
+                                    xyz_cid0=xyz_cid0, node_ids=node_ids)
+
+    def get_element_quality(self, element_ids=None, xyz_cid0=None, node_ids=None):
+        """
+        Gets the shell/solid quality metrics (e.g., skew, aspect ratio,
+        taper ratio, warp, interior angles, jacobian) using vectorized
+        calculations by element type.
+
+        Parameters
+        ----------
+        element_ids : List[int] / None
+            the element ids to consider
+            default=None -> all elements
+        xyz_cid0 : (nnodes, 3) float ndarray; default=None
+            the node locations in the global frame; calculated if None
+        node_ids : (nnodes, ) int ndarray; default=None
+            the node ids corresponding to xyz_cid0
+
+        Returns
+        -------
+        quality : Dict[str] = (n, ) ndarray
+            the sorted element_id/element_type and the quality metrics
+
+        .. seealso:: pyNastran.bdf.mesh_utils.element_quality.get_element_quality
+        .. seealso:: pyNastran.bdf.mesh_utils.element_quality.get_quality_violations
+        """
+        return get_element_quality(self, element_ids=element_ids,
+                                   xyz_cid0=xyz_cid0, node_ids=node_ids)
+
+    def get_responses(self, op2_model, dresp_ids=None):
+        """
+        Evaluates the DRESP1/DRESP2 responses for all the subcases and
+        times in an OP2 at once.
+
+        Parameters
+        ----------
+        op2_model : OP2()
+            the results
+        dresp_ids : List[int] / None
+            the DRESP1/DRESP2 ids to evaluate
+            default=None -> all responses
+
+        Returns
+        -------
+        responses : Dict[str] = (n, ) ndarray
+            the dresp_id/response_type/key/isubcase/itime/time/id/value
+            response table
+
+        .. seealso:: pyNastran.bdf.mesh_utils.optimization_responses.get_responses
+        """
+        return get_responses(self, op2_model, dresp_ids=dresp_ids)
+
+    def apply_design_vector(self, desvar_values, design_map=None):
+        """
+        Updates the properties/materials from the DVPRELx/DVMRELx cards
+        for a new set of design variables.
+
+        Parameters
+        ----------
+        desvar_values : Dict[int] = float / (ndesvars, ) float ndarray
+            the design variables as a {desvar_id : value} dictionary or
+            an array in sorted DESVAR id order
+        design_map : Dict[str] = varies; default=None
+            the precompiled map from ``get_design_vector_map``;
+            reuse it when applying many design vectors
+
+        Returns
+        -------
+        design : Dict[str] = ndarray
+            the desvar_ids/desvar_values and oid/card_type/value
+            of the updated fields
+
+        .. seealso:: pyNastran.bdf.mesh_utils.design_vector.apply_design_vector
+        .. seealso:: pyNastran.bdf.mesh_utils.design_vector.get_design_vector_map
+        """
+        return apply_design_vector(self, desvar_values, design_map=design_map)
+
+    def get_dynamic_load_matrix(self, dload_id, freqs_or_times, loadset_id=None,
+                                is_sparse=False):
+        """
+        Builds the frequency (RLOAD1, RLOAD2, ACSRCE) or time (TLOAD1,
+        TLOAD2) dependent load matrix for a DLOAD.
+
+        Parameters
+        ----------
+        dload_id : int
+            the DLOAD=ID in the case control deck
+        freqs_or_times : (nfreq, ) / (ntime, ) float ndarray
+            the frequencies or times
+        loadset_id : int; default=None
+            the LOADSET=ID in the case control deck, which selects
+            the LSEQs; None : all the LSEQs are considered
+        is_sparse : bool; default=False
+            return a scipy.sparse.csr_matrix instead of a dense array
+
+        Returns
+        -------
+        dofs : (ndof, 2) int ndarray
+            the (node_id, component) of the rows
+        load_matrix : (ndof, nfreq) complex ndarray / (ndof, ntime) float ndarray
+            the excitation
+
+        .. seealso:: pyNastran.bdf.mesh_utils.dynamic_loads.get_dynamic_load_matrix
+        """
+        return get_dynamic_load_matrix(self, dload_id, freqs_or_times,
+                                       loadset_id=loadset_id, is_sparse=is_sparse)
+
+    def get_pressure_arrays(self, load_case_ids=None, xyz_cid0=None, node_ids=None):
+        """
+        Gets the PLOAD/PLOAD2/PLOAD4 element pressures and nodal forces
+        for many load cases at once.
+
+        Parameters
+        ----------
+        load_case_ids : List[int]; default=None
+            the LOAD ids; None : all the LOAD ids in the model
+        xyz_cid0 : (nnodes, 3) float ndarray; default=None
+            the node locations in the global frame; calculated if None
+        node_ids : (nnodes, ) int ndarray; default=None
+            the node ids corresponding to xyz_cid0
+
+        Returns
+        -------
+        pressure_arrays : Dict[str] = ndarray
+            load_case_ids (ncases, ), element_ids (nelements, ),
+            pressures (nelements, ncases), node_ids (nnodes, ),
+            forces (nnodes, 3, ncases)
+
+        .. seealso:: pyNastran.bdf.mesh_utils.pressure_loads.get_pressure_arrays
+        """
+        return get_pressure_arrays(self, load_case_ids=load_case_ids,
+                                   xyz_cid0=xyz_cid0, node_ids=node_ids)
+
+    def get_caero_panels(self, caero_ids=None):
+        """
+        Gets the aero box points, quads, box ids, and control surface
+        masks of the CAERO1/CAERO3/CAERO4/CAERO5 panels as flat arrays
+
+        Parameters
+        ----------
+        caero_ids : List[int]; default=None
+            the CAERO ids; None : all the CAEROx panels
+
+        Returns
+        -------
+        caero_panels : Dict[str] = ndarray
+            caero_ids (ncaeros, ), points (npoints, 3),
+            elements (nboxes, 4), box_ids (nboxes, ),
+            box_caero_ids (nboxes, ), control_surface_labels (nsurfaces, ),
+            control_surface_mask (nboxes, nsurfaces)
+
+        .. seealso:: pyNastran.bdf.mesh_utils.aero_panels.get_caero_panels
+        """
+        return get_caero_panels(self, caero_ids=caero_ids)
+
+    def build_spline_matrix(self, spline_ids=None):
+        """
+        Builds the sparse SPLINE1/SPLINE2/SPLINE4/SPLINE5 matrix that
+        interpolates the structural displacements to the aero boxes.
+        The blocks of each spline are cached.
+
+        Parameters
+        ----------
+        spline_ids : List[int]; default=None
+            the SPLINEx ids; None : all the splines
+
+        Returns
+        -------
+        aero_dofs : (nrows, 2) int ndarray
+            the (box_id, component) of the rows
+        structure_dofs : (ncols, 2) int ndarray
+            the (node_id, component) of the columns
+        G : (nrows, ncols) scipy.sparse.csr_matrix
+            the displacement interpolation matrix
+
+        .. seealso:: pyNastran.bdf.mesh_utils.splines.build_spline_matrix
+        """
+        return build_spline_matrix(self, spline_ids=spline_ids)
+
+    def get_laminate_properties(self, property_ids=None):
+        """
+        Gets the ABD matrices, equivalent moduli, mass per area, and ply
+        z locations of the PCOMP/PCOMPG properties at once.
+
+        Parameters
+        ----------
+        property_ids : List[int]; default=None
+            the PCOMP/PCOMPG ids; None : all the PCOMP/PCOMPG properties
+
+        Returns
+        -------
+        laminates : Dict[str] = ndarray
+            property_ids (nproperties, ), nplies (nproperties, ),
+            thicknesses/thetas (nproperties, nplies_max),
+            z (nproperties, nplies_max + 1), thickness (nproperties, ),
+            mass_per_area (nproperties, ), ABD (nproperties, 6, 6),
+            membrane_moduli/bending_moduli (nproperties, 4)
+
+        .. seealso:: pyNastran.bdf.mesh_utils.laminates.get_laminate_properties
+        """
+        return get_laminate_properties(self, property_ids=property_ids)
+
     def get_element_faces(self, element_ids=None, allow_blank_nids=True):
         """
         Gets the elements and faces that are skinned from solid elements.
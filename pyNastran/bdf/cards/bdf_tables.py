@@ -56,10 +56,172 @@ def make_xy(table_id, table_type, xy):
     y = xy[:, 1]
     return x, y
 
+class TableInterpolator(object):
+    """
+    A precompiled piecewise linear table (e.g., TABLED1, TABLEM3), so
+    the axis-type branching and the segment slopes aren't redone for
+    every lookup.
+
+    The table is evaluated as::
+
+        u = (x - x1) / x2           # log(u) for a LOG x-axis
+        y = y0[i] + slope[i] * u    # exp(y) for a LOG y-axis
+
+    where i is the segment that u is in.  Outside the table, the end
+    segments are linearly extrapolated (in log space for LOG axes) or
+    the end values are held constant.  At a jump discontinuity (two
+    points with the same x), the value to the right is used.
+    """
+    def __init__(self, x, y, xaxis='LINEAR', yaxis='LINEAR', x1=0., x2=1.,
+                 extrapolate=True):
+        """
+        Parameters
+        ----------
+        x / y : (n, ) float ndarray
+            the table points; x is sorted
+        xaxis / yaxis : str; default='LINEAR'
+            LINEAR, LOG
+        x1 / x2 : float; default=0. / 1.
+            the offset/scale for the x values
+        extrapolate : bool; default=True
+            True : linearly extrapolate the end segments
+            False : use the end values
+        """
+        x = np.asarray(x, dtype='float64')
+        y = np.asarray(y, dtype='float64')
+        self.is_xlog = xaxis == 'LOG'
+        self.is_ylog = yaxis == 'LOG'
+        self.x1 = x1
+        self.x2 = x2
+        self.extrapolate = extrapolate
+
+        xs = np.log(x) if self.is_xlog else x
+        ys = np.log(y) if self.is_ylog else y
+        self.xmin = xs[0]
+        self.xmax = xs[-1]
+        if len(xs) == 1:
+            self.x_interior = np.zeros(0, dtype='float64')
+            self.slope = np.zeros(1, dtype='float64')
+            self.y0 = ys.copy()
+            return
+
+        dx = np.diff(xs)
+        dy = np.diff(ys)
+        is_jump = dx == 0.
+        dx[is_jump] = 1.
+        slope = np.where(is_jump, 0., dy / dx)
+
+        #: the interior points, which define the segment of a point
+        self.x_interior = xs[1:-1]
+        self.slope = slope
+        self.y0 = ys[:-1] - slope * xs[:-1]
+
+    def interpolate(self, x):
+        """
+        Evaluates the table
+
+        Parameters
+        ----------
+        x : float / ndarray
+            the values to look up (e.g., the frequencies)
+
+        Returns
+        -------
+        y : float ndarray
+            the table values; the same shape as x
+        """
+        u = np.asarray(x, dtype='float64')
+        if self.x1 != 0.:
+            u = u - self.x1
+        if self.x2 != 1.:
+            u = u / self.x2
+        if self.is_xlog:
+            u = np.log(u)
+        if not self.extrapolate:
+            u = np.clip(u, self.xmin, self.xmax)
+
+        i = np.searchsorted(self.x_interior, u, side='right')
+        y = self.y0[i] + self.slope[i] * u
+        if self.is_ylog:
+            y = np.exp(y)
+        return y
+
+
+class PolynomialTableInterpolator(object):
+    """
+    A precompiled power series table (e.g., TABLED4, TABLEM4)::
+
+        y = sum_{i=0}^N a_i * ((x - x1) / x2)^i
+
+    where x is limited to [x3, x4]
+    """
+    def __init__(self, x1, x2, x3, x4, a):
+        self.x1 = x1
+        self.x2 = x2
+        self.x3 = x3
+        self.x4 = x4
+        # highest power first for Horner's method
+        self.coeffs = np.asarray(a, dtype='float64')[::-1]
+
+    def interpolate(self, x):
+        """
+        Evaluates the table
+
+        Parameters
+        ----------
+        x : float / ndarray
+            the values to look up (e.g., the temperatures)
+
+        Returns
+        -------
+        y : float ndarray
+            the table values; the same shape as x
+        """
+        u = np.clip(np.asarray(x, dtype='float64'), self.x3, self.x4)
+        return np.polyval(self.coeffs, (u - self.x1) / self.x2)
+
+
 class Table(BaseCard):
     def __init__(self):
         pass
 
+    def _interpolator_args(self):
+        """gets the interpolator class and its arguments"""
+        raise NotImplementedError('%s does not support interpolation' % self.type)
+
+    def get_interpolator(self):
+        """
+        Gets the compiled interpolator (e.g., TableInterpolator), which
+        is cached until one of the table's attributes is reassigned
+        """
+        cls, args = self._interpolator_args()
+        cached = self.__dict__.get('_interpolator')
+        if cached is not None:
+            cached_args, interpolator = cached
+            if all(arg is cached_arg for arg, cached_arg in zip(args, cached_args)):
+                return interpolator
+        interpolator = cls(*args)
+        self._interpolator = (args, interpolator)
+        return interpolator
+
+    def interpolate(self, x):
+        """
+        Evaluates the table for a single value or an array of values
+
+        Parameters
+        ----------
+        x : float / List[float] / ndarray
+            the values to look up (e.g., the frequencies)
+
+        Returns
+        -------
+        y : float ndarray
+            the table values; a float returns a (1, ) array
+        """
+        if isinstance(x, float):
+            x = [x]
+        return self.get_interpolator().interpolate(x)
+
     #def parse_fields(self, xy, nrepeated, is_data=False):
         #self.table = TableObj(xy, nrepeated, is_data)
 
@@ -178,7 +340,7 @@ class TABLED1(Table):
     """
     type = 'TABLED1'
     #def __init__(self, tid, xaxis, yaxis, xy, comment=''):
-    def __init__(self, tid, x, y, xaxis='LINEAR', yaxis='LINEAR', comment=''):
+    def __init__(self, tid, x, y, xaxis='LINEAR', yaxis='LINEAR', extrap=0, comment=''):
         """
         Creates a TABLED1, which is a dynamic load card that is applied
         by the DAREA card
@@ -195,6 +357,9 @@ class TABLED1(Table):
             LINEAR, LOG
         yaxis : str
             LINEAR, LOG
+        extrap : int; default=0
+            0 : linearly extrapolate the end segments
+            1 : use the end values outside the table
         comment : str; default=''
             a comment for the card
         """
@@ -206,8 +371,10 @@ class TABLED1(Table):
         self.y = np.asarray(y, dtype='float64')
         self.xaxis = xaxis
         self.yaxis = yaxis
+        self.extrap = extrap
         assert self.xaxis in ['LINEAR', 'LOG'], 'xaxis=%r' % (self.xaxis)
         assert self.yaxis in ['LINEAR', 'LOG'], 'yaxis=%r' % (self.yaxis)
+        assert self.extrap in [0, 1], 'extrap=%r' % (self.extrap)
 
     @classmethod
     def add_card(cls, card, comment=''):
@@ -224,6 +391,7 @@ class TABLED1(Table):
         tid = integer(card, 1, 'tid')
         xaxis = string_or_blank(card, 2, 'xaxis', 'LINEAR')
         yaxis = string_or_blank(card, 3, 'yaxis', 'LINEAR')
+        extrap = integer_or_blank(card, 4, 'extrap', 0)
 
         nfields = len(card) - 1
         nterms = (nfields - 9) // 2
@@ -241,7 +409,8 @@ class TABLED1(Table):
             xy.append([xi, yi])
         string(card, nfields, 'ENDT')
         x, y = make_xy(tid, 'TABLED1', xy)
-        return TABLED1(tid, x, y, xaxis=xaxis, yaxis=yaxis, comment=comment)
+        return TABLED1(tid, x, y, xaxis=xaxis, yaxis=yaxis,
+                       extrap=extrap, comment=comment)
 
     @classmethod
     def add_op2_data(cls, data, comment=''):
@@ -255,62 +424,25 @@ class TABLED1(Table):
         y = xy[:, 1]
         return TABLED1(tid, x, y, xaxis=xaxis, yaxis=yaxis, comment=comment)
 
+    def _interpolator_args(self):
+        """the end segments are extrapolated unless EXTRAP=1"""
+        return TableInterpolator, (self.x, self.y, self.xaxis, self.yaxis,
+                                   0., 1., self.extrap == 0)
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
             xy.extend([xi, yi])
-        list_fields = ['TABLED1', self.tid, self.xaxis, self.yaxis, None,
+        list_fields = ['TABLED1', self.tid, self.xaxis, self.yaxis, self.extrap,
                        None, None, None, None] + xy + ['ENDT']
         return list_fields
 
     def repr_fields(self):
         #xaxis = set_blank_if_default(self.xaxis, 'LINEAR')
         #yaxis = set_blank_if_default(self.yaxis, 'LINEAR')
-        return self.raw_fields()
-
-    def interpolate(self, x):
-        if isinstance(x, float):
-            x = [x]
-        x = np.asarray(x)
-        #nx = x.size
-        #ny = self.y.size
-
-        # xj follow xi
-        i = np.searchsorted(self.x, x, side='left') - 1
-        j = i + 1
-        #k = np.where(j == ny)[0]
-
-        # TODO: handle out of range errors
-        xi = self.x[i]
-        yi = self.y[i]
-        try:
-            xj = self.x[j]
-            yj = self.y[j]
-        except IndexError:
-            #print('table.x = %s' % self.x)
-            #print('table.y = %s' % self.y)
-            #print('x = %s' % x)
-            #print('yi = %s' % yi)
-            return yi
-
-        # TODO: could probably speed this up with log rules
-        if self.xaxis == 'LINEAR' and self.yaxis == 'LINEAR':
-            dx = xj - xi
-            y = (xj - x) / dx * yi + (x - xi) / dx * yj
-        elif self.xaxis == 'LOG' and self.yaxis == 'LINEAR':
-            dx = np.log(xj / xi)
-            y = np.log(xj / x) / dx * yi + np.log(x / xi) / dx * yj
-        elif self.xaxis == 'LINEAR' and self.yaxis == 'LOG':
-            dx = xj - xi
-            lny = (xj - x) / dx * np.log(yi) + (x - xi) / dx * np.log(yj)
-            y = np.exp(lny)
-        elif self.xaxis == 'LOG' and self.yaxis == 'LOG':
-            dx = np.log(xj / xi)
-            lny = (xj - x) / dx * np.log(yi) + (x - xi) / dx * np.log(yj)
-            y = np.exp(lny)
-        else:
-            raise NotImplementedError('xaxis=%r yaxis=%r' % (self.xaxis, self.yaxis))
-        return y
+        list_fields = self.raw_fields()
+        list_fields[4] = set_blank_if_default(self.extrap, 0)
+        return list_fields
 
 class TABLED2(Table):
     """Dynamic Load Table, Type 2"""
@@ -379,34 +511,9 @@ class TABLED2(Table):
         y = xy[:, 1]
         return TABLED2(tid, x1, x, y, comment=comment)
 
-    def interpolate(self, x):
-        if isinstance(x, float):
-            x = [x]
-        x = np.asarray(x)
-        #nx = x.size
-        #ny = self.y.size
-
-        # xj follow xi
-        i = np.searchsorted(self.x, x, side='left') - 1
-        j = i + 1
-        #k = np.where(j == ny)[0]
-
-        # TODO: handle out of range errors
-        xi = self.x[i]
-        yi = self.y[i]
-        try:
-            xj = self.x[j]
-            yj = self.y[j]
-        except IndexError:
-            #print('table.x = %s' % self.x)
-            #print('table.y = %s' % self.y)
-            #print('x = %s' % x)
-            #print('yi = %s' % yi)
-            return yi
-
-        dx = xj - xi
-        y = (xj - x) / dx * yi + (x - xi) / dx * yj
-        return y
+    def _interpolator_args(self):
+        """y = yT(x - x1)"""
+        return TableInterpolator, (self.x, self.y, 'LINEAR', 'LINEAR', self.x1)
 
     def raw_fields(self):
         xy = []
@@ -479,6 +586,10 @@ class TABLED3(Table):
         y = xy[:, 1]
         return TABLED3(tid, x1, x2, x, y, comment=comment)
 
+    def _interpolator_args(self):
+        """y = yT((x - x1) / x2)"""
+        return TableInterpolator, (self.x, self.y, 'LINEAR', 'LINEAR', self.x1, self.x2)
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
@@ -549,6 +660,10 @@ class TABLED4(Table):
         a = data[5:]
         return TABLED4(tid, x1, x2, x3, x4, a, comment=comment)
 
+    def _interpolator_args(self):
+        """y = sum_{i=0}^N Ai * ((x-x1)/x2))^i"""
+        return PolynomialTableInterpolator, (self.x1, self.x2, self.x3, self.x4, self.a)
+
     def raw_fields(self):
         list_fields = ['TABLED4', self.tid, self.x1, self.x2, self.x3, self.x4,
                        None, None, None] + list(self.a) + ['ENDT']
@@ -557,31 +672,6 @@ class TABLED4(Table):
     def repr_fields(self):
         return self.raw_fields()
 
-    def interpolate(self, x):
-        """
-        y = sum_{i=0}^N Ai * ((x-x1)/x2))^i
-        """
-        if isinstance(x, float):
-            x = [x]
-        x = np.asarray(x)
-        nx = x.size
-
-        na = self.a.size
-        n = np.arange(0., na)
-
-        x1 = np.ones(nx) * self.x1
-        x2 = np.ones(nx) * self.x2
-
-        i = np.where(x < self.x3)[0]
-        x[i] = self.x3
-
-        j = np.where(x > self.x4)[0]
-        x[j] = self.x4
-
-        yi = self.a * ((x - x1) / x2) ** n
-        return yi.sum()
-
-
 class TABDMP1(Table):
     type = 'TABDMP1'
     def __init__(self, tid, x, y, Type='G', comment=''):
@@ -639,6 +729,10 @@ class TABDMP1(Table):
         y = xy[:, 1]
         return TABDMP1(tid, Type, x, y, comment=comment)
 
+    def _interpolator_args(self):
+        """the damping is linearly interpolated with frequency"""
+        return TableInterpolator, (self.x, self.y)
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
@@ -717,6 +811,10 @@ class TABLEM1(Table):
         return TABLEM1(tid, x, y, comment=comment)
 
 
+    def _interpolator_args(self):
+        """y = yT(x)"""
+        return TableInterpolator, (self.x, self.y)
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
@@ -794,6 +892,10 @@ class TABLEM2(Table):
         y = xy[:, 1]
         return TABLEM2(tid, x1, x, y, comment=comment)
 
+    def _interpolator_args(self):
+        """y = yT(x - x1); the material scales the result by Z"""
+        return TableInterpolator, (self.x, self.y, 'LINEAR', 'LINEAR', self.x1)
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
@@ -878,6 +980,10 @@ class TABLEM3(Table):
         y = xy[:, 1]
         return TABLEM3(tid, x1, x2, x, y, comment=comment)
 
+    def _interpolator_args(self):
+        """y = yT((x - x1) / x2)"""
+        return TableInterpolator, (self.x, self.y, 'LINEAR', 'LINEAR', self.x1, self.x2)
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
@@ -970,6 +1076,10 @@ class TABLEM4(Table):
         a = data[3:]
         return TABLEM4(tid, x1, x2, x3, x4, a, comment=comment)
 
+    def _interpolator_args(self):
+        """y = sum_{i=0}^N Ai * ((x-x1)/x2))^i"""
+        return PolynomialTableInterpolator, (self.x1, self.x2, self.x3, self.x4, self.a)
+
     def raw_fields(self):
         list_fields = ['TABLEM4', self.tid, self.x1, self.x2, self.x3, self.x4,
                        None, None, None] + list(self.a) + ['ENDT']
@@ -6,11 +6,13 @@ The capitalization of the sub-functions is important.
 """
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
+from functools import reduce
 from six import exec_
 
 import numpy as np
 from numpy import (
     cos, sin, tan, log, log10, mean, exp, sqrt, square, mod, abs, sum,
+    cosh, sinh, tanh,
     arcsin as asin, arccos as acos, arctan as atan, arctan2 as atan2,
     arcsinh as asinh, arccosh as acosh, arctanh as atanh)
 # atan2h
@@ -108,6 +110,51 @@ def _get_ta(f):
     ta2 = k1 * f**4 / ((f**2 + p1**2)**2 * (f**2 + p4**2)**2)
     return ta1, ta2
 
+def _ssq_array(*args):
+    """sum of squares; vectorized"""
+    return reduce(np.add, [np.square(arg) for arg in args])
+
+def _rss_array(*args):
+    """2-norm; vectorized"""
+    return np.sqrt(_ssq_array(*args))
+
+def _sum_array(*args):
+    """sum; vectorized"""
+    return reduce(np.add, args)
+
+def _avg_array(*args):
+    """average; vectorized"""
+    return _sum_array(*args) / len(args)
+
+def _min_array(*args):
+    """minimum; vectorized"""
+    return reduce(np.minimum, args)
+
+def _max_array(*args):
+    """maximum; vectorized"""
+    return reduce(np.maximum, args)
+
+def _dim_array(x, y):
+    """positive difference; vectorized"""
+    return x - np.minimum(x, y)
+
+#: the functions available to ``DEQATN.evaluate_array``;
+#: the intrinsics that take a variable number of arguments are
+#: replaced with versions that work element-wise on arrays
+_ARRAY_NAMESPACE = {
+    'np' : np,
+    'cos' : cos, 'sin' : sin, 'tan' : tan,
+    'cosh' : cosh, 'sinh' : sinh, 'tanh' : tanh,
+    'asin' : asin, 'acos' : acos, 'atan' : atan, 'atan2' : atan2,
+    'asinh' : asinh, 'acosh' : acosh, 'atanh' : atanh, 'atan2h' : atan2h,
+    'log' : log, 'log10' : log10, 'logx' : logx, 'exp' : exp,
+    'sqrt' : sqrt, 'square' : square, 'mod' : mod, 'abs' : abs, 'pi' : pi,
+    'rss' : _rss_array, 'ssq' : _ssq_array, 'sum' : _sum_array,
+    'avg' : _avg_array, 'mean' : _avg_array,
+    'min' : _min_array, 'max' : _max_array, 'dim' : _dim_array,
+    'db' : db, 'invdb' : invdb, 'dba' : dba, 'invdba' : invdba,
+}
+
 class DEQATN(BaseCard):  # needs work...
     """
     Design Equation Defintion
@@ -225,6 +272,13 @@ class DEQATN(BaseCard):  # needs work...
         self.func = func
         self.nargs = nargs
 
+        # the array version is compiled once, so a sweep is a single call
+        unused_func_name, unused_nargs, func_str_array = fortran_to_python(
+            self.eqs, default_values, str(self), is_array=True)
+        namespace = dict(_ARRAY_NAMESPACE)
+        exec_(func_str_array, namespace)
+        self.func_array = namespace[func_name]
+
     def cross_reference(self, model):
         """
         Cross links the card so referenced cards can be extracted directly
@@ -241,7 +295,7 @@ class DEQATN(BaseCard):  # needs work...
         self._setup_equation()
 
     def uncross_reference(self):
-        del self.func
+        del self.func, self.func_array
         #del self.f
         #del getattr(self, self.func_name)
         setattr(self, self.func_name, None)
@@ -261,6 +315,41 @@ class DEQATN(BaseCard):  # needs work...
         return self.func(*args)
         #self.func(*args)
 
+    def evaluate_array(self, *args):
+        """
+        Evaluates the equation for arrays of inputs (e.g., a sweep)
+
+        Parameters
+        ----------
+        args : float / ndarray
+            the equation arguments; these are broadcast against each other
+
+        Returns
+        -------
+        values : ndarray
+            the equation evaluated element-wise; the shape is the
+            broadcast shape of args
+
+        >>> deqatn.evaluate_array(np.linspace(0., 1., num=1000000), 2.)
+        """
+        if len(args) > self.nargs:
+            msg = 'len(args) > nargs\n'
+            msg += 'nargs=%s len(args)=%s; func_name=%s' % (
+                self.nargs, len(args), self.func_name)
+            raise RuntimeError(msg)
+        elif len(args) == 0:
+            msg = 'no args were passed\n'
+            msg += 'nargs=%s len(args)=%s; func_name=%s' % (
+                self.nargs, len(args), self.func_name)
+            raise RuntimeError(msg)
+        values = np.asarray(self.func_array(*args), dtype='float64')
+
+        # constant equations (e.g., f(x) = 1.) don't depend on the inputs
+        shape = np.broadcast(*args).shape if len(args) > 1 else np.shape(args[0])
+        if values.shape != shape:
+            values = np.broadcast_to(values, shape).copy()
+        return values
+
     def raw_fields(self):
         return [self.write_card()]
 
@@ -421,7 +510,7 @@ def fortran_to_python_short(line, default_values):
     exec_(func_str, globals(), d)
     return d['func']
 
-def fortran_to_python(lines, default_values, comment=''):
+def fortran_to_python(lines, default_values, comment='', is_array=False):
     """
     Creates the python function
 
@@ -431,6 +520,11 @@ def fortran_to_python(lines, default_values, comment=''):
         the equations to write broken up by statement
     default_values : dict[name] = value
         the default values from the DTABLE card
+    comment : str; default=''
+        the docstring of the function
+    is_array : bool; default=False
+        the arguments are cast to float arrays instead of floats
+        (see ``DEQATN.evaluate_array``)
 
     def f(x, y=10.):
         '''
@@ -474,18 +568,19 @@ def fortran_to_python(lines, default_values, comment=''):
 
         if i == 0:
             func_name, msg, variables = write_function_header(
-                f, eq, default_values, comment)
+                f, eq, default_values, comment, is_array=is_array)
+            out = func_name
             #print(msg)
         else:
             out = f
             msg += '    %s = %s\n' % (out, eq)
-    msg += '    return %s' % f
+    msg += '    return %s' % out
     #print(msg)
     nargs = len(variables)
     return func_name, nargs, msg
 
 
-def write_function_header(func_header, eq, default_values, comment=''):
+def write_function_header(func_header, eq, default_values, comment='', is_array=False):
     """
     initializes the python function
 
@@ -514,6 +609,10 @@ def write_function_header(func_header, eq, default_values, comment=''):
         max(a, b, c)
     default_values : dict[name] = value
         the default values from the DTABLE card
+    comment : str; default=''
+        the docstring of the function
+    is_array : bool; default=False
+        the arguments are cast to float arrays instead of floats
 
     Returns
     -------
@@ -556,7 +655,10 @@ def write_function_header(func_header, eq, default_values, comment=''):
         #
         msg += _write_function_line(func_name, variables, default_values)
     msg += _write_comment(comment)
-    msg += _write_variables(variables)
+    if is_array:
+        msg += _write_variables_array(variables)
+    else:
+        msg += _write_variables(variables)
     msg += '    %s = %s\n' % (func_name, eq)
     return func_name, msg, variables
 
@@ -599,3 +701,10 @@ def _write_variables(variables):
     msg += '        print(locals())\n'
     msg += '        raise\n'
     return msg
+
+def _write_variables_array(variables):
+    """casts the inputs to float arrays"""
+    msg = ''
+    for var in variables:
+        msg += "    %s = np.asarray(%s, dtype='float64')\n" % (var, var)
+    return msg
@@ -156,17 +156,18 @@ class LoadCombination(Load):
             'ACCEL', 'ACCEL1', #'SLOAD',
         ]
         for loads in self.load_ids_ref:
-            for load in loads:
-                if isinstance(load, integer_types):
-                    load_ids.append(load)
-                elif load.type == 'LOAD':
-                    load_ids.append(load.sid)
-                elif load.type in supported_loads:
-                    load_ids.append(load.sid)
-                else:
-                    msg = ('The get_load_ids method doesnt support %s cards.\n'
-                           '%s' % (load.__class__.__name__, str(load)))
-                    raise NotImplementedError(msg)
+            # all the cards in a load set have the same id
+            load = loads if isinstance(loads, integer_types) else loads[0]
+            if isinstance(load, integer_types):
+                load_ids.append(load)
+            elif load.type == 'LOAD':
+                load_ids.append(load.sid)
+            elif load.type in supported_loads:
+                load_ids.append(load.sid)
+            else:
+                msg = ('The get_load_ids method doesnt support %s cards.\n'
+                       '%s' % (load.__class__.__name__, str(load)))
+                raise NotImplementedError(msg)
         return load_ids
 
     def get_loads(self):
@@ -470,5 +470,65 @@ class TestDEQATN(unittest.TestCase):
         deqatn = model.add_deqatn(1001, eqs)
         model.cross_reference()
 
+    def test_deqatn_evaluate_array(self):
+        """the array version matches the scalar version and broadcasts"""
+        model = BDF(debug=None)
+        eqs = ['f(a,b,c)=rss(a,b,c)+max(a,b)-dim(a,c)+avg(a,b,c)+ssq(a,b)+min(b,c)']
+        model.add_deqatn(1, eqs)
+        card_lines = [
+            'DEQATN  41      F1(A,B,C,D,R) = A+B *C-(D**3 + 10.0) + sin(PI(1) * R)',
+            '                + A**2 / (B - C); F = A + B - F1 * D',
+        ]
+        model.add_card(card_lines, 'DEQATN', is_list=False, has_none=True)
+        model.add_deqatn(2, ['f(x)=1.'])
+        model.add_deqatn(3, ['f(p,pref,f)=dba(p,pref,f)+db(p,pref)+sinh(p/f)'])
+        model.cross_reference()
+
+        deqatn = model.dequations[1]
+        a = np.linspace(1., 2., num=11)
+        values = deqatn.evaluate_array(a, 2., 3.)
+        expected = [deqatn.evaluate(ai, 2., 3.) for ai in a]
+        assert values.shape == (11, ), values.shape
+        assert np.allclose(values, expected)
+
+        # broadcast a (11, 1) sweep against a (3, ) sweep
+        b = np.array([2., 3., 4.])
+        values = deqatn.evaluate_array(a[:, np.newaxis], b, 3.)
+        assert values.shape == (11, 3), values.shape
+        assert np.isclose(values[5, 2], deqatn.evaluate(a[5], b[2], 3.))
+
+        deqatn = model.dequations[41]
+        args = [a, a + 2., a + 3., a, 0.5 * a]
+        values = deqatn.evaluate_array(*args)
+        expected = [deqatn.evaluate(*argsi) for argsi in zip(*args)]
+        assert np.allclose(values, expected)
+
+        values = model.dequations[2].evaluate_array(a)
+        assert np.array_equal(values, np.ones(11)), values
+
+        deqatn = model.dequations[3]
+        values = deqatn.evaluate_array(a, 0.1, 100.)
+        expected = [deqatn.evaluate(ai, 0.1, 100.) for ai in a]
+        assert np.allclose(values, expected)
+
+        with self.assertRaises(RuntimeError):
+            deqatn.evaluate_array(a, a, a, a)
+        with self.assertRaises(RuntimeError):
+            deqatn.evaluate_array()
+
+    def test_deqatn_evaluate_array_func(self):
+        """the array version matches func element-wise"""
+        model = BDF(debug=None)
+        model.add_deqatn(1, ['f(a,b)=rss(a,b)+avg(a,b)'])
+        model.cross_reference()
+
+        deqatn = model.dequations[1]
+        a = np.linspace(-1., 1., num=101)
+        b = np.linspace(2., 3., num=101)
+        values = deqatn.evaluate_array(a, b)
+        expected = np.array([deqatn.func(ai, bi) for ai, bi in zip(a, b)])
+        assert values.shape == expected.shape, values.shape
+        assert np.allclose(values, expected)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1152,6 +1152,61 @@ class TestLoads(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             model.validate()
 
+    def test_reduced_loads(self):
+        """tests the cached LOAD/DLOAD reduction"""
+        model = BDF(debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_force(10, 1, 1., [1., 0., 0.])
+        model.add_force(10, 1, 2., [0., 1., 0.])
+        model.add_moment(11, 1, 3., [0., 0., 1.])
+        model.add_load(20, 2., [1., 0.5], [10, 11])
+        model.add_load(21, 1., [3., 1.], [20, 10])
+        model.cross_reference()
+        assert model.load_combinations[20][0].get_load_ids() == [10, 11]
+
+        loads, scale_factors, is_grav = model.get_reduced_loads(21, scale=2.)
+        assert [load.mag for load in loads] == [1., 2., 3., 1., 2.]
+        assert scale_factors == [12., 12., 6., 2., 2.], scale_factors
+        assert not is_grav
+
+        # the cache is cleared when a card is added
+        model.add_grav(11, 9.81, [0., 0., -1.])
+        loads, scale_factors, is_grav = model.get_reduced_loads(20)
+        assert [load.type for load in loads] == ['FORCE', 'FORCE', 'MOMENT', 'GRAV']
+        assert scale_factors == [2., 2., 1., 1.], scale_factors
+        assert is_grav
+
+        # the cache is checked against the cards, so in-place edits are used
+        model.load_combinations[20][0].scale = 5.
+        loads, scale_factors, is_grav = model.get_reduced_loads(20)
+        assert scale_factors == [5., 5., 2.5, 2.5], scale_factors
+        loads, scale_factors, is_grav = model.get_reduced_loads(21)
+        assert scale_factors == [15., 15., 7.5, 7.5, 1., 1.], scale_factors
+        force = model.loads[10].pop()
+        loads, scale_factors, is_grav = model.get_reduced_loads(21)
+        assert force not in loads
+        assert scale_factors == [15., 7.5, 7.5, 1.], scale_factors
+        model.loads[10].append(force)
+        model.load_combinations[20][0].scale = 2.
+
+        model.add_load(22, 1., [1.], [23])
+        model.add_load(23, 1., [1.], [22])
+        with self.assertRaises(RuntimeError):
+            model.get_reduced_loads(22)
+
+        model.add_darea(100, 1, 3, 2.)
+        model.add_tabled1(1000, [0., 100.], [1., 2.])
+        model.add_rload1(30, 100, tc=1000)
+        model.add_rload2(31, 100, tb=1000)
+        model.add_dload(1, 2., [1., 0.5], [30, 31])
+        model.cross_reference()
+        dloads, scale_factors = model.get_reduced_dloads(1)
+        assert [dload.type for dload in dloads] == ['RLOAD1', 'RLOAD2']
+        assert scale_factors == [2., 1.], scale_factors
+
+        dloads, scale_factors = model.get_reduced_dloads(30)
+        assert [dload.type for dload in dloads] == ['RLOAD1']
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
 
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from pyNastran.bdf.bdf import BDF, BDFCard
 from pyNastran.bdf.cards.bdf_tables import (
     TABLED1, TABLED2, TABLED3, TABLED4,
@@ -141,5 +142,60 @@ class TestTables(unittest.TestCase):
         card2 = TABLEM4.add_card(card)
         #print(card2)
 
+    def test_tabled1_interpolate(self):
+        """tests the TABLED1 linear/log interpolation and extrapolation"""
+        x = [1., 2., 4.]
+        y = [1., 3., 2.]
+        table = TABLED1(1, x, y)
+        xi = np.array([0., 1., 1.5, 2., 3., 4., 6.])
+        expected = [-1., 1., 2., 3., 2.5, 2., 1.]
+        assert np.allclose(table.interpolate(xi), expected), table.interpolate(xi)
+        assert np.allclose(table.interpolate(1.5), [2.])
+        assert table.get_interpolator() is table.get_interpolator()
+
+        table.extrap = 1
+        assert np.allclose(table.interpolate(xi), [1., 1., 2., 3., 2.5, 2., 2.])
+        assert 'TABLED1        1  LINEAR  LINEAR       1' in table.write_card()
+
+        table = TABLED1(2, x, y, xaxis='LOG', yaxis='LOG')
+        xi = np.array([np.sqrt(2.), 2. * np.sqrt(2.), 8.])
+        assert np.allclose(table.interpolate(xi), [np.sqrt(3.), np.sqrt(6.), 4. / 3.])
+
+        # a jump discontinuity uses the value to the right
+        table = TABLED1(3, [0., 1., 1., 2.], [0., 1., 5., 5.])
+        assert np.allclose(table.interpolate([0.5, 1., 1.5]), [0.5, 5., 5.])
+
+    def test_table_interpolate(self):
+        """tests the TABLED2/3/4 and TABLEM1/2/3/4 interpolation"""
+        x = [0., 1., 2.]
+        y = [0., 10., 30.]
+        xi = np.linspace(-1., 3., num=9)
+        yi = np.interp(xi, x, y)
+        yi[0] = -10.
+        yi[1] = -5.
+        yi[-1] = 50.
+        yi[-2] = 40.
+        assert np.allclose(TABLEM1(1, x, y).interpolate(xi), yi)
+        assert np.allclose(TABDMP1(1, x, y).interpolate(xi), yi)
+        assert np.allclose(TABLED2(1, 0.5, x, y).interpolate(xi + 0.5), yi)
+        assert np.allclose(TABLEM2(1, 0.5, x, y).interpolate(xi + 0.5), yi)
+        assert np.allclose(TABLED3(1, 0.5, 2., x, y).interpolate(2. * xi + 0.5), yi)
+        assert np.allclose(TABLEM3(1, 0.5, 2., x, y).interpolate(2. * xi + 0.5), yi)
+
+        # the x values are limited to [x3, x4]
+        table = TABLED4(1, 1., 2., 0., 10., [1., 2., 3.])
+        xi = np.array([-1., 0., 5., 10., 12.])
+        u = (np.clip(xi, 0., 10.) - 1.) / 2.
+        assert np.allclose(table.interpolate(xi), 1. + 2. * u + 3. * u ** 2)
+        table = TABLEM4(1, 1., 2., 0., 10., [1., 2., 3.])
+        assert np.allclose(table.interpolate(xi), 1. + 2. * u + 3. * u ** 2)
+
+        # the cache is updated if the table is changed
+        table = TABLEM1(1, x, y)
+        interpolator = table.get_interpolator()
+        table.y = np.array([0., 1., 2.])
+        assert table.get_interpolator() is not interpolator
+        assert np.allclose(table.interpolate([0.5, 1.5]), [0.5, 1.5])
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
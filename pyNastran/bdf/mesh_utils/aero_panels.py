@@ -0,0 +1,225 @@
+"""
+defines:
+ - caero_panels = get_caero_panels(model, caero_ids=None)
+
+Builds the aero box mesh (points, quads, box ids, and control surface
+masks) of all the CAERO1/CAERO3/CAERO4/CAERO5 panels at once.  Only the
+chordwise/spanwise divisions are gathered per card; the corner points,
+the box points, the quads, and the box ids are calculated in batch
+instead of calling panel_points_elements/_init_ids per card.
+"""
+from __future__ import print_function, division
+from collections import defaultdict
+from six import iteritems
+import numpy as np
+
+#: the CAEROx cards that are split into boxes
+PANEL_TYPES = ('CAERO1', 'CAERO3', 'CAERO4', 'CAERO5')
+
+#: the CAEROx cards where x12/x43 are defined in the aero coordinate system
+ACSID_TYPES = ('CAERO1', 'CAERO3')
+
+
+def get_caero_panels(model, caero_ids=None):
+    """
+    Gets the aero boxes of the CAERO panels as flat arrays
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object (must be cross-referenced)
+    caero_ids : List[int]; default=None
+        the CAERO ids to consider; None : all the CAEROx panels
+        CAERO2 bodies are not split into boxes and are skipped
+
+    Returns
+    -------
+    caero_panels : dict
+        caero_ids : (ncaeros, ) int ndarray
+            the CAERO ids; sorted
+        points : (npoints, 3) float ndarray
+            the box corner points in the global frame; the points of
+            each CAERO are stored chordwise-major like
+            ``panel_points_elements``
+        elements : (nboxes, 4) int ndarray
+            the quad connectivity as indices into points
+        box_ids : (nboxes, ) int ndarray
+            the box id of each quad (the same as ``caero.box_ids.flat``)
+        box_caero_ids : (nboxes, ) int ndarray
+            the CAERO id of each box
+        control_surface_labels : List[str]
+            the AESURF labels; sorted by AESURF id
+        control_surface_mask : (nboxes, nsurfaces) bool ndarray
+            is the box part of the AESURF (ALID1 or ALID2)
+    """
+    caeros = _get_panel_caeros(model, caero_ids)
+    ncaeros = len(caeros)
+    eids = np.array([caero.eid for caero in caeros], dtype='int64')
+    nchord, nspan, x, y = _get_divisions(caeros)
+    p1, p2, p3, p4 = _get_corner_points(caeros)
+
+    # the (nchord+1, nspan+1) grid of points of each CAERO
+    nx = nchord + 1
+    ny = nspan + 1
+    npoints_per = nx * ny
+    ipoint0 = _get_offsets(npoints_per)
+    ix0 = _get_offsets(nx)
+    iy0 = _get_offsets(ny)
+
+    icaero = np.repeat(np.arange(ncaeros), npoints_per)
+    ipoint = np.arange(npoints_per.sum()) - ipoint0[icaero]
+    xv = x[ix0[icaero] + ipoint // ny[icaero]][:, np.newaxis]
+    yv = y[iy0[icaero] + ipoint % ny[icaero]][:, np.newaxis]
+    a = xv * p2[icaero] + (1 - xv) * p1[icaero]
+    b = xv * p3[icaero] + (1 - xv) * p4[icaero]
+    points = yv * b + (1 - yv) * a
+
+    # the (nchord, nspan) grid of boxes of each CAERO
+    nboxes_per = nchord * nspan
+    ibox0 = _get_offsets(nboxes_per)
+    icaero = np.repeat(np.arange(ncaeros), nboxes_per)
+    ibox = np.arange(nboxes_per.sum()) - ibox0[icaero]
+    ichord = ibox // nspan[icaero]
+    ispan = ibox % nspan[icaero]
+
+    inode0 = ipoint0[icaero] + ichord * ny[icaero] + ispan
+    inode1 = inode0 + ny[icaero]
+    elements = np.column_stack([inode0, inode1, inode1 + 1, inode0 + 1])
+    box_ids = eids[icaero] + ichord + ispan * nchord[icaero]
+    if box_ids.size and box_ids.max() <= np.iinfo('int32').max:
+        box_ids = box_ids.astype('int32')
+
+    labels, mask = _get_control_surface_mask(model, box_ids)
+    caero_panels = {
+        'caero_ids' : eids,
+        'points' : points,
+        'elements' : elements.astype('int32'),
+        'box_ids' : box_ids,
+        'box_caero_ids' : eids[icaero],
+        'control_surface_labels' : labels,
+        'control_surface_mask' : mask,
+    }
+    return caero_panels
+
+
+def _get_panel_caeros(model, caero_ids):
+    """gets the CAERO1/CAERO3/CAERO4/CAERO5 cards sorted by id"""
+    if caero_ids is None:
+        caeros = [caero for unused_eid, caero in sorted(iteritems(model.caeros))
+                  if caero.type in PANEL_TYPES]
+    else:
+        caeros = [model.CAero(eid) for eid in sorted(caero_ids)]
+        for caero in caeros:
+            if caero.type not in PANEL_TYPES:
+                raise NotImplementedError('%s eid=%s is not split into boxes' % (
+                    caero.type, caero.eid))
+    return caeros
+
+
+def _get_offsets(counts):
+    """gets the index of the first item of each block"""
+    offsets = np.zeros(len(counts), dtype='int64')
+    np.cumsum(counts[:-1], out=offsets[1:])
+    return offsets
+
+
+def _get_divisions(caeros):
+    """
+    Gets the chordwise/spanwise divisions of the CAEROs
+
+    Returns
+    -------
+    nchord / nspan : (ncaeros, ) int ndarray
+        the number of chordwise/spanwise boxes
+    x / y : (sum(nchord+1), ) / (sum(nspan+1), ) float ndarray
+        the stacked chordwise/spanwise fractions of each CAERO; the
+        equally spaced divisions are calculated in batch and the
+        AEFACT (LCHORD/LSPAN) divisions are filled in
+    """
+    nchord = np.zeros(len(caeros), dtype='int64')
+    nspan = np.zeros(len(caeros), dtype='int64')
+    aefact_x = {}
+    aefact_y = {}
+    for i, caero in enumerate(caeros):
+        if caero.type == 'CAERO1':
+            if caero.nchord == 0:
+                aefact_x[i] = caero.lchord_ref.Di
+            if caero.nspan == 0:
+                aefact_y[i] = caero.lspan_ref.Di
+        elif caero.type in ('CAERO4', 'CAERO5') and caero.nspan == 0:
+            aefact_y[i] = caero.lspan_ref.Di
+        nchord[i], nspan[i] = _get_shape(caero)
+
+    x = _get_fractions(nchord, aefact_x)
+    y = _get_fractions(nspan, aefact_y)
+    return nchord, nspan, x, y
+
+
+def _get_shape(caero):
+    """gets the (nchord, nspan) of a CAERO; CAERO5 doesn't define shape"""
+    if caero.type == 'CAERO5':
+        nspan = caero.get_npanel_points_elements()[1]
+        return 1, nspan
+    return caero.shape
+
+
+def _get_fractions(ndivisions, aefacts):
+    """stacks the equally spaced and the AEFACT divisions"""
+    npoints = ndivisions + 1
+    i0 = _get_offsets(npoints)
+    iblock = np.repeat(np.arange(len(ndivisions)), npoints)
+    fractions = (np.arange(npoints.sum()) - i0[iblock]) / ndivisions[iblock]
+    for i, divisions in iteritems(aefacts):
+        fractions[i0[i]:i0[i] + npoints[i]] = divisions
+    return fractions
+
+
+def _get_corner_points(caeros):
+    """
+    Gets the p1/p2/p3/p4 corner points in the global frame.  The points
+    are transformed in batch for each CP, and x12/x43 are transformed in
+    batch for each ACSID (CAERO1/CAERO3) or along the global x-axis
+    (CAERO4/CAERO5).
+    """
+    ncaeros = len(caeros)
+    p1 = np.array([caero.p1 for caero in caeros], dtype='float64').reshape(ncaeros, 3)
+    p4 = np.array([caero.p4 for caero in caeros], dtype='float64').reshape(ncaeros, 3)
+    x12 = np.zeros((ncaeros, 3), dtype='float64')
+    x43 = np.zeros((ncaeros, 3), dtype='float64')
+    x12[:, 0] = [caero.x12 for caero in caeros]
+    x43[:, 0] = [caero.x43 for caero in caeros]
+
+    cp_to_icaeros = defaultdict(list)
+    acsid_to_icaeros = defaultdict(list)
+    for i, caero in enumerate(caeros):
+        cp_to_icaeros[caero.Cp()].append(i)
+        if caero.type in ACSID_TYPES:
+            acsid_to_icaeros[caero.ascid_ref.cid].append(i)
+
+    for cp, icaeros in iteritems(cp_to_icaeros):
+        if cp == 0:
+            continue
+        coord = caeros[icaeros[0]].cp_ref
+        p1[icaeros] = coord.transform_vector_to_global_array(p1[icaeros]) + coord.origin
+        p4[icaeros] = coord.transform_vector_to_global_array(p4[icaeros]) + coord.origin
+
+    for acsid, icaeros in iteritems(acsid_to_icaeros):
+        if acsid == 0:
+            continue
+        coord = caeros[icaeros[0]].ascid_ref
+        x12[icaeros] = coord.transform_vector_to_global_array(x12[icaeros])
+        x43[icaeros] = coord.transform_vector_to_global_array(x43[icaeros])
+    return p1, p1 + x12, p4 + x43, p4
+
+
+def _get_control_surface_mask(model, box_ids):
+    """flags the boxes of the ALID1/ALID2 AELISTs of each AESURF"""
+    aesurfs = [aesurf for unused_aesid, aesurf in sorted(iteritems(model.aesurf))]
+    labels = [aesurf.label for aesurf in aesurfs]
+    mask = np.zeros((len(box_ids), len(aesurfs)), dtype='bool')
+    for i, aesurf in enumerate(aesurfs):
+        elements = list(aesurf.alid1_ref.elements)
+        if aesurf.alid2 is not None:
+            elements += aesurf.alid2_ref.elements
+        mask[:, i] = np.in1d(box_ids, elements)
+    return labels, mask
@@ -6,9 +6,11 @@ defines:
                                   size=8, is_double=False,
                                   remove_collapsed_elements=False,
                                   avoid_collapsed_elements=False,
-                                  crash_on_collapse=False, log=None, debug=True)
+                                  crash_on_collapse=False, log=None, debug=True,
+                                  method='kdtree', nprocs=1, interface_node_sets=None)
 """
 from __future__ import print_function
+import multiprocessing as mp
 from six import iteritems, string_types, PY2
 
 import numpy as np
@@ -27,7 +29,8 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
                           size=8, is_double=False,
                           remove_collapsed_elements=False,
                           avoid_collapsed_elements=False,
-                          crash_on_collapse=False, log=None, debug=True):
+                          crash_on_collapse=False, log=None, debug=True,
+                          method='kdtree', nprocs=1, interface_node_sets=None):
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -71,6 +74,18 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
         bdf debugging
     log : logger(); default=None
         bdf logging
+    method : str; default='kdtree'
+        'kdtree' : build a single kdtree of all the nodes and query the
+                   neq_max closest nodes
+        'bucket' : hash the nodes into tol-sized cells, which are grouped
+                   into blocks that are equivalenced independently (with
+                   a 1 cell halo); neq_max is not used
+    nprocs : int; default=1
+        the number of processes used by method='bucket'
+    interface_node_sets : List[List[int] / (n, ) ndarray]; default=None
+        only equivalence nodes from different sets (e.g., the interface
+        nodes of 2 components); nodes that are not in a set aren't
+        equivalenced
 
     Returns
     -------
@@ -90,11 +105,18 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
     nodes_xyz, model, nids, inew = _eq_nodes_setup(
         bdf_filename, tol, renumber_nodes=renumber_nodes,
         xref=xref, node_set=node_set, debug=debug)
-    ieq, slots = _eq_nodes_build_tree(nodes_xyz, nids, tol,
-                                      inew=inew, node_set=node_set,
-                                      neq_max=neq_max)[1:]
+    if method == 'kdtree':
+        ieq, slots = _eq_nodes_build_tree(nodes_xyz, nids, tol,
+                                          inew=inew, node_set=node_set,
+                                          neq_max=neq_max)[1:]
+        nid_pairs = _eq_nodes_find_pairs(nids, slots, ieq, node_set=node_set)
+    elif method == 'bucket':
+        nid_pairs = _eq_nodes_find_pairs_bucket(nodes_xyz, nids, tol, nprocs=nprocs)
+    else:
+        raise NotImplementedError("method=%r; expected 'kdtree' or 'bucket'" % method)
 
-    nid_pairs = _eq_nodes_find_pairs(nids, slots, ieq, node_set=node_set)
+    if interface_node_sets is not None:
+        nid_pairs = _eq_nodes_filter_interface(nid_pairs, interface_node_sets)
     _eq_nodes_final(nid_pairs, model, tol, node_set=node_set)
 
     if bdf_filename_out is not None:
@@ -265,6 +287,178 @@ def _eq_nodes_find_pairs(nids, slots, ieq, node_set=None):
     return nid_pairs
 
 
+def _eq_nodes_find_pairs_bucket(nodes_xyz, nids, tol, nprocs=1, nblock_cells=None,
+                                nnodes_per_block=100000):
+    """
+    helper function for `bdf_equivalence_nodes`
+
+    The nodes are hashed into tol-sized cells, so any pair of nodes
+    that is within tol lies in the same or an adjacent cell.  The cells
+    are grouped into cubic blocks of nblock_cells per side.  Each block
+    owns the nodes that lie in its cells and borrows the nodes in the
+    1 cell halo around it from the neighboring blocks.  The blocks are
+    independent, so they may be run in parallel.
+
+    Parameters
+    ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyz locations
+    nids : (nnodes, ) int ndarray
+        the node ids
+    tol : float
+        the spherical tolerance
+    nprocs : int; default=1
+        the number of processes
+    nblock_cells : int; default=None
+        the number of cells per side of a block
+        None : size the blocks to hold ~nnodes_per_block nodes
+    nnodes_per_block : int; default=100000
+        the target number of nodes for nblock_cells=None
+
+    Returns
+    -------
+    nid_pairs : List[(nid1, nid2)]
+        the pairs of node ids (nid1 < nid2) that are within tol of
+        each other sorted by nid1, then nid2
+    """
+    assert isinstance(tol, float), 'tol=%r' % tol
+    assert tol > 0., 'tol=%r' % tol
+    nodes_xyz = np.asarray(nodes_xyz, dtype='float64')
+    nids = np.asarray(nids)
+    nnodes = nodes_xyz.shape[0]
+    if nnodes < 2:
+        return []
+
+    xyz_min = nodes_xyz.min(axis=0)
+    icell = np.floor((nodes_xyz - xyz_min) / tol).astype('int64')
+    if nblock_cells is None:
+        ncells_max = icell.max(axis=0) + 1
+        nblocks = max(1., nnodes / float(nnodes_per_block))
+        nblock_cells = int(np.ceil(ncells_max.max() / nblocks ** (1. / 3.)))
+    nblock_cells = max(1, nblock_cells)
+
+    # the owning block of each node; the halo may lie in block -1
+    iblock = icell // nblock_cells
+    nblocks_ijk = iblock.max(axis=0) + 3
+    def _block_key(iblocki):
+        """flattens the (i, j, k) block index"""
+        iblocki = iblocki + 1
+        return (iblocki[:, 0] * nblocks_ijk[1] + iblocki[:, 1]) * nblocks_ijk[2] + iblocki[:, 2]
+    block_key = _block_key(iblock)
+
+    # a node is in the halo of every other block that touches its
+    # adjacent cells
+    block_keys = [block_key]
+    inodes_all = [np.arange(nnodes, dtype='int64')]
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            for dk in (-1, 0, 1):
+                if di == 0 and dj == 0 and dk == 0:
+                    continue
+                block_keyi = _block_key((icell + [di, dj, dk]) // nblock_cells)
+                ihalo = np.where(block_keyi != block_key)[0]
+                if len(ihalo):
+                    block_keys.append(block_keyi[ihalo])
+                    inodes_all.append(ihalo)
+    block_keys = np.hstack(block_keys)
+    inodes_all = np.hstack(inodes_all)
+
+    # sort the (block, node) entries by block and drop the duplicate
+    # halo entries; the owned entries come first, so they're kept
+    block_node_keys, ifirst = np.unique(block_keys * nnodes + inodes_all, return_index=True)
+    block_keys = block_keys[ifirst]
+    inodes_all = inodes_all[ifirst]
+    is_owned_all = ifirst < nnodes
+    isplit = np.where(np.diff(block_keys) != 0)[0] + 1
+
+    blocks = []
+    for inodes, is_owned in zip(np.split(inodes_all, isplit), np.split(is_owned_all, isplit)):
+        if len(inodes) < 2 or not is_owned.any():
+            continue
+        blocks.append((nodes_xyz[inodes, :], inodes, is_owned, tol))
+
+    if nprocs > 1 and len(blocks) > 1:
+        pool = mp.Pool(nprocs)
+        ipairs = pool.map(_eq_nodes_bucket_block, blocks)
+        pool.close()
+        pool.join()
+    else:
+        ipairs = [_eq_nodes_bucket_block(block) for block in blocks]
+
+    ipairs = [ipair for ipair in ipairs if len(ipair)]
+    if not ipairs:
+        return []
+    nid_pairs = np.vstack(ipairs)
+    nid_pairs = nids[nid_pairs]
+    nid_pairs.sort(axis=1)
+    nid_pairs = np.unique(nid_pairs, axis=0)
+    nid_pairs = nid_pairs[nid_pairs[:, 0] != nid_pairs[:, 1], :]
+    return [(nid1, nid2) for nid1, nid2 in nid_pairs.tolist()]
+
+
+def _eq_nodes_bucket_block(block):
+    """
+    Finds the node pairs within a block for `_eq_nodes_find_pairs_bucket`
+
+    Parameters
+    ----------
+    block : (xyz, inodes, is_owned, tol)
+        xyz : (n, 3) float ndarray
+            the xyz locations of the owned and halo nodes
+        inodes : (n, ) int ndarray
+            the global node index
+        is_owned : (n, ) bool ndarray
+            is the node owned by the block
+        tol : float
+            the spherical tolerance
+
+    Returns
+    -------
+    ipairs : (npairs, 2) int ndarray
+        the pairs of global node indices; at least one node of the pair
+        is owned by the block
+    """
+    xyz, inodes, is_owned, tol = block
+    kdt = _get_tree(xyz)
+    ipairs = kdt.query_pairs(tol, output_type='ndarray')
+    if len(ipairs) == 0:
+        return np.zeros((0, 2), dtype=inodes.dtype)
+    ipairs = ipairs[is_owned[ipairs].any(axis=1), :]
+    return inodes[ipairs]
+
+
+def _eq_nodes_filter_interface(nid_pairs, interface_node_sets):
+    """
+    Only keeps the node pairs that span 2 of the node sets
+
+    Parameters
+    ----------
+    nid_pairs : List[(nid1, nid2)]
+        the pairs of node ids
+    interface_node_sets : List[List[int] / (n, ) ndarray]
+        the sets of nodes (e.g., the interface nodes of different
+        components)
+
+    Returns
+    -------
+    nid_pairs : List[(nid1, nid2)]
+        the pairs of node ids that are in different sets
+    """
+    nid_to_iset = {}
+    for iset, node_seti in enumerate(interface_node_sets):
+        for nid in node_seti:
+            nid_to_iset[nid] = iset
+
+    nid_pairs2 = []
+    for (nid1, nid2) in nid_pairs:
+        if nid1 not in nid_to_iset or nid2 not in nid_to_iset:
+            continue
+        if nid_to_iset[nid1] == nid_to_iset[nid2]:
+            continue
+        nid_pairs2.append((nid1, nid2))
+    return nid_pairs2
+
+
 def _eq_nodes_final(nid_pairs, model, tol, node_set=None):
     """apply nodal equivalencing to model"""
     for (nid1, nid2) in nid_pairs:
@@ -2,14 +2,115 @@
 defines:
  - bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None, size=8,
              is_double=False, cards_to_skip=None, log=None, skip_case_control_deck=False)
+ - bdf_merge_streaming(bdf_filenames, bdf_filename_out, encoding=None, size=8,
+                       is_double=False, cards_to_skip=None, log=None)
 """
 from __future__ import print_function
+from codecs import open as codec_open
 from six.moves import StringIO
 from six import string_types, iteritems
+from pyNastran.utils import integer_types
+from pyNastran.bdf.utils import to_fields, parse_executive_control_deck
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
 from pyNastran.bdf.bdf import BDF, read_bdf
 
 
+# the id fields that get offset by bdf_merge_streaming
+# the first entry is the id that is defined by the card (field 1)
+_STREAMING_ID_FIELDS = {
+    # nodes/coords
+    'GRID' : [('nid', 'nid'), ('cp', 'cid'), ('cd', 'cid')],
+    'CORD2R' : [('cid', 'cid'), ('rid', 'cid')],
+    'CORD2C' : [('cid', 'cid'), ('rid', 'cid')],
+    'CORD2S' : [('cid', 'cid'), ('rid', 'cid')],
+    'CORD1R' : [('cid', 'cid'), ('g1', 'nid'), ('g2', 'nid'), ('g3', 'nid')],
+    'CORD1C' : [('cid', 'cid'), ('g1', 'nid'), ('g2', 'nid'), ('g3', 'nid')],
+    'CORD1S' : [('cid', 'cid'), ('g1', 'nid'), ('g2', 'nid'), ('g3', 'nid')],
+
+    # elements
+    'CELAS1' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CELAS2' : [('eid', 'eid'), ('nodes', 'nid')],
+    'CDAMP1' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CDAMP2' : [('eid', 'eid'), ('nodes', 'nid')],
+    'CROD' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CTUBE' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CONROD' : [('eid', 'eid'), ('mid', 'mid'), ('nodes', 'nid')],
+    'CBAR' : [('eid', 'eid'), ('pid', 'pid'), ('ga', 'nid'), ('gb', 'nid'), ('g0', 'nid')],
+    'CBEAM' : [('eid', 'eid'), ('pid', 'pid'), ('ga', 'nid'), ('gb', 'nid'), ('g0', 'nid')],
+    'CBUSH' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('g0', 'nid'),
+               ('cid', 'cid'), ('ocid', 'cid')],
+    'CSHEAR' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CTRIA3' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('theta_mcid', 'cid')],
+    'CQUAD4' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('theta_mcid', 'cid')],
+    'CTRIA6' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('theta_mcid', 'cid')],
+    'CQUAD8' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('theta_mcid', 'cid')],
+    'CTRIAR' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('theta_mcid', 'cid')],
+    'CQUADR' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid'), ('theta_mcid', 'cid')],
+    'CTETRA' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CPYRAM' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CPENTA' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+    'CHEXA' : [('eid', 'eid'), ('pid', 'pid'), ('nodes', 'nid')],
+
+    # masses
+    'CONM1' : [('eid', 'eid'), ('nid', 'nid'), ('cid', 'cid')],
+    'CONM2' : [('eid', 'eid'), ('nid', 'nid'), ('cid', 'cid')],
+
+    # rigid elements
+    'RBAR' : [('eid', 'eid'), ('ga', 'nid'), ('gb', 'nid')],
+    'RBE2' : [('eid', 'eid'), ('gn', 'nid'), ('Gmi', 'nid')],
+    'RBE3' : [('eid', 'eid'), ('refgrid', 'nid'), ('Gijs', 'nid'), ('Gmi', 'nid')],
+
+    # properties
+    'PELAS' : [('pid', 'pid')],
+    'PDAMP' : [('pid', 'pid')],
+    'PBUSH' : [('pid', 'pid')],
+    'PROD' : [('pid', 'pid'), ('mid', 'mid')],
+    'PTUBE' : [('pid', 'pid'), ('mid', 'mid')],
+    'PBAR' : [('pid', 'pid'), ('mid', 'mid')],
+    'PBARL' : [('pid', 'pid'), ('mid', 'mid')],
+    'PBEAM' : [('pid', 'pid'), ('mid', 'mid')],
+    'PBEAML' : [('pid', 'pid'), ('mid', 'mid')],
+    'PSHEAR' : [('pid', 'pid'), ('mid', 'mid')],
+    'PSHELL' : [('pid', 'pid'), ('mid1', 'mid'), ('mid2', 'mid'), ('mid3', 'mid'),
+                ('mid4', 'mid')],
+    'PCOMP' : [('pid', 'pid'), ('mids', 'mid')],
+    'PCOMPG' : [('pid', 'pid'), ('mids', 'mid')],
+    'PSOLID' : [('pid', 'pid'), ('mid', 'mid'), ('cordm', 'cid')],
+
+    # materials
+    'MAT1' : [('mid', 'mid')],
+    'MAT2' : [('mid', 'mid')],
+    'MAT8' : [('mid', 'mid')],
+    'MAT9' : [('mid', 'mid')],
+
+    # constraints
+    'SPC' : [('conid', 'spc_id'), ('gids', 'nid')],
+    'SPC1' : [('conid', 'spc_id'), ('nodes', 'nid')],
+    'SPCADD' : [('conid', 'spc_id'), ('sets', 'spc_id')],
+    'MPC' : [('conid', 'mpc_id'), ('nodes', 'nid')],
+    'MPCADD' : [('conid', 'mpc_id'), ('sets', 'mpc_id')],
+
+    # loads
+    'FORCE' : [('sid', 'load_id'), ('node', 'nid'), ('cid', 'cid')],
+    'MOMENT' : [('sid', 'load_id'), ('node', 'nid'), ('cid', 'cid')],
+    'GRAV' : [('sid', 'load_id'), ('cid', 'cid')],
+    'PLOAD2' : [('sid', 'load_id'), ('eids', 'eid')],
+    'PLOAD4' : [('sid', 'load_id'), ('eids', 'eid'), ('g1', 'nid'), ('g34', 'nid'),
+                ('cid', 'cid')],
+    'LOAD' : [('sid', 'load_id'), ('load_ids', 'load_id')],
+}
+
+# CORD1x cards may define two coordinate systems
+_STREAMING_DEFINING_FIELDS = {
+    'CORD1R' : (1, 5),
+    'CORD1C' : (1, 5),
+    'CORD1S' : (1, 5),
+}
+
+# cards without ids; these are taken from the primary model
+_STREAMING_PRIMARY_CARDS = ['PARAM']
+
+
 def bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None, size=8,
               is_double=False, cards_to_skip=None, log=None, skip_case_control_deck=False):
     """
@@ -182,6 +283,206 @@ def bdf_merge(bdf_filenames, bdf_filename_out=None, renumber=True, encoding=None
                                      mapper_renumber=mapper_renumber)
     return model, mappers_final
 
+def bdf_merge_streaming(bdf_filenames, bdf_filename_out, encoding=None, size=8,
+                        is_double=False, cards_to_skip=None, punch=False, log=None):
+    """
+    Merges multiple BDFs into one file without building the merged model
+
+    Unlike ``bdf_merge``, the models are never fully built or cross
+    referenced.  A lightweight pre-scan finds the maximum id of each
+    id type (e.g., nid, eid) in each deck, which defines a constant id
+    offset per deck.  The cards are then parsed one card type at a
+    time, offset and written directly to the output file.  Peak memory
+    use is set by the lines of one input deck and the cards of its
+    largest card type rather than by the sum of all the models.
+
+    Parameters
+    ----------
+    bdf_filenames : List[str]
+        list of bdf filenames
+    bdf_filename_out : str
+        the output bdf filename
+    encoding : str
+        the unicode encoding (default=None; system default)
+    size : int; {8, 16}; default=8
+        the bdf write precision
+    is_double : bool; default=False
+        the field precision to write
+    cards_to_skip : List[str]; (default=None -> don't skip any cards)
+        cards that are dropped from the merged deck
+    punch : bool; default=False
+        are the input decks punch files
+    log : logger; default=None
+        a logger object
+
+    Returns
+    --------
+    offsets_all : List[Dict[str, int]]
+        the id offset for each deck; new_id = old_id + offset
+        keys : nid, eid, pid, mid, cid, spc_id, mpc_id, load_id
+
+    The executive/case control decks and PARAMs of the first deck are
+    used.  Coordinate system 0 is never offset.
+
+    Supports
+    --------
+      nodes:       GRID
+      coords:      CORD1x, CORD2x
+      elements:    CELAS1, CELAS2, CDAMP1, CDAMP2, CROD, CTUBE, CONROD,
+                   CBAR, CBEAM, CBUSH, CSHEAR, CTRIA3, CQUAD4, CTRIA6,
+                   CQUAD8, CTRIAR, CQUADR, CTETRA, CPYRAM, CPENTA, CHEXA,
+                   CONM1, CONM2, RBAR, RBE2, RBE3
+      properties:  PELAS, PDAMP, PBUSH, PROD, PTUBE, PBAR, PBARL, PBEAM,
+                   PBEAML, PSHEAR, PSHELL, PCOMP, PCOMPG, PSOLID
+      materials:   MAT1, MAT2, MAT8, MAT9
+      constraints: SPC, SPC1, SPCADD, MPC, MPCADD
+      loads:       FORCE, MOMENT, GRAV, PLOAD2, PLOAD4, LOAD
+
+    .. warning:: unsupported cards must be passed in with cards_to_skip
+    """
+    if not isinstance(bdf_filenames, (list, tuple)):
+        raise TypeError('bdf_filenames is not a list/tuple...%s' % str(bdf_filenames))
+    if not len(bdf_filenames) > 1:
+        raise RuntimeError("You can't merge one BDF...bdf_filenames=%s" % str(bdf_filenames))
+    if cards_to_skip is None:
+        cards_to_skip = []
+
+    id_types = ['nid', 'eid', 'pid', 'mid', 'cid', 'spc_id', 'mpc_id', 'load_id']
+    offsets_all = []
+    offsets = {id_type : 0 for id_type in id_types}
+    for bdf_filename in bdf_filenames:
+        max_ids = _get_max_ids_streaming(bdf_filename, encoding, punch, cards_to_skip, log)
+        offsets_all.append(offsets)
+        offsets = {id_type : offset + max_ids[id_type]
+                   for id_type, offset in iteritems(offsets)}
+
+    with codec_open(bdf_filename_out, 'w', encoding=encoding) as bdf_file:
+        for i, (bdf_filename, offsets) in enumerate(zip(bdf_filenames, offsets_all)):
+            model, cards = _get_cards_streaming(bdf_filename, encoding, punch, log,
+                                                is_primary=i == 0)
+            if i == 0:
+                model.log.info('primary=%s' % bdf_filename)
+                if not model.punch:
+                    model._write_executive_control_deck(bdf_file)
+                    model._write_case_control_deck(bdf_file)
+            else:
+                model.log.info('secondary=%s' % bdf_filename)
+
+            bdf_file.write('$ %s\n' % bdf_filename)
+            for card_name in sorted(cards.keys()):
+                card_list = cards.pop(card_name)
+                if card_name in cards_to_skip or card_name == 'ENDDATA':
+                    continue
+                if card_name in _STREAMING_PRIMARY_CARDS:
+                    if i > 0:
+                        continue
+                elif card_name not in _STREAMING_ID_FIELDS:
+                    msg = '%s is not supported by bdf_merge_streaming; add it to cards_to_skip' % (
+                        card_name)
+                    raise NotImplementedError(msg)
+
+                for comment, card_lines in card_list:
+                    model.add_card(card_lines, card_name, comment=comment,
+                                   is_list=False, has_none=False)
+                del card_list
+                model.pop_parse_errors()
+                _write_card_type_streaming(model, card_name, offsets, bdf_file,
+                                           size, is_double)
+        bdf_file.write('ENDDATA\n')
+    return offsets_all
+
+def _get_cards_streaming(bdf_filename, encoding, punch, log, is_primary=False):
+    """
+    Gets the unparsed bulk data cards of a deck grouped by card type
+
+    Returns
+    -------
+    model : BDF
+        an empty model used to parse the cards; the executive and case
+        control decks are loaded for the primary model
+    cards : Dict[str] = List[[comment, card_lines], ...]
+        the unparsed cards
+    """
+    model = BDF(debug=False, log=log)
+    model._read_bdf_helper(bdf_filename, encoding, punch, True)
+    model._parse_primary_file_header(bdf_filename)
+    out = model._get_lines(bdf_filename)
+    system_lines, executive_control_lines, case_control_lines, bulk_data_lines = out
+    del out
+
+    if is_primary and not model.punch:
+        from pyNastran.bdf.case_control_deck import CaseControlDeck
+        model.system_command_lines = system_lines
+        model.executive_control_lines = executive_control_lines
+        sol, method, sol_iline = parse_executive_control_deck(executive_control_lines)
+        model.update_solution(sol, method, sol_iline)
+        model.case_control_deck = CaseControlDeck(case_control_lines, model.log)
+
+    cards = model.get_bdf_cards_dict(bulk_data_lines)[0]
+    return model, cards
+
+def _get_max_ids_streaming(bdf_filename, encoding, punch, cards_to_skip, log):
+    """
+    Gets the maximum id of each id type without building card objects
+
+    Only the id defined by the card (e.g., the nid on a GRID) is
+    considered.
+    """
+    max_ids = {
+        'nid' : 0, 'eid' : 0, 'pid' : 0, 'mid' : 0, 'cid' : 0,
+        'spc_id' : 0, 'mpc_id' : 0, 'load_id' : 0,
+    }
+    cards = _get_cards_streaming(bdf_filename, encoding, punch, log)[1]
+    for card_name, card_list in iteritems(cards):
+        if card_name in cards_to_skip or card_name not in _STREAMING_ID_FIELDS:
+            continue
+        id_type = _STREAMING_ID_FIELDS[card_name][0][1]
+        ifields = _STREAMING_DEFINING_FIELDS.get(card_name, (1,))
+        max_id = max_ids[id_type]
+        for unused_comment, card_lines in card_list:
+            fields = to_fields(card_lines, card_name)
+            for ifield in ifields:
+                if ifield >= len(fields):
+                    continue
+                field = fields[ifield].strip()
+                if field:
+                    max_id = max(max_id, int(field))
+        max_ids[id_type] = max_id
+    return max_ids
+
+def _write_card_type_streaming(model, card_name, offsets, bdf_file, size, is_double):
+    """offsets and writes all the cards of one type and clears them from the model"""
+    slot_name = model._type_to_slot_map[card_name]
+    slot = getattr(model, slot_name)
+    if isinstance(slot, dict):
+        cards = []
+        for value in slot.values():
+            if isinstance(value, list):
+                cards.extend(value)
+            else:
+                cards.append(value)
+        slot.clear()
+    else:
+        cards = slot[:]
+        del slot[:]
+
+    id_fields = _STREAMING_ID_FIELDS.get(card_name, [])
+    for card in cards:
+        if slot_name == 'coords' and card.cid == 0:
+            continue
+        for attr, id_type in id_fields:
+            value = getattr(card, attr)
+            setattr(card, attr, _offset_id(value, offsets[id_type]))
+        bdf_file.write(card.write_card(size, is_double))
+
+def _offset_id(value, offset):
+    """offsets an id, a list of ids or a list of lists of ids; 0/None/floats are skipped"""
+    if isinstance(value, list):
+        return [_offset_id(valuei, offset) for valuei in value]
+    if isinstance(value, integer_types) and value > 0:
+        return value + offset
+    return value
+
 def _assemble_mapper(mappers, mapper_0, data_members, mapper_renumber=None):
     """
     Assemble final mappings from all original ids to the ids in the merged and possibly
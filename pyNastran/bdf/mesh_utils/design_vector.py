@@ -0,0 +1,386 @@
+"""
+defines:
+ - design_map = get_design_vector_map(model)
+ - design = apply_design_vector(model, desvar_values, design_map=None)
+
+Updates the properties/materials for a new design vector.  The map is
+built once per model, so an optimization loop only pays for:
+  - a sparse matrix product for the DLINK/DVPREL1/DVMREL1 linear terms
+  - one ``DEQATN.evaluate_array`` call per DEQATN for the DVPREL2/DVMREL2s
+  - the write-back to the property/material cards
+
+Supports:
+  - DESVAR bounds (XLB/XUB) and DLINK dependent design variables
+  - DVPREL1, DVPREL2, DVMREL1, DVMREL2
+"""
+from __future__ import print_function
+import re
+from collections import defaultdict
+
+from six import iteritems, string_types
+import numpy as np
+import scipy.sparse
+
+from pyNastran.utils import integer_types
+
+#: the default PMIN/MPMIN for a field that may not be negative
+DEFAULT_MIN_POSITIVE = 1.0e-15
+#: the default PMIN/MPMIN for a field that may be negative
+DEFAULT_MIN_NEGATIVE = -1.0e35
+
+#: the stress recovery points, which use a default PMIN of -1.0E35
+STRESS_RECOVERY_NAMES = ('C1', 'C2', 'D1', 'D2', 'E1', 'E2', 'F1', 'F2')
+
+#: the material properties that may be negative, so they use a default
+#: MPMIN of -1.0E35 (e.g., the coefficient of thermal expansion)
+NEGATIVE_MATERIAL_NAMES = (
+    'NU', 'NU12', 'NUTH', 'NUXTH', 'NUTHZ', 'NUZX',
+    'A', 'A1', 'A2', 'A3', 'TREF',
+    'G12', 'G13', 'G23',
+)
+
+#: the PNAME/MPNAME that don't match the attribute name
+FIELD_ALIASES = {
+    ('PELAS', 'K1') : 'k',
+    ('PELAS', 'GE1') : 'ge',
+    ('PELAS', 'S1') : 's',
+    ('PSHELL', '12I/T**3') : 'twelveIt3',
+    ('PSHELL', 'TS/T') : 'tst',
+    ('MAT8', 'E1') : 'e11',
+    ('MAT8', 'E2') : 'e22',
+}
+
+
+def get_design_vector_map(model):
+    """
+    Builds the map from the design variables to the property/material
+    fields, which may be reused for many design vectors
+
+    Parameters
+    ----------
+    model : BDF()
+        the model with the DESVAR/DLINK/DVPRELx/DVMRELx cards
+
+    Returns
+    -------
+    design_map : Dict[str] = varies
+        desvar_ids : (ndesvars, ) int ndarray
+            the sorted DESVAR ids, which define the desvar_values order
+        xinit / xlb / xub : (ndesvars, ) float ndarray
+            the initial value and bounds of the DESVARs
+        dlink : (ndesvars, ndesvars) csr_matrix, dlink_c0 : (ndesvars, ) float ndarray
+            x_dependent = dlink_c0 + dlink * x (0 for independent DESVARs)
+        is_dependent : (ndesvars, ) bool ndarray
+            is the DESVAR defined by a DLINK
+        oid / card_type : (nfields, ) int/str ndarray
+            the DVPRELx/DVMRELx id and card type
+        linear : (nfields, ndesvars) csr_matrix, c0 : (nfields, ) float ndarray
+            the DVPREL1/DVMREL1 terms (0 for the DVxREL2 rows)
+        equations : List[(deqatn, irows, idesvars, constants)]
+            the DVPREL2/DVMREL2s grouped by DEQATN, where each
+            argument is ``x[idesvars[iarg]] + constants[iarg]``
+        p_min / p_max : (nfields, ) float ndarray
+            the bounds on the property/material values
+        targets : List[(card, attr, index)]
+            the fields to update
+    """
+    desvar_ids = np.array(sorted(model.desvars), dtype='int32')
+    ndesvars = len(desvar_ids)
+    desvars = [model.desvars[desvar_id] for desvar_id in desvar_ids]
+    xinit = np.array([desvar.xinit for desvar in desvars], dtype='float64')
+    xlb = np.array([desvar.xlb for desvar in desvars], dtype='float64')
+    xub = np.array([desvar.xub for desvar in desvars], dtype='float64')
+
+    # the dependent design variables
+    rows = []
+    cols = []
+    coeffs = []
+    dlink_c0 = np.zeros(ndesvars, dtype='float64')
+    is_dependent = np.zeros(ndesvars, dtype='bool')
+    for unused_oid, dlink in sorted(iteritems(model.dlinks)):
+        irow = _get_desvar_index(desvar_ids, dlink.ddvid, dlink)
+        is_dependent[irow] = True
+        dlink_c0[irow] = dlink.c0
+        for desvar_id, coeff in zip(dlink.IDv, dlink.Ci):
+            rows.append(irow)
+            cols.append(_get_desvar_index(desvar_ids, desvar_id, dlink))
+            coeffs.append(dlink.cmult * coeff)
+    dlink_matrix = scipy.sparse.csr_matrix(
+        (coeffs, (rows, cols)), shape=(ndesvars, ndesvars), dtype='float64')
+
+    dvxrels = (
+        [dvprel for unused_oid, dvprel in sorted(iteritems(model.dvprels))] +
+        [dvmrel for unused_oid, dvmrel in sorted(iteritems(model.dvmrels))])
+    nfields = len(dvxrels)
+    oid = np.zeros(nfields, dtype='int32')
+    card_type = np.zeros(nfields, dtype='|U8')
+    c0 = np.zeros(nfields, dtype='float64')
+    p_min = np.zeros(nfields, dtype='float64')
+    p_max = np.zeros(nfields, dtype='float64')
+    targets = []
+
+    rows = []
+    cols = []
+    coeffs = []
+    # equation_groups[equation_id] = [(irow, idesvars, constants), ...]
+    equation_groups = defaultdict(list)
+    for irow, dvxrel in enumerate(dvxrels):
+        oid[irow] = dvxrel.oid
+        card_type[irow] = dvxrel.type
+        if dvxrel.type in ['DVPREL1', 'DVPREL2']:
+            card, name = _get_dvprel_card(model, dvxrel), dvxrel.pname_fid
+            p_mini, p_maxi = dvxrel.p_min, dvxrel.p_max
+            default_min = _get_default_pmin(name)
+        else:
+            card, name = model.materials[dvxrel.Mid()], dvxrel.mp_name
+            p_mini, p_maxi = dvxrel.mp_min, dvxrel.mp_max
+            default_min = _get_default_mpmin(name)
+        targets.append(_get_field_target(card, name, dvxrel))
+        p_min[irow] = default_min if p_mini is None else p_mini
+        p_max[irow] = 1e20 if p_maxi is None else p_maxi
+
+        if dvxrel.type in ['DVPREL1', 'DVMREL1']:
+            c0[irow] = dvxrel.c0
+            desvar_idsi = dvxrel.desvar_ids if dvxrel.type == 'DVPREL1' else dvxrel.dvids
+            for desvar_id, coeff in zip(desvar_idsi, dvxrel.coeffs):
+                rows.append(irow)
+                cols.append(_get_desvar_index(desvar_ids, desvar_id, dvxrel))
+                coeffs.append(coeff)
+        else:
+            # the DEQATN arguments are the DESVARs and then the DTABLEs
+            idesvars = [_get_desvar_index(desvar_ids, _get_desvar_id(desvar_id), dvxrel)
+                        for desvar_id in dvxrel.dvids]
+            constants = [0.] * len(idesvars)
+            for label in dvxrel.labels:
+                idesvars.append(-1)
+                constants.append(model.dtable[label])
+            equation_groups[dvxrel.DEquation()].append((irow, idesvars, constants))
+
+    linear = scipy.sparse.csr_matrix(
+        (coeffs, (rows, cols)), shape=(nfields, ndesvars), dtype='float64')
+
+    equations = []
+    for equation_id, group in sorted(iteritems(equation_groups)):
+        deqatn = model.dequations[equation_id]
+        if not hasattr(deqatn, 'func_array'):
+            deqatn._setup_equation()
+        nargs = set(len(idesvars) for unused_irow, idesvars, unused_constants in group)
+        if len(nargs) != 1:
+            oids = [oid[irow] for irow, unused_idesvars, unused_constants in group]
+            msg = 'DEQATN=%s has an inconsistent number of arguments (%s); oids=%s' % (
+                equation_id, sorted(nargs), oids)
+            raise RuntimeError(msg)
+        irows = np.array([irow for irow, unused_idesvars, unused_constants in group])
+        # (nargs, ngroup); -1 points to the zero padding of x
+        idesvars = np.array([idesvarsi for unused_irow, idesvarsi, unused_constants in group],
+                            dtype='int32').T
+        constants = np.array([constantsi for unused_irow, unused_idesvars, constantsi in group],
+                             dtype='float64').T
+        equations.append((deqatn, irows, idesvars, constants))
+
+    design_map = {
+        'desvar_ids' : desvar_ids,
+        'xinit' : xinit,
+        'xlb' : xlb,
+        'xub' : xub,
+        'dlink' : dlink_matrix,
+        'dlink_c0' : dlink_c0,
+        'is_dependent' : is_dependent,
+        'oid' : oid,
+        'card_type' : card_type,
+        'linear' : linear,
+        'c0' : c0,
+        'equations' : equations,
+        'p_min' : p_min,
+        'p_max' : p_max,
+        'targets' : targets,
+    }
+    return design_map
+
+
+def apply_design_vector(model, desvar_values, design_map=None):
+    """
+    Updates the properties/materials for a new design vector
+
+    Parameters
+    ----------
+    model : BDF()
+        the model to update
+    desvar_values : Dict[int] = float / (ndesvars, ) float ndarray
+        the design variables as a {desvar_id : value} dictionary, where
+        missing DESVARs use XINIT, or as an array in
+        ``design_map['desvar_ids']`` order
+    design_map : Dict[str] = varies; default=None -> build it
+        the output of ``get_design_vector_map``; reuse it when applying
+        many design vectors to the same model
+
+    Returns
+    -------
+    design : Dict[str] = ndarray
+        desvar_ids : (ndesvars, ) int ndarray
+            the DESVAR ids
+        desvar_values : (ndesvars, ) float ndarray
+            the design variables after the bounds/DLINKs are applied
+        oid : (nfields, ) int ndarray
+            the DVPRELx/DVMRELx ids
+        card_type : (nfields, ) str ndarray
+            the DVPRELx/DVMRELx card type
+        value : (nfields, ) float ndarray
+            the updated property/material values
+
+    The design variables are limited to [XLB, XUB] and the property
+    values to [PMIN, PMAX].  As in Nastran, a blank PMIN defaults to
+    1.0E-15, so fields that may be negative (e.g., PCOMP Z0) need an
+    explicit PMIN; the stress recovery points and the material
+    properties that may be negative use -1.0E35.
+    """
+    if design_map is None:
+        design_map = get_design_vector_map(model)
+    desvar_ids = design_map['desvar_ids']
+
+    if isinstance(desvar_values, dict):
+        x = design_map['xinit'].copy()
+        for desvar_id, value in iteritems(desvar_values):
+            x[_get_desvar_index(desvar_ids, desvar_id, 'desvar_values')] = value
+    else:
+        x = np.array(desvar_values, dtype='float64')
+        if x.shape != desvar_ids.shape:
+            raise ValueError('desvar_values.shape=%s; expected=%s' % (
+                str(x.shape), str(desvar_ids.shape)))
+
+    xlb = design_map['xlb']
+    xub = design_map['xub']
+    x = np.clip(x, xlb, xub)
+    is_dependent = design_map['is_dependent']
+    if is_dependent.any():
+        x_dependent = design_map['dlink_c0'] + design_map['dlink'].dot(x)
+        x = np.where(is_dependent, np.clip(x_dependent, xlb, xub), x)
+
+    values = design_map['c0'] + design_map['linear'].dot(x)
+    x_padded = np.hstack([x, 0.])
+    for deqatn, irows, idesvars, constants in design_map['equations']:
+        args = x_padded[idesvars] + constants
+        values[irows] = deqatn.evaluate_array(*args)
+    values = np.clip(values, design_map['p_min'], design_map['p_max'])
+
+    for (card, attr, index), value in zip(design_map['targets'], values.tolist()):
+        if index is None:
+            setattr(card, attr, value)
+            continue
+        obj = getattr(card, attr)
+        for i in index[:-1]:
+            obj = obj[i]
+        obj[index[-1]] = value
+
+    design = {
+        'desvar_ids' : desvar_ids,
+        'desvar_values' : x,
+        'oid' : design_map['oid'],
+        'card_type' : design_map['card_type'],
+        'value' : values,
+    }
+    return design
+
+
+def _get_desvar_id(desvar):
+    """gets the id of a DESVAR or an integer"""
+    if isinstance(desvar, integer_types):
+        return desvar
+    return desvar.desvar_id
+
+
+def _get_desvar_index(desvar_ids, desvar_id, card):
+    """gets the index of a DESVAR"""
+    idesvar = np.searchsorted(desvar_ids, desvar_id)
+    if idesvar == len(desvar_ids) or desvar_ids[idesvar] != desvar_id:
+        raise KeyError('DESVAR=%s does not exist, which is required by %s' % (
+            desvar_id, str(card).rstrip()))
+    return idesvar
+
+
+def _get_dvprel_card(model, dvprel):
+    """gets the property card that a DVPREL1/DVPREL2 updates"""
+    pid = dvprel.Pid()
+    if pid in model.properties:
+        return model.properties[pid]
+    if pid in model.properties_mass:
+        return model.properties_mass[pid]
+    raise KeyError('pid=%s does not exist, which is required by %s' % (
+        pid, str(dvprel).rstrip()))
+
+
+def _get_default_pmin(pname_fid):
+    """gets the DVPRELx PMIN default"""
+    if isinstance(pname_fid, string_types):
+        name = pname_fid.split('(')[0]
+        if name in STRESS_RECOVERY_NAMES:
+            return DEFAULT_MIN_NEGATIVE
+    return DEFAULT_MIN_POSITIVE
+
+
+def _get_default_mpmin(mp_name):
+    """gets the DVMRELx MPMIN default"""
+    if mp_name in NEGATIVE_MATERIAL_NAMES:
+        return DEFAULT_MIN_NEGATIVE
+    return DEFAULT_MIN_POSITIVE
+
+
+def _get_field_target(card, name, dvxrel):
+    """
+    Gets the attribute to update for a PNAME/FID or MPNAME
+
+    Returns
+    -------
+    target : (card, attr, index)
+        the card, the attribute name, and the index into the
+        attribute (None for a scalar attribute)
+    """
+    if isinstance(name, integer_types):
+        field_map = getattr(card, '_field_map', {})
+        if name in field_map:
+            return card, field_map[name], None
+        msg = '%s pname_fid=%s is not supported for %s' % (
+            dvxrel.type, name, card.type)
+        raise NotImplementedError(msg)
+
+    # PBEAM/PBEAML end A/B (e.g., I1(B))
+    iend = None
+    match = re.match(r'^(.+)\((A|B)\)$', name)
+    if match:
+        name, end = match.groups()
+        iend = 0 if end == 'A' else -1
+
+    key = (card.type, name)
+    if key in FIELD_ALIASES:
+        return card, FIELD_ALIASES[key], None
+
+    match = re.match(r'^(T|THETA|DIM)(\d+)$', name)
+    if match and card.type in ['PCOMP', 'PCOMPG', 'PBARL', 'PBEAML']:
+        word, i = match.groups()
+        attr = {'T' : 'thicknesses', 'THETA' : 'thetas', 'DIM' : 'dim'}[word]
+        index = int(i) - 1
+        if card.type == 'PBEAML':
+            return card, attr, (0 if iend is None else iend, index)
+        return card, attr, (index, )
+
+    attr = None
+    lower_name = name.lower()
+    for attri in getattr(card, '_field_map', {}).values():
+        if attri.lower() == lower_name:
+            attr = attri
+            break
+    if attr is None:
+        # the lowercase name is preferred to skip methods (e.g., PBEAM.I1())
+        for attri in [lower_name, name]:
+            if hasattr(card, attri) and not callable(getattr(card, attri)):
+                attr = attri
+                break
+    if attr is None:
+        msg = '%s pname=%r is not supported for %s' % (dvxrel.type, name, card.type)
+        raise NotImplementedError(msg)
+
+    value = getattr(card, attr)
+    if isinstance(value, (list, np.ndarray)):
+        # PBEAM; the unsuffixed names refer to end A
+        return card, attr, (0 if iend is None else iend, )
+    return card, attr, None
@@ -0,0 +1,76 @@
+"""
+defines:
+ - benchmark_convert(bdf_filename, units_from, units_to, nrepeat=3, log=None)
+
+Compares the card-by-card and vectorized unit conversion
+(``convert(..., vectorize=False/True)``).
+
+Usage:
+    python benchmark_convert.py BDF_FILENAME [NREPEAT]
+"""
+from __future__ import print_function
+import sys
+import time
+from six import StringIO
+
+from pyNastran.bdf.bdf import read_bdf
+from pyNastran.bdf.mesh_utils.convert import convert
+
+
+def benchmark_convert(bdf_filename, units_from, units_to, nrepeat=3, log=None):
+    """
+    Times the card-by-card and vectorized unit conversions and checks
+    that they give the same deck
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the model to convert
+    units_from / units_to : List[str]
+        [length, mass, time]
+    nrepeat : int; default=3
+        the number of times to convert the model; the fastest run is used
+    log : logger; default=None
+        a logger object
+
+    Returns
+    -------
+    times : Dict[bool] = float
+        the fastest conversion time (sec) for vectorize=False/True
+    """
+    times = {}
+    decks = {}
+    for vectorize in [False, True]:
+        dts = []
+        for unused_i in range(nrepeat):
+            model = read_bdf(bdf_filename, validate=False, log=log, debug=None)
+            time0 = time.time()
+            convert(model, units_to, units=units_from, vectorize=vectorize)
+            dts.append(time.time() - time0)
+
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        decks[vectorize] = bdf_file.getvalue()
+        times[vectorize] = min(dts)
+
+    if decks[False] != decks[True]:
+        raise RuntimeError('the vectorized conversion of %r is different' % bdf_filename)
+
+    print('nnodes=%s nelements=%s' % (len(model.nodes), len(model.elements)))
+    print('  card-by-card: %.4f sec' % times[False])
+    print('  vectorized:   %.4f sec' % times[True])
+    print('  speedup:      %.2fx' % (times[False] / times[True]))
+    return times
+
+
+def main():  # pragma: no cover
+    """the interface for benchmark_convert"""
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    bdf_filename = sys.argv[1]
+    nrepeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    benchmark_convert(bdf_filename, ['in', 'lbm', 's'], ['m', 'kg', 's'], nrepeat=nrepeat)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
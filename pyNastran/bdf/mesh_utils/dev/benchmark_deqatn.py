@@ -0,0 +1,76 @@
+"""
+defines:
+ - benchmark_deqatn(eqs, npoints=1000000, nrepeat=3)
+
+Compares the scalar (``DEQATN.evaluate``) and array
+(``DEQATN.evaluate_array``) DEQATN evaluation for a sweep.
+
+Usage:
+    python benchmark_deqatn.py [NPOINTS]
+"""
+from __future__ import print_function
+import sys
+import time
+
+import numpy as np
+from pyNastran.bdf.bdf import BDF
+
+
+def benchmark_deqatn(eqs, npoints=1000000, nrepeat=3):
+    """
+    Times the scalar and array DEQATN evaluations and checks that they
+    give the same result
+
+    Parameters
+    ----------
+    eqs : List[str]
+        the DEQATN equations (e.g., ['f(a,b)=rss(a,b)'])
+    npoints : int; default=1000000
+        the number of points in the sweep
+    nrepeat : int; default=3
+        the number of times to evaluate the array version;
+        the fastest run is used
+
+    Returns
+    -------
+    times : Dict[str] = float
+        the evaluation time (sec) for scalar/array
+    """
+    model = BDF(debug=None)
+    deqatn = model.add_deqatn(1, eqs)
+    model.cross_reference()
+
+    args = [np.linspace(1., 2., num=npoints) + i for i in range(deqatn.nargs)]
+
+    time0 = time.time()
+    func = deqatn.evaluate
+    values_scalar = np.array([func(*argsi) for argsi in zip(*args)])
+    dt_scalar = time.time() - time0
+
+    dts = []
+    for unused_i in range(nrepeat):
+        time0 = time.time()
+        values_array = deqatn.evaluate_array(*args)
+        dts.append(time.time() - time0)
+    dt_array = min(dts)
+
+    if not np.allclose(values_scalar, values_array):
+        raise RuntimeError('the array evaluation of %s is different' % eqs)
+
+    print('npoints=%s eqs=%s' % (npoints, eqs))
+    print('  scalar: %.4f sec' % dt_scalar)
+    print('  array:  %.4f sec' % dt_array)
+    print('  speedup: %.1fx' % (dt_scalar / dt_array))
+    return {'scalar' : dt_scalar, 'array' : dt_array}
+
+
+def main():  # pragma: no cover
+    """the interface for benchmark_deqatn"""
+    npoints = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    benchmark_deqatn(['f(a,b,c)=rss(a,b,c)+avg(a,b)-dim(a,c)+sin(a*b)/c'], npoints=npoints)
+    benchmark_deqatn(['f1(a,b,c,d,r)=a+b*c-(d**3+10.0)+sin(pi(1)*r)+a**2/(b-c)',
+                      'f=a+b-f1*d'], npoints=npoints)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,274 @@
+"""
+defines:
+ - dofs, load_matrix = get_dynamic_load_matrix(
+       model, dload_id, freqs_or_times, loadset_id=None, is_sparse=False)
+
+Assembles the DLOAD/RLOADx/TLOADx/ACSRCE excitations into a
+(ndof, nfreq) complex or (ndof, ntime) real load matrix.
+"""
+from __future__ import print_function
+from six import iteritems
+import numpy as np
+import scipy.sparse
+
+#: the dynamic load cards that are evaluated in the frequency domain
+FREQUENCY_LOADS = ('RLOAD1', 'RLOAD2', 'ACSRCE')
+
+#: the dynamic load cards that are evaluated in the time domain
+TIME_LOADS = ('TLOAD1', 'TLOAD2')
+
+#: the component offset for the static loads that are expanded by an LSEQ
+STATIC_LOAD_COMPONENTS = {
+    'FORCE' : 1, 'FORCE1' : 1, 'FORCE2' : 1,
+    'MOMENT' : 4, 'MOMENT1' : 4, 'MOMENT2' : 4,
+}
+
+
+def get_dynamic_load_matrix(model, dload_id, freqs_or_times,
+                            loadset_id=None, is_sparse=False):
+    """
+    Builds the load matrix for a DLOAD (or RLOADx/TLOADx/ACSRCE) id
+
+    Frequency domain (RLOAD1, RLOAD2, ACSRCE; f in cycles/time)::
+
+      RLOAD1 : {A} [C(f) + iD(f)] e^(i(theta - 2*pi*f*tau))
+      RLOAD2 : {A} B(f) e^(i(phi(f) + theta - 2*pi*f*tau))
+      ACSRCE : {A} 1/(2*pi*f) sqrt(8*pi*c*P(f)/rho) e^(i(theta + 2*pi*f*tau));  c = sqrt(B/rho)
+
+    Time domain (TLOAD1, TLOAD2)::
+
+      TLOAD1 : {A} F(t - tau)
+      TLOAD2 : {A} t2^B e^(C t2) cos(2*pi*F t2 + P);  t2 = t - T1 - tau
+               for 0 <= t2 <= T2 - T1 and 0 otherwise
+
+    {A} comes from the DAREA and the static loads of the LSEQs with
+    the same EXCITEID.  theta (DPHASE) and tau (DELAY) are given per
+    degree of freedom.
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    dload_id : int
+        the DLOAD=ID in the case control deck; may also directly
+        reference the RLOADx/TLOADx/ACSRCE cards
+    freqs_or_times : (nfreq, ) / (ntime, ) float ndarray
+        the frequencies (for RLOADx/ACSRCE) or times (for TLOADx)
+    loadset_id : int; default=None
+        the LOADSET=ID in the case control deck, which selects the
+        LSEQs; None : all the LSEQs are considered
+    is_sparse : bool; default=False
+        return a scipy.sparse.csr_matrix instead of a dense array
+
+    Returns
+    -------
+    dofs : (ndof, 2) int ndarray
+        the (node_id, component) of the rows; sorted
+    load_matrix : (ndof, nfreq) complex ndarray / (ndof, ntime) float ndarray
+        the excitation
+
+    .. note:: FORCE/MOMENT loads are expanded in the basic frame
+    .. note:: the Type (LOAD/DISP/VELO/ACCE) of the card is not
+              considered, so enforced motion is returned as a load
+    """
+    x = np.atleast_1d(np.asarray(freqs_or_times, dtype='float64'))
+    dloads, scale_factors = model.get_reduced_dloads(dload_id)
+    load_types = set([dload.type for dload in dloads])
+    unsupported_types = load_types.difference(FREQUENCY_LOADS + TIME_LOADS)
+    if unsupported_types:
+        raise NotImplementedError('dload_id=%s; unsupported dynamic loads=%s' % (
+            dload_id, sorted(unsupported_types)))
+    is_frequency = bool(load_types.intersection(FREQUENCY_LOADS))
+    if is_frequency and load_types.intersection(TIME_LOADS):
+        raise RuntimeError('dload_id=%s mixes frequency and time dependent loads; %s' % (
+            dload_id, sorted(load_types)))
+    dtype = 'complex128' if is_frequency else 'float64'
+
+    excitations = {}
+    dof_blocks = []
+    blocks = []
+    for dload, scale in zip(dloads, scale_factors):
+        if dload.excite_id not in excitations:
+            excitations[dload.excite_id] = _get_excitation(
+                model, dload.excite_id, loadset_id)
+        dofs, amplitudes = excitations[dload.excite_id]
+        if dload.type == 'RLOAD1':
+            block = _rload1(model, dload, dofs, x)
+        elif dload.type == 'RLOAD2':
+            block = _rload2(model, dload, dofs, x)
+        elif dload.type == 'ACSRCE':
+            block = _acsrce(model, dload, dofs, x)
+        elif dload.type == 'TLOAD1':
+            block = _tload1(model, dload, dofs, x)
+        else:
+            block = _tload2(model, dload, dofs, x)
+        dof_blocks.append(dofs)
+        blocks.append((scale * amplitudes)[:, np.newaxis] * block)
+
+    all_dofs = np.vstack(dof_blocks)
+    dofs, irows = np.unique(all_dofs, axis=0, return_inverse=True)
+    irows = irows.ravel()
+    data = np.vstack(blocks).astype(dtype)
+    shape = (len(dofs), len(x))
+    if is_sparse:
+        nx = len(x)
+        rows = np.repeat(irows, nx)
+        cols = np.tile(np.arange(nx), len(irows))
+        load_matrix = scipy.sparse.coo_matrix(
+            (data.ravel(), (rows, cols)), shape=shape).tocsr()
+    else:
+        load_matrix = np.zeros(shape, dtype=dtype)
+        np.add.at(load_matrix, irows, data)
+    return dofs, load_matrix
+
+
+def _get_excitation(model, excite_id, loadset_id):
+    """
+    Gets the degrees of freedom and the scale factors ({A}) for an
+    EXCITEID from the DAREA and the static loads referenced by the LSEQs
+    (or a SLOAD with the same id if there is no LSEQ)
+    """
+    nids = []
+    components = []
+    scales = []
+    if excite_id in model.dareas:
+        darea = model.dareas[excite_id]
+        nids += darea.node_ids
+        components += darea.components
+        scales += darea.scales
+
+    load_ids = []
+    for lseq_id, lseqs in sorted(iteritems(model.load_combinations)):
+        if loadset_id is not None and lseq_id != loadset_id:
+            continue
+        for lseq in lseqs:
+            if lseq.type == 'LSEQ' and lseq.excite_id == excite_id:
+                load_ids.append(lseq.Lid())
+
+    if load_ids:
+        for load_id in load_ids:
+            loads, scale_factors = model.get_reduced_loads(load_id)[:2]
+            _add_static_loads(loads, scale_factors, nids, components, scales)
+    elif excite_id in model.loads:
+        sloads = [load for load in model.loads[excite_id] if load.type == 'SLOAD']
+        _add_static_loads(sloads, [1.] * len(sloads), nids, components, scales)
+
+    if not nids:
+        raise KeyError('excite_id=%s does not reference a DAREA, LSEQ, or SLOAD' % excite_id)
+    dofs = np.column_stack([nids, components]).astype('int32')
+    return dofs, np.array(scales, dtype='float64')
+
+
+def _add_static_loads(loads, scale_factors, nids, components, scales):
+    """expands the static loads to degrees of freedom"""
+    for load, scale in zip(loads, scale_factors):
+        if load.type == 'SLOAD':
+            nids += load.node_ids
+            components += [0] * len(load.mags)
+            scales += [scale * mag for mag in load.mags]
+            continue
+        elif load.type not in STATIC_LOAD_COMPONENTS:
+            raise NotImplementedError('LSEQ static load type=%r is not supported' % load.type)
+
+        if load.type in ['FORCE', 'MOMENT'] and load.Cid() != 0:
+            vector = load.cid_ref.transform_vector_to_global(load.xyz)
+        else:
+            vector = load.xyz
+        icomponent = STATIC_LOAD_COMPONENTS[load.type]
+        for i, value in enumerate(load.mag * scale * vector):
+            if value != 0.0:
+                nids.append(load.node_id)
+                components.append(icomponent + i)
+                scales.append(value)
+
+
+def _get_dof_values(model, value, card_type, dofs):
+    """
+    Gets the per degree of freedom DELAY/DPHASE values
+
+    Parameters
+    ----------
+    value : int / float
+        float : the value is used for all the degrees of freedom
+        int : the DELAY/DPHASE id; 0 is no delay/phase
+    card_type : str
+        DELAY / DPHASE
+    dofs : (ndof, 2) int ndarray
+        the (node_id, component) of the excitation
+    """
+    values = np.zeros(len(dofs), dtype='float64')
+    if isinstance(value, float):
+        values[:] = value
+    elif value:
+        if card_type == 'DELAY':
+            card = model.DELAY(value)
+            card_values = card.delays
+        else:
+            card = model.DPHASE(value)
+            card_values = card.phase_leads
+        dof_values = {(nid, component) : valuei for nid, component, valuei in zip(
+            card.node_ids, card.components, card_values)}
+        for i, (nid, component) in enumerate(dofs):
+            values[i] = dof_values.get((nid, component), 0.0)
+    return values
+
+
+def _get_table_values(model, table_id, x):
+    """interpolates a TABLEDx at x; a float is used as a constant"""
+    if isinstance(table_id, float):
+        return np.full(x.shape, table_id)
+    elif table_id == 0:
+        return np.zeros(x.shape)
+    return model.TableD(table_id).interpolate(x.ravel()).reshape(x.shape)
+
+
+def _get_phase(model, dload, dofs, freq):
+    """gets the theta - 2*pi*f*tau term"""
+    tau = _get_dof_values(model, dload.delay, 'DELAY', dofs)
+    theta = np.radians(_get_dof_values(model, dload.dphase, 'DPHASE', dofs))
+    return theta[:, np.newaxis] - 2 * np.pi * np.outer(tau, freq)
+
+
+def _rload1(model, rload1, dofs, freq):
+    """{A} [C(f) + iD(f)] e^(i(theta - 2*pi*f*tau))"""
+    c = _get_table_values(model, rload1.tc, freq)
+    d = _get_table_values(model, rload1.td, freq)
+    phase = _get_phase(model, rload1, dofs, freq)
+    return (c + 1.j * d)[np.newaxis, :] * np.exp(1.j * phase)
+
+
+def _rload2(model, rload2, dofs, freq):
+    """{A} B(f) e^(i(phi(f) + theta - 2*pi*f*tau))"""
+    b = _get_table_values(model, rload2.tb, freq)
+    phi = np.radians(_get_table_values(model, rload2.tp, freq))
+    phase = _get_phase(model, rload2, dofs, freq) + phi[np.newaxis, :]
+    return b[np.newaxis, :] * np.exp(1.j * phase)
+
+
+def _acsrce(model, acsrce, dofs, freq):
+    """{A} 1/(2*pi*f) sqrt(8*pi*c*P(f)/rho) e^(i(theta + 2*pi*f*tau))"""
+    c = np.sqrt(acsrce.b / acsrce.rho)
+    power = _get_table_values(model, acsrce.power, freq)
+    tau = _get_dof_values(model, acsrce.delay, 'DELAY', dofs)
+    theta = np.radians(_get_dof_values(model, acsrce.dphase, 'DPHASE', dofs))
+    phase = theta[:, np.newaxis] + 2 * np.pi * np.outer(tau, freq)
+    strength = np.sqrt(8 * np.pi * c * power / acsrce.rho) / (2 * np.pi * freq)
+    return strength[np.newaxis, :] * np.exp(1.j * phase)
+
+
+def _tload1(model, tload1, dofs, time):
+    """{A} F(t - tau)"""
+    tau = _get_dof_values(model, tload1.delay, 'DELAY', dofs)
+    time2 = time[np.newaxis, :] - tau[:, np.newaxis]
+    return _get_table_values(model, tload1.tid, time2)
+
+
+def _tload2(model, tload2, dofs, time):
+    """{A} t2^B e^(C t2) cos(2*pi*F t2 + P); t2 = t - T1 - tau"""
+    tau = _get_dof_values(model, tload2.delay, 'DELAY', dofs)
+    time2 = time[np.newaxis, :] - tload2.T1 - tau[:, np.newaxis]
+    is_active = (time2 >= 0.) & (time2 <= tload2.T2 - tload2.T1)
+    time2 = np.where(is_active, time2, 0.)
+    phase = 2 * np.pi * tload2.frequency * time2 + np.radians(tload2.phase)
+    values = time2 ** tload2.b * np.exp(tload2.c * time2) * np.cos(phase)
+    return np.where(is_active, values, 0.)
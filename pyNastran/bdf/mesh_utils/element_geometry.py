@@ -0,0 +1,292 @@
+"""
+defines:
+ - geometry = get_element_geometry(model, element_ids=None,
+                                   quantities=('centroid', 'area', 'normal', 'volume', 'length'),
+                                   xyz_cid0=None, node_ids=None)
+
+Calculates the centroid/area/normal/volume/length of elements in
+vectorized form.  Elements are grouped by type and the geometry is
+calculated from an (nelements, ncorners) connectivity array and the
+global xyz array, so there is no per-element Centroid()/Area() call.
+"""
+from __future__ import print_function, division
+from collections import defaultdict
+
+from six import iteritems
+import numpy as np
+
+#: the number of corner nodes used to calculate the geometry by element type;
+#: midside nodes don't contribute to any of the quantities
+LINE_TYPES = {'CROD' : 2, 'CONROD' : 2, 'CTUBE' : 2, 'CBAR' : 2, 'CBEAM' : 2}
+TRI_TYPES = {'CTRIA3' : 3, 'CTRIAR' : 3, 'CTRIA6' : 3}
+QUAD_TYPES = {'CQUAD4' : 4, 'CQUADR' : 4, 'CQUAD8' : 4, 'CQUAD' : 4, 'CSHEAR' : 4}
+SOLID_TYPES = {'CTETRA' : 4, 'CPYRAM' : 5, 'CPENTA' : 6, 'CHEXA' : 8}
+
+NCORNERS = {}
+NCORNERS.update(LINE_TYPES)
+NCORNERS.update(TRI_TYPES)
+NCORNERS.update(QUAD_TYPES)
+NCORNERS.update(SOLID_TYPES)
+
+ALL_QUANTITIES = ('centroid', 'area', 'normal', 'volume', 'length')
+
+
+def get_element_geometry(model, element_ids=None,
+                         quantities=('centroid', 'area', 'normal', 'volume', 'length'),
+                         xyz_cid0=None, node_ids=None):
+    """
+    Gets the element geometry for many elements at once
+
+    Parameters
+    ----------
+    model : BDF()
+        the model object
+    element_ids : List[int] / (n, ) int ndarray; default=None -> all
+        the element ids to consider
+    quantities : List[str]; default=all
+        the quantities to calculate
+        {centroid, area, normal, volume, length}
+    xyz_cid0 : (nnodes, 3) float ndarray; default=None
+        the node locations in the global frame; calculated if None
+    node_ids : (nnodes, ) int ndarray; default=None
+        the node ids corresponding to xyz_cid0;
+        required if xyz_cid0 is given
+
+    Returns
+    -------
+    geometry : Dict[str] = ndarray
+        element_id : (n, ) int ndarray
+            the sorted element ids that are supported
+        element_type : (n, ) str ndarray
+            the element type (e.g., CQUAD4)
+        centroid : (n, 3) float ndarray
+            the centroid for all elements
+        area : (n, ) float ndarray
+            the area for shells; nan for other elements
+        normal : (n, 3) float ndarray
+            the unit normal for shells; nan for other elements
+        volume : (n, ) float ndarray
+            the volume for solids; nan for other elements
+        length : (n, ) float ndarray
+            the length for line elements; nan for other elements
+
+    Supports:
+      - line elements: CROD, CONROD, CTUBE, CBAR, CBEAM
+      - shells: CTRIA3, CTRIAR, CTRIA6, CQUAD4, CQUADR, CQUAD8, CQUAD, CSHEAR
+      - solids: CTETRA, CPYRAM, CPENTA, CHEXA (linear and quadratic)
+
+    Unsupported elements (e.g., springs) are skipped.  The formulas
+    match the ones used by the element objects (e.g., CQUAD4.Area()),
+    so the CTETRA volume is signed, while the other solids use the
+    absolute value.
+
+    .. note:: The cards in model.elements are used; the model doesn't
+              need to be cross-referenced if xyz_cid0/node_ids are given.
+    """
+    for quantity in quantities:
+        if quantity not in ALL_QUANTITIES:
+            msg = 'quantity=%r is not supported; allowed=%s' % (quantity, ALL_QUANTITIES)
+            raise ValueError(msg)
+
+    node_ids, xyz_cid0 = _get_sorted_xyz_cid0(model, xyz_cid0, node_ids)
+    eids_by_type = _get_element_ids_by_type(model, element_ids)
+
+    neids = sum(len(eids) for eids in eids_by_type.values())
+    element_id = np.zeros(neids, dtype='int32')
+    element_type = np.zeros(neids, dtype='|U8')
+    centroid = np.full((neids, 3), np.nan, dtype='float64')
+    area = np.full(neids, np.nan, dtype='float64')
+    normal = np.full((neids, 3), np.nan, dtype='float64')
+    volume = np.full(neids, np.nan, dtype='float64')
+    length = np.full(neids, np.nan, dtype='float64')
+
+    i0 = 0
+    for etype, eids in sorted(iteritems(eids_by_type)):
+        ncorners = NCORNERS[etype]
+        nodes = _get_corner_xyz(model, eids, ncorners, node_ids, xyz_cid0, etype)
+        i1 = i0 + len(eids)
+        element_id[i0:i1] = eids
+        element_type[i0:i1] = etype
+
+        if etype in LINE_TYPES:
+            cent, lengthi = _line_geometry(nodes)
+            length[i0:i1] = lengthi
+        elif etype in TRI_TYPES:
+            cent, areai, normali = _tri_geometry(nodes)
+            area[i0:i1] = areai
+            normal[i0:i1, :] = normali
+        elif etype in QUAD_TYPES:
+            cent, areai, normali = _quad_geometry(nodes)
+            area[i0:i1] = areai
+            normal[i0:i1, :] = normali
+        elif etype == 'CTETRA':
+            cent, volumei = _tetra_geometry(nodes)
+            volume[i0:i1] = volumei
+        elif etype == 'CPYRAM':
+            cent, volumei = _pyram_geometry(nodes)
+            volume[i0:i1] = volumei
+        elif etype == 'CPENTA':
+            cent, volumei = _penta_geometry(nodes)
+            volume[i0:i1] = volumei
+        elif etype == 'CHEXA':
+            cent, volumei = _hexa_geometry(nodes)
+            volume[i0:i1] = volumei
+        else:  # pragma: no cover
+            raise NotImplementedError(etype)
+        centroid[i0:i1, :] = cent
+        i0 = i1
+
+    isort = np.argsort(element_id)
+    geometry = {
+        'element_id' : element_id[isort],
+        'element_type' : element_type[isort],
+    }
+    all_quantities = {
+        'centroid' : centroid,
+        'area' : area,
+        'normal' : normal,
+        'volume' : volume,
+        'length' : length,
+    }
+    for quantity in quantities:
+        geometry[quantity] = all_quantities[quantity][isort]
+    return geometry
+
+
+def _get_sorted_xyz_cid0(model, xyz_cid0, node_ids):
+    """gets the sorted node ids and the global xyz locations"""
+    if xyz_cid0 is None:
+        if node_ids is not None:
+            raise ValueError('node_ids must be None if xyz_cid0 is None')
+        out = model.get_displacement_index_xyz_cp_cd(sort_ids=True)
+        unused_icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+        node_ids = nid_cp_cd[:, 0]
+        xyz_cid0 = model.transform_xyzcp_to_xyz_cid(
+            xyz_cp, node_ids, icp_transform, cid=0)
+    else:
+        if node_ids is None:
+            raise ValueError('node_ids must be defined if xyz_cid0 is defined')
+        node_ids = np.asarray(node_ids)
+        isort = np.argsort(node_ids)
+        node_ids = node_ids[isort]
+        xyz_cid0 = np.asarray(xyz_cid0)[isort, :]
+    return node_ids, xyz_cid0
+
+
+def _get_element_ids_by_type(model, element_ids, etypes=None):
+    """groups the supported element ids by element type"""
+    if element_ids is None:
+        element_ids = model.elements.keys()
+    if etypes is None:
+        etypes = NCORNERS
+
+    eids_by_type = defaultdict(list)
+    for eid in element_ids:
+        elem = model.elements[eid]
+        if elem.type in etypes:
+            eids_by_type[elem.type].append(eid)
+    return eids_by_type
+
+
+def _get_corner_xyz(model, eids, ncorners, node_ids, xyz_cid0, etype):
+    """
+    Gets the corner node locations for a set of elements of the same type
+
+    Returns
+    -------
+    nodes : (ncorners, neids, 3) float ndarray
+        the xyz locations of each corner node
+    """
+    conn = np.array([model.elements[eid].node_ids[:ncorners] for eid in eids],
+                    dtype='int64')
+    inode = np.searchsorted(node_ids, conn)
+    inode_safe = np.minimum(inode, len(node_ids) - 1)
+    is_missing = node_ids[inode_safe] != conn
+    if is_missing.any():
+        ielem = np.where(is_missing.any(axis=1))[0]
+        msg = 'missing nodes for %s; eids=%s nids=%s' % (
+            etype, np.array(eids)[ielem].tolist(), np.unique(conn[is_missing]).tolist())
+        raise RuntimeError(msg)
+    return xyz_cid0[inode.T, :]
+
+
+def _line_geometry(nodes):
+    """gets the centroid and length of rod/bar/beam elements"""
+    p1, p2 = nodes
+    centroid = (p1 + p2) / 2.
+    length = np.linalg.norm(p2 - p1, axis=1)
+    return centroid, length
+
+
+def _tri_geometry(nodes):
+    """gets the centroid, area, and normal of triangle elements"""
+    p1, p2, p3 = nodes
+    centroid = (p1 + p2 + p3) / 3.
+    vector = np.cross(p1 - p2, p1 - p3)
+    length = np.linalg.norm(vector, axis=1)
+    area = 0.5 * length
+    normal = vector / length[:, np.newaxis]
+    return centroid, area, normal
+
+
+def _quad_geometry(nodes):
+    """gets the centroid, area, and normal of quad elements"""
+    p1, p2, p3, p4 = nodes
+    centroid = (p1 + p2 + p3 + p4) / 4.
+    vector = np.cross(p1 - p3, p2 - p4)
+    length = np.linalg.norm(vector, axis=1)
+    area = 0.5 * length
+    normal = vector / length[:, np.newaxis]
+    return centroid, area, normal
+
+
+def _quad_area_centroid(p1, p2, p3, p4):
+    """vectorized version of ``solid.area_centroid``"""
+    area1 = 0.5 * np.linalg.norm(np.cross(p1 - p2, p2 - p4), axis=1)
+    c1 = (p1 + p2 + p4) / 3.
+
+    area2 = 0.5 * np.linalg.norm(np.cross(p2 - p4, p2 - p3), axis=1)
+    c2 = (p2 + p3 + p4) / 3.
+
+    area = area1 + area2
+    centroid = (c1 * area1[:, np.newaxis] + c2 * area2[:, np.newaxis]) / area[:, np.newaxis]
+    return area, centroid
+
+
+def _tetra_geometry(nodes):
+    """gets the centroid and volume of CTETRA elements"""
+    p1, p2, p3, p4 = nodes
+    centroid = (p1 + p2 + p3 + p4) / 4.
+    volume = -np.einsum('ij,ij->i', p1 - p4, np.cross(p2 - p4, p3 - p4)) / 6.
+    return centroid, volume
+
+
+def _pyram_geometry(nodes):
+    """gets the centroid and volume of CPYRAM elements"""
+    p1, p2, p3, p4, p5 = nodes
+    area1, c1 = _quad_area_centroid(p1, p2, p3, p4)
+    centroid = (c1 + p5) / 2.
+    volume = np.abs(area1 / 3. * np.linalg.norm(c1 - p5, axis=1))
+    return centroid, volume
+
+
+def _penta_geometry(nodes):
+    """gets the centroid and volume of CPENTA elements"""
+    p1, p2, p3, p4, p5, p6 = nodes
+    area1 = 0.5 * np.linalg.norm(np.cross(p3 - p1, p2 - p1), axis=1)
+    area2 = 0.5 * np.linalg.norm(np.cross(p6 - p4, p5 - p4), axis=1)
+    c1 = (p1 + p2 + p3) / 3.
+    c2 = (p4 + p5 + p6) / 3.
+    centroid = (c1 + c2) / 2.
+    volume = np.abs((area1 + area2) / 2. * np.linalg.norm(c1 - c2, axis=1))
+    return centroid, volume
+
+
+def _hexa_geometry(nodes):
+    """gets the centroid and volume of CHEXA elements"""
+    p1, p2, p3, p4, p5, p6, p7, p8 = nodes
+    area1, c1 = _quad_area_centroid(p1, p2, p3, p4)
+    area2, c2 = _quad_area_centroid(p5, p6, p7, p8)
+    centroid = (c1 + c2) / 2.
+    volume = np.abs((area1 + area2) / 2. * np.linalg.norm(c1 - c2, axis=1))
+    return centroid, volume
@@ -0,0 +1,663 @@
+"""
+defines:
+ - quality = get_element_quality(model, element_ids=None, xyz_cid0=None, node_ids=None)
+ - violations = get_quality_violations(quality, min_theta=0.1, max_theta=175.,
+                                       max_skew=70., max_aspect_ratio=100.,
+                                       max_taper_ratio=4.0, max_warp=20.,
+                                       min_jacobian=0.)
+ - out = tri_quality(p1, p2, p3)
+ - out = quad_quality(p1, p2, p3, p4)
+ - out = get_min_max_theta(faces, all_node_ids, nid_map, xyz_cid0)
+
+The vectorized functions calculate the quality by element type from an
+(nelements, ncorners) connectivity array and the global xyz array.  The
+single element versions are used by the GUI.
+"""
+from __future__ import print_function, division
+from six import iteritems
+import numpy as np
+
+from pyNastran.bdf.mesh_utils.element_geometry import (
+    TRI_TYPES, QUAD_TYPES, SOLID_TYPES, _get_sorted_xyz_cid0, _get_element_ids_by_type,
+    _get_corner_xyz, _tetra_geometry, _pyram_geometry, _penta_geometry, _hexa_geometry)
+
+piover2 = np.pi / 2.
+piover3 = np.pi / 3.
+
+#: the faces of the solid elements (corner nodes only; 0-based)
+SOLID_FACES = {
+    'CTETRA' : ((0, 1, 2), (0, 3, 1), (0, 2, 3), (1, 3, 2)),
+    'CPYRAM' : ((0, 1, 2, 3), (1, 4, 2), (2, 4, 3), (0, 3, 4), (0, 4, 1)),
+    'CPENTA' : ((0, 2, 1), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (0, 3, 5, 2)),
+    'CHEXA' : ((4, 5, 6, 7), (0, 3, 2, 1), (1, 2, 6, 5),
+               (2, 3, 7, 6), (0, 4, 7, 3), (0, 1, 5, 4)),
+}
+
+#: the 3 adjacent corners of each corner (ordered for a positive
+#: jacobian); the CPYRAM apex has 4 adjacent nodes, so it's skipped
+SOLID_CORNER_NEIGHBORS = {
+    'CTETRA' : ((0, 1, 2, 3), (1, 2, 0, 3), (2, 0, 1, 3), (3, 2, 1, 0)),
+    'CPYRAM' : ((0, 1, 3, 4), (1, 2, 0, 4), (2, 3, 1, 4), (3, 0, 2, 4)),
+    'CPENTA' : ((0, 1, 2, 3), (1, 2, 0, 4), (2, 0, 1, 5),
+                (3, 5, 4, 0), (4, 3, 5, 1), (5, 4, 3, 2)),
+    'CHEXA' : ((0, 1, 3, 4), (1, 2, 0, 5), (2, 3, 1, 6), (3, 0, 2, 7),
+               (4, 7, 5, 0), (5, 4, 6, 1), (6, 5, 7, 2), (7, 6, 4, 3)),
+}
+
+#: the quality metrics that are calculated
+QUALITY_NAMES = (
+    'area', 'taper_ratio', 'area_ratio', 'max_skew_angle', 'aspect_ratio',
+    'min_interior_angle', 'max_interior_angle', 'dideal_theta',
+    'min_edge_length', 'max_warp_angle', 'volume', 'min_jacobian',
+)
+
+
+def get_element_quality(model, element_ids=None, xyz_cid0=None, node_ids=None):
+    """
+    Gets the quality metrics for the shell and solid elements
+
+    Parameters
+    ----------
+    model : BDF()
+        the model object
+    element_ids : List[int] / (n, ) int ndarray; default=None -> all
+        the element ids to consider
+    xyz_cid0 : (nnodes, 3) float ndarray; default=None
+        the node locations in the global frame; calculated if None
+    node_ids : (nnodes, ) int ndarray; default=None
+        the node ids corresponding to xyz_cid0;
+        required if xyz_cid0 is given
+
+    Returns
+    -------
+    quality : Dict[str] = (n, ) ndarray
+        element_id : (n, ) int ndarray
+            the sorted element ids that are supported
+        element_type : (n, ) str ndarray
+            the element type (e.g., CQUAD4)
+        area : the shell area
+        taper_ratio : the quad taper ratio
+        area_ratio : the quad area ratio (hourglass check)
+        max_skew_angle : the shell skew angle (radians)
+        aspect_ratio : the max/min edge length
+        min_interior_angle : the min face angle (radians)
+        max_interior_angle : the max face angle (radians)
+        dideal_theta : the max deviation from the ideal face angle (radians)
+        min_edge_length : the min edge length
+        max_warp_angle : the quad warp angle (radians)
+        volume : the solid volume
+        min_jacobian : the min scaled jacobian of the solid corners;
+                       1.0 is ideal, <= 0.0 is inverted
+
+    Metrics that don't apply to an element type are nan.
+
+    Supports:
+      - shells: CTRIA3, CTRIAR, CTRIA6, CQUAD4, CQUADR, CQUAD8, CQUAD, CSHEAR
+      - solids: CTETRA, CPYRAM, CPENTA, CHEXA (only the corner nodes are used)
+    """
+    node_ids, xyz_cid0 = _get_sorted_xyz_cid0(model, xyz_cid0, node_ids)
+    etypes = {}
+    etypes.update(TRI_TYPES)
+    etypes.update(QUAD_TYPES)
+    etypes.update(SOLID_TYPES)
+    eids_by_type = _get_element_ids_by_type(model, element_ids, etypes=etypes)
+
+    neids = sum(len(eids) for eids in eids_by_type.values())
+    element_id = np.zeros(neids, dtype='int32')
+    element_type = np.zeros(neids, dtype='|U8')
+    quality = {name : np.full(neids, np.nan, dtype='float64') for name in QUALITY_NAMES}
+
+    i0 = 0
+    for etype, eids in sorted(iteritems(eids_by_type)):
+        ncorners = etypes[etype]
+        nodes = _get_corner_xyz(model, eids, ncorners, node_ids, xyz_cid0, etype)
+        i1 = i0 + len(eids)
+        element_id[i0:i1] = eids
+        element_type[i0:i1] = etype
+
+        if etype in TRI_TYPES:
+            (area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta,
+             min_edge_length) = tri_quality_array(*nodes)
+            out = {
+                'area' : area, 'max_skew_angle' : max_skew,
+                'aspect_ratio' : aspect_ratio, 'min_interior_angle' : min_theta,
+                'max_interior_angle' : max_theta, 'dideal_theta' : dideal_theta,
+                'min_edge_length' : min_edge_length,
+            }
+        elif etype in QUAD_TYPES:
+            (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+             min_theta, max_theta, dideal_theta, min_edge_length,
+             max_warp) = quad_quality_array(*nodes)
+            out = {
+                'area' : area, 'taper_ratio' : taper_ratio, 'area_ratio' : area_ratio,
+                'max_skew_angle' : max_skew, 'aspect_ratio' : aspect_ratio,
+                'min_interior_angle' : min_theta, 'max_interior_angle' : max_theta,
+                'dideal_theta' : dideal_theta, 'min_edge_length' : min_edge_length,
+                'max_warp_angle' : max_warp,
+            }
+        else:
+            (volume, min_jacobian, aspect_ratio, min_theta, max_theta,
+             dideal_theta, min_edge_length) = solid_quality_array(etype, nodes)
+            out = {
+                'volume' : volume, 'min_jacobian' : min_jacobian,
+                'aspect_ratio' : aspect_ratio, 'min_interior_angle' : min_theta,
+                'max_interior_angle' : max_theta, 'dideal_theta' : dideal_theta,
+                'min_edge_length' : min_edge_length,
+            }
+
+        for name, values in iteritems(out):
+            quality[name][i0:i1] = values
+        i0 = i1
+
+    isort = np.argsort(element_id)
+    for name in QUALITY_NAMES:
+        quality[name] = quality[name][isort]
+    quality['element_id'] = element_id[isort]
+    quality['element_type'] = element_type[isort]
+    return quality
+
+
+def get_quality_violations(quality, min_theta=0.1, max_theta=175., max_skew=70.,
+                           max_aspect_ratio=100., max_taper_ratio=4.0, max_warp=20.,
+                           min_jacobian=0.):
+    """
+    Gets the elements that fail the quality criteria
+
+    Parameters
+    ----------
+    quality : Dict[str] = ndarray
+        the output from ``get_element_quality``
+    min_theta : float; default=0.1
+        the minimum interior angle (degrees)
+    max_theta : float; default=175.
+        the maximum interior angle (degrees)
+    max_skew : float; default=70.
+        the maximum skew angle (degrees)
+    max_aspect_ratio : float; default=100.
+        the max aspect ratio
+    max_taper_ratio : float; default=4.0
+        the taper ratio; applies to quads only
+    max_warp : float; default=20.
+        the maximum warp angle (degrees); applies to quads only
+    min_jacobian : float; default=0.
+        the minimum scaled jacobian; applies to solids only
+
+    Returns
+    -------
+    violations : Dict[str] = (n, ) int ndarray
+        the element ids that fail the criteria by quality metric name
+
+    A criteria may be disabled by setting it to None.  Zero length edges
+    are always flagged.
+    """
+    checks = [
+        ('min_interior_angle', min_theta, True, True),
+        ('max_interior_angle', max_theta, False, True),
+        ('max_skew_angle', max_skew, False, True),
+        ('aspect_ratio', max_aspect_ratio, False, False),
+        ('taper_ratio', max_taper_ratio, False, False),
+        ('max_warp_angle', max_warp, False, True),
+        ('min_jacobian', min_jacobian, True, False),
+    ]
+    eids = quality['element_id']
+    violations = {}
+    for name, allowable, is_min, is_angle in checks:
+        if allowable is None:
+            continue
+        if is_angle:
+            allowable = np.radians(allowable)
+        values = quality[name]
+        with np.errstate(invalid='ignore'):
+            if is_min:
+                is_failed = values < allowable
+            else:
+                is_failed = values > allowable
+        violations[name] = eids[is_failed]
+    violations['min_edge_length'] = eids[quality['min_edge_length'] == 0.]
+    return violations
+
+
+def _norm(vector):
+    """vectorized norm of an (n, 3) array"""
+    return np.linalg.norm(vector, axis=1)
+
+
+def _dot(vector1, vector2):
+    """vectorized dot product of two (n, 3) arrays"""
+    return np.einsum('ij,ij->i', vector1, vector2)
+
+
+def tri_quality_array(p1, p2, p3):
+    """
+    Gets the quality metrics for many tris
+
+    .. seealso:: tri_quality
+    """
+    e1 = (p1 + p2) / 2.
+    e2 = (p2 + p3) / 2.
+    e3 = (p3 + p1) / 2.
+    e21 = e2 - e1
+    e31 = e3 - e1
+    e32 = e3 - e2
+
+    e3_p2 = e3 - p2
+    e2_p1 = e2 - p1
+    e1_p3 = e1 - p3
+
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v13 = p1 - p3
+    lengths = np.column_stack([_norm(v21), _norm(v32), _norm(v13)])
+    length21, length32, length13 = lengths.T
+    min_edge_length = lengths.min(axis=1)
+    area = 0.5 * _norm(np.cross(v21, v13))
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cos_skew1 = _dot(e2_p1, e31) / (_norm(e2_p1) * _norm(e31))
+        cos_skew3 = _dot(e3_p2, e21) / (_norm(e3_p2) * _norm(e21))
+        cos_skew5 = _dot(e1_p3, e32) / (_norm(e1_p3) * _norm(e32))
+        cos_skew = np.column_stack([
+            cos_skew1, -cos_skew1, cos_skew3, -cos_skew3, cos_skew5, -cos_skew5])
+        max_skew = np.pi / 2. - np.abs(np.arccos(np.clip(cos_skew, -1., 1.))).min(axis=1)
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+        cos_theta1 = _dot(v21, -v13) / (length21 * length13)
+        cos_theta2 = _dot(v32, -v21) / (length32 * length21)
+        cos_theta3 = _dot(v13, -v32) / (length13 * length32)
+    thetas = np.arccos(np.clip(np.column_stack([cos_theta1, cos_theta2, cos_theta3]), -1., 1.))
+    min_theta = thetas.min(axis=1)
+    max_theta = thetas.max(axis=1)
+    dideal_theta = np.maximum(max_theta - piover3, piover3 - min_theta)
+    return area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def quad_quality_array(p1, p2, p3, p4):
+    """
+    Gets the quality metrics for many quads
+
+    .. seealso:: quad_quality
+
+    The warp angle is the angle between the normals of the two
+    triangles formed by splitting the quad along each diagonal.
+    """
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v43 = p4 - p3
+    v14 = p1 - p4
+    lengths = np.column_stack([_norm(v21), _norm(v32), _norm(v43), _norm(v14)])
+    length21, length32, length43, length14 = lengths.T
+    min_edge_length = lengths.min(axis=1)
+
+    p12 = (p1 + p2) / 2.
+    p23 = (p2 + p3) / 2.
+    p34 = (p3 + p4) / 2.
+    p14 = (p4 + p1) / 2.
+    v31 = p3 - p1
+    v42 = p4 - p2
+    normal = np.cross(v31, v42)
+    area = 0.5 * _norm(normal)
+
+    # the ratio of the ideal area to the actual area (hourglass check)
+    areas = np.column_stack([
+        _norm(np.cross(-v14, v21)), # v41 x v21
+        _norm(np.cross(v32, -v21)), # v32 x v12
+        _norm(np.cross(v43, -v32)), # v43 x v23
+        _norm(np.cross(v14, v43)),  # v14 x v43
+    ])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        area_ratio1 = area / areas.min(axis=1)
+        area_ratio2 = areas.max(axis=1) / area
+        area_ratio = np.maximum(area_ratio1, area_ratio2)
+
+        corner_areas = 0.5 * areas
+        aavg = corner_areas.mean(axis=1)
+        taper_ratio = np.abs(corner_areas - aavg[:, np.newaxis]).sum(axis=1) / aavg
+
+        e13 = p34 - p12
+        e42 = p23 - p14
+        cos_skew1 = _dot(e13, e42) / (_norm(e13) * _norm(e42))
+        cos_skew = np.column_stack([cos_skew1, -cos_skew1])
+        max_skew = np.pi / 2. - np.abs(np.arccos(np.clip(cos_skew, -1., 1.))).min(axis=1)
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+        cos_theta = np.column_stack([
+            _dot(v21, -v14) / (length21 * length14),
+            _dot(v32, -v21) / (length32 * length21),
+            _dot(v43, -v32) / (length43 * length32),
+            _dot(v14, -v43) / (length14 * length43),
+        ])
+
+    # a negative sign flags a reflex angle (the corner normal is flipped)
+    n = np.sign(np.column_stack([
+        _dot(np.cross(v14, v21), normal),
+        _dot(np.cross(v21, v32), normal),
+        _dot(np.cross(v32, v43), normal),
+        _dot(np.cross(v43, v14), normal),
+    ]))
+    theta_additional = np.where(n < 0, 2*np.pi, 0.)
+    theta = n * np.arccos(np.clip(cos_theta, -1., 1.)) + theta_additional
+    min_theta = theta.min(axis=1)
+    max_theta = theta.max(axis=1)
+    dideal_theta = np.maximum(max_theta - piover2, piover2 - min_theta)
+
+    n1a = np.cross(v21, v31) # v21 x v31
+    n1b = np.cross(v31, -v14) # v31 x v41
+    n2a = np.cross(v32, v42) # v32 x v42
+    n2b = np.cross(v42, -v21) # v42 x v12
+    with np.errstate(invalid='ignore', divide='ignore'):
+        warp1 = _dot(n1a, n1b) / (_norm(n1a) * _norm(n1b))
+        warp2 = _dot(n2a, n2b) / (_norm(n2a) * _norm(n2b))
+    max_warp = np.maximum(np.arccos(np.clip(warp1, -1., 1.)),
+                          np.arccos(np.clip(warp2, -1., 1.)))
+    return (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+            min_theta, max_theta, dideal_theta, min_edge_length, max_warp)
+
+
+def solid_quality_array(etype, nodes):
+    """
+    Gets the quality metrics for many solids of the same type
+
+    Parameters
+    ----------
+    etype : str
+        CTETRA, CPYRAM, CPENTA, CHEXA
+    nodes : (ncorners, n, 3) float ndarray
+        the xyz locations of each corner node
+
+    Returns
+    -------
+    volume : (n, ) float ndarray
+        the volume (see ``get_element_geometry``)
+    min_jacobian : (n, ) float ndarray
+        the min scaled jacobian of the corners
+    aspect_ratio : (n, ) float ndarray
+        the max/min edge length
+    min_theta / max_theta : (n, ) float ndarray
+        the min/max face angles (radians)
+    dideal_theta : (n, ) float ndarray
+        the max deviation from the ideal face angle (radians)
+    min_edge_length : (n, ) float ndarray
+        the min edge length
+    """
+    if etype == 'CTETRA':
+        volume = _tetra_geometry(nodes)[1]
+    elif etype == 'CPYRAM':
+        volume = _pyram_geometry(nodes)[1]
+    elif etype == 'CPENTA':
+        volume = _penta_geometry(nodes)[1]
+    elif etype == 'CHEXA':
+        volume = _hexa_geometry(nodes)[1]
+    else:
+        raise NotImplementedError(etype)
+
+    jacobians = []
+    for i0, i1, i2, i3 in SOLID_CORNER_NEIGHBORS[etype]:
+        v1 = nodes[i1] - nodes[i0]
+        v2 = nodes[i2] - nodes[i0]
+        v3 = nodes[i3] - nodes[i0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            jacobians.append(_dot(np.cross(v1, v2), v3) /
+                             (_norm(v1) * _norm(v2) * _norm(v3)))
+    min_jacobian = np.column_stack(jacobians).min(axis=1)
+
+    edges = set()
+    thetas = []
+    ideal_thetas = []
+    for face in SOLID_FACES[etype]:
+        nface = len(face)
+        ideal_theta = piover3 if nface == 3 else piover2
+        for i in range(nface):
+            iprev = face[i - 1]
+            inode = face[i]
+            inext = face[(i + 1) % nface]
+            edges.add(tuple(sorted([inode, inext])))
+            va = nodes[iprev] - nodes[inode]
+            vb = nodes[inext] - nodes[inode]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                cos_theta = _dot(va, vb) / (_norm(va) * _norm(vb))
+            thetas.append(np.arccos(np.clip(cos_theta, -1., 1.)))
+            ideal_thetas.append(ideal_theta)
+    thetas = np.column_stack(thetas)
+    ideal_thetas = np.array(ideal_thetas)
+    min_theta = thetas.min(axis=1)
+    max_theta = thetas.max(axis=1)
+    dideal_theta = np.abs(thetas - ideal_thetas).max(axis=1)
+
+    lengths = np.column_stack([_norm(nodes[i2] - nodes[i1]) for i1, i2 in sorted(edges)])
+    min_edge_length = lengths.min(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+    return volume, min_jacobian, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def tri_quality(p1, p2, p3):
+    """gets the quality metrics for a tri"""
+    e1 = (p1 + p2) / 2.
+    e2 = (p2 + p3) / 2.
+    e3 = (p3 + p1) / 2.
+
+    #    3
+    #    / \
+    # e3/   \ e2
+    #  /    /\
+    # /    /  \
+    # 1---/----2
+    #    e1
+    e21 = e2 - e1
+    e31 = e3 - e1
+    e32 = e3 - e2
+
+    e3_p2 = e3 - p2
+    e2_p1 = e2 - p1
+    e1_p3 = e1 - p3
+
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v13 = p1 - p3
+    length21 = np.linalg.norm(v21)
+    length32 = np.linalg.norm(v32)
+    length13 = np.linalg.norm(v13)
+    min_edge_length = min(length21, length32, length13)
+    areai = 0.5 * np.linalg.norm(np.cross(v21, v13))
+
+    cos_skew1 = np.dot(e2_p1, e31) / (np.linalg.norm(e2_p1) * np.linalg.norm(e31))
+    cos_skew2 = np.dot(e2_p1, -e31) / (np.linalg.norm(e2_p1) * np.linalg.norm(e31))
+    cos_skew3 = np.dot(e3_p2, e21) / (np.linalg.norm(e3_p2) * np.linalg.norm(e21))
+    cos_skew4 = np.dot(e3_p2, -e21) / (np.linalg.norm(e3_p2) * np.linalg.norm(e21))
+    cos_skew5 = np.dot(e1_p3, e32) / (np.linalg.norm(e1_p3) * np.linalg.norm(e32))
+    cos_skew6 = np.dot(e1_p3, -e32) / (np.linalg.norm(e1_p3) * np.linalg.norm(e32))
+    max_skew = np.pi / 2. - np.abs(np.arccos(np.clip([
+        cos_skew1, cos_skew2, cos_skew3,
+        cos_skew4, cos_skew5, cos_skew6], -1., 1.))).min()
+    lengths = np.linalg.norm([v21, v32, v13], axis=1)
+    #assert len(lengths) == 3, lengths
+    aspect_ratio = lengths.max() / lengths.min()
+
+    cos_theta1 = np.dot(v21, -v13) / (length21 * length13)
+    cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
+    cos_theta3 = np.dot(v13, -v32) / (length13 * length32)
+    thetas = np.arccos(np.clip([cos_theta1, cos_theta2, cos_theta3], -1., 1.))
+    min_thetai = thetas.min()
+    max_thetai = thetas.max()
+    dideal_thetai = max(max_thetai - piover3, piover3 - min_thetai)
+
+    #theta_deg = np.degrees(np.arccos(max_cos_theta))
+    #if theta_deg < 60.:
+        #print('p1=%s' % xyz_cid0[p1, :])
+        #print('p2=%s' % xyz_cid0[p2, :])
+        #print('p3=%s' % xyz_cid0[p3, :])
+        #print('theta1=%s' % np.degrees(np.arccos(cos_theta1)))
+        #print('theta2=%s' % np.degrees(np.arccos(cos_theta2)))
+        #print('theta3=%s' % np.degrees(np.arccos(cos_theta3)))
+        #print('max_theta=%s' % theta_deg)
+        #asdf
+    return areai, max_skew, aspect_ratio, min_thetai, max_thetai, dideal_thetai, min_edge_length
+
+
+def quad_quality(p1, p2, p3, p4):
+    """gets the quality metrics for a quad"""
+    v21 = p2 - p1
+    v32 = p3 - p2
+    v43 = p4 - p3
+    v14 = p1 - p4
+    length21 = np.linalg.norm(v21)
+    length32 = np.linalg.norm(v32)
+    length43 = np.linalg.norm(v43)
+    length14 = np.linalg.norm(v14)
+    min_edge_length = min(length21, length32, length43, length14)
+
+    v42 = p4 - p2
+    v31 = p3 - p1
+    p12 = (p1 + p2) / 2.
+    p23 = (p2 + p3) / 2.
+    p34 = (p3 + p4) / 2.
+    p14 = (p4 + p1) / 2.
+    v31 = p3 - p1
+    v42 = p4 - p2
+    normal = np.cross(v31, v42)
+    areai = 0.5 * np.linalg.norm(normal)
+
+    # still kind of in development
+    #
+    # the ratio of the ideal area to the actual area
+    # this is an hourglass check
+    areas = [
+        np.linalg.norm(np.cross(-v14, v21)), # v41 x v21
+        np.linalg.norm(np.cross(v32, -v21)), # v32 x v12
+        np.linalg.norm(np.cross(v43, -v32)), # v43 x v23
+        np.linalg.norm(np.cross(v14, v43)),  # v14 x v43
+    ]
+    #
+    # for:
+    #   area=1; area1=0.5 -> area_ratioi1=2.0; area_ratio=2.0
+    #   area=1; area1=2.0 -> area_ratioi2=2.0; area_ratio=2.0
+    area_ratioi1 = areai / min(areas)
+    area_ratioi2 = max(areas) / areai
+    area_ratioi = max(area_ratioi1, area_ratioi2)
+
+    area1 = 0.5 * np.linalg.norm(np.cross(-v14, v21)) # v41 x v21
+    area2 = 0.5 * np.linalg.norm(np.cross(-v21, v32)) # v12 x v32
+    area3 = 0.5 * np.linalg.norm(np.cross(v43, v32)) # v43 x v32
+    area4 = 0.5 * np.linalg.norm(np.cross(v14, -v43)) # v14 x v34
+    aavg = (area1 + area2 + area3 + area4) / 4.
+    taper_ratioi = (abs(area1 - aavg) + abs(area2 - aavg) +
+                    abs(area3 - aavg) + abs(area4 - aavg)) / aavg
+
+    #    e3
+    # 4-------3
+    # |       |
+    # |e4     |  e2
+    # 1-------2
+    #     e1
+    e13 = p34 - p12
+    e42 = p23 - p14
+    cos_skew1 = np.dot(e13, e42) / (np.linalg.norm(e13) * np.linalg.norm(e42))
+    cos_skew2 = np.dot(e13, -e42) / (np.linalg.norm(e13) * np.linalg.norm(e42))
+    max_skew = np.pi / 2. - np.abs(np.arccos(
+        np.clip([cos_skew1, cos_skew2], -1., 1.))).min()
+    #aspect_ratio = max(p12, p23, p34, p14) / max(p12, p23, p34, p14)
+    lengths = np.linalg.norm([v21, v32, v43, v14], axis=1)
+    #assert len(lengths) == 3, lengths
+    aspect_ratio = lengths.max() / lengths.min()
+
+    cos_theta1 = np.dot(v21, -v14) / (length21 * length14)
+    cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
+    cos_theta3 = np.dot(v43, -v32) / (length43 * length32)
+    cos_theta4 = np.dot(v14, -v43) / (length14 * length43)
+    #max_thetai = np.arccos([cos_theta1, cos_theta2, cos_theta3, cos_theta4]).max()
+
+    # dot the local normal with the normal vector
+    # then take the norm of that to determine the angle relative to the normal
+    # then take the sign of that to see if we're pointing roughly towards the normal
+
+    # np.sign(np.linalg.norm(np.dot(
+    # a x b = ab sin(theta)
+    # a x b / ab = sin(theta)
+    # sin(theta) < 0. -> normal is flipped
+    normal2 = np.sign(np.dot(np.cross(v21, v32), normal))
+    normal3 = np.sign(np.dot(np.cross(v32, v43), normal))
+    normal4 = np.sign(np.dot(np.cross(v43, v14), normal))
+    normal1 = np.sign(np.dot(np.cross(v14, v21), normal))
+    n = np.array([normal1, normal2, normal3, normal4])
+    theta_additional = np.where(n < 0, 2*np.pi, 0.)
+
+    theta = n * np.arccos(np.clip(
+        [cos_theta1, cos_theta2, cos_theta3, cos_theta4], -1., 1.)) + theta_additional
+    min_thetai = theta.min()
+    max_thetai = theta.max()
+    dideal_thetai = max(max_thetai - piover2, piover2 - min_thetai)
+    #print('theta_max = ', theta_max)
+
+    #if 0:
+        ## warp
+        #v31 = xyz_cid0[p3, :] - xyz_cid0[p1, :]
+        #n1a = np.cross(v21, v31) # v21 x v31
+        #n1b = np.cross(v31, -v14) # v31 x v41
+        #warp1 = np.dot(n1a, n1b) / (np.linalg.norm(n1a) * np.linalg.norm(n1b))
+
+        #v42 = xyz_cid0[p4, :] - xyz_cid0[p2, :]
+        #n2a = np.cross(v32, v42) # v32 x v42
+        #n2b = np.cross(v42, -v21) # v42 x v12
+        #warp2 = np.dot(n2a, n2b) / (np.linalg.norm(n2a) * np.linalg.norm(n2b))
+        #max_warp = max(np.arccos(warp1), np.arccos(warp2))
+    out = (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
+           min_thetai, max_thetai, dideal_thetai, min_edge_length)
+    return out
+
+def get_min_max_theta(faces, all_node_ids, nid_map, xyz_cid0):
+    """get the min/max thetas for CTETRA, CPENTA, CHEXA, CPYRAM"""
+    cos_thetas = []
+    ideal_theta = []
+    #print('faces =', faces)
+    #assert len(faces) > 0, 'faces=%s nids=%s' % (faces, all_node_ids)
+    for face in faces:
+        if len(face) == 3:
+            node_ids = all_node_ids[face[0]], all_node_ids[face[1]], all_node_ids[face[2]]
+            n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
+            v21 = xyz_cid0[n2, :] - xyz_cid0[n1, :]
+            v32 = xyz_cid0[n3, :] - xyz_cid0[n2, :]
+            v13 = xyz_cid0[n1, :] - xyz_cid0[n3, :]
+            length21 = np.linalg.norm(v21)
+            length32 = np.linalg.norm(v32)
+            length13 = np.linalg.norm(v13)
+            min_edge_length = min(length21, length32, length13)
+
+            cos_theta1 = np.dot(v21, -v13) / (length21 * length13)
+            cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
+            cos_theta3 = np.dot(v13, -v32) / (length13 * length32)
+            cos_thetas.extend([cos_theta1, cos_theta2, cos_theta3])
+            ideal_theta.extend([piover3, piover3, piover3])
+        elif len(face) == 4:
+            try:
+                node_ids = (all_node_ids[face[0]], all_node_ids[face[1]],
+                            all_node_ids[face[2]], all_node_ids[face[3]])
+            except:
+                print(face)
+                print(node_ids)
+                raise
+
+            n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
+            v21 = xyz_cid0[n2, :] - xyz_cid0[n1, :]
+            v32 = xyz_cid0[n3, :] - xyz_cid0[n2, :]
+            v43 = xyz_cid0[n4, :] - xyz_cid0[n3, :]
+            v14 = xyz_cid0[n1, :] - xyz_cid0[n4, :]
+            length21 = np.linalg.norm(v21)
+            length32 = np.linalg.norm(v32)
+            length43 = np.linalg.norm(v43)
+            length14 = np.linalg.norm(v14)
+            min_edge_length = min(length21, length32, length43, length14)
+            cos_theta1 = np.dot(v21, -v14) / (length21 * length14)
+            cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
+            cos_theta3 = np.dot(v43, -v32) / (length43 * length32)
+            cos_theta4 = np.dot(v14, -v43) / (length14 * length43)
+            cos_thetas.extend([cos_theta1, cos_theta2, cos_theta3, cos_theta4])
+            ideal_theta.extend([piover2, piover2, piover2, piover2])
+        else:
+            raise NotImplementedError(face)
+    thetas = np.arccos(cos_thetas)
+    ideal_theta = np.array(ideal_theta)
+    ideal_thetai = max((thetas - ideal_theta).max(), (ideal_theta - thetas).min())
+
+    min_thetai = thetas.min()
+    max_thetai = thetas.max()
+    return min_thetai, max_thetai, ideal_thetai, min_edge_length
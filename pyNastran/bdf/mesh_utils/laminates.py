@@ -0,0 +1,242 @@
+"""
+defines:
+ - laminates = get_laminate_properties(model, property_ids=None)
+
+Builds the laminate properties (ABD matrices, equivalent moduli, mass per
+area, and ply z locations) of many PCOMP/PCOMPG properties at once.  The
+plies of all the properties are stacked into padded (nproperties, nplies)
+arrays, so the ply stiffness rotations and the through the thickness
+integrals are calculated in batch.  The padded plies have no thickness,
+so they don't contribute.
+"""
+from __future__ import print_function, division
+from six import iteritems
+import numpy as np
+
+#: the composite shell properties
+COMPOSITE_TYPES = ('PCOMP', 'PCOMPG')
+
+#: the supported ply materials
+PLY_MATERIALS = ('MAT1', 'MAT2', 'MAT8')
+
+
+def get_laminate_properties(model, property_ids=None):
+    """
+    Gets the laminate properties of the PCOMP/PCOMPG properties
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    property_ids : List[int]; default=None
+        the PCOMP/PCOMPG ids; None : all the PCOMP/PCOMPG properties
+
+    Returns
+    -------
+    laminates : dict
+        property_ids : (nproperties, ) int ndarray
+            the property ids; sorted
+        nplies : (nproperties, ) int ndarray
+            the number of plies (including the mirrored SYM plies)
+        thicknesses : (nproperties, nplies_max) float ndarray
+            the ply thicknesses; 0.0 for the padded plies
+        thetas : (nproperties, nplies_max) float ndarray
+            the ply angles in degrees
+        z : (nproperties, nplies_max + 1) float ndarray
+            the ply z locations; the padded plies are at the top
+            surface
+        thickness : (nproperties, ) float ndarray
+            the laminate thickness
+        mass_per_area : (nproperties, ) float ndarray
+            sum(rho * t) + nsm
+        ABD : (nproperties, 6, 6) float ndarray
+            the [A B; B D] stiffness matrices about the reference plane
+        membrane_moduli : (nproperties, 4) float ndarray
+            the equivalent [Ex, Ey, Gxy, nu_xy] from A^-1
+        bending_moduli : (nproperties, 4) float ndarray
+            the equivalent [Ex, Ey, Gxy, nu_xy] from D^-1
+
+    .. note:: SYM laminates are mirrored about the last ply, so the
+              stack is plies 1, ..., n, n, ..., 1
+    .. note:: the LAM options other than SYM are not considered
+    """
+    if property_ids is None:
+        property_ids = [pid for pid, prop in iteritems(model.properties)
+                        if prop.type in COMPOSITE_TYPES]
+    property_ids = np.array(sorted(property_ids), dtype='int32')
+    props = [model.properties[pid] for pid in property_ids]
+    for prop in props:
+        if prop.type not in COMPOSITE_TYPES:
+            raise TypeError('pid=%s is a %s; expected %s' % (
+                prop.pid, prop.type, ', '.join(COMPOSITE_TYPES)))
+
+    mids, thicknesses, thetas, nplies = _stack_plies(props)
+    is_ply = np.arange(mids.shape[1]) < nplies[:, np.newaxis]
+    q_mat, rho_mat, material_ids = _get_ply_materials(model, mids[is_ply])
+    imat = np.searchsorted(material_ids, mids)
+    imat[~is_ply] = 0
+
+    thickness = thicknesses.sum(axis=1)
+    z0 = np.array([prop.z0 for prop in props], dtype='float64')
+    nsm = np.array([prop.nsm for prop in props], dtype='float64')
+    z = np.zeros((len(props), thicknesses.shape[1] + 1), dtype='float64')
+    z[:, 0] = z0
+    z[:, 1:] = z0[:, np.newaxis] + np.cumsum(thicknesses, axis=1)
+    mass_per_area = (rho_mat[imat] * thicknesses).sum(axis=1) + nsm
+
+    qbar = _rotate_q(q_mat[imat], np.radians(thetas))
+    dz1 = z[:, 1:] - z[:, :-1]
+    dz2 = (z[:, 1:] ** 2 - z[:, :-1] ** 2) / 2.
+    dz3 = (z[:, 1:] ** 3 - z[:, :-1] ** 3) / 3.
+    A = np.einsum('ij,ijkl->ikl', dz1, qbar)
+    B = np.einsum('ij,ijkl->ikl', dz2, qbar)
+    D = np.einsum('ij,ijkl->ikl', dz3, qbar)
+    abd = np.zeros((len(props), 6, 6), dtype='float64')
+    abd[:, :3, :3] = A
+    abd[:, :3, 3:] = B
+    abd[:, 3:, :3] = B
+    abd[:, 3:, 3:] = D
+
+    laminates = {
+        'property_ids' : property_ids,
+        'nplies' : nplies,
+        'thicknesses' : thicknesses,
+        'thetas' : thetas,
+        'z' : z,
+        'thickness' : thickness,
+        'mass_per_area' : mass_per_area,
+        'ABD' : abd,
+        'membrane_moduli' : _get_moduli(np.linalg.inv(A), thickness),
+        'bending_moduli' : _get_moduli(np.linalg.inv(D), thickness ** 3 / 12.),
+    }
+    return laminates
+
+
+def _stack_plies(props):
+    """
+    Stacks the plies of the properties into padded arrays; SYM
+    laminates are mirrored
+
+    Returns
+    -------
+    mids : (nproperties, nplies_max) int ndarray
+        the ply material ids; 0 for the padded plies
+    thicknesses / thetas : (nproperties, nplies_max) float ndarray
+        the ply thicknesses/angles; 0.0 for the padded plies
+    nplies : (nproperties, ) int ndarray
+        the number of plies
+    """
+    nstored = np.array([len(prop.thicknesses) for prop in props], dtype='int32')
+    is_sym = np.array([prop.is_symmetrical() for prop in props], dtype='bool')
+    nplies = np.where(is_sym, 2 * nstored, nstored)
+    nplies_max = nplies.max() if len(props) else 0
+
+    mids_flat = np.hstack([prop.mids for prop in props] + [[]]).astype('int32')
+    t_flat = np.hstack([prop.thicknesses for prop in props] + [[]]).astype('float64')
+    theta_flat = np.hstack([prop.thetas for prop in props] + [[]]).astype('float64')
+    iprop = np.repeat(np.arange(len(props)), nstored)
+    i0 = np.zeros(len(props), dtype='int32')
+    np.cumsum(nstored[:-1], out=i0[1:])
+    iply = np.arange(len(iprop)) - i0[iprop]
+
+    shape = (len(props), nplies_max)
+    mids = np.zeros(shape, dtype='int32')
+    thicknesses = np.zeros(shape, dtype='float64')
+    thetas = np.zeros(shape, dtype='float64')
+    mids[iprop, iply] = mids_flat
+    thicknesses[iprop, iply] = t_flat
+    thetas[iprop, iply] = theta_flat
+
+    # mirror the SYM plies
+    isym = is_sym[iprop]
+    iprop_sym = iprop[isym]
+    iply_sym = 2 * nstored[iprop_sym] - 1 - iply[isym]
+    mids[iprop_sym, iply_sym] = mids_flat[isym]
+    thicknesses[iprop_sym, iply_sym] = t_flat[isym]
+    thetas[iprop_sym, iply_sym] = theta_flat[isym]
+    return mids, thicknesses, thetas, nplies
+
+
+def _get_ply_materials(model, mids):
+    """
+    Gets the in-plane stiffness matrices (Q) and the densities of the
+    ply materials
+
+    Returns
+    -------
+    q : (nmaterials, 3, 3) float ndarray
+        the plane stress stiffness matrices
+    rho : (nmaterials, ) float ndarray
+        the densities
+    material_ids : (nmaterials, ) int ndarray
+        the material ids; sorted
+    """
+    material_ids = np.unique(mids)
+    q = np.zeros((len(material_ids), 3, 3), dtype='float64')
+    rho = np.zeros(len(material_ids), dtype='float64')
+    for i, mid in enumerate(material_ids):
+        mat = model.Material(mid)
+        rho[i] = mat.rho
+        if mat.type == 'MAT8':
+            nu21 = mat.nu12 * mat.e22 / mat.e11
+            denom = 1. - mat.nu12 * nu21
+            q[i, 0, 0] = mat.e11 / denom
+            q[i, 1, 1] = mat.e22 / denom
+            q[i, 0, 1] = q[i, 1, 0] = mat.nu12 * mat.e22 / denom
+            q[i, 2, 2] = mat.g12
+        elif mat.type == 'MAT1':
+            denom = 1. - mat.nu ** 2
+            q[i, 0, 0] = q[i, 1, 1] = mat.e / denom
+            q[i, 0, 1] = q[i, 1, 0] = mat.nu * mat.e / denom
+            q[i, 2, 2] = mat.g
+        elif mat.type == 'MAT2':
+            g11, g12, g13, g22, g23, g33 = [
+                0. if value is None else value
+                for value in (mat.G11, mat.G12, mat.G13, mat.G22, mat.G23, mat.G33)]
+            q[i] = [
+                [g11, g12, g13],
+                [g12, g22, g23],
+                [g13, g23, g33],
+            ]
+        else:
+            raise NotImplementedError('mid=%s type=%s; expected %s' % (
+                mid, mat.type, ', '.join(PLY_MATERIALS)))
+    return q, rho, material_ids
+
+
+def _rotate_q(q, theta):
+    """
+    Rotates the ply stiffness matrices to the laminate frame::
+
+      Qbar = T^-1 Q T^-T
+
+    Parameters
+    ----------
+    q : (..., 3, 3) float ndarray
+        the ply stiffness matrices
+    theta : (...) float ndarray
+        the ply angles in radians
+    """
+    c = np.cos(theta)
+    s = np.sin(theta)
+    tinv = np.zeros(theta.shape + (3, 3), dtype='float64')
+    tinv[..., 0, 0] = c ** 2
+    tinv[..., 0, 1] = s ** 2
+    tinv[..., 0, 2] = -2 * c * s
+    tinv[..., 1, 0] = s ** 2
+    tinv[..., 1, 1] = c ** 2
+    tinv[..., 1, 2] = 2 * c * s
+    tinv[..., 2, 0] = c * s
+    tinv[..., 2, 1] = -c * s
+    tinv[..., 2, 2] = c ** 2 - s ** 2
+    return np.matmul(np.matmul(tinv, q), np.swapaxes(tinv, -1, -2))
+
+
+def _get_moduli(compliance, scale):
+    """gets [Ex, Ey, Gxy, nu_xy] from the A^-1 (scale=h) or D^-1 (scale=h^3/12)"""
+    moduli = np.zeros((len(scale), 4), dtype='float64')
+    moduli[:, 0] = 1. / (scale * compliance[:, 0, 0])
+    moduli[:, 1] = 1. / (scale * compliance[:, 1, 1])
+    moduli[:, 2] = 1. / (scale * compliance[:, 2, 2])
+    moduli[:, 3] = -compliance[:, 0, 1] / compliance[:, 0, 0]
+    return moduli
@@ -0,0 +1,538 @@
+"""
+defines:
+ - responses = get_responses(model, op2_model, dresp_ids=None)
+
+Evaluates the DRESP1/DRESP2 optimization responses for all the subcases
+and times in an OP2.  The DRESP1s are grouped by the OP2 table they pull
+from, so each table is sliced once per subcase with a single fancy index
+instead of once per DRESP1.  The DRESP2 equations are evaluated for all
+subcases/times at once with ``DEQATN.evaluate_array``.
+
+Supports:
+  - DRESP1 grid responses:
+      DISP, SPCFORCE, TDISP, TVELO, TACCL, TSPCF,
+      FRDISP, FRVELO, FRACCL, FRSPCF
+  - DRESP1 element responses (item codes are relative to the centroid):
+      STRESS, STRAIN, FORCE, TSTRE, TFORC
+      for CROD, CONROD, CTUBE, CBAR, CELASx, CSHEAR, CTRIA3, CQUAD4,
+      CTRIAR, CQUADR
+  - DRESP1 model responses: EIGN, LAMA, FREQ, WEIGHT, VOLUME
+  - DRESP2 references: DRESP1, DRESP2, DESVAR, DTABLE, DNODE
+"""
+from __future__ import print_function, division
+from collections import defaultdict
+
+from six import iteritems, string_types
+import numpy as np
+
+from pyNastran.utils import integer_types
+from pyNastran.bdf.cards.deqatn import _ARRAY_NAMESPACE
+
+#: the DRESP1 response type to the OP2 grid point table
+GRID_RESULTS = {
+    'DISP' : 'displacements',
+    'SPCFORCE' : 'spc_forces',
+    'TDISP' : 'displacements',
+    'TVELO' : 'velocities',
+    'TACCL' : 'accelerations',
+    'TSPCF' : 'spc_forces',
+    'FRDISP' : 'displacements',
+    'FRVELO' : 'velocities',
+    'FRACCL' : 'accelerations',
+    'FRSPCF' : 'spc_forces',
+}
+
+#: the DRESP1 response type to the OP2 element table suffix
+ELEMENT_RESULTS = {
+    'STRESS' : 'stress',
+    'TSTRE' : 'stress',
+    'STRAIN' : 'strain',
+    'FORCE' : 'force',
+    'TFORC' : 'force',
+}
+
+#: the elements where the item code maps to the centroidal result as:
+#:   irow = (item_code - 2) // ncolumns  (e.g., the Z1/Z2 fiber)
+#:   icolumn = (item_code - 2) % ncolumns
+ELEMENT_TYPES = (
+    'CROD', 'CONROD', 'CTUBE', 'CBAR', 'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
+    'CSHEAR', 'CTRIA3', 'CQUAD4', 'CTRIAR', 'CQUADR',
+)
+
+#: the DRESP1 response type to the RealEigenvalues attribute
+EIGEN_RESULTS = {
+    'EIGN' : 'eigenvalues',
+    'LAMA' : 'eigenvalues',
+    'FREQ' : 'cycles',
+}
+
+#: the ATTB functions that reduce a transient/frequency response
+TIME_FUNCTIONS = ('SUM', 'AVG', 'SSQ', 'RSS', 'MAX', 'MIN')
+
+#: the FUNC options for a DRESP2 without a DEQATN
+DRESP2_FUNCTIONS = ('SUM', 'AVG', 'SSQ', 'RSS', 'MAX', 'MIN')
+
+
+def get_responses(model, op2_model, dresp_ids=None):
+    """
+    Evaluates the DRESP1/DRESP2 responses for every subcase and time
+
+    Parameters
+    ----------
+    model : BDF()
+        the cross-referenced model with the DRESP1/DRESP2 cards
+    op2_model : OP2()
+        the results
+    dresp_ids : List[int]; default=None -> all
+        the DRESP1/DRESP2 ids to evaluate; referenced responses are
+        evaluated, but only the requested ones are returned
+
+    Returns
+    -------
+    responses : Dict[str] = (n, ) ndarray
+        the response table, where each row is a single value
+        dresp_id : int ndarray
+            the DRESP1/DRESP2 id
+        response_type : str ndarray
+            the DRESP1 response type (e.g., DISP) or DRESP2
+        key : object ndarray
+            the OP2 result key (e.g., the subcase id), the eigenvalue
+            title, or None for a model response (e.g., WEIGHT)
+        isubcase : int ndarray
+            the subcase id; 0 if the response doesn't have one
+        itime : int ndarray
+            the time/frequency/mode index; -1 for a reduced response
+            (e.g., ATTB=MAX) or a model response
+        time : float ndarray
+            the time/frequency/mode; nan if there isn't one
+        id : int ndarray
+            the node/element/mode id; 0 for a DRESP2 or a model response
+        value : float ndarray
+            the response value
+
+    Unsupported responses are skipped with a warning, as are the
+    DRESP2s that reference them.
+    """
+    log = model.log
+    if dresp_ids is None:
+        dresp_ids = sorted(model.dresps.keys())
+
+    dresp1s, dresp2s = _get_referenced_dresps(model, dresp_ids)
+
+    # blocks[dresp_id] = {key : (times, ids, values)}
+    #   times : (ntimes, ) float ndarray
+    #   ids : (nvalues, ) int ndarray
+    #   values : (ntimes, nvalues) float ndarray
+    blocks = {}
+    _get_dresp1_blocks(model, op2_model, dresp1s, blocks, log)
+    for dresp2 in dresp2s:
+        _get_dresp2_block(model, dresp2, blocks, log)
+
+    return _build_response_table(model, dresp_ids, blocks)
+
+
+def _get_referenced_dresps(model, dresp_ids):
+    """
+    Gets the DRESP1s and the DRESP2s (in dependency order) that are
+    required to evaluate ``dresp_ids``
+    """
+    dresp1s = {}
+    dresp2s = []
+    used_dresp2_ids = set()
+
+    def _add_dresp(dresp_id):
+        dresp = model.dresps[dresp_id]
+        if dresp.type == 'DRESP1':
+            dresp1s[dresp_id] = dresp
+        elif dresp.type == 'DRESP2':
+            if dresp_id in used_dresp2_ids:
+                return
+            used_dresp2_ids.add(dresp_id)
+            for (unused_j, name), values in sorted(iteritems(dresp.params)):
+                if name in ['DRESP1', 'DRESP2']:
+                    for dresp_idi in values:
+                        _add_dresp(_get_id(dresp_idi, 'dresp_id'))
+            dresp2s.append(dresp)
+        else:
+            model.log.warning('skipping %s=%s' % (dresp.type, dresp_id))
+
+    for dresp_id in dresp_ids:
+        _add_dresp(dresp_id)
+    return dresp1s, dresp2s
+
+
+def _get_id(value, attr):
+    """gets the id of a cross-referenced object or an integer"""
+    if isinstance(value, integer_types):
+        return value
+    return getattr(value, attr)
+
+
+def _get_dresp1_blocks(model, op2_model, dresp1s, blocks, log):
+    """evaluates the DRESP1s by grouping them by OP2 table"""
+    grid_groups = defaultdict(list)
+    element_groups = defaultdict(list)
+    for dresp_id, dresp in sorted(iteritems(dresp1s)):
+        rtype = dresp.response_type
+        if rtype in GRID_RESULTS:
+            grid_groups[GRID_RESULTS[rtype]].append(dresp)
+        elif rtype in ELEMENT_RESULTS:
+            element_groups[ELEMENT_RESULTS[rtype]].append(dresp)
+        elif rtype in EIGEN_RESULTS:
+            _get_eigen_block(op2_model, dresp, blocks)
+        elif rtype in ['WEIGHT', 'VOLUME']:
+            _get_model_block(model, op2_model, dresp, blocks)
+        else:
+            log.warning('skipping DRESP1=%s; response_type=%r is not supported' % (
+                dresp_id, rtype))
+
+    for table_name, dresps in sorted(iteritems(grid_groups)):
+        _get_grid_blocks(op2_model, table_name, dresps, blocks, log)
+    for suffix, dresps in sorted(iteritems(element_groups)):
+        _get_element_blocks(model, op2_model, suffix, dresps, blocks, log)
+
+
+def _get_grid_blocks(op2_model, table_name, dresps, blocks, log):
+    """
+    Evaluates the DISP/SPCFORCE/FRDISP/... responses that use a single
+    grid point table
+    """
+    # flatten the requests, so there is a single fancy index per result key
+    nids = []
+    components = []
+    islices = []
+    i0 = 0
+    for dresp in dresps:
+        comp = dresp.atta
+        nidsi = [_get_id(nid, 'nid') for nid in dresp.atti]
+        if not isinstance(comp, integer_types) or not 1 <= comp <= 12:
+            log.warning('skipping DRESP1=%s; invalid component=%r' % (dresp.dresp_id, comp))
+            islices.append(None)
+            continue
+        nids.extend(nidsi)
+        components.extend([(comp - 1) % 6] * len(nidsi))
+        islices.append(slice(i0, i0 + len(nidsi)))
+        i0 += len(nidsi)
+    nids = np.array(nids, dtype='int32')
+    components = np.array(components, dtype='int32')
+
+    results = getattr(op2_model, table_name)
+    for key, case in sorted(iteritems(results), key=_sort_key):
+        nids_case = case.node_gridtype[:, 0]
+        inid = np.searchsorted(nids_case, nids)
+        inid_safe = np.minimum(inid, len(nids_case) - 1)
+        is_found = nids_case[inid_safe] == nids
+        all_data = case.data[:, inid_safe, components]
+        times = _get_times(case)
+
+        for dresp, islice in zip(dresps, islices):
+            if islice is None:
+                continue
+            data = all_data[:, islice]
+            if np.iscomplexobj(data):
+                if dresp.atta <= 6:
+                    data = np.abs(data)
+                else:
+                    data = np.angle(data, deg=True)
+            data = np.where(is_found[islice], data.real, np.nan)
+            ids = nids[islice]
+            _add_block(blocks, dresp, key, times, ids, data)
+
+
+def _get_element_blocks(model, op2_model, suffix, dresps, blocks, log):
+    """
+    Evaluates the STRESS/STRAIN/FORCE responses, which are grouped by
+    element type, so each OP2 table is sliced once per result key
+    """
+    # requests[etype] = [(idresp, eid), ...]
+    requests = defaultdict(list)
+    is_valid = []
+    for idresp, dresp in enumerate(dresps):
+        item_code = dresp.atta
+        if not isinstance(item_code, integer_types) or item_code < 2:
+            log.warning('skipping DRESP1=%s; invalid item_code=%r' % (
+                dresp.dresp_id, item_code))
+            is_valid.append(False)
+            continue
+        eids = _get_dresp1_element_ids(model, dresp)
+        etypes = set()
+        for eid in eids:
+            etype = model.elements[eid].type
+            etypes.add(etype)
+            requests[etype].append((idresp, eid))
+        unsupported = etypes.difference(ELEMENT_TYPES)
+        if unsupported:
+            log.warning('skipping DRESP1=%s; element types=%s are not supported' % (
+                dresp.dresp_id, sorted(unsupported)))
+            is_valid.append(False)
+            continue
+        is_valid.append(True)
+
+    # values[idresp][key] = [times, [ids], [(ntimes, n) values]]
+    values = [{} for dresp in dresps]
+    for etype, requestsi in sorted(iteritems(requests)):
+        if etype not in ELEMENT_TYPES:
+            continue
+        table_name = '%s_%s' % (etype.lower(), suffix)
+        results = getattr(op2_model, table_name, {})
+        idresps = np.array([idresp for idresp, eid in requestsi], dtype='int32')
+        eids = np.array([eid for idresp, eid in requestsi], dtype='int32')
+        item_codes = np.array([dresps[idresp].atta for idresp in idresps], dtype='int32')
+
+        for key, case in sorted(iteritems(results), key=_sort_key):
+            data = _slice_element_case(case, eids, item_codes)
+            times = _get_times(case)
+            for idresp in np.unique(idresps):
+                i = np.where(idresps == idresp)[0]
+                if key not in values[idresp]:
+                    values[idresp][key] = [times, [], []]
+                values[idresp][key][1].append(eids[i])
+                values[idresp][key][2].append(data[:, i])
+
+    for dresp, is_validi, valuesi in zip(dresps, is_valid, values):
+        if not is_validi:
+            continue
+        for key, (times, ids, data) in sorted(iteritems(valuesi), key=_sort_key):
+            ids = np.hstack(ids)
+            data = np.hstack(data)
+            isort = np.argsort(ids, kind='mergesort')
+            _add_block(blocks, dresp, key, times, ids[isort], data[:, isort])
+
+
+def _get_dresp1_element_ids(model, dresp):
+    """gets the element ids for a PTYPE=ELEM or property DRESP1"""
+    ptype = dresp.property_type
+    if ptype == 'ELEM':
+        return [_get_id(eid, 'eid') for eid in dresp.atti]
+
+    pids = [_get_id(pid, 'pid') for pid in dresp.atti]
+    eids_dict = model.get_element_ids_dict_with_pids(pids, stop_if_no_eids=False)
+    eids = []
+    for pid in pids:
+        eids.extend(eids_dict[pid])
+    return sorted(eids)
+
+
+def _slice_element_case(case, eids, item_codes):
+    """
+    Slices an element result for a set of (element id, item code) pairs
+
+    Returns
+    -------
+    data : (ntimes, n) float ndarray
+        the values; nan if the element/item code isn't in the result
+    """
+    ntimes, nrows, ncolumns = case.data.shape
+    if hasattr(case, 'element') and case.element is not None and len(case.element) == nrows:
+        eids_case = case.element
+    else:
+        eids_case = case.element_node[:, 0]
+
+    istart = np.searchsorted(eids_case, eids, side='left')
+    iend = np.searchsorted(eids_case, eids, side='right')
+    irow = istart + (item_codes - 2) // ncolumns
+    icolumn = (item_codes - 2) % ncolumns
+    is_found = irow < iend
+    irow = np.where(is_found, irow, 0)
+    data = case.data[:, irow, icolumn]
+    return np.where(is_found, data, np.nan)
+
+
+def _get_eigen_block(op2_model, dresp, blocks):
+    """evaluates an EIGN/LAMA/FREQ response"""
+    attr = EIGEN_RESULTS[dresp.response_type]
+    modes = np.array([dresp.atta], dtype='int32')
+    for title, eigenvalues in sorted(iteritems(op2_model.eigenvalues)):
+        values = getattr(eigenvalues, attr)
+        imode = np.searchsorted(eigenvalues.mode, modes)
+        imode_safe = np.minimum(imode, len(values) - 1)
+        is_found = eigenvalues.mode[imode_safe] == modes
+        data = np.where(is_found, values[imode_safe], np.nan).reshape(1, 1)
+        _add_block(blocks, dresp, title, np.array([np.nan]), modes, data)
+
+
+def _get_model_block(model, op2_model, dresp, blocks):
+    """
+    Evaluates a WEIGHT/VOLUME response
+
+    WEIGHT comes from the grid point weight generator table if it exists
+    and otherwise from the model's mass (no WTMASS scaling).
+    """
+    if dresp.response_type == 'WEIGHT':
+        gpwg = getattr(op2_model, 'grid_point_weight', None)
+        if gpwg is not None and gpwg.mass is not None:
+            value = gpwg.mass[0]
+        else:
+            value = model.mass_properties()[0]
+    else:
+        value = sum(model.get_volume_breakdown().values())
+    data = np.array([[value]], dtype='float64')
+    _add_block(blocks, dresp, None, np.array([np.nan]), np.zeros(1, dtype='int32'), data)
+
+
+def _add_block(blocks, dresp, key, times, ids, data):
+    """applies the ATTB time filter and stores the response"""
+    attb = dresp.attb
+    if dresp.response_type in GRID_RESULTS or dresp.response_type in ELEMENT_RESULTS:
+        if isinstance(attb, float):
+            itime = np.abs(times - attb).argmin()
+            times = times[[itime]]
+            data = data[[itime], :]
+        elif isinstance(attb, string_types) and attb.upper() in TIME_FUNCTIONS:
+            func = _ARRAY_NAMESPACE[attb.lower()]
+            data = np.atleast_2d(func(*data))
+            times = np.array([np.nan])
+    blocks.setdefault(dresp.dresp_id, {})[key] = (times, ids, data)
+
+
+def _get_dresp2_block(model, dresp2, blocks, log):
+    """evaluates a DRESP2 for all subcases/times at once"""
+    dresp_id = dresp2.dresp_id
+    # args are either a block or a scalar
+    args = []
+    for (unused_j, name), values in sorted(iteritems(dresp2.params)):
+        if name in ['DRESP1', 'DRESP2']:
+            for dresp_idi in values:
+                dresp_idi = _get_id(dresp_idi, 'dresp_id')
+                if dresp_idi not in blocks:
+                    log.warning('skipping DRESP2=%s; %s=%s was not evaluated' % (
+                        dresp_id, name, dresp_idi))
+                    return
+                args.append(blocks[dresp_idi])
+        elif name == 'DESVAR':
+            for desvar_id in values:
+                args.append(model.desvars[_get_id(desvar_id, 'desvar_id')].xinit)
+        elif name == 'DTABLE':
+            for label in values:
+                args.append(model.dtable[label])
+        elif name == 'DNODE':
+            nids, components = values
+            for nid, comp in zip(nids, components):
+                xyz = model.nodes[_get_id(nid, 'nid')].get_position()
+                args.append(xyz[comp - 1])
+        else:
+            log.warning('skipping DRESP2=%s; %s is not supported' % (dresp_id, name))
+            return
+
+    func = _get_dresp2_function(model, dresp2)
+    if func is None:
+        log.warning('skipping DRESP2=%s; dequation=%r is not supported' % (
+            dresp_id, dresp2.dequation))
+        return
+
+    keys = None
+    for arg in args:
+        if isinstance(arg, dict):
+            keysi = set(key for key in arg if key is not None)
+            if keysi:
+                keys = keysi if keys is None else keys.intersection(keysi)
+    keys = [None] if keys is None else sorted(keys, key=_sort_key_value)
+
+    block = {}
+    for key in keys:
+        times = None
+        argsi = []
+        for arg in args:
+            if not isinstance(arg, dict):
+                argsi.append(arg)
+                continue
+            timesi, unused_ids, data = arg[key] if key in arg else arg[None]
+            if key in arg and times is None:
+                times = timesi
+            argsi.extend(data.T)
+        if times is None:
+            times = np.array([np.nan])
+
+        # each arg is (ntimes, ) or (1, ) or a scalar
+        ntimes = len(times)
+        for arg in argsi:
+            if np.ndim(arg) and len(arg) not in [1, ntimes]:
+                raise ValueError('DRESP2=%s has responses with different number of '
+                                 'times for key=%s' % (dresp_id, key))
+        values = func(*argsi)
+        values = np.broadcast_to(np.asarray(values, dtype='float64'), (ntimes, ))
+        block[key] = (times, np.zeros(1, dtype='int32'), values.reshape(ntimes, 1))
+    blocks[dresp_id] = block
+
+
+def _get_dresp2_function(model, dresp2):
+    """gets the vectorized function for a DRESP2"""
+    dequation = dresp2.DEquation()
+    if isinstance(dequation, integer_types):
+        deqatn = model.dequations[dequation]
+        if not hasattr(deqatn, 'func_array'):
+            deqatn._setup_equation()
+        return deqatn.evaluate_array
+    if dequation.upper() in DRESP2_FUNCTIONS:
+        return _ARRAY_NAMESPACE[dequation.lower()]
+    return None
+
+
+def _get_times(case):
+    """gets the times/frequencies/modes of a result (nan for static)"""
+    ntimes = case.data.shape[0]
+    times = np.asarray(getattr(case, '_times', []), dtype='float64')
+    if len(times) != ntimes:
+        times = np.full(ntimes, np.nan, dtype='float64')
+    return times
+
+
+def _sort_key(key_value):
+    """sorts (key, value) pairs by key, where the key may be an int/tuple/str"""
+    return _sort_key_value(key_value[0])
+
+
+def _sort_key_value(key):
+    """sorts keys that may be an int/tuple/str/None"""
+    if key is None:
+        return (0, ())
+    if isinstance(key, tuple):
+        return (1, tuple(str(keyi) for keyi in key))
+    return (1, (str(key), ))
+
+
+def _get_isubcase(key):
+    """gets the subcase id from an OP2 result key"""
+    if isinstance(key, integer_types):
+        return key
+    if isinstance(key, tuple) and isinstance(key[0], integer_types):
+        return key[0]
+    return 0
+
+
+def _build_response_table(model, dresp_ids, blocks):
+    """flattens the blocks into the response table"""
+    columns = defaultdict(list)
+    for dresp_id in dresp_ids:
+        if dresp_id not in blocks:
+            continue
+        dresp = model.dresps[dresp_id]
+        rtype = dresp.response_type if dresp.type == 'DRESP1' else dresp.type
+        for key, (times, ids, data) in sorted(iteritems(blocks[dresp_id]), key=_sort_key):
+            ntimes, nvalues = data.shape
+            is_reduced = (key is None) or (ntimes == 1 and np.isnan(times[0]) and
+                                           isinstance(getattr(dresp, 'attb', None),
+                                                      string_types))
+            itimes = np.arange(ntimes) if not is_reduced else np.full(ntimes, -1)
+            n = ntimes * nvalues
+            columns['dresp_id'].append(np.full(n, dresp_id, dtype='int32'))
+            columns['response_type'].append(np.full(n, rtype, dtype='|U8'))
+            columns['key'].append(np.array([key] * n + [None], dtype='object')[:-1])
+            columns['isubcase'].append(np.full(n, _get_isubcase(key), dtype='int32'))
+            columns['itime'].append(np.repeat(itimes, nvalues).astype('int32'))
+            columns['time'].append(np.repeat(times, nvalues))
+            columns['id'].append(np.tile(ids, ntimes).astype('int32'))
+            columns['value'].append(data.ravel())
+
+    dtypes = {
+        'dresp_id' : 'int32', 'response_type' : '|U8', 'key' : 'object',
+        'isubcase' : 'int32', 'itime' : 'int32', 'time' : 'float64',
+        'id' : 'int32', 'value' : 'float64',
+    }
+    responses = {}
+    for name, dtype in sorted(iteritems(dtypes)):
+        if columns[name]:
+            responses[name] = np.hstack(columns[name])
+        else:
+            responses[name] = np.zeros(0, dtype=dtype)
+    return responses
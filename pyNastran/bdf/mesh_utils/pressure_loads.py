@@ -0,0 +1,323 @@
+"""
+defines:
+ - pressure_arrays = get_pressure_arrays(model, load_case_ids=None,
+                                         xyz_cid0=None, node_ids=None)
+
+Builds the PLOAD/PLOAD2/PLOAD4 pressures and the equivalent nodal forces
+for many load cases at once.  The pressure loads of all the cases are
+flattened into (element, case) columns, so the geometry, the THRU range
+expansion, and the direction vectors are calculated in batch instead of
+per card.
+"""
+from __future__ import print_function, division
+from six import iteritems
+import numpy as np
+
+from pyNastran.bdf.mesh_utils.element_geometry import (
+    get_element_geometry, _get_sorted_xyz_cid0, TRI_TYPES, QUAD_TYPES)
+
+#: the shells that support PLOAD2/PLOAD4
+SHELL_TYPES = set(TRI_TYPES) | set(QUAD_TYPES)
+
+#: the solids that support PLOAD4
+SOLID_TYPES = ('CTETRA', 'CHEXA', 'CPENTA')
+
+
+def get_pressure_arrays(model, load_case_ids=None, xyz_cid0=None, node_ids=None):
+    """
+    Gets the element pressures and the nodal forces for many load cases
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    load_case_ids : List[int]; default=None
+        the LOAD ids (LOAD combinations or load sets);
+        None : all the LOAD ids in the model
+    xyz_cid0 : (nnodes, 3) float ndarray; default=None
+        the node locations in the global frame; calculated if None
+    node_ids : (nnodes, ) int ndarray; default=None
+        the node ids corresponding to xyz_cid0;
+        required if xyz_cid0 is given
+
+    Returns
+    -------
+    pressure_arrays : Dict[str] = ndarray
+        load_case_ids : (ncases, ) int ndarray
+            the load case ids
+        element_ids : (nelements, ) int ndarray
+            the sorted element ids
+        pressures : (nelements, ncases) float ndarray
+            the PLOAD2/PLOAD4 pressure (the average of the corner
+            pressures) on each element
+        node_ids : (nnodes, ) int ndarray
+            the sorted node ids
+        forces : (nnodes, 3, ncases) float ndarray
+            the PLOAD/PLOAD2/PLOAD4 forces in the global frame
+
+    Considers:
+      - PLOAD  : 3/4 grid points
+      - PLOAD2 : CTRIA3, CTRIA6, CTRIAR, CQUAD4, CQUAD8, CQUAD, CQUADR, CSHEAR
+      - PLOAD4 : the PLOAD2 shells, CTETRA, CPENTA, CHEXA
+
+    The force on a face (pressure * area * direction) is split equally
+    between the corner nodes.  The direction is the face normal unless
+    the PLOAD4 defines a vector (N1, N2, N3) in a rectangular CID.
+
+    .. note:: the solid PLOAD4 faces require a cross-referenced model
+    """
+    node_ids, xyz_cid0 = _get_sorted_xyz_cid0(model, xyz_cid0, node_ids)
+    if load_case_ids is None:
+        load_case_ids = set(model.loads)
+        for load_id, loads in iteritems(model.load_combinations):
+            if any(load.type == 'LOAD' for load in loads):
+                load_case_ids.add(load_id)
+    load_case_ids = np.array(sorted(load_case_ids), dtype='int32')
+    element_ids = np.array(sorted(model.elements), dtype='int32')
+
+    ncases = len(load_case_ids)
+    pressures = np.zeros((len(element_ids), ncases), dtype='float64')
+    forces = np.zeros((len(node_ids), ncases, 3), dtype='float64')
+
+    element_loads, ploads = _get_pressure_loads(model, load_case_ids)
+    if element_loads is not None:
+        _add_element_pressures(model, element_loads, element_ids, pressures,
+                               node_ids, xyz_cid0, forces)
+    for nnodes, (nids, icase, pressure) in sorted(iteritems(ploads)):
+        _add_pload_forces(nids, icase, pressure, node_ids, xyz_cid0, forces)
+
+    pressure_arrays = {
+        'load_case_ids' : load_case_ids,
+        'element_ids' : element_ids,
+        'pressures' : pressures,
+        'node_ids' : node_ids,
+        'forces' : np.ascontiguousarray(forces.transpose(0, 2, 1)),
+    }
+    return pressure_arrays
+
+
+def _get_pressure_loads(model, load_case_ids):
+    """
+    Flattens the scaled PLOAD2/PLOAD4 cards of all the load cases into
+    one entry per (element, case) and groups the PLOADs by the number
+    of nodes
+
+    Returns
+    -------
+    element_loads : Dict[str] = ndarray / None
+        eid, icase, pressures (n, 4), nvector (n, 3), cid, g1, g34
+    ploads : Dict[int] = (nids (n, nnodes), icase (n, ), pressure (n, ))
+        the PLOADs
+    """
+    cards = []
+    card_ids = {}
+    card_index = []
+    card_icase = []
+    card_scale = []
+    ploads = {}
+    for icase, load_case_id in enumerate(load_case_ids):
+        loads, scale_factors = model.get_reduced_loads(load_case_id)[:2]
+        for load, scale in zip(loads, scale_factors):
+            if load.type == 'PLOAD':
+                nids = load.node_ids
+                ploads.setdefault(len(nids), []).append((nids, icase, load.pressure * scale))
+                continue
+            elif load.type not in ['PLOAD2', 'PLOAD4']:
+                continue
+            if load.type == 'PLOAD4' and load.surf_or_line != 'SURF':
+                msg = 'surf_or_line=%r on PLOAD4 is not supported\n%s' % (
+                    load.surf_or_line, str(load))
+                raise NotImplementedError(msg)
+
+            if id(load) not in card_ids:
+                card_ids[id(load)] = len(cards)
+                cards.append(load)
+            card_index.append(card_ids[id(load)])
+            card_icase.append(icase)
+            card_scale.append(scale)
+
+    ploads = {nnodes : (np.array([nids for nids, icase, pressure in values], dtype='int32'),
+                        np.array([icase for nids, icase, pressure in values], dtype='int32'),
+                        np.array([pressure for nids, icase, pressure in values]))
+              for nnodes, values in iteritems(ploads)}
+    if not cards:
+        return None, ploads
+
+    # the card columns; the PLOAD4 THRU ranges are stored back to back
+    ncards = len(cards)
+    card_eids = [load.element_ids for load in cards]
+    neids = np.array([len(eids) for eids in card_eids], dtype='int32')
+    eids = np.hstack(card_eids).astype('int32')
+    ieid0 = np.hstack([0, np.cumsum(neids)[:-1]])
+
+    card_pressures = np.zeros((ncards, 4), dtype='float64')
+    nvector = np.zeros((ncards, 3), dtype='float64')
+    cid = np.zeros(ncards, dtype='int32')
+    g1 = np.full(ncards, -1, dtype='int32')
+    g34 = np.full(ncards, -1, dtype='int32')
+    for i, load in enumerate(cards):
+        if load.type == 'PLOAD2':
+            card_pressures[i, :] = load.pressure
+            continue
+        card_pressures[i, :] = load.pressures
+        nvector[i, :] = load.nvector
+        cid[i] = load.Cid()
+        if load.g1 is not None:
+            g1[i] = load.G1()
+        if load.g34 is not None:
+            g34[i] = load.G34()
+
+    # expand the (card, case) entries to (element, case) entries
+    card_index = np.array(card_index, dtype='int32')
+    counts = neids[card_index]
+    ientry = np.repeat(np.arange(len(card_index)), counts)
+    offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    icard = card_index[ientry]
+    ieid = ieid0[icard] + offset
+
+    element_loads = {
+        'eid' : eids[ieid],
+        'icase' : np.array(card_icase, dtype='int32')[ientry],
+        'pressures' : card_pressures[icard, :] * np.array(card_scale)[ientry, np.newaxis],
+        'nvector' : nvector[icard, :],
+        'cid' : cid[icard],
+        'g1' : g1[icard],
+        'g34' : g34[icard],
+    }
+    return element_loads, ploads
+
+
+def _add_element_pressures(model, element_loads, element_ids, pressures,
+                           node_ids, xyz_cid0, forces):
+    """adds the PLOAD2/PLOAD4 pressures and forces"""
+    eids = element_loads['eid']
+    icase = element_loads['icase']
+    ielement = np.searchsorted(element_ids, eids)
+    ielement_safe = np.minimum(ielement, len(element_ids) - 1)
+    is_missing = element_ids[ielement_safe] != eids
+    if is_missing.any():
+        raise KeyError('missing elements with a PLOAD2/PLOAD4; eids=%s' % (
+            np.unique(eids[is_missing]).tolist()))
+    etypes = np.array([model.elements[eid].type for eid in element_ids[ielement]])
+    direction = _get_pload4_directions(model, element_loads['nvector'], element_loads['cid'])
+
+    is_shell = np.array([etype in SHELL_TYPES for etype in etypes], dtype='bool')
+    ishell = np.where(is_shell)[0]
+    if len(ishell):
+        shell_eids, ishell_eid = np.unique(eids[ishell], return_inverse=True)
+        geometry = get_element_geometry(model, element_ids=shell_eids,
+                                        quantities=('area', 'normal'),
+                                        xyz_cid0=xyz_cid0, node_ids=node_ids)
+        conn = np.full((len(shell_eids), 4), -1, dtype='int32')
+        for i, eid in enumerate(shell_eids):
+            elem = model.elements[eid]
+            ncorners = 3 if elem.type in TRI_TYPES else 4
+            conn[i, :ncorners] = elem.node_ids[:ncorners]
+
+        nface = np.where(conn[ishell_eid, 3] == -1, 3, 4)
+        pressure = np.where(nface == 3,
+                            element_loads['pressures'][ishell, :3].mean(axis=1),
+                            element_loads['pressures'][ishell, :].mean(axis=1))
+        normal = geometry['normal'][ishell_eid, :]
+        directioni = direction[ishell, :]
+        is_normal = np.abs(directioni).sum(axis=1) == 0.
+        directioni[is_normal, :] = normal[is_normal, :]
+
+        np.add.at(pressures, (ielement[ishell], icase[ishell]), pressure)
+        force = (pressure * geometry['area'][ishell_eid])[:, np.newaxis] * directioni
+        _add_face_forces(conn[ishell_eid, :], icase[ishell], force, nface,
+                         node_ids, forces)
+
+    isolid = np.where(~is_shell)[0]
+    for i in isolid:
+        etype = etypes[i]
+        if etype not in SOLID_TYPES:
+            model.log.debug('etype=%r loadtype=PLOAD4 is not supported' % etype)
+            continue
+        elem = model.elements[eids[i]]
+        face_node_ids, area, normal = _get_solid_face(
+            elem, element_loads['g1'][i], element_loads['g34'][i])
+        nface = len(face_node_ids)
+        pressure = element_loads['pressures'][i, :nface].mean()
+        directioni = normal if np.abs(direction[i, :]).sum() == 0. else direction[i, :]
+        pressures[ielement[i], icase[i]] += pressure
+        conn = np.full((1, 4), -1, dtype='int32')
+        conn[0, :nface] = face_node_ids
+        _add_face_forces(conn, icase[[i]], (pressure * area * directioni)[np.newaxis, :],
+                         np.array([nface]), node_ids, forces)
+
+
+def _get_pload4_directions(model, nvector, cid):
+    """
+    Gets the PLOAD4 unit direction vectors in the global frame; rows
+    without a vector are 0.
+    """
+    direction = np.zeros(nvector.shape, dtype='float64')
+    length = np.linalg.norm(nvector, axis=1)
+    is_vector = length > 0.
+    if not is_vector.any():
+        return direction
+
+    for cidi in np.unique(cid[is_vector]):
+        i = np.where(is_vector & (cid == cidi))[0]
+        vectors = nvector[i, :] / length[i, np.newaxis]
+        if cidi != 0:
+            coord = model.Coord(cidi)
+            if coord.type not in ['CORD1R', 'CORD2R']:
+                raise NotImplementedError('PLOAD4 cid=%s (%s) is not supported; '
+                                          'use a rectangular frame' % (cidi, coord.type))
+            vectors = coord.transform_vector_to_global_array(vectors)
+        direction[i, :] = vectors
+    return direction
+
+
+def _get_solid_face(elem, g1, g34):
+    """gets the PLOAD4 face node ids, area, and normal for a solid element"""
+    if elem.type == 'CTETRA':
+        face, area, unused_centroid, normal = elem.get_face_area_centroid_normal(g1, g34)
+    elif elem.type == 'CHEXA':
+        face, area, unused_centroid, normal = elem.get_face_area_centroid_normal(g34, g1)
+    else:
+        g34 = None if g34 == -1 else g34
+        face, area, unused_centroid, normal = elem.get_face_area_centroid_normal(g1, g34)
+    node_ids = elem.node_ids
+    face_node_ids = [node_ids[i] for i in face]
+    return face_node_ids, area, normal
+
+
+def _add_face_forces(conn, icase, force, nface, node_ids, forces):
+    """splits the face forces equally between the corner nodes"""
+    force = force / nface[:, np.newaxis]
+    for icorner in range(4):
+        i = np.where(conn[:, icorner] != -1)[0]
+        inode = _get_node_index(node_ids, conn[i, icorner])
+        np.add.at(forces, (inode, icase[i]), force[i, :])
+
+
+def _add_pload_forces(nids, icase, pressure, node_ids, xyz_cid0, forces):
+    """adds the PLOAD (3/4 grid point) forces"""
+    nnodes = nids.shape[1]
+    if nnodes not in [3, 4]:
+        raise RuntimeError('invalid number of nodes on PLOAD card; nnodes=%s' % nnodes)
+    inode = _get_node_index(node_ids, nids)
+    xyz = xyz_cid0[inode, :]
+    if nnodes == 3:
+        axb = np.cross(xyz[:, 0, :] - xyz[:, 1, :], xyz[:, 0, :] - xyz[:, 2, :])
+    else:
+        axb = np.cross(xyz[:, 0, :] - xyz[:, 2, :], xyz[:, 1, :] - xyz[:, 3, :])
+
+    # area * normal = 0.5 * axb
+    force = (0.5 * pressure / nnodes)[:, np.newaxis] * axb
+    for icorner in range(nnodes):
+        np.add.at(forces, (inode[:, icorner], icase), force)
+
+
+def _get_node_index(node_ids, nids):
+    """maps node ids to the sorted node_ids"""
+    inode = np.searchsorted(node_ids, nids)
+    inode_safe = np.minimum(inode, len(node_ids) - 1)
+    is_missing = node_ids[inode_safe] != nids
+    if is_missing.any():
+        raise KeyError('missing nodes with a pressure load; nids=%s' % (
+            np.unique(nids[is_missing]).tolist()))
+    return inode
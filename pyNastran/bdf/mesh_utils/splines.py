@@ -0,0 +1,325 @@
+"""
+defines:
+ - aero_dofs, structure_dofs, G = build_spline_matrix(model, spline_ids=None)
+
+Builds the structure to aero displacement interpolation matrix of the
+infinite plate (SPLINE1/SPLINE4) and beam (SPLINE2/SPLINE5) splines::
+
+  {u_k} = [G] {u_g}
+  {F_g} = [G]^T {F_k}
+
+The spline kernels are evaluated in batch for all the box/grid pairs of
+a spline, and the spline blocks are assembled into a scipy.sparse matrix.
+The per spline blocks are cached on the model, so repeated calls (e.g.,
+a loads transfer loop) only build new splines.  Each block is stored with
+the grid/box geometry it was built from and is rebuilt when that geometry
+changes.  Adding a GRID, CORDx, SPLINEx, CAEROx, AELIST, or SETx clears
+the cache; after editing a card in place (e.g., ``node.xyz``), the cache
+may be reset with::
+
+  model._spline_matrix_cache.clear()
+"""
+from __future__ import print_function, division
+import numpy as np
+import scipy.sparse
+
+from pyNastran.bdf.mesh_utils.aero_panels import get_caero_panels
+from pyNastran.bdf.mesh_utils.element_geometry import _get_sorted_xyz_cid0
+
+#: the infinite plate splines
+PLATE_SPLINES = ('SPLINE1', 'SPLINE4')
+
+#: the beam splines
+BEAM_SPLINES = ('SPLINE2', 'SPLINE5')
+
+
+def build_spline_matrix(model, spline_ids=None):
+    """
+    Builds the spline matrix that interpolates the structural grid
+    displacements to the aero boxes
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object (must be cross-referenced)
+    spline_ids : List[int]; default=None
+        the SPLINE1/SPLINE2/SPLINE4/SPLINE5 ids; None : all the splines
+
+    Returns
+    -------
+    aero_dofs : (nrows, 2) int ndarray
+        the (box_id, component) of the rows; sorted
+        3 : the box displacement normal to the CAERO panel
+        5 : the box rotation about the spline y-axis (-dw/dx)
+    structure_dofs : (ncols, 2) int ndarray
+        the (node_id, component) of the columns; sorted
+    G : (nrows, ncols) scipy.sparse.csr_matrix
+        the displacement interpolation matrix; the force transfer is G.T
+
+    .. note:: the box displacements are calculated at the box centroid
+    .. note:: the structural degrees of freedom are in the global frame
+              (the grid CD is not considered)
+    .. note:: the infinite plate kernel is r^2 ln(r^2) with DZ added to
+              the diagonal; TPS uses the same kernel and FPS is not
+              supported
+    .. note:: the beam spline uses a cubic bending and a linear torsion
+              kernel (scaled by DTOR); the rotational attachment
+              flexibilities (DTHX/DTHY, THX/THY) are not considered
+    """
+    if spline_ids is None:
+        spline_ids = sorted(model.splines.keys())
+    cache = model._spline_matrix_cache
+
+    if len(spline_ids) == 0:
+        empty = np.zeros((0, 2), dtype='int32')
+        return empty, empty, scipy.sparse.csr_matrix((0, 0))
+
+    node_ids, xyz_cid0 = _get_sorted_xyz_cid0(model, None, None)
+    aero_dofs_list = []
+    structure_dofs_list = []
+    rows = []
+    cols = []
+    data = []
+    nrows = 0
+    ncols = 0
+    for spline_id in spline_ids:
+        spline = model.splines[spline_id]
+        geometry = _get_spline_geometry(model, spline, node_ids, xyz_cid0)
+        geometry_key = _get_geometry_key(spline, geometry)
+        if spline_id not in cache or cache[spline_id][0] != geometry_key:
+            cache[spline_id] = (geometry_key, _build_spline(spline, *geometry))
+        aero_dofsi, structure_dofsi, gi = cache[spline_id][1]
+        irow, icol = np.nonzero(gi)
+        rows.append(irow + nrows)
+        cols.append(icol + ncols)
+        data.append(gi[irow, icol])
+        aero_dofs_list.append(aero_dofsi)
+        structure_dofs_list.append(structure_dofsi)
+        nrows += len(aero_dofsi)
+        ncols += len(structure_dofsi)
+
+    aero_dofs, irows = np.unique(np.vstack(aero_dofs_list), axis=0, return_inverse=True)
+    structure_dofs, icols = np.unique(
+        np.vstack(structure_dofs_list), axis=0, return_inverse=True)
+    rows = irows.ravel()[np.hstack(rows)]
+    cols = icols.ravel()[np.hstack(cols)]
+    shape = (len(aero_dofs), len(structure_dofs))
+    G = scipy.sparse.coo_matrix((np.hstack(data), (rows, cols)), shape=shape).tocsr()
+    return aero_dofs, structure_dofs, G
+
+
+def _get_spline_geometry(model, spline, node_ids, xyz_cid0):
+    """
+    Gets the geometry that defines the block of a spline
+
+    Returns
+    -------
+    box_ids : (nboxes, ) int ndarray
+        the aero box ids
+    xyz_box : (nboxes, 3) float ndarray
+        the box centroids
+    p1234 : (4, 3) float ndarray
+        the CAERO corner points
+    nids : (nnodes, ) int ndarray
+        the structural node ids
+    xyz_grid : (nnodes, 3) float ndarray
+        the structural node locations in the global frame
+    """
+    if spline.type in PLATE_SPLINES:
+        if spline.method not in ('IPS', 'TPS'):
+            raise NotImplementedError('%s eid=%s method=%r is not supported' % (
+                spline.type, spline.eid, spline.method))
+    elif spline.type in BEAM_SPLINES:
+        if spline.type == 'SPLINE5' and spline.method != 'BEAM':
+            raise NotImplementedError('%s eid=%s method=%r is not supported' % (
+                spline.type, spline.eid, spline.method))
+    else:
+        raise NotImplementedError('%s eid=%s is not supported' % (spline.type, spline.eid))
+
+    box_ids, xyz_box, p1234 = _get_box_centroids(model, spline)
+    nids = np.asarray(spline.setg_ref.ids)
+    inode = np.searchsorted(node_ids, nids)
+    inode[inode == len(node_ids)] = 0
+    missing = node_ids[inode] != nids
+    if missing.any():
+        raise KeyError('%s eid=%s; missing GRIDs=%s' % (
+            spline.type, spline.eid, nids[missing].tolist()))
+    xyz_grid = xyz_cid0[inode, :]
+    return box_ids, xyz_box, p1234, nids, xyz_grid
+
+
+def _get_geometry_key(spline, geometry):
+    """
+    Gets the key that a cached spline block is checked against; the block
+    is stale if the boxes, grids, spline frame, or spline flexibility change
+    """
+    key = [array.tobytes() for array in geometry]
+    key.extend([spline.dz, getattr(spline, 'dtor', None)])
+    if spline.type in BEAM_SPLINES:
+        coord = spline.cid_ref
+        key.extend([coord.origin.tobytes(), coord.j.tobytes()])
+    return tuple(key)
+
+
+def _build_spline(spline, box_ids, xyz_box, p1234, nids, xyz_grid):
+    """
+    Builds the dense block of a spline
+
+    Returns
+    -------
+    aero_dofs : (2*nboxes, 2) int ndarray
+        the (box_id, component) of the rows
+    structure_dofs : (3*nnodes, 2) / (6*nnodes, 2) int ndarray
+        the (node_id, component) of the columns
+    gi : (2*nboxes, 3*nnodes) / (2*nboxes, 6*nnodes) float ndarray
+        the interpolation block
+    """
+    p1, p2, p3, p4 = p1234
+    normal = np.cross(p3 - p1, p4 - p2)
+    normal /= np.linalg.norm(normal)
+    if spline.type in PLATE_SPLINES:
+        origin = p1
+        xaxis = (p2 - p1) / np.linalg.norm(p2 - p1)
+        yaxis = np.cross(normal, xaxis)
+    else:
+        coord = spline.cid_ref
+        origin = coord.origin
+        yaxis = coord.j - coord.j.dot(normal) * normal
+        yaxis /= np.linalg.norm(yaxis)
+        xaxis = np.cross(yaxis, normal)
+
+    xk = (xyz_box - origin).dot(xaxis)
+    yk = (xyz_box - origin).dot(yaxis)
+    xs = (xyz_grid - origin).dot(xaxis)
+    ys = (xyz_grid - origin).dot(yaxis)
+
+    nboxes = len(box_ids)
+    nnodes = len(nids)
+    if spline.type in PLATE_SPLINES:
+        g_w, g_slope = _plate_spline(xk, yk, xs, ys, spline.dz)
+        ncomponents = 3
+        gi = np.zeros((nboxes, 2, nnodes, ncomponents), dtype='float64')
+        gi[:, 0, :, :] = g_w[:, :, np.newaxis] * normal
+        gi[:, 1, :, :] = -g_slope[:, :, np.newaxis] * normal
+    else:
+        g_w, g_theta = _beam_spline(yk, ys, spline.dz, spline.dtor)
+        ncomponents = 6
+        gi = np.zeros((nboxes, 2, nnodes, ncomponents), dtype='float64')
+        gi[:, 0, :, :3] = g_w[:, :, np.newaxis] * normal
+        gi[:, 0, :, 3:] = -xk[:, np.newaxis, np.newaxis] * g_theta[:, :, np.newaxis] * yaxis
+        gi[:, 1, :, 3:] = g_theta[:, :, np.newaxis] * yaxis
+
+    aero_dofs = np.column_stack([
+        np.repeat(box_ids, 2),
+        np.tile([3, 5], nboxes),
+    ]).astype('int32')
+    structure_dofs = np.column_stack([
+        np.repeat(nids, ncomponents),
+        np.tile(np.arange(1, ncomponents + 1), nnodes),
+    ]).astype('int32')
+    gi = gi.reshape(2 * nboxes, nnodes * ncomponents)
+    return aero_dofs, structure_dofs, gi
+
+
+def _get_box_centroids(model, spline):
+    """gets the spline's box ids, box centroids, and the CAERO corner points"""
+    caero = spline.caero_ref
+    caero_panels = get_caero_panels(model, caero_ids=[caero.eid])
+    box_ids = np.asarray(spline.aero_element_ids)
+    isort = np.argsort(caero_panels['box_ids'])
+    sorted_box_ids = caero_panels['box_ids'][isort]
+    ibox = np.searchsorted(sorted_box_ids, box_ids)
+    ibox[ibox == len(sorted_box_ids)] = 0
+    missing = sorted_box_ids[ibox] != box_ids
+    if missing.any():
+        raise KeyError('%s eid=%s; CAERO eid=%s does not have boxes=%s' % (
+            spline.type, spline.eid, caero.eid, box_ids[missing].tolist()))
+
+    points = caero_panels['points']
+    elements = caero_panels['elements'][isort[ibox], :]
+    xyz_box = points[elements].mean(axis=1)
+    p1234 = np.array(caero.get_points(), dtype='float64')
+    return box_ids, xyz_box, p1234
+
+
+def _plate_kernel(dx, dy):
+    """r^2 ln(r^2) and its x-derivative; both are 0 at r=0"""
+    r2 = dx ** 2 + dy ** 2
+    is_nonzero = r2 > 0.
+    log_r2 = np.log(np.where(is_nonzero, r2, 1.))
+    kernel = np.where(is_nonzero, r2 * log_r2, 0.)
+    dkernel_dx = np.where(is_nonzero, 2 * dx * (log_r2 + 1.), 0.)
+    return kernel, dkernel_dx
+
+
+def _solve_spline(polynomial, kernel, dz):
+    """
+    Solves the kernel/polynomial system for the unit grid displacements::
+
+      [ 0   P^T    ] {a}   {0}
+      [ P   K + dz ] {F} = {I}
+
+    Returns
+    -------
+    coefficients : (npolynomial + nnodes, nnodes) float ndarray
+        the polynomial (a) and kernel (F) coefficients for each unit
+        grid displacement
+    """
+    nnodes, npolynomial = polynomial.shape
+    nsystem = npolynomial + nnodes
+    A = np.zeros((nsystem, nsystem), dtype='float64')
+    A[:npolynomial, npolynomial:] = polynomial.T
+    A[npolynomial:, :npolynomial] = polynomial
+    A[npolynomial:, npolynomial:] = kernel + dz * np.eye(nnodes)
+    rhs = np.zeros((nsystem, nnodes), dtype='float64')
+    rhs[npolynomial:, :] = np.eye(nnodes)
+    return np.linalg.solve(A, rhs)
+
+
+def _plate_spline(xk, yk, xs, ys, dz):
+    """
+    Infinite plate spline; w = a0 + a1 x + a2 y + sum(F_i r_i^2 ln(r_i^2))
+
+    Returns
+    -------
+    g_w / g_slope : (nboxes, nnodes) float ndarray
+        the box displacement and dw/dx for unit grid displacements
+    """
+    kernel_ss = _plate_kernel(xs[:, np.newaxis] - xs, ys[:, np.newaxis] - ys)[0]
+    polynomial = np.column_stack([np.ones(len(xs)), xs, ys])
+    coefficients = _solve_spline(polynomial, kernel_ss, dz)
+
+    kernel_ks, dkernel_ks = _plate_kernel(xk[:, np.newaxis] - xs, yk[:, np.newaxis] - ys)
+    nboxes = len(xk)
+    g_w = np.hstack([np.ones((nboxes, 1)), xk[:, np.newaxis], yk[:, np.newaxis],
+                     kernel_ks]).dot(coefficients)
+    g_slope = np.hstack([np.zeros((nboxes, 1)), np.ones((nboxes, 1)), np.zeros((nboxes, 1)),
+                         dkernel_ks]).dot(coefficients)
+    return g_w, g_slope
+
+
+def _beam_spline(yk, ys, dz, dtor):
+    """
+    Beam spline along the spline y-axis::
+
+      bending : w = a0 + a1 y + sum(F_i |y - y_i|^3 / 12)
+      torsion : theta = b0 + sum(T_i dtor |y - y_i| / 2)
+
+    Returns
+    -------
+    g_w / g_theta : (nboxes, nnodes) float ndarray
+        the box displacement/twist for unit grid displacements/twists
+    """
+    nboxes = len(yk)
+    dy_ss = np.abs(ys[:, np.newaxis] - ys)
+    dy_ks = np.abs(yk[:, np.newaxis] - ys)
+
+    polynomial = np.column_stack([np.ones(len(ys)), ys])
+    coefficients = _solve_spline(polynomial, dy_ss ** 3 / 12., dz)
+    g_w = np.hstack([np.ones((nboxes, 1)), yk[:, np.newaxis],
+                     dy_ks ** 3 / 12.]).dot(coefficients)
+
+    polynomial = np.ones((len(ys), 1))
+    coefficients = _solve_spline(polynomial, dtor * dy_ss / 2., 0.)
+    g_theta = np.hstack([np.ones((nboxes, 1)), dtor * dy_ks / 2.]).dot(coefficients)
+    return g_w, g_theta
@@ -0,0 +1,88 @@
+from __future__ import print_function
+import os
+import unittest
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.aero_panels import get_caero_panels
+from pyNastran.utils.log import SimpleLogger
+
+pkg_path = pyNastran.__path__[0]
+model_path = os.path.join(pkg_path, '..', 'models')
+
+log = SimpleLogger(level='error')
+
+
+class TestAeroPanels(unittest.TestCase):
+    """tests the batched CAERO box mesh"""
+    def test_caero_panels(self):
+        """checks the CAERO1/CAERO3/CAERO4/CAERO5 boxes and the AESURFs"""
+        model = BDF(log=log)
+        model.add_cord2r(1, origin=[10., 0., 0.], zaxis=[10., 0., 1.], xzplane=[10., 1., 0.])
+        model.add_cord2r(2, origin=[0., 0., 0.], zaxis=[0., 0., 1.], xzplane=[1., 1., 0.])
+        model.add_aero(100., 1.0, 1.0, acsid=2)
+        model.add_paero1(1)
+        model.add_aefact(10, [0., 0.2, 0.7, 1.])
+        model.add_aefact(11, [0., 0.5, 0.75, 1.0])
+        p1 = np.array([0., 0., 0.])
+        p4 = np.array([0.5, 5., 0.])
+        model.add_caero1(1000, 1, 1, p1, 2., p4, 1., nspan=4, lchord=10)
+        model.add_caero1(2000, 1, 1, p1, 2., p4, 1., cp=1, nchord=2, lspan=11)
+
+        model.add_paero3(3, 4, 0, [], [])
+        model.add_aefact(30, [0., 0.5, 1.])
+        model.add_caero3(3000, 3, 30, p1 + [0., 10., 0.], 3., p4 + [0., 10., 0.], 2.)
+        model.add_paero4(4, [], [], [])
+        model.add_caero4(4000, 4, [0., 20., 0.], 3., [1., 22., 0.], 2., lspan=11)
+        model.add_paero5(5, [0., 0.5, 1.0], lxis=50, ltaus=50)
+        model.add_aefact(50, [0., 0.5, 1.0])
+        model.add_caero5(5000, 5, [0., 30., 0.], 3., [1., 32., 0.], 2., nspan=3)
+
+        model.add_aelist(100, [1000, 1001, 1002])
+        model.add_aelist(101, [2003, 4001])
+        model.add_aesurf(1, 'FLAP', 0, 100, cid2=0, alid2=101)
+        model.add_aesurf(2, 'AIL', 0, 101)
+        model.cross_reference()
+
+        caero_panels = get_caero_panels(model)
+        assert np.array_equal(caero_panels['caero_ids'], [1000, 2000, 3000, 4000, 5000])
+        _check_panels(model, caero_panels)
+
+        assert caero_panels['control_surface_labels'] == ['FLAP', 'AIL']
+        box_ids = caero_panels['box_ids']
+        mask = caero_panels['control_surface_mask']
+        assert np.array_equal(box_ids[mask[:, 0]], [1000, 1001, 1002, 2003, 4001])
+        assert np.array_equal(box_ids[mask[:, 1]], [2003, 4001])
+
+        caero_panels2 = model.get_caero_panels(caero_ids=[2000])
+        assert np.array_equal(caero_panels2['box_caero_ids'], [2000] * 6)
+        _check_panels(model, caero_panels2)
+
+    def test_caero_panels_bah(self):
+        """checks the CAERO1s in a CP frame"""
+        bdf_filename = os.path.join(model_path, 'aero', 'bah_plane', 'bah_plane.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        caero_panels = model.get_caero_panels()
+        _check_panels(model, caero_panels)
+        assert caero_panels['control_surface_mask'].shape == (len(caero_panels['box_ids']), 0)
+
+
+def _check_panels(model, caero_panels):
+    """compares the batched boxes to the per-card panel_points_elements"""
+    points = caero_panels['points']
+    elements = caero_panels['elements']
+    box_ids = caero_panels['box_ids']
+    box_caero_ids = caero_panels['box_caero_ids']
+    for eid in caero_panels['caero_ids']:
+        caero = model.caeros[eid]
+        pointsi, elementsi = caero.panel_points_elements()
+        ibox = np.where(box_caero_ids == eid)[0]
+        assert np.allclose(points[elements[ibox]], pointsi[elementsi]), caero.type
+        if hasattr(caero, 'box_ids'):
+            assert np.array_equal(box_ids[ibox], caero.box_ids.ravel()), caero.type
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
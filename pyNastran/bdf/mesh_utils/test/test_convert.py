@@ -2,6 +2,7 @@ from __future__ import print_function
 import os
 import unittest
 
+from six import StringIO
 import numpy as np
 from numpy import allclose
 #import pyNastran
@@ -198,6 +199,26 @@ class TestConvert(unittest.TestCase):
         model.write_bdf(bdf_filename_out)
         os.remove(bdf_filename_out)
 
+    def test_convert_vectorized(self):
+        """the vectorized conversion is the same as the card-by-card conversion"""
+        bdf_filenames = [
+            os.path.join(pkg_path, '..', 'models', 'bwb', 'BWB_saero.bdf'),
+            os.path.join(pkg_path, '..', 'models', 'iSat', 'ISat_Dploy_Sm.dat'),
+            os.path.join(pkg_path, '..', 'models', 'sol_101_elements',
+                         'static_solid_shell_bar.bdf'),
+        ]
+        units_from = ['in', 'lbm', 's']
+        units_to = ['m', 'kg', 's']
+        for bdf_filename in bdf_filenames:
+            decks = []
+            for vectorize in [False, True]:
+                model = read_bdf(bdf_filename, validate=False, log=log, debug=None)
+                convert(model, units_to, units=units_from, vectorize=vectorize)
+                bdf_file = StringIO()
+                model.write_bdf(bdf_file, close=False)
+                decks.append(bdf_file.getvalue())
+            self.assertEqual(decks[0], decks[1], msg=bdf_filename)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,95 @@
+from __future__ import print_function
+import os
+import unittest
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.design_vector import (
+    get_design_vector_map, apply_design_vector)
+from pyNastran.utils.log import SimpleLogger
+
+pkg_path = pyNastran.__path__[0]
+model_path = os.path.join(pkg_path, '..', 'models')
+
+log = SimpleLogger(level='error')
+
+
+class TestDesignVector(unittest.TestCase):
+    """tests the vectorized design variable to property update"""
+    def test_design_vector_dvprel2(self):
+        """checks the PBEAM DVPREL2s against the scalar DEQATN"""
+        bdf_filename = os.path.join(model_path, 'sol200', 'model_200.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        design_map = get_design_vector_map(model)
+        assert np.array_equal(design_map['desvar_ids'], [1000, 2000, 3000])
+        assert len(design_map['equations']) == 1
+
+        for x in ([1., 2., 3.], [0.5, -0.3822, 2e8]):
+            design = apply_design_vector(model, np.array(x), design_map=design_map)
+            x = design['desvar_values']
+            assert x[2] <= 1e8, x
+
+            deqatn = model.dequations[1]
+            for oid, value in zip(design['oid'], design['value']):
+                dvprel = model.dvprels[oid]
+                expected = deqatn.evaluate(*(list(x) + [model.dtable[dvprel.labels[0]]]))
+                expected = max(expected, 1e-15)
+                assert np.isclose(value, expected), (oid, value, expected)
+
+                i = 0 if dvprel.pname_fid == 'I1(A)' else -1
+                assert np.isclose(model.properties[dvprel.Pid()].i1[i], value)
+
+        design = model.apply_design_vector({1000 : 1.})
+        assert np.allclose(design['desvar_values'], [1., -0.3822, 1.6906])
+
+        with self.assertRaises(ValueError):
+            apply_design_vector(model, [1., 2.], design_map=design_map)
+        with self.assertRaises(KeyError):
+            apply_design_vector(model, {42 : 1.}, design_map=design_map)
+
+    def test_design_vector_linear(self):
+        """checks the DVPREL1/DVMREL1/DLINK and the bounds"""
+        model = BDF(log=log)
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_pcomp(2, [1, 1], [0.1, 0.2], thetas=[0., 45.], z0=-0.15)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_desvar(1, 'X1', 0.1, xlb=0.01, xub=1.0)
+        model.add_desvar(2, 'X2', 0.2)
+        model.add_desvar(3, 'X3', 0.2)
+        model.add_dlink(10, 3, [1, 2], [1., 2.], c0=0.5, cmult=2.)
+        model.add_dvprel1(1, 'PSHELL', 1, 'T', [1, 2], [1., 0.5], c0=0.01)
+        model.add_dvprel1(2, 'PCOMP', 2, 'T2', [3], [1.], validate=False)
+        model.add_dvprel1(3, 'PCOMP', 2, 'Z0', [2], [1.], validate=False)
+        model.add_dvprel1(4, 'PSHELL', 1, 'T', [2], [1.], p_max=0.5, validate=False)
+        model.add_dvmrel1(5, 'MAT1', 1, 'E', [1], [1.0e8])
+        model.add_dvmrel1(6, 'MAT1', 1, 'NU', [2], [1.])
+        model.cross_reference()
+
+        design = apply_design_vector(model, {1 : 2.0, 2 : -1.0})
+        x1 = 1.0  # limited by XUB
+        x2 = -1.0
+        x3 = 0.5 + 2. * (x1 + 2. * x2)
+        assert np.allclose(design['desvar_values'], [x1, x2, x3])
+        assert np.array_equal(design['oid'], [1, 2, 3, 4, 5, 6])
+        assert np.array_equal(design['card_type'],
+                              ['DVPREL1'] * 4 + ['DVMREL1'] * 2)
+
+        # PMIN defaults to 1e-15, so the PCOMP T2/Z0 are limited
+        # unless the field may be negative (MAT1 NU)
+        expected = [0.01 + x1 + 0.5 * x2, 1e-15, 1e-15, 1e-15, 1.0e8 * x1, x2]
+        assert np.allclose(design['value'], expected), design['value']
+        assert model.properties[1].t == 1e-15  # the last DVPREL1 wins
+        assert model.properties[2].thicknesses[1] == 1e-15
+        assert model.properties[2].z0 == 1e-15
+        assert model.materials[1].e == 1.0e8
+        assert model.materials[1].nu == -1.0
+
+        design = apply_design_vector(model, {1 : 0.5, 2 : 1.0})
+        assert np.isclose(design['value'][3], 0.5)  # PMAX
+        assert np.isclose(model.properties[2].thicknesses[1], 0.5 + 2. * 2.5)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,97 @@
+from __future__ import print_function
+import unittest
+
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.dynamic_loads import get_dynamic_load_matrix
+from pyNastran.utils.log import SimpleLogger
+
+log = SimpleLogger(level='error')
+
+
+class TestDynamicLoads(unittest.TestCase):
+    """tests the DLOAD load matrix assembly"""
+    def test_dynamic_load_matrix_freq(self):
+        """checks the RLOAD1/RLOAD2 with a DAREA, LSEQ, DELAY, and DPHASE"""
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_darea(100, 1, 3, 2.)
+        model.add_darea(100, 2, 3, 4.)
+        model.add_lseq(5, 200, 10)
+        model.add_force(10, 2, 3., [1., 0., 0.])
+        model.add_moment(10, 1, 1., [0., 0., 2.])
+        model.add_tabled1(1000, [0., 100.], [1., 3.])
+        model.add_tabled1(1001, [0., 100.], [0., 90.])
+        model.add_delay(300, 1, 3, 0.01)
+        model.add_dphase(301, 2, 3, 45.)
+        model.add_rload1(20, 100, delay=300, dphase=301, tc=1000, td=0.5)
+        model.add_rload2(21, 200, tb=1000, tp=1001)
+        model.add_dload(1, 2., [1., 0.5], [20, 21])
+        model.cross_reference()
+
+        freqs = np.array([0., 25., 50.])
+        dofs, load_matrix = get_dynamic_load_matrix(model, 1, freqs)
+        assert np.array_equal(dofs, [[1, 3], [1, 6], [2, 1], [2, 3]]), dofs
+        assert load_matrix.shape == (4, 3)
+        assert load_matrix.dtype == 'complex128'
+
+        c = 1. + freqs / 50.
+        rload1 = (c + 0.5j) * 2.
+        tau = np.array([0.01, 0.])
+        theta = np.radians([0., 45.])
+        phase = theta[:, np.newaxis] - 2 * np.pi * np.outer(tau, freqs)
+        expected_rload1 = np.array([[2.], [4.]]) * rload1 * np.exp(1.j * phase)
+        expected_rload2 = c * np.exp(1.j * np.radians(freqs * 0.9))
+        assert np.allclose(load_matrix[[0, 3], :], expected_rload1)
+        assert np.allclose(load_matrix[1, :], 2. * expected_rload2)
+        assert np.allclose(load_matrix[2, :], 3. * expected_rload2)
+
+        dofs2, load_matrix2 = model.get_dynamic_load_matrix(1, freqs, is_sparse=True)
+        assert np.array_equal(dofs, dofs2)
+        assert np.allclose(load_matrix2.toarray(), load_matrix)
+
+        # the RLOAD1 may be referenced directly
+        dofs, load_matrix = model.get_dynamic_load_matrix(20, freqs)
+        assert np.array_equal(dofs, [[1, 3], [2, 3]]), dofs
+        assert np.allclose(load_matrix, expected_rload1 / 2.)
+
+        # the LSEQ isn't selected by the LOADSET
+        with self.assertRaises(KeyError):
+            model.get_dynamic_load_matrix(21, freqs, loadset_id=6)
+
+    def test_dynamic_load_matrix_time(self):
+        """checks the TLOAD1/TLOAD2"""
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_spoint([10])
+        model.add_darea(100, 1, 2, 2.)
+        model.add_sload(101, [10], [5.])
+        model.add_tabled2(1000, 0., [-1., 0., 1., 2.], [0., 0., 1., 0.])
+        model.add_tload1(20, 100, 1000, delay=0.5)
+        model.add_tload2(21, 101, T1=0.2, T2=1.5, frequency=2., phase=30., c=-0.5, b=1.)
+        model.add_dload(1, 1., [1., 1.], [20, 21])
+        model.add_rload1(30, 100, tc=1000)
+        model.add_dload(2, 1., [1., 1.], [20, 30])
+        model.cross_reference()
+
+        times = np.linspace(0., 2., num=9)
+        dofs, load_matrix = model.get_dynamic_load_matrix(1, times)
+        assert np.array_equal(dofs, [[1, 2], [10, 0]]), dofs
+        assert load_matrix.dtype == 'float64'
+
+        time2 = times - 0.5
+        assert np.allclose(load_matrix[0, :], 2. * np.interp(time2, [-1., 0., 1., 2.], [0., 0., 1., 0.]))
+
+        time2 = times - 0.2
+        expected = time2 * np.exp(-0.5 * time2) * np.cos(4 * np.pi * time2 + np.radians(30.))
+        expected[(time2 < 0.) | (time2 > 1.3)] = 0.
+        assert np.allclose(load_matrix[1, :], 5. * expected)
+
+        with self.assertRaises(RuntimeError):
+            model.get_dynamic_load_matrix(2, times)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,100 @@
+from __future__ import print_function
+import os
+import unittest
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.element_geometry import (
+    get_element_geometry, LINE_TYPES, TRI_TYPES, QUAD_TYPES, SOLID_TYPES)
+from pyNastran.utils.log import SimpleLogger
+
+pkg_path = pyNastran.__path__[0]
+model_path = os.path.join(pkg_path, '..', 'models')
+
+log = SimpleLogger(level='error')
+
+
+class TestElementGeometry(unittest.TestCase):
+    """tests the vectorized element geometry"""
+    def _check_geometry(self, model):
+        """compares the vectorized geometry to the element methods"""
+        geometry = model.get_element_geometry()
+        eids = geometry['element_id']
+        assert len(eids) > 0
+        assert np.array_equal(eids, np.unique(eids))
+        for i, eid in enumerate(eids):
+            elem = model.elements[eid]
+            assert elem.type == geometry['element_type'][i], elem.type
+            # the CPENTA15/CPYRAM13 methods disagree with the linear
+            # elements, so only the CPENTA6/CPYRAM5 are compared
+            is_quadratic = elem.type in ['CPENTA', 'CPYRAM'] and len(elem.nodes) > 6
+            if not is_quadratic:
+                assert np.allclose(geometry['centroid'][i], elem.Centroid()), str(elem)
+
+            if elem.type in LINE_TYPES:
+                assert np.isclose(geometry['length'][i], elem.Length()), str(elem)
+                assert np.isnan(geometry['area'][i])
+            elif elem.type in TRI_TYPES or elem.type in QUAD_TYPES:
+                assert np.isclose(geometry['area'][i], elem.Area()), str(elem)
+                assert np.allclose(geometry['normal'][i], elem.Normal()), str(elem)
+                assert np.isnan(geometry['volume'][i])
+            else:
+                assert elem.type in SOLID_TYPES, elem.type
+                if not is_quadratic:
+                    assert np.isclose(geometry['volume'][i], elem.Volume()), str(elem)
+                assert np.isnan(geometry['length'][i])
+
+    def test_element_geometry_elements(self):
+        """checks the geometry of the various element types"""
+        bdf_filename = os.path.join(model_path, 'elements', 'static_elements.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        self._check_geometry(model)
+
+    def test_element_geometry_solid_shell_bar(self):
+        """checks the geometry of a model with coordinate systems"""
+        bdf_filename = os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        self._check_geometry(model)
+
+    def test_element_geometry_pyram(self):
+        """checks the CPYRAM, the subset, and the quantities"""
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [0.5, 0.5, 3.])
+        model.add_cpyram(10, 100, [1, 2, 3, 4, 5])
+        model.add_cquad4(11, 200, [1, 2, 3, 4])
+        model.add_crod(12, 300, [1, 5])
+        model.add_celas2(13, 1000., [1, 2], c1=1, c2=1)
+        model.add_psolid(100, 1)
+        model.add_pshell(200, mid1=1, t=0.1)
+        model.add_prod(300, 1, A=1.0)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+
+        geometry = model.get_element_geometry()
+        assert np.array_equal(geometry['element_id'], [10, 11, 12]), geometry['element_id']
+        assert np.isclose(geometry['volume'][0], 1.), geometry['volume']
+        assert np.allclose(geometry['centroid'][0], [0.5, 0.5, 1.5]), geometry['centroid']
+        assert np.isclose(geometry['area'][1], 1.), geometry['area']
+        assert np.allclose(geometry['normal'][1], [0., 0., 1.]), geometry['normal']
+        assert np.isclose(geometry['length'][2], np.sqrt(9.5)), geometry['length']
+
+        xyz_cid0 = model.get_xyz_in_coord(cid=0)
+        node_ids = np.array(sorted(model.nodes))
+        geometry = get_element_geometry(model, element_ids=[11],
+                                        quantities=['area'],
+                                        xyz_cid0=xyz_cid0, node_ids=node_ids)
+        assert sorted(geometry) == ['area', 'element_id', 'element_type'], sorted(geometry)
+        assert np.array_equal(geometry['element_id'], [11])
+
+        with self.assertRaises(ValueError):
+            get_element_geometry(model, quantities=['cat'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,106 @@
+from __future__ import print_function
+import os
+import unittest
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.element_quality import (
+    get_element_quality, get_quality_violations, tri_quality, quad_quality)
+from pyNastran.utils.log import SimpleLogger
+
+pkg_path = pyNastran.__path__[0]
+model_path = os.path.join(pkg_path, '..', 'models')
+
+log = SimpleLogger(level='error')
+
+
+class TestElementQuality(unittest.TestCase):
+    """tests the vectorized element quality"""
+    def test_quality_shells(self):
+        """compares the vectorized quality to the single element version"""
+        bdf_filename = os.path.join(model_path, 'bwb', 'BWB_saero.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        quality = model.get_element_quality()
+        eids = quality['element_id']
+        assert len(eids) == 9236 + 136, len(eids)
+
+        for i, eid in enumerate(eids[::50]):
+            i *= 50
+            elem = model.elements[eid]
+            xyz = [node.get_position() for node in elem.nodes_ref]
+            if elem.type == 'CTRIA3':
+                (area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta,
+                 min_edge_length) = tri_quality(*xyz)
+                assert np.isnan(quality['taper_ratio'][i])
+            else:
+                (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+                 min_theta, max_theta, dideal_theta, min_edge_length) = quad_quality(*xyz)
+                assert np.isclose(quality['taper_ratio'][i], taper_ratio)
+                assert np.isclose(quality['area_ratio'][i], area_ratio)
+                assert quality['max_warp_angle'][i] >= 0.
+            assert np.isclose(quality['area'][i], area)
+            assert np.isclose(quality['max_skew_angle'][i], max_skew)
+            assert np.isclose(quality['aspect_ratio'][i], aspect_ratio)
+            assert np.isclose(quality['min_interior_angle'][i], min_theta)
+            assert np.isclose(quality['max_interior_angle'][i], max_theta)
+            assert np.isclose(quality['dideal_theta'][i], dideal_theta)
+            assert np.isclose(quality['min_edge_length'][i], min_edge_length)
+            assert np.isnan(quality['volume'][i])
+
+        violations = get_quality_violations(quality, max_skew=70.)
+        is_skewed = quality['max_skew_angle'] > np.radians(70.)
+        assert np.array_equal(violations['max_skew_angle'], eids[is_skewed])
+        assert len(violations['max_skew_angle']) > 0
+        assert len(violations['min_edge_length']) == 0
+
+    def test_quality_solids(self):
+        """checks the solid metrics and the threshold checks"""
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [0., 0., 1.])
+        model.add_grid(6, [1., 0., 1.])
+        model.add_grid(7, [1., 1., 1.])
+        model.add_grid(8, [0., 1., 1.])
+        model.add_grid(9, [0.5, 0.5, 1.])
+        model.add_grid(10, [1., 1., 0.3]) # a warped quad
+
+        model.add_chexa(1, 100, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_ctetra(2, 100, [1, 2, 4, 5])
+        model.add_cpenta(3, 100, [1, 2, 4, 5, 6, 8])
+        model.add_cpyram(4, 100, [1, 2, 3, 4, 9])
+        model.add_ctetra(5, 100, [1, 4, 2, 5]) # inverted
+        model.add_cquad4(6, 200, [1, 2, 10, 4])
+        model.add_psolid(100, 1)
+        model.add_pshell(200, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+
+        quality = get_element_quality(model)
+        assert np.array_equal(quality['element_id'], [1, 2, 3, 4, 5, 6])
+        assert np.allclose(quality['volume'][:5], [1., 1./6., 0.5, 1./3., -1./6.])
+        assert np.allclose(quality['min_jacobian'][:3], [1., 0.5, 1./np.sqrt(2.)])
+        assert np.isclose(quality['min_jacobian'][3], 1./np.sqrt(1.5))
+        assert quality['min_jacobian'][4] < 0.
+        assert np.isclose(quality['min_interior_angle'][0], np.pi / 2.)
+        assert np.isclose(quality['max_interior_angle'][0], np.pi / 2.)
+        assert np.isclose(quality['dideal_theta'][0], 0.)
+        assert np.isclose(quality['aspect_ratio'][0], 1.)
+        assert np.isclose(quality['aspect_ratio'][1], np.sqrt(2.))
+        assert quality['max_warp_angle'][5] > np.radians(10.)
+        assert np.isnan(quality['max_warp_angle'][0])
+
+        violations = get_quality_violations(quality, max_warp=10., min_jacobian=1e-8)
+        assert np.array_equal(violations['min_jacobian'], [5]), violations
+        assert np.array_equal(violations['max_warp_angle'], [6]), violations
+        violations = get_quality_violations(quality, max_warp=None, min_jacobian=None)
+        assert 'min_jacobian' not in violations
+        assert 'max_warp_angle' not in violations
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,101 @@
+from __future__ import print_function
+import unittest
+
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.laminates import get_laminate_properties
+from pyNastran.utils.log import SimpleLogger
+
+log = SimpleLogger(level='error')
+
+
+def _qbar(e11, e22, nu12, g12, theta):
+    """the rotated orthotropic stiffness per Jones"""
+    nu21 = nu12 * e22 / e11
+    q11 = e11 / (1. - nu12 * nu21)
+    q22 = e22 / (1. - nu12 * nu21)
+    q12 = nu12 * e22 / (1. - nu12 * nu21)
+    q66 = g12
+    c = np.cos(np.radians(theta))
+    s = np.sin(np.radians(theta))
+    qb11 = q11 * c**4 + 2 * (q12 + 2 * q66) * s**2 * c**2 + q22 * s**4
+    qb22 = q11 * s**4 + 2 * (q12 + 2 * q66) * s**2 * c**2 + q22 * c**4
+    qb12 = (q11 + q22 - 4 * q66) * s**2 * c**2 + q12 * (s**4 + c**4)
+    qb66 = (q11 + q22 - 2 * q12 - 2 * q66) * s**2 * c**2 + q66 * (s**4 + c**4)
+    qb16 = (q11 - q12 - 2 * q66) * s * c**3 + (q12 - q22 + 2 * q66) * s**3 * c
+    qb26 = (q11 - q12 - 2 * q66) * s**3 * c + (q12 - q22 + 2 * q66) * s * c**3
+    return np.array([
+        [qb11, qb12, qb16],
+        [qb12, qb22, qb26],
+        [qb16, qb26, qb66],
+    ])
+
+
+class TestLaminates(unittest.TestCase):
+    """tests the batched PCOMP/PCOMPG laminate properties"""
+    def test_laminates(self):
+        """checks the ABD, moduli, mass, and z locations"""
+        model = BDF(log=log)
+        e11, e22, nu12, g12 = 20.e6, 1.5e6, 0.3, 0.8e6
+        model.add_mat8(1, e11, e22, nu12, g12=g12, rho=0.05)
+        model.add_mat1(2, 10.e6, None, 0.25, rho=0.1)
+        model.add_mat2(3, 1.e6, 0.2e6, None, 2.e6, None, 0.5e6, rho=0.2)
+
+        thetas = [0., 30., -45., 90.]
+        thicknesses = [0.1, 0.2, 0.15, 0.05]
+        model.add_pcomp(1, [1, 1, 1, 1], thicknesses, thetas, nsm=0.5, z0=-0.3)
+        model.add_pcomp(2, [2], [0.2])
+        model.add_pcomp(3, [1, 3], [0.1, 0.2], [0., 30.], lam='SYM')
+        model.add_pcomp(4, [1, 3, 3, 1], [0.1, 0.2, 0.2, 0.1], [0., 30., 30., 0.])
+        model.add_pcompg(5, [10, 20], [1, 3], [0.1, 0.2], [0., 30.], lam='SYM')
+        model.add_pshell(6, mid1=2, t=0.1)
+
+        laminates = get_laminate_properties(model)
+        assert np.array_equal(laminates['property_ids'], [1, 2, 3, 4, 5])
+        assert np.array_equal(laminates['nplies'], [4, 1, 4, 4, 4])
+        assert laminates['thicknesses'].shape == (5, 4)
+
+        for i, pid in enumerate(laminates['property_ids']):
+            prop = model.properties[pid]
+            assert np.allclose(laminates['thickness'][i], prop.Thickness())
+            assert np.allclose(laminates['mass_per_area'][i],
+                               prop.get_mass_per_area_rho(
+                                   [model.materials[mid].rho for mid in prop.mids]))
+
+        nplies = laminates['nplies'][0]
+        assert np.allclose(laminates['z'][0, :nplies + 1],
+                           model.properties[1].get_z_locations())
+
+        # a hand rolled ABD
+        z = -0.3 + np.hstack([0., np.cumsum(thicknesses)])
+        abd = np.zeros((6, 6))
+        for theta, z1, z2 in zip(thetas, z[:-1], z[1:]):
+            qbar = _qbar(e11, e22, nu12, g12, theta)
+            abd[:3, :3] += qbar * (z2 - z1)
+            abd[:3, 3:] += qbar * (z2 ** 2 - z1 ** 2) / 2.
+            abd[3:, 3:] += qbar * (z2 ** 3 - z1 ** 3) / 3.
+        abd[3:, :3] = abd[:3, 3:]
+        assert np.allclose(laminates['ABD'][0], abd)
+
+        # an isotropic ply
+        e, nu = 10.e6, 0.25
+        g = e / (2. * (1. + nu))
+        assert np.allclose(laminates['membrane_moduli'][1], [e, e, g, nu])
+        assert np.allclose(laminates['bending_moduli'][1], [e, e, g, nu])
+        assert np.allclose(laminates['ABD'][1, :3, 3:], 0.)
+
+        # the SYM plies are mirrored
+        abd3, abd4, abd5 = laminates['ABD'][2:]
+        assert np.allclose(abd3, abd4)
+        assert np.allclose(abd5, abd4)
+        assert np.allclose(abd3[:3, 3:], 0.)
+        assert np.array_equal(laminates['thetas'][2], [0., 30., 30., 0.])
+
+        laminates2 = model.get_laminate_properties(property_ids=[4, 2])
+        assert np.array_equal(laminates2['property_ids'], [2, 4])
+        assert np.allclose(laminates2['ABD'], laminates['ABD'][[1, 3]])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
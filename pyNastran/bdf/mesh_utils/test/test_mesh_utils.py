@@ -25,7 +25,7 @@ from pyNastran.utils.log import SimpleLogger
 
 # testing these imports are up to date
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
-from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
+from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge, bdf_merge_streaming
 from pyNastran.bdf.mesh_utils.delete_bad_elements import delete_bad_shells
 
 pkg_path = pyNastran.__path__[0]
@@ -351,6 +351,64 @@ class TestMeshUtils(unittest.TestCase):
         os.remove(bdf_filename)
         os.remove(bdf_filename_out)
 
+    def test_eq_bucket(self):
+        r"""
+        Checks the bucketed equivalencing and the interface node sets
+
+          5
+        6 *-------* 40
+          | \     |
+          |   \   |
+          |     \ |
+          *-------* 3
+          1       20
+        """
+        msg = (
+            'CEND\n'
+            'BEGIN BULK\n'
+            'GRID,1, , 0.,   0.,   0.\n'
+            'GRID,20,, 1.,   0.,   0.\n'
+            'GRID,3, , 1.01, 0.,   0.\n'
+            'GRID,40,, 1.,   1.,   0.\n'
+            'GRID,5, , 0.,   1.,   0.\n'
+            'GRID,6, , 0.,   1.01, 0.\n'
+            'CTRIA3,1, 100,1,20,6\n'
+            'CTRIA3,10,100,3,40,5\n'
+            'PSHELL,100,1000,0.1\n'
+            'MAT1,1000,3.0,, 0.3\n'
+            'ENDDATA'
+        )
+        bdf_filename = 'nonunique_bucket.bdf'
+        bdf_filename_out = 'unique_bucket.bdf'
+
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(msg)
+
+        tol = 0.2
+        # Collapse 5/6 and 20/3
+        for nprocs in [1, 2]:
+            model = bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                          renumber_nodes=False, xref=True,
+                                          node_set=None, crash_on_collapse=False,
+                                          method='bucket', nprocs=nprocs,
+                                          log=log, debug=False)
+            model = read_bdf(bdf_filename_out, log=log, debug=False)
+            self.assertEqual(sorted(model.nodes.keys()), [1, 3, 5, 40])
+            os.remove(bdf_filename_out)
+
+        # Only collapse 20/3 because 5/6 are in the same set
+        interface_node_sets = [[1, 20, 5, 6], [3, 40]]
+        for method in ['kdtree', 'bucket']:
+            bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                  renumber_nodes=False, xref=True,
+                                  node_set=None, crash_on_collapse=False,
+                                  method=method, interface_node_sets=interface_node_sets,
+                                  log=log, debug=False)
+            model = read_bdf(bdf_filename_out, log=log, debug=False)
+            self.assertEqual(sorted(model.nodes.keys()), [1, 3, 5, 6, 40])
+            os.remove(bdf_filename_out)
+        os.remove(bdf_filename)
+
     def test_fix_bad_quads(self):
         """split high interior angle quads"""
         msg = [
@@ -450,6 +508,42 @@ class TestMeshUtils(unittest.TestCase):
         read_bdf(bdf_filename_out2, log=log)
         read_bdf(bdf_filename_out3, log=log)
 
+    def test_merge_streaming_01(self):
+        """merges multiple bdfs into a single deck without building the models"""
+        bdf_filename1 = os.path.abspath(os.path.join(
+            pkg_path, '..', 'models', 'sol_101_elements', 'static_solid_shell_bar.bdf'))
+        bdf_filename2 = os.path.abspath(os.path.join(
+            pkg_path, '..', 'models', 'solid_bending', 'solid_bending.bdf'))
+        bdf_filename_out = os.path.abspath(os.path.join(
+            pkg_path, '..', 'models', 'solid_bending', 'merge_streaming.out'))
+
+        bdf_filenames = [bdf_filename1, bdf_filename2, bdf_filename1]
+        offsets = bdf_merge_streaming(bdf_filenames, bdf_filename_out,
+                                      size=8, is_double=False, log=log)
+        self.assertEqual(len(offsets), 3)
+        self.assertEqual(offsets[0]['nid'], 0)
+
+        models = [read_bdf(bdf_filename, log=log) for bdf_filename in bdf_filenames]
+        model = read_bdf(bdf_filename_out, log=log)
+        self.assertEqual(len(model.nodes), sum([len(modeli.nodes) for modeli in models]))
+        self.assertEqual(len(model.elements), sum([len(modeli.elements) for modeli in models]))
+        self.assertEqual(len(model.properties),
+                         sum([len(modeli.properties) for modeli in models]))
+        self.assertEqual(len(model.coords), 1 + sum([len(modeli.coords) - 1 for modeli in models]))
+        self.assertEqual(len(model.params), len(models[0].params))
+
+        for modeli, offsetsi in zip(models, offsets):
+            for nid, node in iteritems(modeli.nodes):
+                node2 = model.nodes[nid + offsetsi['nid']]
+                assert np.allclose(node.get_position(), node2.get_position())
+            for eid, elem in iteritems(modeli.elements):
+                elem2 = model.elements[eid + offsetsi['eid']]
+                self.assertEqual(elem.type, elem2.type)
+                self.assertEqual(elem.Pid() + offsetsi['pid'], elem2.Pid())
+                nids = [nid + offsetsi['nid'] for nid in elem.node_ids]
+                self.assertEqual(nids, elem2.node_ids)
+        os.remove(bdf_filename_out)
+
     def test_export_mcids(self):
         """creates material coordinate systems"""
         bdf_filename = os.path.abspath(os.path.join(
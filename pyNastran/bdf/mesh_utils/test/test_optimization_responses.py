@@ -0,0 +1,138 @@
+from __future__ import print_function
+import os
+import unittest
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import read_bdf
+from pyNastran.op2.op2 import read_op2
+from pyNastran.bdf.mesh_utils.optimization_responses import get_responses
+from pyNastran.utils.log import SimpleLogger
+
+pkg_path = pyNastran.__path__[0]
+model_path = os.path.join(pkg_path, '..', 'models')
+
+log = SimpleLogger(level='error')
+
+
+def _find(responses, dresp_id, key):
+    """gets the rows for a DRESP and an OP2 key (which may be a tuple)"""
+    is_key = np.array([keyi == key for keyi in responses['key']], dtype='bool')
+    return np.where((responses['dresp_id'] == dresp_id) & is_key)[0]
+
+
+class TestOptimizationResponses(unittest.TestCase):
+    """tests the batched DRESP1/DRESP2 evaluation"""
+    def test_responses_sol200(self):
+        """checks the DISP DRESP1s and the DEQATN DRESP2"""
+        bdf_filename = os.path.join(model_path, 'sol200', 'model_200.bdf')
+        op2_filename = os.path.join(model_path, 'sol200', 'model_200.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log, debug=False)
+        responses = model.get_responses(op2_model)
+
+        for key, case in op2_model.displacements.items():
+            for i, dresp_id in enumerate([101, 102, 103, 104, 105]):
+                j = _find(responses, dresp_id, key)
+                assert len(j) == 1, j
+                assert responses['id'][j[0]] == i + 1
+                assert responses['isubcase'][j[0]] == 1
+                assert np.isclose(responses['value'][j[0]], case.data[0, i, 2])
+
+            j = _find(responses, 100, key)
+            assert len(j) == 1, j
+            deqatn = model.dresps[100].dequation_ref
+            expected = deqatn.evaluate(*case.data[0, :5, 2])
+            assert np.isclose(responses['value'][j[0]], expected)
+            assert responses['response_type'][j[0]] == 'DRESP2'
+
+        responses = get_responses(model, op2_model, dresp_ids=[102])
+        assert np.array_equal(responses['dresp_id'], [102, 102])
+
+    def test_responses_elements(self):
+        """checks the STRESS/FORCE element responses by property and element"""
+        bdf_filename = os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        op2_filename = os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log, debug=False)
+
+        # von mises at Z1/Z2 for the PSHELL elements (CQUAD4/CTRIA3)
+        model.add_dresp1(1, 'VMZ1', 'STRESS', 'PSHELL', None, 9, None, [4], validate=False)
+        model.add_dresp1(2, 'VMZ2', 'STRESS', 'PSHELL', None, 17, None, [4], validate=False)
+        # axial force
+        model.add_dresp1(3, 'ROD', 'FORCE', 'ELEM', None, 2, None, [14, 15], validate=False)
+        # the CBAR SA1
+        model.add_dresp1(4, 'BAR', 'STRESS', 'PBAR', None, 2, None, [1], validate=False)
+        model.add_dresp2(5, 'MAXVM', 'MAX', None, {(0, 'DRESP1') : [1, 2]})
+        model.add_dresp1(6, 'SOLID', 'STRESS', 'PSOLID', None, 2, None, [2], validate=False)
+        model.cross_reference()
+
+        responses = get_responses(model, op2_model)
+        dresp_id = responses['dresp_id']
+        assert 6 not in dresp_id
+
+        quad = op2_model.cquad4_stress[1]
+        tri = op2_model.ctria3_stress[1]
+        for dresp_idi, irow in [(1, 0), (2, 1)]:
+            i = dresp_id == dresp_idi
+            assert np.array_equal(responses['id'][i], [6, 7, 8, 9, 10, 11])
+            iquad = [np.searchsorted(quad.element_node[:, 0], eid) + irow for eid in [6, 7]]
+            itri = [np.searchsorted(tri.element_node[:, 0], eid) + irow for eid in [8, 9, 10, 11]]
+            expected = np.hstack([quad.data[0, iquad, 7], tri.data[0, itri, 7]])
+            assert np.allclose(responses['value'][i], expected)
+
+        i = dresp_id == 3
+        rod = op2_model.crod_force[1]
+        assert np.allclose(responses['value'][i], rod.data[0, :, 0])
+
+        i = dresp_id == 4
+        bar = op2_model.cbar_stress[1]
+        assert np.allclose(responses['value'][i], bar.data[0, :, 0])
+
+        i = dresp_id == 5
+        vm = responses['value'][(dresp_id == 1) | (dresp_id == 2)]
+        assert np.isclose(responses['value'][i][0], vm.max())
+
+    def test_responses_dynamic(self):
+        """checks the EIGN/FREQ and the complex FRDISP responses"""
+        bdf_filename = os.path.join(model_path, 'beam_modes', 'beam_modes.dat')
+        op2_filename = os.path.join(model_path, 'beam_modes', 'beam_modes_m1.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log, debug=False)
+        model.add_dresp1(1, 'EIGN', 'EIGN', None, None, 2, None, [], validate=False)
+        model.add_dresp1(2, 'FREQ', 'FREQ', None, None, 3, None, [], validate=False)
+        model.add_dresp1(3, 'WEIGHT', 'WEIGHT', None, None, 33, None, [], validate=False)
+        responses = get_responses(model, op2_model)
+        eigenvalues = list(op2_model.eigenvalues.values())[0]
+        assert np.isclose(responses['value'][0], eigenvalues.eigenvalues[1])
+        assert np.isclose(responses['value'][1], eigenvalues.cycles[2])
+        assert responses['id'][1] == 3
+        assert responses['itime'][2] == -1
+        assert np.isclose(responses['value'][2], op2_model.grid_point_weight.mass[0])
+
+        bdf_filename = os.path.join(model_path, 'sol_101_elements', 'freq_solid_shell_bar.bdf')
+        op2_filename = os.path.join(model_path, 'sol_101_elements', 'freq_solid_shell_bar.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2_model = read_op2(op2_filename, log=log, debug=False)
+        case = op2_model.displacements[1]
+        nid = case.node_gridtype[1, 0]
+        model.add_dresp1(1, 'MAG', 'FRDISP', None, None, 3, None, [nid], validate=False)
+        model.add_dresp1(2, 'PHASE', 'FRDISP', None, None, 9, None, [nid], validate=False)
+        model.add_dresp1(3, 'PEAK', 'FRDISP', None, None, 3, 'MAX', [nid], validate=False)
+        model.add_dresp1(4, 'FREQ', 'FRDISP', None, None, 3, case._times[-1], [nid], validate=False)
+        model.cross_reference()
+        responses = get_responses(model, op2_model)
+        dresp_id = responses['dresp_id']
+        magnitude = np.abs(case.data[:, 1, 2])
+        assert np.allclose(responses['value'][dresp_id == 1], magnitude)
+        assert np.allclose(responses['time'][dresp_id == 1], case._times)
+        assert np.allclose(responses['value'][dresp_id == 2],
+                           np.angle(case.data[:, 1, 2], deg=True))
+        assert np.isclose(responses['value'][dresp_id == 3][0], magnitude.max())
+        assert responses['itime'][dresp_id == 3][0] == -1
+        assert np.isclose(responses['value'][dresp_id == 4][0], magnitude[-1])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import print_function
+import os
+import unittest
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.pressure_loads import get_pressure_arrays
+from pyNastran.utils.log import SimpleLogger
+
+pkg_path = pyNastran.__path__[0]
+model_path = os.path.join(pkg_path, '..', 'models')
+
+log = SimpleLogger(level='error')
+
+
+class TestPressureLoads(unittest.TestCase):
+    """tests the batched pressure/nodal force arrays"""
+    def test_pressure_arrays_shells(self):
+        """checks the PLOAD/PLOAD2/PLOAD4 on shells with LOAD combinations"""
+        model = BDF(log=log)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [2., 0., 0.])
+        model.add_grid(3, [2., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        model.add_grid(5, [3., 0., 0.])
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_cquad4(11, 1, [1, 2, 3, 4])
+        model.add_ctria3(12, 1, [2, 5, 3])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_cord2r(2, origin=[0., 0., 0.], zaxis=[1., 0., 0.], xzplane=[0., 1., 0.])
+
+        model.add_pload4(100, [10, 11], [1., 1., 1., 1.])
+        model.add_pload4(100, [12], [2., 4., 6., 2.])
+        model.add_pload2(101, 3., [10])
+        model.add_pload4(102, [11], [2., 2., 2., 2.], cid=2, nvector=[0., 0., 1.])
+        model.add_pload(103, 5., [1, 2, 3, 4])
+        model.add_load(200, 2., [1., 0.5], [100, 101])
+        model.cross_reference()
+
+        pressure_arrays = get_pressure_arrays(model)
+        assert np.array_equal(pressure_arrays['load_case_ids'], [100, 101, 102, 103, 200])
+        assert np.array_equal(pressure_arrays['element_ids'], [10, 11, 12])
+        assert np.array_equal(pressure_arrays['node_ids'], [1, 2, 3, 4, 5])
+        pressures = pressure_arrays['pressures']
+        forces = pressure_arrays['forces']
+        assert forces.shape == (5, 3, 5)
+
+        expected = np.array([
+            [1., 3., 0., 0., 5.],
+            [1., 0., 2., 0., 2.],
+            [4., 0., 0., 0., 8.],
+        ])
+        assert np.allclose(pressures, expected), pressures
+
+        # sum_forces_moments doesn't support the PLOAD4 cid
+        for icase, load_case_id in enumerate([100, 101, 102, 103, 200]):
+            if load_case_id == 102:
+                continue
+            force, unused_moment = model.sum_forces_moments([0., 0., 0.], load_case_id)
+            assert np.allclose(forces[:, :, icase].sum(axis=0), force), (
+                load_case_id, forces[:, :, icase].sum(axis=0), force)
+
+        # the cid=2 z-axis is the global x-axis
+        assert np.allclose(forces[:, :, 2].sum(axis=0), [4., 0., 0.])
+        # (5 * 2 + 2 * 2) / 4 on the quad nodes; 8 * 0.5 / 3 on the triangle nodes
+        assert np.allclose(forces[:, 2, 4], 3.5 * np.array([1., 1., 1., 1., 0.]) +
+                           4. / 3. * np.array([0., 1., 1., 0., 1.]))
+        assert np.allclose(forces[:, 2, 3], [2.5, 2.5, 2.5, 2.5, 0.])
+
+        pressure_arrays2 = model.get_pressure_arrays(load_case_ids=[200])
+        assert np.allclose(pressure_arrays2['pressures'][:, 0], expected[:, 4])
+        assert np.allclose(pressure_arrays2['forces'][:, :, 0], forces[:, :, 4])
+
+    def test_pressure_arrays_solids(self):
+        """checks the solid PLOAD4 against sum_forces_moments"""
+        for etype in ['ctetra', 'chexa', 'cpenta']:
+            bdf_filename = os.path.join(model_path, 'pload4', etype + '.bdf')
+            model = read_bdf(bdf_filename, log=log)
+            pressure_arrays = get_pressure_arrays(model)
+            forces = pressure_arrays['forces']
+            for icase, load_case_id in enumerate(pressure_arrays['load_case_ids']):
+                force, unused_moment = model.sum_forces_moments([0., 0., 0.], int(load_case_id))
+                assert np.allclose(forces[:, :, icase].sum(axis=0), force), etype
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,131 @@
+from __future__ import print_function
+import unittest
+
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.splines import build_spline_matrix
+from pyNastran.utils.log import SimpleLogger
+
+log = SimpleLogger(level='error')
+
+
+def _get_aero_model():
+    """a 4x2 box CAERO1 in the global xy plane"""
+    model = BDF(log=log)
+    model.add_aero(100., 1.0, 1.0)
+    model.add_paero1(1)
+    model.add_caero1(1000, 1, 1, np.array([0., 0., 0.]), 4., np.array([0., 10., 0.]), 4.,
+                     nspan=4, nchord=2)
+    return model
+
+
+class TestSplines(unittest.TestCase):
+    """tests the SPLINEx interpolation matrix"""
+    def test_plate_spline(self):
+        """checks that the SPLINE1/SPLINE4 reproduce rigid plate motions"""
+        model = _get_aero_model()
+        xyz = np.array([
+            [0., 0., 0.],
+            [3., 1., 0.],
+            [1., 7., 0.],
+            [4., 10., 0.],
+            [2., 5., 0.],
+        ])
+        for nid, xyzi in enumerate(xyz, start=1):
+            model.add_grid(nid, xyzi)
+        model.add_set1(10, [1, 2, 3, 4, 5])
+        model.add_set1(11, [1, 2, 3, 4])
+        model.add_spline1(100, 1000, 1000, 1003, 10)
+        model.add_aelist(20, [1004, 1005, 1006, 1007])
+        model.add_spline4(101, 1000, 20, 11, 0., 'IPS', 'BOTH', 10, 10)
+        model.cross_reference()
+
+        aero_dofs, structure_dofs, G = build_spline_matrix(model)
+        assert G.shape == (16, 15), G.shape
+        assert np.array_equal(aero_dofs[:, 0], np.repeat(np.arange(1000, 1008), 2))
+        assert np.array_equal(aero_dofs[:, 1], np.tile([3, 5], 8))
+        assert np.array_equal(structure_dofs[:, 0], np.repeat([1, 2, 3, 4, 5], 3))
+
+        # w = 0.5 + 0.2 x - 0.1 y
+        u = np.zeros(15)
+        u[2::3] = 0.5 + 0.2 * xyz[:, 0] - 0.1 * xyz[:, 1]
+        u_k = G.dot(u)
+
+        caero_panels = model.get_caero_panels()
+        isort = np.argsort(caero_panels['box_ids'])
+        elements = caero_panels['elements'][isort]
+        xyz_box = caero_panels['points'][elements].mean(axis=1)
+        assert np.allclose(u_k[::2], 0.5 + 0.2 * xyz_box[:, 0] - 0.1 * xyz_box[:, 1])
+        assert np.allclose(u_k[1::2], -0.2)
+
+        # the in-plane motions aren't transferred
+        u = np.zeros(15)
+        u[0::3] = 1.
+        u[1::3] = 2.
+        assert np.allclose(G.dot(u), 0.)
+
+        # the blocks are cached until a GRID/CORDx/SPLINEx/CAEROx/AELIST/SETx
+        # is added or the spline geometry changes
+        cache = model._spline_matrix_cache
+        assert sorted(cache) == [100, 101]
+        gi = cache[100][1][2]
+        G2 = model.build_spline_matrix(spline_ids=[100])[2]
+        assert cache[100][1][2] is gi
+        assert np.allclose(G2.toarray(), G.toarray()[:8, :])
+
+        model.nodes[1].xyz[2] = 0.1
+        model.build_spline_matrix(spline_ids=[100])
+        assert cache[100][1][2] is not gi
+        model.nodes[1].xyz[2] = 0.
+
+        model.add_set1(12, [1, 2, 3])
+        assert len(cache) == 0
+        model.build_spline_matrix()
+        assert sorted(cache) == [100, 101]
+        model.add_grid(20, [0., 0., 0.])
+        assert len(cache) == 0
+
+    def test_beam_spline(self):
+        """checks that the SPLINE2/SPLINE5 reproduce beam bending and torsion"""
+        model = _get_aero_model()
+        model.add_cord2r(1, origin=[1., 0., 0.], zaxis=[1., 0., 1.], xzplane=[2., 0., 0.])
+        ys = np.array([0., 3., 6., 10.])
+        for nid, yi in enumerate(ys, start=1):
+            model.add_grid(nid, [1., yi, 0.])
+        model.add_set1(10, [1, 2, 3, 4])
+        model.add_spline2(100, 1000, 1000, 1007, 10, cid=1)
+        model.add_aelist(20, [1000, 1001, 1002, 1003, 1004, 1005, 1006, 1007])
+        model.add_spline5(101, 1000, 20, 10, 0., 0., cid=1)
+        model.cross_reference()
+
+        aero_dofs, structure_dofs, G = build_spline_matrix(model, spline_ids=[100])
+        assert G.shape == (16, 24), G.shape
+        assert np.array_equal(structure_dofs[:, 1], np.tile(np.arange(1, 7), 4))
+
+        # w = 0.3 - 0.05 y; twist=0.1 about the spline y-axis
+        u = np.zeros((4, 6))
+        u[:, 2] = 0.3 - 0.05 * ys
+        u[:, 4] = 0.1
+        u_k = G.dot(u.ravel())
+
+        caero_panels = model.get_caero_panels()
+        isort = np.argsort(caero_panels['box_ids'])
+        elements = caero_panels['elements'][isort]
+        xyz_box = caero_panels['points'][elements].mean(axis=1)
+        w = 0.3 - 0.05 * xyz_box[:, 1] - 0.1 * (xyz_box[:, 0] - 1.)
+        assert np.allclose(u_k[::2], w)
+        assert np.allclose(u_k[1::2], 0.1)
+
+        # bending through the grid points
+        u = np.zeros((4, 6))
+        u[:, 2] = ys ** 2
+        u_k = G.dot(u.ravel())
+        assert np.all(np.diff(u_k[[0, 4, 8, 12]]) > 0.)
+
+        G5 = model.build_spline_matrix(spline_ids=[101])[2]
+        assert np.allclose(G5.toarray(), G.toarray())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -12,7 +12,7 @@ from __future__ import print_function
 import os
 import sys
 from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
-from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge
+from pyNastran.bdf.mesh_utils.bdf_merge import bdf_merge, bdf_merge_streaming
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
 from pyNastran.bdf.mesh_utils.pierce_shells import pierce_shell_model
 
@@ -320,7 +320,7 @@ def cmd_line_merge():  # pragma: no cover
     from docopt import docopt
     import pyNastran
     msg = "Usage:\n"
-    msg += "  bdf merge (IN_BDF_FILENAMES)... [-o OUT_BDF_FILENAME]\n"
+    msg += "  bdf merge (IN_BDF_FILENAMES)... [-o OUT_BDF_FILENAME] [--stream]\n"
     msg += '  bdf merge -h | --help\n'
     msg += '  bdf merge -v | --version\n'
     msg += '\n'
@@ -330,7 +330,8 @@ def cmd_line_merge():  # pragma: no cover
     msg += '\n'
 
     msg += 'Options:\n'
-    msg += "  -o OUT, --output  OUT_BDF_FILENAME  path to output BDF/DAT/NAS file\n\n"
+    msg += "  -o OUT, --output  OUT_BDF_FILENAME  path to output BDF/DAT/NAS file\n"
+    msg += "  --stream          merge the decks without building the models (no renumbering)\n\n"
 
     msg += 'Info:\n'
     msg += '  -h, --help      show this help message and exit\n'
@@ -354,6 +355,10 @@ def cmd_line_merge():  # pragma: no cover
     cards_to_skip = [
         'AEFACT', 'CAERO1', 'CAERO2', 'SPLINE1', 'SPLINE2',
         'AERO', 'AEROS', 'PAERO1', 'PAERO2', 'MKAERO1']
+    if data['--stream']:
+        bdf_merge_streaming(bdf_filenames, bdf_filename_out, encoding=None, size=size,
+                            is_double=False, cards_to_skip=cards_to_skip)
+        return
     bdf_merge(bdf_filenames, bdf_filename_out, renumber=True,
               encoding=None, size=size, is_double=False, cards_to_skip=cards_to_skip)
 
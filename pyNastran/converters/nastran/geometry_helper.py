@@ -9,10 +9,8 @@ import numpy as np
 from numpy.linalg import norm
 
 from pyNastran.utils import integer_types, iteritems
-
-
-piover2 = np.pi / 2.
-piover3 = np.pi / 3.
+from pyNastran.bdf.mesh_utils.element_quality import (
+    tri_quality, quad_quality, get_min_max_theta)
 
 
 class NastranGuiAttributes(object):
@@ -477,235 +475,3 @@ class NastranGeometryHelper(NastranGuiAttributes):
             bulk[i] = bulki
             speed_of_sound[i] = speed_of_soundi
         return has_mat8, has_mat11, e11, e22, e33
-
-def tri_quality(p1, p2, p3):
-    """gets the quality metrics for a tri"""
-    e1 = (p1 + p2) / 2.
-    e2 = (p2 + p3) / 2.
-    e3 = (p3 + p1) / 2.
-
-    #    3
-    #    / \
-    # e3/   \ e2
-    #  /    /\
-    # /    /  \
-    # 1---/----2
-    #    e1
-    e21 = e2 - e1
-    e31 = e3 - e1
-    e32 = e3 - e2
-
-    e3_p2 = e3 - p2
-    e2_p1 = e2 - p1
-    e1_p3 = e1 - p3
-
-    v21 = p2 - p1
-    v32 = p3 - p2
-    v13 = p1 - p3
-    length21 = np.linalg.norm(v21)
-    length32 = np.linalg.norm(v32)
-    length13 = np.linalg.norm(v13)
-    min_edge_length = min(length21, length32, length13)
-    areai = 0.5 * np.linalg.norm(np.cross(v21, v13))
-
-    cos_skew1 = np.dot(e2_p1, e31) / (np.linalg.norm(e2_p1) * np.linalg.norm(e31))
-    cos_skew2 = np.dot(e2_p1, -e31) / (np.linalg.norm(e2_p1) * np.linalg.norm(e31))
-    cos_skew3 = np.dot(e3_p2, e21) / (np.linalg.norm(e3_p2) * np.linalg.norm(e21))
-    cos_skew4 = np.dot(e3_p2, -e21) / (np.linalg.norm(e3_p2) * np.linalg.norm(e21))
-    cos_skew5 = np.dot(e1_p3, e32) / (np.linalg.norm(e1_p3) * np.linalg.norm(e32))
-    cos_skew6 = np.dot(e1_p3, -e32) / (np.linalg.norm(e1_p3) * np.linalg.norm(e32))
-    max_skew = np.pi / 2. - np.abs(np.arccos(np.clip([
-        cos_skew1, cos_skew2, cos_skew3,
-        cos_skew4, cos_skew5, cos_skew6], -1., 1.))).min()
-    lengths = np.linalg.norm([v21, v32, v13], axis=1)
-    #assert len(lengths) == 3, lengths
-    aspect_ratio = lengths.max() / lengths.min()
-
-    cos_theta1 = np.dot(v21, -v13) / (length21 * length13)
-    cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
-    cos_theta3 = np.dot(v13, -v32) / (length13 * length32)
-    thetas = np.arccos(np.clip([cos_theta1, cos_theta2, cos_theta3], -1., 1.))
-    min_thetai = thetas.min()
-    max_thetai = thetas.max()
-    dideal_thetai = max(max_thetai - piover3, piover3 - min_thetai)
-
-    #theta_deg = np.degrees(np.arccos(max_cos_theta))
-    #if theta_deg < 60.:
-        #print('p1=%s' % xyz_cid0[p1, :])
-        #print('p2=%s' % xyz_cid0[p2, :])
-        #print('p3=%s' % xyz_cid0[p3, :])
-        #print('theta1=%s' % np.degrees(np.arccos(cos_theta1)))
-        #print('theta2=%s' % np.degrees(np.arccos(cos_theta2)))
-        #print('theta3=%s' % np.degrees(np.arccos(cos_theta3)))
-        #print('max_theta=%s' % theta_deg)
-        #asdf
-    return areai, max_skew, aspect_ratio, min_thetai, max_thetai, dideal_thetai, min_edge_length
-
-
-def quad_quality(p1, p2, p3, p4):
-    """gets the quality metrics for a quad"""
-    v21 = p2 - p1
-    v32 = p3 - p2
-    v43 = p4 - p3
-    v14 = p1 - p4
-    length21 = np.linalg.norm(v21)
-    length32 = np.linalg.norm(v32)
-    length43 = np.linalg.norm(v43)
-    length14 = np.linalg.norm(v14)
-    min_edge_length = min(length21, length32, length43, length14)
-
-    v42 = p4 - p2
-    v31 = p3 - p1
-    p12 = (p1 + p2) / 2.
-    p23 = (p2 + p3) / 2.
-    p34 = (p3 + p4) / 2.
-    p14 = (p4 + p1) / 2.
-    v31 = p3 - p1
-    v42 = p4 - p2
-    normal = np.cross(v31, v42)
-    areai = 0.5 * np.linalg.norm(normal)
-
-    # still kind of in development
-    #
-    # the ratio of the ideal area to the actual area
-    # this is an hourglass check
-    areas = [
-        np.linalg.norm(np.cross(-v14, v21)), # v41 x v21
-        np.linalg.norm(np.cross(v32, -v21)), # v32 x v12
-        np.linalg.norm(np.cross(v43, -v32)), # v43 x v23
-        np.linalg.norm(np.cross(v14, v43)),  # v14 x v43
-    ]
-    #
-    # for:
-    #   area=1; area1=0.5 -> area_ratioi1=2.0; area_ratio=2.0
-    #   area=1; area1=2.0 -> area_ratioi2=2.0; area_ratio=2.0
-    area_ratioi1 = areai / min(areas)
-    area_ratioi2 = max(areas) / areai
-    area_ratioi = max(area_ratioi1, area_ratioi2)
-
-    area1 = 0.5 * np.linalg.norm(np.cross(-v14, v21)) # v41 x v21
-    area2 = 0.5 * np.linalg.norm(np.cross(-v21, v32)) # v12 x v32
-    area3 = 0.5 * np.linalg.norm(np.cross(v43, v32)) # v43 x v32
-    area4 = 0.5 * np.linalg.norm(np.cross(v14, -v43)) # v14 x v34
-    aavg = (area1 + area2 + area3 + area4) / 4.
-    taper_ratioi = (abs(area1 - aavg) + abs(area2 - aavg) +
-                    abs(area3 - aavg) + abs(area4 - aavg)) / aavg
-
-    #    e3
-    # 4-------3
-    # |       |
-    # |e4     |  e2
-    # 1-------2
-    #     e1
-    e13 = p34 - p12
-    e42 = p23 - p14
-    cos_skew1 = np.dot(e13, e42) / (np.linalg.norm(e13) * np.linalg.norm(e42))
-    cos_skew2 = np.dot(e13, -e42) / (np.linalg.norm(e13) * np.linalg.norm(e42))
-    max_skew = np.pi / 2. - np.abs(np.arccos(
-        np.clip([cos_skew1, cos_skew2], -1., 1.))).min()
-    #aspect_ratio = max(p12, p23, p34, p14) / max(p12, p23, p34, p14)
-    lengths = np.linalg.norm([v21, v32, v43, v14], axis=1)
-    #assert len(lengths) == 3, lengths
-    aspect_ratio = lengths.max() / lengths.min()
-
-    cos_theta1 = np.dot(v21, -v14) / (length21 * length14)
-    cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
-    cos_theta3 = np.dot(v43, -v32) / (length43 * length32)
-    cos_theta4 = np.dot(v14, -v43) / (length14 * length43)
-    #max_thetai = np.arccos([cos_theta1, cos_theta2, cos_theta3, cos_theta4]).max()
-
-    # dot the local normal with the normal vector
-    # then take the norm of that to determine the angle relative to the normal
-    # then take the sign of that to see if we're pointing roughly towards the normal
-
-    # np.sign(np.linalg.norm(np.dot(
-    # a x b = ab sin(theta)
-    # a x b / ab = sin(theta)
-    # sin(theta) < 0. -> normal is flipped
-    normal2 = np.sign(np.dot(np.cross(v21, v32), normal))
-    normal3 = np.sign(np.dot(np.cross(v32, v43), normal))
-    normal4 = np.sign(np.dot(np.cross(v43, v14), normal))
-    normal1 = np.sign(np.dot(np.cross(v14, v21), normal))
-    n = np.array([normal1, normal2, normal3, normal4])
-    theta_additional = np.where(n < 0, 2*np.pi, 0.)
-
-    theta = n * np.arccos(np.clip(
-        [cos_theta1, cos_theta2, cos_theta3, cos_theta4], -1., 1.)) + theta_additional
-    min_thetai = theta.min()
-    max_thetai = theta.max()
-    dideal_thetai = max(max_thetai - piover2, piover2 - min_thetai)
-    #print('theta_max = ', theta_max)
-
-    #if 0:
-        ## warp
-        #v31 = xyz_cid0[p3, :] - xyz_cid0[p1, :]
-        #n1a = np.cross(v21, v31) # v21 x v31
-        #n1b = np.cross(v31, -v14) # v31 x v41
-        #warp1 = np.dot(n1a, n1b) / (np.linalg.norm(n1a) * np.linalg.norm(n1b))
-
-        #v42 = xyz_cid0[p4, :] - xyz_cid0[p2, :]
-        #n2a = np.cross(v32, v42) # v32 x v42
-        #n2b = np.cross(v42, -v21) # v42 x v12
-        #warp2 = np.dot(n2a, n2b) / (np.linalg.norm(n2a) * np.linalg.norm(n2b))
-        #max_warp = max(np.arccos(warp1), np.arccos(warp2))
-    out = (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
-           min_thetai, max_thetai, dideal_thetai, min_edge_length)
-    return out
-
-def get_min_max_theta(faces, all_node_ids, nid_map, xyz_cid0):
-    """get the min/max thetas for CTETRA, CPENTA, CHEXA, CPYRAM"""
-    cos_thetas = []
-    ideal_theta = []
-    #print('faces =', faces)
-    #assert len(faces) > 0, 'faces=%s nids=%s' % (faces, all_node_ids)
-    for face in faces:
-        if len(face) == 3:
-            node_ids = all_node_ids[face[0]], all_node_ids[face[1]], all_node_ids[face[2]]
-            n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
-            v21 = xyz_cid0[n2, :] - xyz_cid0[n1, :]
-            v32 = xyz_cid0[n3, :] - xyz_cid0[n2, :]
-            v13 = xyz_cid0[n1, :] - xyz_cid0[n3, :]
-            length21 = np.linalg.norm(v21)
-            length32 = np.linalg.norm(v32)
-            length13 = np.linalg.norm(v13)
-            min_edge_length = min(length21, length32, length13)
-
-            cos_theta1 = np.dot(v21, -v13) / (length21 * length13)
-            cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
-            cos_theta3 = np.dot(v13, -v32) / (length13 * length32)
-            cos_thetas.extend([cos_theta1, cos_theta2, cos_theta3])
-            ideal_theta.extend([piover3, piover3, piover3])
-        elif len(face) == 4:
-            try:
-                node_ids = (all_node_ids[face[0]], all_node_ids[face[1]],
-                            all_node_ids[face[2]], all_node_ids[face[3]])
-            except:
-                print(face)
-                print(node_ids)
-                raise
-
-            n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
-            v21 = xyz_cid0[n2, :] - xyz_cid0[n1, :]
-            v32 = xyz_cid0[n3, :] - xyz_cid0[n2, :]
-            v43 = xyz_cid0[n4, :] - xyz_cid0[n3, :]
-            v14 = xyz_cid0[n1, :] - xyz_cid0[n4, :]
-            length21 = np.linalg.norm(v21)
-            length32 = np.linalg.norm(v32)
-            length43 = np.linalg.norm(v43)
-            length14 = np.linalg.norm(v14)
-            min_edge_length = min(length21, length32, length43, length14)
-            cos_theta1 = np.dot(v21, -v14) / (length21 * length14)
-            cos_theta2 = np.dot(v32, -v21) / (length32 * length21)
-            cos_theta3 = np.dot(v43, -v32) / (length43 * length32)
-            cos_theta4 = np.dot(v14, -v43) / (length14 * length43)
-            cos_thetas.extend([cos_theta1, cos_theta2, cos_theta3, cos_theta4])
-            ideal_theta.extend([piover2, piover2, piover2, piover2])
-        else:
-            raise NotImplementedError(face)
-    thetas = np.arccos(cos_thetas)
-    ideal_theta = np.array(ideal_theta)
-    ideal_thetai = max((thetas - ideal_theta).max(), (ideal_theta - thetas).min())
-
-    min_thetai = thetas.min()
-    max_thetai = thetas.max()
-    return min_thetai, max_thetai, ideal_thetai, min_edge_length
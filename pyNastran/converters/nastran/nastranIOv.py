@@ -1839,24 +1839,16 @@ class NastranIO(NastranGuiResults, NastranGeometryHelper):
                 ncaeros_points += points.shape[0]
                 ncaeros += elems.shape[0]
 
-        num_prev = 0
         ncaeros_sub = 0
         if model.caeros:
-            caero_points = []
-            for eid, caero in sorted(iteritems(model.caeros)):
-                if caero.type in ['CAERO1', 'CAERO4']:
-                    ncaeros_sub += 1
-                    pointsi, elementsi = caero.panel_points_elements()
-                    caero_points.append(pointsi)
-                    for i, box_id in enumerate(caero.box_ids.flat):
-                        box_id_to_caero_element_map[box_id] = elementsi[i, :] + num_prev
-                    num_prev += pointsi.shape[0]
-                elif caero.type == 'CAERO2':
-                    pass
-                else:
-                    print('caero\n%s' % caero)
+            caero_ids = [eid for eid, caero in iteritems(model.caeros)
+                         if caero.type in ['CAERO1', 'CAERO4']]
+            ncaeros_sub = len(caero_ids)
             if ncaeros_sub:
-                caero_points = np.vstack(caero_points)
+                caero_panels = model.get_caero_panels(caero_ids=caero_ids)
+                caero_points = caero_panels['points']
+                box_id_to_caero_element_map = dict(zip(
+                    caero_panels['box_ids'], caero_panels['elements']))
             self.has_caero = True
         if ncaeros_sub == 0:
             caero_points = np.empty((0, 3))
@@ -0,0 +1,99 @@
+"""
+defines:
+ - benchmark_nprocs(op2_filename, nprocs_list=None, nrepeat=3, log=None)
+
+Times the OP2 reader for a series of process counts (``nprocs``), so the
+wall time of the parallel result reading may be compared to the serial
+reader.  The table of contents is built once and shared by the runs, so
+the scan isn't included in the read times.
+
+Each result object is read by one worker, so a speedup is only expected
+for large files with many independent result objects; a file that's
+mostly one table (e.g., a SOL 112) or a small file is slower than the
+serial reader because of the worker startup.
+
+Usage:
+    python benchmark_nprocs.py OP2_FILENAME [NREPEAT] [NPROCS...]
+"""
+from __future__ import print_function
+import sys
+import time
+
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.op2_toc import get_op2_toc
+from pyNastran.utils.log import get_logger
+
+
+def benchmark_nprocs(op2_filename, nprocs_list=None, nrepeat=3, log=None):
+    """
+    Times the OP2 reader for each process count and checks that the
+    results are the same as the serial reader
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    nprocs_list : List[int]; default=None -> [1, 2, 4]
+        the process counts to time
+    nrepeat : int; default=3
+        the number of times to read the OP2; the fastest run is used
+    log : logger; default=None
+        a logger object
+
+    Returns
+    -------
+    times : Dict[nprocs] = float
+        the fastest read time (sec); nprocs=1 is the serial reader
+        without a table of contents
+    """
+    if log is None:
+        log = get_logger(level='warning')
+    if nprocs_list is None:
+        nprocs_list = [1, 2, 4]
+
+    time0 = time.time()
+    toc = get_op2_toc(op2_filename, log=log)
+    dt_toc = time.time() - time0
+
+    times = {}
+    stats = None
+    for nprocs in nprocs_list:
+        dts = []
+        for unused_i in range(nrepeat):
+            model = OP2(debug=False, log=log)
+            time0 = time.time()
+            if nprocs == 1:
+                model.read_op2(op2_filename)
+            else:
+                model.read_op2(op2_filename, toc=toc, nprocs=nprocs)
+            dts.append(time.time() - time0)
+        times[nprocs] = min(dts)
+
+        statsi = model.get_op2_stats()
+        if stats is None:
+            stats = statsi
+        elif statsi != stats:
+            raise RuntimeError('the results of %r are different for nprocs=%s' % (
+                op2_filename, nprocs))
+
+    print('toc scan: %.4f sec; npairs=%s' % (dt_toc, toc.npairs))
+    print('%-8s %10s %8s' % ('nprocs', 'time', 'speedup'))
+    dt_serial = times.get(1)
+    for nprocs, dt in sorted(times.items()):
+        speedup = '%7.2fx' % (dt_serial / dt) if dt_serial else ''
+        print('%-8s %10.4f %8s' % (nprocs, dt, speedup))
+    return times
+
+
+def main():  # pragma: no cover
+    """the interface for benchmark_nprocs"""
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    op2_filename = sys.argv[1]
+    nrepeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    nprocs_list = [int(nprocs) for nprocs in sys.argv[3:]] or None
+    benchmark_nprocs(op2_filename, nprocs_list=nprocs_list, nrepeat=nrepeat)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
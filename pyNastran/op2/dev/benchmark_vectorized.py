@@ -0,0 +1,94 @@
+"""
+defines:
+ - benchmark_vectorized(op2_filename, result_names=None, nrepeat=3, log=None)
+
+Compares the struct based (``use_vector=False``) and vectorized
+(``use_vector=True``) OP2 readers result by result, so each element/result
+branch of the table readers is timed on its own.
+
+Usage:
+    python benchmark_vectorized.py OP2_FILENAME [NREPEAT]
+"""
+from __future__ import print_function
+import sys
+import time
+
+import numpy as np
+
+from pyNastran.op2.op2 import OP2
+from pyNastran.utils.log import get_logger
+
+
+def benchmark_vectorized(op2_filename, result_names=None, nrepeat=3, log=None):
+    """
+    Times the struct based and vectorized readers for each result and
+    checks that they give the same arrays
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    result_names : List[str]; default=None -> all
+        the results to time (e.g., ['cbeam_stress', 'ctetra_stress'])
+    nrepeat : int; default=3
+        the number of times to read the result; the fastest run is used
+    log : logger; default=None
+        a logger object
+
+    Returns
+    -------
+    times : Dict[result_name] = (float, float)
+        the fastest read time (sec) for use_vector=False/True
+    """
+    if log is None:
+        log = get_logger(level='warning')
+    if result_names is None:
+        model = OP2(debug=False, log=log)
+        model.read_op2(op2_filename)
+        result_names = [result_name for result_name in model.get_table_types()
+                        if getattr(model, result_name)]
+
+    times = {}
+    for result_name in result_names:
+        models = {}
+        dts = {}
+        for use_vector in [False, True]:
+            dtsi = []
+            for unused_i in range(nrepeat):
+                model = OP2(debug=False, log=log)
+                model.use_vector = use_vector
+                model.set_results([result_name])
+                time0 = time.time()
+                model.read_op2(op2_filename)
+                dtsi.append(time.time() - time0)
+            models[use_vector] = model
+            dts[use_vector] = min(dtsi)
+
+        results = getattr(models[False], result_name)
+        results_vector = getattr(models[True], result_name)
+        for key, result in results.items():
+            # the data is copied bit for bit, so the nans are in the same spots
+            if not np.allclose(result.data, results_vector[key].data,
+                               rtol=0., atol=0., equal_nan=True):
+                raise RuntimeError('the vectorized %s of %r is different' % (
+                    result_name, op2_filename))
+        times[result_name] = (dts[False], dts[True])
+
+    print('%-28s %10s %10s %8s' % ('result', 'struct', 'vector', 'speedup'))
+    for result_name, (dt_struct, dt_vector) in sorted(times.items()):
+        print('%-28s %10.4f %10.4f %7.2fx' % (
+            result_name, dt_struct, dt_vector, dt_struct / dt_vector))
+    return times
+
+
+def main():  # pragma: no cover
+    """the interface for benchmark_vectorized"""
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    op2_filename = sys.argv[1]
+    nrepeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    benchmark_vectorized(op2_filename, nrepeat=nrepeat)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -8,6 +8,7 @@ from copy import deepcopy
 from struct import unpack
 from six import iteritems, b
 from six.moves import range
+import numpy as np
 
 from pyNastran.utils import integer_types
 from pyNastran.op2.errors import FortranMarkerError, SortCodeError
@@ -21,6 +22,29 @@ if sys.version_info < (2, 7, 7):
     raise ImportError('Upgrade your Python to >= 2.7.7; version=(%s.%s.%s)' % (
         imajor, minor1, minor2))
 
+#: the nodal result tables (see set_result_ids)
+NODE_RESULT_TABLES = (b'OUG', b'BOUG', b'OQG', b'OQMG', b'OPG', b'OGPFB')
+
+#: the table_code -> nodal result name (see set_result_ids)
+NODE_RESULT_NAMES = {
+    1 : 'displacements',
+    2 : 'load_vectors',
+    3 : 'spc_forces',
+    7 : 'eigenvectors',
+    10 : 'velocities',
+    11 : 'accelerations',
+    19 : 'grid_point_forces',
+    39 : 'mpc_forces',
+}
+
+#: the element result tables and the result name suffix (see set_result_ids)
+ELEMENT_RESULT_TABLES = [
+    (b'OES', 'stress'),
+    (b'OSTR', 'strain'),
+    (b'OEF', 'force'),
+    (b'ONR', 'strain_energy'),
+]
+
 class FortranFormat(object):
     """defines basic methods for reading Fortran formatted data files"""
     def __init__(self):
@@ -35,10 +59,32 @@ class FortranFormat(object):
         self._endian = None
         self._table_mapper = {}
 
+        #: a memoryview of the memory-mapped file (None if not mapped)
+        self._mmap_view = None
+
         #: stores if the user entered [] for iSubcases
         self.is_all_subcases = True
         self.valid_subcases = []
 
+        #: the table-3/table-4 pairs to jump over; offset3 -> (end, nrecords)
+        #: (see OP2TOC.get_skips)
+        self._toc_skip_pairs = {}
+
+        #: the table-3/table-4 pairs that are sized from the table of contents
+        #: on the array sizing pass; offset3 -> (end, record_len)
+        #: (see OP2TOC.get_size_pairs)
+        self._toc_size_pairs = {}
+
+        #: the offset of the table-3 of the current table-3/table-4 pair
+        self._pair_offset = None
+
+        #: the pairs of the vectorized objects found on the array sizing
+        #: pass; id(obj) -> (obj, [offset3, ...]); None if not lazy
+        self._lazy_pairs = None
+
+        #: the node/element ids of the results to read (see set_result_ids)
+        self._result_ids = None
+
     def show(self, n, types='ifs', endian=None):  # pragma: no cover
         """
         Shows binary data
@@ -389,7 +435,16 @@ class FortranFormat(object):
             self.is_start_of_subtable = True
             if self.is_debug_file:
                 self.binary_debug.write('***isubtable = %i\n' % self.isubtable)
-            self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            if self.n in self._toc_skip_pairs:
+                # the table of contents says the subcase wasn't requested,
+                # so we jump over the table-3/table-4 pair
+                end, nrecords = self._toc_skip_pairs[self.n]
+                self._goto(end)
+                self.isubtable -= nrecords - 1
+            elif self.read_mode == 1 and self.n in self._toc_size_pairs:
+                self._size_subtable_3_4(table3_parser, table4_parser, passer)
+            else:
+                self._read_subtable_3_4(table3_parser, table4_parser, passer)
             #force_table4 = self._read_subtable_3_4(table3_parser, table4_parser, passer)
             self.isubtable -= 1
             self.read_markers([self.isubtable, 1, 0])
@@ -404,6 +459,35 @@ class FortranFormat(object):
     def _finish(self):
         raise NotImplementedError('overwrite this')
 
+    def _size_subtable_3_4(self, table3_parser, table4_parser, passer):
+        """
+        Reads the table-3 of a table-3/table-4 pair on the array sizing
+        pass and sizes the table-4 from the record length in the table of
+        contents, so the table-4 record isn't walked
+        """
+        end, record_len = self._toc_size_pairs[self.n]
+        if self.table_name in [b'OESNLXD', b'OESNL1X', b'OESNLXR']:
+            # the table-3 may be parsed as a table-4 (see _read_subtable_3_4)
+            self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            return
+        self._read_subtable_3_4(table3_parser, table4_parser, passer)
+        self.isubtable -= 1
+        if (passer or not hasattr(self, 'num_wide') or not self.is_valid_subcase() or
+                self.table_name in [b'R1TABRG', b'ONRGY1'] or
+                self._get_result_ids() is not None):
+            # the table-4 is read like any other
+            self.read_markers([self.isubtable, 1, 0])
+            self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            return
+
+        # the table-4 parser only needs the length of the data on the
+        # array sizing pass
+        n = table4_parser(None, record_len)
+        assert isinstance(n, integer_types), 'table_name=%s n=%s table4_parser=%s' % (self.table_name, n, table4_parser)
+        if self._size_obj(record_len):
+            self._cleanup_data_members()
+        self._goto(end)
+
     def _read_subtable_3_4(self, table3_parser, table4_parser, passer):
         """
         Reads a series of subtable 3/4
@@ -438,6 +522,7 @@ class FortranFormat(object):
 
             self.data_code = {}
             self.obj = None
+            self._pair_offset = self.n
             data, ndata = self._read_record_ndata()
             if not passer:
                 try:
@@ -488,6 +573,7 @@ class FortranFormat(object):
         datai = b''
         n = 0
         is_streaming = False
+        result_ids = self._get_result_ids()
         if self.read_mode == 2:
             self.ntotal = 0
 
@@ -500,9 +586,14 @@ class FortranFormat(object):
                     assert isinstance(n, integer_types), self.table_name
                     datai = data[n:]
             else:
-                data, ndata = self._read_record_ndata()
+                data, ndata = self._read_record_view_ndata()
+                if result_ids is not None:
+                    data, ndata = self._filter_result_ids(data, ndata, result_ids)
+                    if ndata == 0:
+                        return 0
                 n = table4_parser(data, ndata)
                 assert isinstance(n, integer_types), self.table_name
+                del data
 
             # PCOMPs are stupid, so we need an element flag
             if hasattr(self, 'eid_old'):
@@ -583,48 +674,71 @@ class FortranFormat(object):
                 #n = record_len
                 #break
             else:
-                if self.table_name in [b'R1TABRG', b'ONRGY1']:
+                if self.table_name in [b'R1TABRG', b'ONRGY1'] or result_ids is not None:
                     data, ndata = self._read_record_ndata()
                 else:
                     data, ndata = self._skip_record_ndata()
+                if result_ids is not None:
+                    # the arrays are sized with the filtered rows
+                    data, ndata = self._filter_result_ids(data, ndata, result_ids)
+                    if ndata == 0:
+                        return 0
+                    record_len = ndata
                 n = table4_parser(data, ndata)
                 assert isinstance(n, integer_types), 'table_name=%s n=%s table4_parser=%s' % (self.table_name, n, table4_parser)
 
             #self._goto(n)
             #n = self._skip_record()
-
-            if hasattr(self, 'obj') and self.obj is not None:
-                if hasattr(self.obj, 'ntimes'):
-                    if not hasattr(self.obj, '_reset_indices'):
-                        #methods = '\ndir(obj)=%s' % ', '.join(sorted(dir(self.obj)))
-                        #msg = 'is %s vectorized because its missing _reset_indices...%s' % (
-                            #self.obj.__class__.__name__, methods)
-                        return None
-                        #raise RuntimeError(msg)
-                    self.obj._reset_indices()
-                    self.obj.ntimes += 1
-                    ntotal = record_len // (self.num_wide * 4) * self._data_factor
-
-                    # this has a problem with XYPLOT data if there is a result
-                    #    request in the same format (e.g. OESNLXD/OES1X1 tables
-                    #    if they both have the same element ID)
-                    #
-                    #class_name = self.obj.__class__.__name__
-                    #if class_name == 'RealBush1DStressArray':
-                        #print('%s.ntotal = %s' % (class_name, ntotal))
-                        #print('num_wide=%s factor=%s len=%s ntotal=%s' % (
-                            #self.num_wide, self._data_factor, record_len, ntotal))
-                    self.obj.ntotal = ntotal
-                    self.obj._ntotals.append(ntotal)
-
-                    assert isinstance(self.obj.ntotal, integer_types), type(self.obj.ntotal)
-                else:
-                    print('obj=%s doesnt have ntimes' % self.obj.__class__.__name__)
+            if not self._size_obj(record_len):
+                return None
         else:
             raise RuntimeError(self.read_mode)
         self._cleanup_data_members()
         return n
 
+    def _size_obj(self, record_len):
+        """
+        Adds a time step to the vectorized object of the table-4 on the
+        array sizing pass
+
+        Returns
+        -------
+        is_vectorized : bool
+            False if the object is missing _reset_indices
+        """
+        if hasattr(self, 'obj') and self.obj is not None:
+            if hasattr(self.obj, 'ntimes'):
+                if not hasattr(self.obj, '_reset_indices'):
+                    #methods = '\ndir(obj)=%s' % ', '.join(sorted(dir(self.obj)))
+                    #msg = 'is %s vectorized because its missing _reset_indices...%s' % (
+                        #self.obj.__class__.__name__, methods)
+                    return False
+                    #raise RuntimeError(msg)
+                self.obj._reset_indices()
+                self.obj.ntimes += 1
+                if self._lazy_pairs is not None:
+                    offsets = self._lazy_pairs.setdefault(id(self.obj), (self.obj, []))[1]
+                    if self._pair_offset not in offsets:
+                        offsets.append(self._pair_offset)
+                ntotal = record_len // (self.num_wide * 4) * self._data_factor
+
+                # this has a problem with XYPLOT data if there is a result
+                #    request in the same format (e.g. OESNLXD/OES1X1 tables
+                #    if they both have the same element ID)
+                #
+                #class_name = self.obj.__class__.__name__
+                #if class_name == 'RealBush1DStressArray':
+                    #print('%s.ntotal = %s' % (class_name, ntotal))
+                    #print('num_wide=%s factor=%s len=%s ntotal=%s' % (
+                        #self.num_wide, self._data_factor, record_len, ntotal))
+                self.obj.ntotal = ntotal
+                self.obj._ntotals.append(ntotal)
+
+                assert isinstance(self.obj.ntotal, integer_types), type(self.obj.ntotal)
+            else:
+                print('obj=%s doesnt have ntimes' % self.obj.__class__.__name__)
+        return True
+
     def _cleanup_data_members(self):
         """deletes variables from previous tables"""
         del_words = [
@@ -679,6 +793,68 @@ class FortranFormat(object):
             return False
         return True
 
+    def _get_result_ids(self):
+        """
+        Gets the node/element ids to keep for the current table-4
+        (see set_result_ids)
+
+        Returns
+        -------
+        ids : (nids, ) int ndarray
+            the sorted ids
+            None : all the rows are read
+        """
+        if self._result_ids is None:
+            return None
+        nodes, elements, by_result_type = self._result_ids
+        table_name = self.table_name
+        if table_name.startswith(NODE_RESULT_TABLES):
+            ids = nodes
+            result_name = NODE_RESULT_NAMES.get(self.table_code)
+        else:
+            for prefix, suffix in ELEMENT_RESULT_TABLES:
+                if table_name.startswith(prefix):
+                    break
+            else:
+                return None
+            element_name = self.data_code.get('element_name')
+            if element_name in [None, 'DMIG']:
+                return None
+            if table_name.endswith(b'C') and suffix in ['stress', 'strain']:
+                suffix = 'composite_' + suffix
+            ids = elements
+            result_name = '%s_%s' % (element_name.lower(), suffix)
+        if not self.is_sort1:
+            return None
+        return by_result_type.get(result_name, ids)
+
+    def _filter_result_ids(self, data, ndata, ids):
+        """
+        Keeps the rows of a SORT1 table-4 record with an id (the first
+        word // 10) in ids
+
+        Returns
+        -------
+        data : bytes
+            the filtered data
+        ndata : int
+            the length of the filtered data
+        """
+        nwords = self.num_wide
+        if nwords <= 0 or ndata % (4 * nwords) != 0:
+            return data, ndata
+        if len(ids) == 0:
+            return b'', 0
+        ints = np.frombuffer(data, dtype=self.idtype, count=ndata // 4).reshape(-1, nwords)
+        row_ids = ints[:, 0] // 10
+        i = np.searchsorted(ids, row_ids)
+        i[i == len(ids)] = 0
+        is_kept = ids[i] == row_ids
+        if is_kept.all():
+            return data, ndata
+        data = ints[is_kept, :].tobytes()
+        return data, len(data)
+
     def _goto(self, n):
         """
         Jumps to position n in the file
@@ -828,6 +1004,35 @@ class FortranFormat(object):
             record = b''.join(records)
         return record, nrecord
 
+    def _read_record_view_ndata(self):
+        """
+        Reads a record as a memoryview slice of the memory-mapped file, so
+        it isn't copied.  Records that are split into multiple blocks and
+        records from files that aren't memory-mapped are read with
+        ``_read_record_ndata``.
+        """
+        if self._mmap_view is None:
+            return self._read_record_ndata()
+
+        n0 = self.n
+        markers0 = self.get_nmarkers(1, rewind=False)
+        n = self.n
+        ndata, = self.struct_i.unpack(self._mmap_view[n:n + 4])
+        if markers0[0] * 4 != ndata:
+            raise FortranMarkerError('markers0=%s*4 len(record)=%s; table_name=%r' % (
+                markers0[0]*4, ndata, self.table_name))
+        self._goto(n + 8 + ndata)
+
+        markers1 = self.get_nmarkers(1, rewind=True)
+        if markers1[0] > 0:
+            # continuation blocks have to be joined
+            self._goto(n0)
+            return self._read_record_ndata()
+        if self.is_debug_file:
+            self.binary_debug.write('read_record - record = [%i, recordi, %i]; view\n' % (
+                ndata, ndata))
+        return self._mmap_view[n + 4:n + 4 + ndata], ndata
+
     def _skip_record_ndata(self, stream=False, debug=True, macro_rewind=False):
         """the skip version of ``_read_record_ndata``"""
         markers0 = self.get_nmarkers(1, rewind=False, macro_rewind=macro_rewind)
@@ -5,7 +5,9 @@ Defines the main OP2 class.  Defines:
  - read_op2(op2_filename=None, combine=True, subcases=None,
             exclude_results=None, include_results=None,
             log=None, debug=True, debug_file=None, build_dataframe=None,
-            skip_undefined_matrices=True, mode='msc', encoding=None)
+            skip_undefined_matrices=True, mode='msc', encoding=None,
+            in_memory=False, toc=None, use_mmap=False, lazy=False,
+            nprocs=1)
 
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
@@ -15,7 +17,8 @@ Defines the main OP2 class.  Defines:
    - object_methods(mode='public', keys_to_skip=None)
    - print_subcase_key()
    - read_op2(op2_filename=None, combine=True, build_dataframe=None,
-              skip_undefined_matrices=False, encoding=None)
+              skip_undefined_matrices=False, encoding=None, in_memory=False,
+              toc=None, use_mmap=False, lazy=False, nprocs=1)
    - set_mode(mode)
    - transform_displacements_to_global(i_transform, coords, xyz_cid0=None, debug=False)
    - transform_gpforce_to_global(nids_all, nids_transform, i_transform, coords, xyz_cid0=None)
@@ -39,12 +42,17 @@ from pyNastran.op2.errors import SortCodeError, DeviceCodeError, FortranMarkerEr
 #from pyNastran.op2.op2_interface.op2_writer import OP2Writer
 from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_toc import OP2TOC, get_op2_toc
+from pyNastran.op2.op2_interface.op2_lazy import (
+    LazyResultLoader, set_lazy, load_lazy_results)
 
 
 def read_op2(op2_filename=None, combine=True, subcases=None,
              exclude_results=None, include_results=None,
              log=None, debug=True, debug_file=None, build_dataframe=None,
-             skip_undefined_matrices=True, mode='msc', encoding=None):
+             skip_undefined_matrices=True, mode='msc', encoding=None,
+             in_memory=False, toc=None, use_mmap=False, lazy=False,
+             nprocs=1, result_dtype=None, index_dtype=None, compact_ids=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -77,6 +85,38 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    in_memory : bool; default=False
+        read the table-4 data records once; the array sizing pass only
+        reads the table-3 headers and sizes the arrays from a table of
+        contents (toc=True if toc is None), and the file is memory-mapped
+        (see use_mmap), so the file isn't copied into memory
+    toc : bool / str / OP2TOC; default=None
+        uses a table of contents to jump over the tables and
+        table-3/table-4 pairs that weren't requested; the subcases,
+        the stress/strain/element_forces results (see exclude_results),
+        and the times (see OP2.set_transient_times) are filtered
+        None : not used
+        True : the file is scanned
+        str : the sidecar filename (see get_op2_toc)
+        OP2TOC : a previously built table of contents
+    use_mmap : bool; default=False
+        memory-maps the file, so the result records are parsed from
+        views of the mapped file without being copied
+    lazy : bool; default=False
+        the vectorized result objects are sized, but their arrays are
+        read from the file the first time they're accessed
+    nprocs : int; default=1
+        the number of processes used to read the vectorized results;
+        each result object is read by one worker, so it's only faster
+        for large files with many independent result objects (see
+        OP2.read_op2)
+    result_dtype : str; default=None -> float32/complex64
+        the dtype of the result arrays; {float16, float32, float64}
+    index_dtype : str; default=None -> int32
+        the dtype of the node/element id arrays; {int32, int64}
+    compact_ids : bool; default=False
+        stores the SORT1 node/element id arrays that are the same for each
+        time step once as read-only views (see OP2.read_op2)
 
     Returns
     -------
@@ -104,7 +144,10 @@ def read_op2(op2_filename=None, combine=True, subcases=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, in_memory=in_memory, toc=toc,
+                   use_mmap=use_mmap, lazy=lazy, nprocs=nprocs,
+                   result_dtype=result_dtype, index_dtype=index_dtype,
+                   compact_ids=compact_ids)
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
     ## doesn't support F06 writer
@@ -400,7 +443,9 @@ class OP2(OP2_Scalar):
         #self.ask = ask
 
     def read_op2(self, op2_filename=None, combine=True, build_dataframe=None,
-                 skip_undefined_matrices=False, encoding=None):
+                 skip_undefined_matrices=False, encoding=None, in_memory=False,
+                 toc=None, use_mmap=False, lazy=False, nprocs=1,
+                 result_dtype=None, index_dtype=None, compact_ids=False):
         """
         Starts the OP2 file reading
 
@@ -418,7 +463,84 @@ class OP2(OP2_Scalar):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        in_memory : bool; default=False
+            read the table-4 data records once; useful for slow (e.g.,
+            network) filesystems.  The array sizing pass only reads the
+            table-3 headers and sizes the arrays from the record lengths
+            in a table of contents (toc=True if toc is None), so the
+            table-4s are only read by the array filling pass.  The file is
+            memory-mapped (see use_mmap), so it isn't copied into memory.
+            The R1TABRG/ONRGY1/OESNL tables and set_result_ids still
+            read their table-4s on both passes.
+        toc : bool / str / OP2TOC; default=None
+            uses a table of contents to jump over the tables and
+            table-3/table-4 pairs that weren't requested; the subcases
+            (see set_subcases), the stress/strain/element_forces results
+            (see set_results/remove_results), and the times
+            (see set_transient_times) are filtered
+            None : not used
+            True : the file is scanned
+            str : the sidecar filename (see get_op2_toc)
+            OP2TOC : a previously built table of contents
+        use_mmap : bool; default=False
+            memory-maps the file, so the result records are parsed from
+            views of the mapped file without being copied
+        lazy : bool; default=False
+            the vectorized result objects (e.g., displacements, stresses)
+            are sized, but the arrays (e.g., data, _times, element) are
+            read from the file the first time one is accessed, so the
+            memory scales with the results that are used; uses a table
+            of contents (toc=True if toc is None)
+
+            .. note:: the lazy results aren't included in build_dataframe;
+                      obj.build_dataframe() may be called after loading
+        nprocs : int; default=1
+            the number of processes used to read the vectorized results;
+            the results are sized like the lazy results (the table-3s are
+            read and the table-4s are sized from the table of contents),
+            then each one is read by a worker from its table-3/table-4
+            pairs and put back in file order, so the results are the same
+            as a serial read (not used if lazy=True).
+
+            .. warning:: the work is split by result object, not by time
+                         step, so the gain is limited to files with many
+                         independent result objects (e.g., the stresses of
+                         several element types).  The largest result sets
+                         the wall time, so a file that's mostly one table
+                         (e.g., the displacements of a SOL 112) isn't read
+                         faster, and the worker startup makes small files
+                         slower (see pyNastran/op2/dev/benchmark_nprocs.py)
+        result_dtype : str; default=None
+            the dtype of the float arrays (e.g., data) of the vectorized
+            results, which is applied when the arrays are built
+            None : float32 (complex64 for complex results)
+            float16 : halves the memory; ~3 significant digits and
+                      values above 65504 overflow to inf, which is
+                      logged as a warning that names the result
+            float32/float64 : complex results use complex64/complex128
+        index_dtype : str; default=None
+            the dtype of the int arrays (e.g., node_gridtype, element_node)
+            of the vectorized results
+            None : int32
+            int32/int64
+        compact_ids : bool; default=False
+            after reading, the SORT1 node/element id arrays that are sized
+            per time step (e.g., the node_element of the grid point
+            forces) are stored once if they're the same for each time step.
+            The arrays keep their shape, but are read-only broadcast views,
+            so they must be copied before they're edited.  The full arrays
+            are allocated while reading, so the peak memory is the same;
+            the memory of the final results is reduced.
         """
+        if result_dtype not in [None, 'float16', 'float32', 'float64']:
+            raise ValueError('result_dtype=%r and must be None, float16, float32, '
+                             'or float64' % result_dtype)
+        if index_dtype not in [None, 'int32', 'int64']:
+            raise ValueError('index_dtype=%r and must be None, int32, or int64' % index_dtype)
+        self._result_dtype = result_dtype
+        self._index_dtype = index_dtype
+        self._compact_ids = compact_ids
+
         if build_dataframe is None:
             build_dataframe = False
             if ipython_info():
@@ -429,6 +551,14 @@ class OP2(OP2_Scalar):
         self.encoding = encoding
 
         self.skip_undefined_matrices = skip_undefined_matrices
+        self._in_memory = in_memory
+        self._use_mmap = use_mmap
+        is_lazy = lazy or nprocs > 1
+        if (is_lazy or in_memory) and toc is None:
+            toc = True
+        nastran_format = self._nastran_format
+        self._set_toc(op2_filename, toc)
+        self._lazy_pairs = {} if is_lazy else None
         assert self.ask in [True, False], self.ask
         self.is_vectorized = True
         self.log.debug('combine=%s' % combine)
@@ -438,6 +568,8 @@ class OP2(OP2_Scalar):
 
         # get GUI object names, build objects, but don't read data
         OP2_Scalar.read_op2(self, op2_filename=op2_filename)
+        if is_lazy:
+            self._set_lazy_results(nastran_format, build_dataframe and lazy)
 
         # TODO: stuff to figure out objects
         # TODO: stuff to show gui of table names
@@ -445,15 +577,113 @@ class OP2(OP2_Scalar):
         self.read_mode = 2
         self._close_op2 = True
         self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
-        OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
+        # the tiny values are flushed to 0 when they're cast to float16;
+        # the overflows are logged per result by _finalize
+        with np.errstate(under='ignore', over='ignore'):
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
 
         self._finalize()
+        if nprocs > 1 and not lazy:
+            # the workers finalize the results
+            self.log.debug('-------- reading the results with nprocs=%s --------' % nprocs)
+            self._load_lazy_results(nprocs)
         if build_dataframe:
             self.build_dataframe()
         self.create_objects_from_matrices()
         self.combine_results(combine=combine)
         self.log.debug('finished reading op2')
 
+    def _set_toc(self, op2_filename, toc):
+        """sets the tables and table-3/table-4 pairs to jump over"""
+        self._toc_skip_tables = {}
+        self._toc_skip_pairs = {}
+        self._toc_size_pairs = {}
+        if toc is None or toc is False:
+            self._toc = None
+            return
+
+        if not isinstance(toc, OP2TOC):
+            toc_filename = None if toc is True else toc
+            op2_filename = self._validate_op2_filename(op2_filename)
+            toc = get_op2_toc(op2_filename, toc_filename=toc_filename, log=self.log)
+        self._toc = toc
+        # the table-4s are sized from the record lengths on the array sizing pass
+        self._toc_size_pairs = toc.get_size_pairs()
+        if self._toc_offsets is not None:
+            self._toc_skip_tables, self._toc_skip_pairs = toc.get_skips(
+                offsets=self._toc_offsets)
+            return
+
+        valid_subcases = None if self.is_all_subcases else self.valid_subcases
+        skip_table_names = self._get_toc_skip_table_names(toc)
+        times = self.expected_times
+        if valid_subcases is not None or skip_table_names or times:
+            self._toc_skip_tables, self._toc_skip_pairs = toc.get_skips(
+                valid_subcases, skip_table_names=skip_table_names, times=times)
+
+    def _get_toc_skip_table_names(self, toc):
+        """
+        Gets the result tables that may be jumped over because the table-4
+        parser doesn't store anything for the excluded results
+        (see exclude_results/include_results)
+        """
+        table_mapper = self._get_table_mapper()
+        result_readers = [
+            ('stress', self._read_oes1_4),
+            ('strain', self._read_ostr1_4),
+            ('element_forces', self._read_oef1_4),
+        ]
+        skip_table_names = []
+        for table_name in toc.table_names:
+            if table_name not in table_mapper:
+                continue
+            read_table4 = table_mapper[table_name][1]
+            for result_name, read_result4 in result_readers:
+                if read_table4 == read_result4 and self._results.is_not_saved(result_name):
+                    skip_table_names.append(table_name)
+                    break
+        return skip_table_names
+
+    def _set_lazy_results(self, nastran_format, build_dataframe):
+        """
+        Makes the vectorized objects found on the array sizing pass lazy
+        and jumps over their table-3/table-4 pairs on the array filling pass
+        """
+        lazy_pairs = self._lazy_pairs
+        self._lazy_pairs = None
+        toc_offsets = set(self._toc.pairs['offset3'].tolist())
+        offsets_skip = []
+        for result_type in self.get_table_types():
+            result = getattr(self, result_type)
+            for key, obj in iteritems(result):
+                if id(obj) not in lazy_pairs:
+                    continue
+                offsets = lazy_pairs[id(obj)][1]
+                if not toc_offsets.issuperset(offsets) or key[3] != 0:
+                    # the table isn't scanned as a results table or the
+                    # key depends on a count of the skipped (e.g., R1TABRG)
+                    # tables
+                    continue
+                loader = LazyResultLoader(
+                    self.op2_filename, self._toc, offsets, result_type, key,
+                    nastran_format=nastran_format, encoding=self.encoding,
+                    build_dataframe=build_dataframe,
+                    use_mmap=self._use_mmap or self._in_memory,
+                    result_ids=self._result_ids, result_dtype=self._result_dtype,
+                    index_dtype=self._index_dtype, compact_ids=self._compact_ids)
+                if set_lazy(obj, loader):
+                    offsets_skip.extend(offsets)
+        self._toc_skip_pairs.update(self._toc.get_skip_pairs(offsets_skip))
+
+    def _load_lazy_results(self, nprocs=1):
+        """loads the lazy results"""
+        objs = []
+        for result_type in self.get_table_types():
+            result = getattr(self, result_type)
+            objs.extend(obj for obj in itervalues(result)
+                        if getattr(obj, 'is_lazy', False))
+        load_lazy_results(objs, nprocs=nprocs)
+
     def create_objects_from_matrices(self):
         """
         creates the following objects:
@@ -476,11 +706,31 @@ class OP2(OP2_Scalar):
         result_types = self.get_table_types()
         for result_type in result_types:
             result = getattr(self, result_type)
-            for obj in itervalues(result):
+            for key, obj in iteritems(result):
+                if getattr(obj, 'is_lazy', False):
+                    continue
                 if hasattr(obj, 'finalize'):
                     obj.finalize()
+                if self._compact_ids and hasattr(obj, 'compact_time_invariant_arrays'):
+                    obj.compact_time_invariant_arrays()
+                if self._result_dtype == 'float16':
+                    self._check_float16_overflow(result_type, key, obj)
         self.del_structs()
 
+    def _check_float16_overflow(self, result_type, key, obj):
+        """
+        Warns about the float16 arrays of a result with non-finite values,
+        which are the values that were too big for float16 (abs > 65504)
+        """
+        names = [name for name, array in sorted(iteritems(obj.__dict__))
+                 if isinstance(array, np.ndarray) and array.dtype == np.float16 and
+                 not np.isfinite(array).all()]
+        if names:
+            self.log.warning(
+                '%s[%r] (%s) has non-finite values in %s; values larger than '
+                '65504 overflow with result_dtype=float16' % (
+                    result_type, key, obj.__class__.__name__, ', '.join(names)))
+
     def build_dataframe(self):
         """
         Converts the OP2 objects into pandas DataFrames
@@ -510,6 +760,8 @@ class OP2(OP2_Scalar):
         for result_type in result_types:
             result = getattr(self, result_type)
             for obj in itervalues(result):
+                if getattr(obj, 'is_lazy', False):
+                    continue
                 class_name = obj.__class__.__name__
                 #print('working on %s' % class_name)
                 obj.object_attributes()
@@ -709,6 +961,7 @@ class OP2(OP2_Scalar):
                     res2 = result[key2]
                     del result[key1]
                     del result[key2]
+                    res1.load_lazy()
                     res1.combine(res2)
                     result[isubcase] = res1
                     # print('r[isubcase] =', result[isubcase])
@@ -17,7 +17,8 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
                   exclude_results=None, include_results=None,
                   validate=True, xref=True,
                   build_dataframe=False, skip_undefined_matrices=True,
-                  mode='msc', log=None, debug=True, debug_file=None, encoding=None):
+                  mode='msc', log=None, debug=True, debug_file=None, encoding=None,
+                  card_arrays=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -51,6 +52,10 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    card_arrays : bool; default=False
+        stores the vectorized cards (e.g., GRID, CQUAD4, PSHELL, MAT1)
+        as columnar arrays in ``model.card_arrays`` instead of creating
+        the card objects; the model isn't validated/cross referenced
 
     Returns
     -------
@@ -63,6 +68,7 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
                does not have so many methods
     """
     model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
+    model.save_card_arrays = card_arrays
     model.set_subcases(subcases)
     if exclude_results and include_results:
         msg = 'exclude_results or include_results must be None\n'
@@ -77,6 +83,9 @@ def read_op2_geom(op2_filename=None, combine=True, subcases=None,
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
                    encoding=encoding)
+    if card_arrays:
+        # the vectorized cards weren't created
+        return model
     if validate:
         model.validate()
     if xref:
@@ -5,7 +5,7 @@ from six import string_types, b
 from six.moves import range
 
 import numpy as np
-from numpy import radians, sin, cos, fromstring, ones, dtype as npdtype
+from numpy import radians, sin, cos, frombuffer, ones, dtype as npdtype
 
 from pyNastran import is_release
 from pyNastran.f06.f06_writer import F06Writer
@@ -48,6 +48,16 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         # -----------------
         self.use_vector = True
 
+        #: the dtypes of the arrays of the vectorized results
+        #: (see read_op2(..., result_dtype, index_dtype))
+        #: None : the dtype of the result class (e.g., float32, int32)
+        self._result_dtype = None
+        self._index_dtype = None
+
+        #: store the time invariant SORT1 id arrays once
+        #: (see read_op2(..., compact_ids))
+        self._compact_ids = False
+
         # is a debug file being written to
         self.is_debug_file = False
 
@@ -848,8 +858,8 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             n = nnodes * 4 * 8
             itotal2 = obj.itotal + nnodes
             #print('ndata=%s n=%s nnodes=%s' % (ndata, n, nnodes))
-            ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[obj.itime] = dt
             #self.node_gridtype[self.itotal, :] = [node_id, grid_type]
             #self.data[self.itime, self.itotal, :] = [v1, v2, v3, v4, v5, v6]
@@ -903,13 +913,13 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj.data[obj.itime, obj.itotal:itotal2, 0] = floats[:, 2]
             assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
             obj._times[itime] = dt
@@ -947,14 +957,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal = obj.itotal
             itotal2 = itotal + nnodes
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 #nids = ints[:, 0] // 10
                 nids = ones(nnodes, dtype='int32') * eid
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[itime] = floats[:, 0]
             obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2]
             assert np.abs(floats[:, 3:]).max() == 0, '%s is not a scalar result...' % obj.__class__.__name__
@@ -993,8 +1003,8 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             n = nnodes * 4 * 8
             itotal2 = obj.itotal + nnodes
             #print('ndata=%s n=%s nnodes=%s' % (ndata, n, nnodes))
-            ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[obj.itime] = dt
             #self.node_gridtype[self.itotal, :] = [node_id, grid_type]
             #self.data[self.itime, self.itotal, :] = [v1, v2, v3, v4, v5, v6]
@@ -1044,14 +1054,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
 
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:]
             obj._times[itime] = dt
             obj.itotal = itotal2
@@ -1089,14 +1099,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal = obj.itotal
             itotal2 = itotal + nnodes
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 #nids = ints[:, 0] // 10
                 nids = ones(nnodes, dtype='int32') * eid
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[itime] = floats[:, 0]
             obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2:]
             obj.itotal = itotal2
@@ -1135,13 +1145,13 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = obj.itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 14)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[obj.itotal:itotal2, 0] = nids
                 obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 14)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
             mag = floats[:, 2:8]
             phase = floats[:, 8:]
             rtheta = radians(phase)
@@ -1182,14 +1192,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 14)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
                 #print(ints[:, :2])
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 14)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
             real = floats[:, 2:8]
             imag = floats[:, 8:]
 
@@ -1796,6 +1806,13 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             return True
         return False
 
+    def _build_obj(self):
+        """sizes the arrays of self.obj and applies the result_dtype/index_dtype"""
+        self.obj.build()
+        if self._result_dtype is not None or self._index_dtype is not None:
+            self.obj.cast_arrays(result_dtype=self._result_dtype,
+                                 index_dtype=self._index_dtype)
+
     def _create_table_object(self, result_name, nnodes,
                              slot, slot_object, slot_vector, is_cid=False):
         assert isinstance(result_name, string_types), result_name
@@ -1816,7 +1833,7 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
                 self.code = self._get_code()
                 self.obj = slot[self.code]
                 #self.obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_obj()
         else:  # not vectorized
             self.result_names.add(result_name)
             if self.read_mode == 1:
@@ -1842,7 +1859,7 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             self.code = self._get_code()
             self.obj = slot[self.code]
             #self.obj.update_data_code(self.data_code)
-            self.obj.build()
+            self._build_obj()
         else:
             auto_return = True
         return auto_return
@@ -1920,7 +1937,7 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
                     raise TypeError(msg)
 
                 #obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_obj()
 
             else:  # not vectorized
                 auto_return = True
@@ -0,0 +1,173 @@
+"""
+defines:
+ - LazyResultLoader(op2_filename, toc, offsets, result_type, key, ...)
+ - is_lazy = set_lazy(obj, loader)
+ - load_lazy_results(objs, nprocs=1)
+
+A lazy result object keeps the metadata from the array sizing pass
+(e.g., class, table_name, element_name, ntimes, ntotal), but not the
+attributes that are created by ``build()`` (e.g., data, _times, node_gridtype,
+element).  The first time one of the missing attributes is accessed, the
+table-3/table-4 pairs of the result are read (see
+``BaseScalarObject.__getattr__``) using the table of contents of the OP2.
+"""
+from __future__ import print_function
+from types import MethodType
+import multiprocessing as mp
+
+
+class LazyResultLoader(object):
+    """loads the arrays of a lazy result object from the OP2"""
+    def __init__(self, op2_filename, toc, offsets, result_type, key,
+                 nastran_format='msc', encoding=None, build_dataframe=False,
+                 use_mmap=False, result_ids=None, result_dtype=None, index_dtype=None,
+                 compact_ids=False):
+        """
+        Creates the LazyResultLoader
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 filename
+        toc : OP2TOC()
+            the table of contents of the OP2
+        offsets : List[int]
+            the table-3 offsets of the pairs of the result
+        result_type : str
+            the result name (e.g., 'displacements')
+        key : tuple
+            the (isubcase, analysis_code, sort, count, ...) key of the result
+            before the results are combined
+        nastran_format : str; default='msc'
+            the format that the OP2 was read with (e.g., 'msc', 'nx')
+        encoding / build_dataframe / use_mmap : see OP2.read_op2
+        result_ids : tuple; default=None
+            the node/element ids to read (see set_result_ids)
+        result_dtype / index_dtype : str; default=None
+            the dtypes of the arrays (see OP2.read_op2)
+        compact_ids : bool; default=False
+            store the time invariant id arrays once (see OP2.read_op2)
+        """
+        self.op2_filename = op2_filename
+        self.toc = toc
+        self.offsets = offsets
+        self.result_type = result_type
+        self.key = key
+        self.nastran_format = nastran_format
+        self.encoding = encoding
+        self.build_dataframe = build_dataframe
+        self.use_mmap = use_mmap
+        self.result_ids = result_ids
+        self.result_dtype = result_dtype
+        self.index_dtype = index_dtype
+        self.compact_ids = compact_ids
+
+    def load(self):
+        """reads the pairs of the result and returns the result object"""
+        from pyNastran.op2.op2 import OP2
+        model = OP2(debug=False)
+        set_as = getattr(model, 'set_as_%s' % self.nastran_format, None)
+        if set_as is not None:
+            set_as()
+        model._toc_offsets = self.offsets
+        model._result_ids = self.result_ids
+        model.read_op2(self.op2_filename, combine=False,
+                       build_dataframe=self.build_dataframe, encoding=self.encoding,
+                       toc=self.toc, use_mmap=self.use_mmap,
+                       result_dtype=self.result_dtype, index_dtype=self.index_dtype,
+                       compact_ids=self.compact_ids)
+        return getattr(model, self.result_type)[self.key]
+
+    def __call__(self, obj):
+        """reads the pairs of the result and replaces the attributes of obj"""
+        _replace_attributes(obj, self.load())
+
+
+def _load_result(loader):
+    """loads a result in a worker process"""
+    return loader.load()
+
+
+def load_lazy_results(objs, nprocs=1):
+    """
+    Loads the arrays of lazy result objects
+
+    Parameters
+    ----------
+    objs : List[BaseScalarObject]
+        the lazy result objects
+    nprocs : int; default=1
+        the number of processes; each result is read by a worker, so
+        the table-4 records of different results are parsed in parallel
+
+    .. note:: a result isn't split between workers, so the wall time is
+              at least the time to read the largest result
+    """
+    loaders = [obj._lazy_loader for obj in objs]
+    if nprocs > 1 and len(loaders) > 1:
+        pool = mp.Pool(min(nprocs, len(loaders)))
+        results = pool.map(_load_result, loaders, chunksize=1)
+        pool.close()
+        pool.join()
+    else:
+        results = [loader.load() for loader in loaders]
+
+    for obj, loader, result in zip(objs, loaders, results):
+        _replace_attributes(obj, result)
+        if loader.compact_ids:
+            # the broadcast views are copied when they're sent back by the workers
+            obj.compact_time_invariant_arrays()
+
+
+def _replace_attributes(obj, result):
+    """
+    Replaces the attributes of obj with the attributes of the loaded
+    result, so the references to obj stay valid
+    """
+    # the bound methods (e.g., add_sort1) aren't pickled by the workers
+    # (see BaseScalarObject.__getstate__), so they're kept from obj
+    methods = {key : value for key, value in obj.__dict__.items()
+               if isinstance(value, MethodType)}
+    obj.__dict__.clear()
+    obj.__dict__.update(methods)
+    for key, value in result.__dict__.items():
+        if isinstance(value, MethodType) and value.__self__ is result:
+            value = MethodType(value.__func__, obj)
+        obj.__dict__[key] = value
+
+
+def set_lazy(obj, loader):
+    """
+    Drops the attributes of a sized (read_mode=1) result object that are
+    created by ``build()`` and attaches the loader
+
+    Parameters
+    ----------
+    obj : BaseScalarObject()
+        the vectorized result object
+    loader : LazyResultLoader()
+        the loader
+
+    Returns
+    -------
+    is_lazy : bool
+        False if the object couldn't be built, so it's read normally
+    """
+    state = obj.__dict__.copy()
+    try:
+        obj.build()
+    except Exception:  # pragma: no cover
+        is_lazy = False
+        built_keys = []
+    else:
+        is_lazy = True
+        built = obj.__dict__
+        built_keys = [key for key in set(state) | set(built)
+                      if key not in state or key not in built or built[key] is not state[key]]
+    obj.__dict__.clear()
+    obj.__dict__.update(state)
+    if is_lazy:
+        for key in built_keys + ['is_built']:
+            obj.__dict__.pop(key, None)
+        obj._lazy_loader = loader
+    return is_lazy
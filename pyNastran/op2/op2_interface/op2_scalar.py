@@ -54,6 +54,7 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
+import mmap
 #import sys
 from struct import unpack, Struct
 from collections import Counter
@@ -86,6 +87,7 @@ from pyNastran.op2.tables.oug.oug import OUG
 from pyNastran.op2.tables.ogpwg import OGPWG
 from pyNastran.op2.tables.minor_tables import MinorTables
 from pyNastran.op2.fortran_format import FortranFormat
+from pyNastran.op2.op2_interface.op2_toc import OP2TOC, PAIR_COLUMNS, FLOAT_ANALYSIS_CODES
 
 from pyNastran.utils import is_binary_file
 from pyNastran.utils.log import get_logger
@@ -698,6 +700,21 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.is_vectorized = False
         self._close_op2 = True
 
+        #: read the table-4s once; the file is memory-mapped and the arrays
+        #: are sized from the table of contents (see read_op2(in_memory=True))
+        self._in_memory = False
+
+        #: memory-map the file, so the table-4 records are memoryview
+        #: slices of the mapped file instead of copies
+        self._use_mmap = False
+
+        #: the table of contents (see get_op2_toc)
+        self._toc = None
+        #: the tables to jump over; start -> end
+        self._toc_skip_tables = {}
+        #: the only table-3/table-4 pairs to read; used to load lazy results
+        self._toc_offsets = None
+
         self.result_names = set([])
 
         self.grid_point_weight = GridPointWeight()
@@ -739,6 +756,48 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             self.valid_subcases = set(subcases)
         self.log.debug("set_subcases - subcases = %s" % self.valid_subcases)
 
+    def set_result_ids(self, nodes=None, elements=None, by_result_type=None):
+        """
+        Allows you to read only the rows of the SORT1 results with the
+        given node/element ids.  The rows are filtered before the table-4
+        records are parsed, so the arrays are sized with the filtered
+        counts.
+
+        Parameters
+        ----------
+        nodes : List[int]; default=None -> all
+            the node ids of the nodal results (e.g., displacements,
+            spc_forces, grid_point_forces)
+        elements : List[int]; default=None -> all
+            the element ids of the element results (e.g., stress,
+            strain, force, strain_energy)
+        by_result_type : dict[result_name] = List[int]; default=None
+            the ids for specific results, which take precedence over
+            nodes/elements; the results names are:
+              - displacements, spc_forces, mpc_forces, ...
+              - the element name and the kind of result
+                (e.g., cquad4_stress, cquad4_composite_strain,
+                cbar_force, ctetra_strain_energy)
+
+        .. note:: the SORT2 results and the results without an id in
+                  the first word of each row (e.g., DMIG strain energy)
+                  are read in full
+        .. note:: the nodal results of the transient variants
+                  (e.g., displacements_PSD) use the base result name
+        """
+        if nodes is None and elements is None and not by_result_type:
+            self._result_ids = None
+            return
+        if nodes is not None:
+            nodes = np.unique(nodes).astype('int32')
+        if elements is not None:
+            elements = np.unique(elements).astype('int32')
+        by_result_type2 = {}
+        if by_result_type:
+            for result_name, ids in iteritems(by_result_type):
+                by_result_type2[result_name] = np.unique(ids).astype('int32')
+        self._result_ids = (nodes, elements, by_result_type2)
+
     def set_transient_times(self, times):  # TODO this name sucks...
         """
         Takes a dictionary of list of times in a transient case and
@@ -748,11 +807,13 @@ class OP2_Scalar(LAMA, ONR, OGPF,
           times = {subcase_id_1: [time1, time2],
                    subcase_id_2: [time3, time4]}
 
-        .. warning:: I'm not sure this still works...
+        .. note:: the times are only applied when a table of contents
+                  is used (see read_op2(toc=True)); the table-3/table-4
+                  pairs of the other times are jumped over
         """
         expected_times = {}
         for (isubcase, etimes) in iteritems(times):
-            etimes = list(times)
+            etimes = list(etimes)
             etimes.sort()
             expected_times[isubcase] = array(etimes)
         self.expected_times = expected_times
@@ -1323,27 +1384,7 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.table_name = None
 
         if not hasattr(self, 'f') or self.f is None:
-            #: the OP2 file object
-            self.f = open(self.op2_filename, 'rb')
-            self._endian = None
-            flag_data = self.f.read(20)
-            self.f.seek(0)
-
-            if unpack(b'>5i', flag_data)[0] == 4:
-                self._endian = '>'
-            elif unpack(b'<5i', flag_data)[0] == 4:
-                self._endian = '<'
-            #elif unpack(b'<ii', flag_data)[0] == 4:
-                #self._endian = '<'
-            else:
-                # Matrices from test show
-                # (24, 10, 10, 6, 2) before the Matrix Name...
-                #self.show_data(flag_data, types='iqlfsld', endian='<')
-                #print('----------')
-                #self.show_data(flag_data, types='iqlfsld', endian='>')
-                raise FatalError('cannot determine endian')
-            if PY2:
-                self._endian = b(self._endian)
+            self._open_op2()
         else:
             self._goto(self.n)
 
@@ -1365,12 +1406,54 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             self.binary_debug.write('f.tell()=%s\ndone...\n' % self.f.tell())
             self.binary_debug.close()
         if self._close_op2:
-            self.f.close()
+            self._close_op2_file()
             del self.binary_debug
             del self.f
         #self.remove_unpickable_data()
         return table_names
 
+    def _open_op2(self):
+        """opens the OP2 file and determines the endian"""
+        #: the OP2 file object
+        if self._use_mmap or self._in_memory:
+            # the records of the result tables are memoryview slices of
+            # the mapped file, so the data isn't copied until the result
+            # arrays are filled; the pages are read from disk once and the
+            # sizing (read_mode=1) and filling (read_mode=2) passes both
+            # walk the mapping
+            with open(self.op2_filename, 'rb') as op2_file:
+                self.f = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if PY3:
+                self._mmap_view = memoryview(self.f)
+        else:
+            self.f = open(self.op2_filename, 'rb')
+        self._endian = None
+        flag_data = self.f.read(20)
+        self.f.seek(0)
+
+        if unpack(b'>5i', flag_data)[0] == 4:
+            self._endian = '>'
+        elif unpack(b'<5i', flag_data)[0] == 4:
+            self._endian = '<'
+        #elif unpack(b'<ii', flag_data)[0] == 4:
+            #self._endian = '<'
+        else:
+            # Matrices from test show
+            # (24, 10, 10, 6, 2) before the Matrix Name...
+            #self.show_data(flag_data, types='iqlfsld', endian='<')
+            #print('----------')
+            #self.show_data(flag_data, types='iqlfsld', endian='>')
+            raise FatalError('cannot determine endian')
+        if PY2:
+            self._endian = b(self._endian)
+
+    def _close_op2_file(self):
+        """closes the OP2 file and releases the memory map"""
+        if self._mmap_view is not None:
+            self._mmap_view.release()
+            self._mmap_view = None
+        self.f.close()
+
     def _read_version(self):
         """reads the version header"""
         #try:
@@ -1534,7 +1617,11 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             #if 0:
                 #self._skip_table(table_name)
             #else:
-            if table_name in self.generalized_tables:
+            if self.n in self._toc_skip_tables:
+                # the table of contents says none of the subcases in the
+                # table were requested
+                self._goto(self._toc_skip_tables[self.n])
+            elif table_name in self.generalized_tables:
                 self.generalized_tables[table_name](self)
             elif table_name in GEOM_TABLES:
                 self._read_geom_table()  # DIT (agard)
@@ -1606,6 +1693,124 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             table_name = self._read_table_name(rewind=True, stop_on_failure=False)
         return table_names
 
+    def _scan_toc(self):
+        """
+        Walks the record markers to build the table of contents; only the
+        table-3 headers are read (see ``get_op2_toc``)
+
+        Returns
+        -------
+        toc : OP2TOC()
+            the table of contents
+        """
+        self.read_mode = 1
+        self.is_debug_file = False
+        self.n = 0
+        self.table_name = None
+        self._open_op2()
+        self._set_structs()
+
+        table_names = []
+        table_starts = []
+        table_ends = []
+        pairs = {name : [] for name, unused_dtype in PAIR_COLUMNS}
+        try:
+            self._read_version()
+            table_name = self._read_table_name(rewind=True, stop_on_failure=False)
+            while table_name is not None:
+                self.table_name = table_name
+                table_starts.append(self.n)
+                # same precedence as _read_tables
+                is_results_table = table_name in RESULT_TABLES and not (
+                    table_name in self.generalized_tables or
+                    table_name in GEOM_TABLES or table_name in MATRIX_TABLES)
+                if is_results_table:
+                    self._scan_toc_results_table(len(table_names), pairs)
+                else:
+                    self._skip_toc_table(table_name)
+                table_names.append(table_name)
+                table_ends.append(self.n)
+                table_name = self._read_table_name(rewind=True, stop_on_failure=False)
+        finally:
+            self.f.close()
+            del self.f
+        return OP2TOC(self.op2_filename, table_names, table_starts, table_ends, pairs)
+
+    def _scan_toc_results_table(self, itable, pairs):
+        """
+        Adds the table-3/table-4 pairs of a results table to the table
+        of contents
+        """
+        self._read_table_name(rewind=False)
+        self.read_markers([-1])
+        self._skip_record()
+        self.read_markers([-2, 1, 0])
+        self._skip_record()
+
+        isubtable = -3
+        self.read_markers([isubtable, 1, 0])
+        struct_4i = Struct(b(self._endian + '4i'))
+        struct_time_int = Struct(b(self._endian + 'i'))
+        struct_time_float = Struct(b(self._endian + 'f'))
+
+        is_table3 = True
+        ipair = None
+        markers = self.get_nmarkers(1, rewind=True)
+        while markers[0] != 0:
+            offset = self.n
+            record_len = self._get_record_length()
+            if is_table3 and record_len == 584:
+                data = self._read_record()
+                approach_code, table_code, element_type, isubcase = struct_4i.unpack(data[:16])
+                analysis_code = approach_code // 10
+                if analysis_code in FLOAT_ANALYSIS_CODES:
+                    time, = struct_time_float.unpack(data[16:20])
+                else:
+                    time, = struct_time_int.unpack(data[16:20])
+                row = [itable, isubtable, 1, offset, -1, 0, 0,
+                       approach_code, analysis_code, table_code % 1000, table_code // 1000,
+                       element_type, isubcase, time]
+                is_table3 = False
+            elif ipair is None:
+                # a data record without a table-3; flagged with an
+                # approach_code of -1, so the table is never skipped
+                self._skip_record()
+                row = [itable, isubtable, 1, offset, offset, 0, record_len,
+                       -1, -1, -1, -1, -1, -1, 0.]
+            else:
+                self._skip_record()
+                pairs['nrecords'][ipair] += 1
+                if not is_table3:
+                    pairs['offset4'][ipair] = offset
+                    pairs['record_len'][ipair] = record_len
+                is_table3 = True
+                row = None
+
+            if row is not None:
+                ipair = len(pairs['itable'])
+                for (name, unused_dtype), value in zip(PAIR_COLUMNS, row):
+                    pairs[name].append(value)
+            pairs['end'][ipair] = self.n
+
+            isubtable -= 1
+            self.read_markers([isubtable, 1, 0])
+            markers = self.get_nmarkers(1, rewind=True)
+        self.read_markers([0])
+
+    def _skip_toc_table(self, table_name):
+        """skips a geometry/matrix table for the table of contents"""
+        n = self.n
+        if table_name in MATRIX_TABLES:
+            skip_methods = [self._skip_matrix_mat, self._skip_table_helper]
+        else:
+            skip_methods = [self._skip_table_helper, self._skip_matrix_mat]
+
+        try:
+            skip_methods[0]()
+        except FortranMarkerError:
+            self._goto(n)
+            skip_methods[1]()
+
     def _read_tol(self):
         """
         This is probably broken for MSC Nastran
@@ -0,0 +1,305 @@
+"""
+defines:
+ - toc = get_op2_toc(op2_filename, toc_filename=None, log=None)
+ - OP2TOC(op2_filename, table_names, table_starts, table_ends, pairs)
+
+The table of contents (TOC) of an OP2 stores the byte offsets of the
+tables and of the table-3/table-4 pairs (the header record and the data
+record) of the result tables.  It's built by walking the record markers
+without reading the data, so it's fast, and it may be saved next to the
+OP2 as a sidecar file.  The OP2 reader uses it to jump over the tables
+and pairs that weren't requested instead of walking through them.
+"""
+from __future__ import print_function, division
+import os
+
+import numpy as np
+
+#: the table-3 header columns of the table-3/table-4 pairs
+PAIR_COLUMNS = [
+    ('itable', 'int32'),  # index into the tables
+    ('isubtable', 'int32'),  # the table-3 subtable marker (-3, -5, ...)
+    ('nrecords', 'int32'),  # the number of records in the pair
+    ('offset3', 'int64'),  # the start of the table-3 record
+    ('offset4', 'int64'),  # the start of the table-4 record; -1 if missing
+    ('end', 'int64'),  # the end of the pair
+    ('record_len', 'int64'),  # the length of the table-4 data in bytes
+    ('approach_code', 'int32'),
+    ('analysis_code', 'int32'),
+    ('table_code', 'int32'),
+    ('sort_code', 'int32'),  # table_code // 1000
+    ('element_type', 'int32'),
+    ('isubcase', 'int32'),
+    ('time', 'float64'),  # the time/frequency/eigenvalue/mode/load step
+]
+
+#: word 5 is a float for these analysis codes
+#: (frequency, transient, nonlinear statics)
+FLOAT_ANALYSIS_CODES = (5, 6, 10)
+
+#: the sort codes of the SORT1 tables, which have the time in word 5
+#: (the SORT2 tables have the node/element id)
+SORT1_CODES = (0, 1, 4)
+
+#: tables with a table-3 that doesn't follow the approach_code, table_code,
+#: element_type, isubcase format, so the pairs can't be filtered by subcase
+NO_SUBCASE_TABLES = (b'LAMA', b'BLAMA', b'CLAMA', b'OGPWG', b'OGPWGM')
+
+
+def get_op2_toc(op2_filename, toc_filename=None, log=None):
+    """
+    Gets the table of contents of an OP2
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 filename
+    toc_filename : str; default=None
+        the sidecar filename; if it exists and is current, it's loaded,
+        otherwise the OP2 is scanned and the sidecar is written
+        None : the OP2 is scanned
+    log : Log(); default=None
+        a logger
+
+    Returns
+    -------
+    toc : OP2TOC()
+        the table of contents
+    """
+    if toc_filename is not None and os.path.exists(toc_filename):
+        toc = OP2TOC.load(toc_filename)
+        if toc.is_current(op2_filename):
+            return toc
+
+    from pyNastran.op2.op2 import OP2
+    model = OP2(debug=False, log=log)
+    model.op2_filename = op2_filename
+    toc = model._scan_toc()
+    if toc_filename is not None:
+        toc.save(toc_filename)
+    return toc
+
+
+class OP2TOC(object):
+    """the table of contents of an OP2"""
+    def __init__(self, op2_filename, table_names, table_starts, table_ends, pairs,
+                 size=None, mtime=None):
+        """
+        Creates the OP2TOC object
+
+        Parameters
+        ----------
+        op2_filename : str
+            the OP2 filename
+        table_names : (ntables, ) bytes ndarray
+            the table names (e.g. OUGV1, OES1X1)
+        table_starts / table_ends : (ntables, ) int ndarray
+            the byte offsets of the start/end of the tables
+        pairs : dict[name] = (npairs, ) ndarray
+            the table-3/table-4 pairs of the result tables
+            (see ``PAIR_COLUMNS``)
+        size / mtime : int / float; default=None -> from op2_filename
+            used to check that the OP2 hasn't changed
+        """
+        self.op2_filename = op2_filename
+        self.table_names = np.asarray(table_names, dtype='|S8')
+        self.table_starts = np.asarray(table_starts, dtype='int64')
+        self.table_ends = np.asarray(table_ends, dtype='int64')
+        self.pairs = {name : np.asarray(pairs[name], dtype=dtype)
+                      for name, dtype in PAIR_COLUMNS}
+        if size is None:
+            stat = os.stat(op2_filename)
+            size = stat.st_size
+            mtime = stat.st_mtime
+        self.size = size
+        self.mtime = mtime
+
+    @property
+    def npairs(self):
+        """the number of table-3/table-4 pairs"""
+        return len(self.pairs['offset3'])
+
+    def is_current(self, op2_filename):
+        """is the TOC for the current version of the OP2?"""
+        stat = os.stat(op2_filename)
+        return stat.st_size == self.size and stat.st_mtime == self.mtime
+
+    def get_pairs(self, table_name=None, isubcase=None):
+        """
+        Gets the table-3/table-4 pairs
+
+        Parameters
+        ----------
+        table_name : bytes; default=None -> all
+            the table name (e.g., b'OUGV1')
+        isubcase : int; default=None -> all
+            the subcase id
+
+        Returns
+        -------
+        pairs : dict[name] = (npairs, ) ndarray
+            the filtered pairs with an added table_name column
+        """
+        i = np.ones(self.npairs, dtype='bool')
+        itable = self.pairs['itable']
+        if table_name is not None:
+            i &= self.table_names[itable] == table_name
+        if isubcase is not None:
+            i &= self.pairs['isubcase'] == isubcase
+        pairs = {name : values[i] for name, values in self.pairs.items()}
+        pairs['table_name'] = self.table_names[itable[i]]
+        return pairs
+
+    def get_skips(self, valid_subcases=None, offsets=None, skip_table_names=None,
+                  times=None):
+        """
+        Gets the tables and pairs that weren't requested and may be
+        jumped over
+
+        Parameters
+        ----------
+        valid_subcases : List[int]; default=None -> all
+            the subcases to read
+        offsets : List[int]; default=None -> all
+            the table-3 offsets of the only pairs to read; every other
+            table is jumped over
+        skip_table_names : List[bytes]; default=None -> none
+            the tables to jump over (e.g., b'OES1X1')
+        times : dict[isubcase] = List[float]; default=None -> all
+            the times/frequencies/modes to read; the pairs with the
+            closest time (per table) to each requested time are read and
+            the other pairs of the subcase are jumped over (SORT1 only)
+
+        Returns
+        -------
+        skip_tables : dict[start] = end
+            the byte offsets of the tables to jump over
+        skip_pairs : dict[offset3] = (end, nrecords)
+            the byte offsets of the pairs to jump over
+        """
+        itable = self.pairs['itable']
+        ntables = len(self.table_names)
+        is_skipped = np.zeros(self.npairs, dtype='bool')
+        is_filtered = (
+            ~np.in1d(self.table_names, NO_SUBCASE_TABLES)[itable] &
+            (self.pairs['approach_code'] != -1))
+        if valid_subcases is not None:
+            is_skipped |= is_filtered & ~np.in1d(self.pairs['isubcase'], list(valid_subcases))
+        if times:
+            is_sort1 = np.in1d(self.pairs['sort_code'], SORT1_CODES)
+            is_skipped |= is_filtered & is_sort1 & ~self._is_closest_time(times)
+        is_table_skipped = np.zeros(ntables, dtype='bool')
+        if skip_table_names:
+            is_table_skipped = np.in1d(self.table_names, list(skip_table_names))
+            is_skipped |= is_table_skipped[itable]
+        if offsets is not None:
+            is_skipped |= ~np.in1d(self.pairs['offset3'], list(offsets))
+        skip_pairs = self._get_skip_pairs(is_skipped)
+
+        # a table is skipped when all of its pairs are
+        nkept = np.bincount(itable[~is_skipped], minlength=ntables)
+        nskipped = np.bincount(itable[is_skipped], minlength=ntables)
+        if offsets is None:
+            iskip = np.where(((nskipped > 0) & (nkept == 0)) | is_table_skipped)[0]
+        else:
+            iskip = np.where(nkept == 0)[0]
+        skip_tables = dict(zip(self.table_starts[iskip].tolist(),
+                               self.table_ends[iskip].tolist()))
+        return skip_tables, skip_pairs
+
+    def _is_closest_time(self, times):
+        """
+        Flags the pairs with the closest time (per table) to a requested
+        time; the subcases without requested times are all flagged
+        """
+        itable = self.pairs['itable']
+        isubcases = self.pairs['isubcase']
+        pair_times = self.pairs['time']
+        is_closest = ~np.in1d(isubcases, list(times))
+        for isubcase, expected_times in sorted(times.items()):
+            is_subcase = isubcases == isubcase
+            for itablei in np.unique(itable[is_subcase]):
+                i = is_subcase & (itable == itablei)
+                unique_times = np.unique(pair_times[i])
+                iclosest = np.abs(
+                    unique_times[:, np.newaxis] - np.asarray(expected_times)).argmin(axis=0)
+                is_closest[i] = np.in1d(pair_times[i], unique_times[iclosest])
+        return is_closest
+
+    def get_size_pairs(self):
+        """
+        Gets the table-3/table-4 pairs with a single table-4 record, which
+        may be sized from the table of contents on the array sizing pass
+
+        Returns
+        -------
+        size_pairs : dict[offset3] = (end, record_len)
+            the end of the pair and the length of the table-4 data in bytes
+        """
+        i = ((self.pairs['nrecords'] == 2) & (self.pairs['offset4'] >= 0) &
+             (self.pairs['approach_code'] != -1))
+        offset3 = self.pairs['offset3'][i]
+        end = self.pairs['end'][i]
+        record_len = self.pairs['record_len'][i]
+        size_pairs = {
+            offset3i : (endi, record_leni)
+            for offset3i, endi, record_leni in zip(offset3.tolist(), end.tolist(),
+                                                    record_len.tolist())}
+        return size_pairs
+
+    def get_skip_pairs(self, offsets):
+        """
+        Gets the pairs to jump over
+
+        Parameters
+        ----------
+        offsets : List[int]
+            the table-3 offsets of the pairs
+
+        Returns
+        -------
+        skip_pairs : dict[offset3] = (end, nrecords)
+            the byte offsets of the pairs to jump over
+        """
+        return self._get_skip_pairs(np.in1d(self.pairs['offset3'], list(offsets)))
+
+    def _get_skip_pairs(self, is_skipped):
+        """gets the {offset3: (end, nrecords)} jumps of the flagged pairs"""
+        offset3 = self.pairs['offset3'][is_skipped]
+        end = self.pairs['end'][is_skipped]
+        nrecords = self.pairs['nrecords'][is_skipped]
+        skip_pairs = {
+            offset3i : (endi, nrecordsi)
+            for offset3i, endi, nrecordsi in zip(offset3.tolist(), end.tolist(),
+                                                  nrecords.tolist())}
+        return skip_pairs
+
+    def save(self, toc_filename):
+        """saves the TOC as an npz sidecar file"""
+        with open(toc_filename, 'wb') as toc_file:
+            np.savez(toc_file,
+                     op2_filename=np.array(self.op2_filename),
+                     size=np.array(self.size), mtime=np.array(self.mtime),
+                     table_names=self.table_names,
+                     table_starts=self.table_starts,
+                     table_ends=self.table_ends,
+                     **self.pairs)
+
+    @classmethod
+    def load(cls, toc_filename):
+        """loads an npz sidecar file"""
+        with np.load(toc_filename) as data:
+            pairs = {name : data[name] for name, unused_dtype in PAIR_COLUMNS}
+            toc = cls(str(data['op2_filename']), data['table_names'],
+                      data['table_starts'], data['table_ends'], pairs,
+                      size=int(data['size']), mtime=float(data['mtime']))
+        return toc
+
+    def __repr__(self):
+        msg = 'OP2TOC(op2_filename=%r; ntables=%s, npairs=%s)\n' % (
+            self.op2_filename, len(self.table_names), self.npairs)
+        itable = self.pairs['itable']
+        for i, table_name in enumerate(self.table_names):
+            msg += '  %-8s offset=%-10s npairs=%s\n' % (
+                table_name.decode('latin1'), self.table_starts[i], (itable == i).sum())
+        return msg
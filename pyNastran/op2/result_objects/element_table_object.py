@@ -130,6 +130,7 @@ class ElementTableArray(ScalarObject):  # displacement style table
                    % (headers,
                       [int(i) for i in self.data.shape], self.data.dtype))
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     @property
@@ -3,7 +3,7 @@ from __future__ import print_function, unicode_literals
 import copy
 from itertools import count
 from struct import pack
-from six import text_type, binary_type, iteritems, PY3, string_types
+from six import text_type, binary_type, iteritems, itervalues, PY3, string_types
 from six.moves import range
 import numpy as np
 
@@ -36,6 +36,27 @@ class BaseScalarObject(Op2Codes):
         #self.ntotal = 0
         #assert isinstance(self.name, (text_type, binary_type)), 'name=%s type=%s' % (self.name, type(self.name))
 
+    def __getattr__(self, name):
+        """loads the arrays of a lazy result on first access (see read_op2(..., lazy=True))"""
+        lazy_loader = self.__dict__.get('_lazy_loader')
+        if lazy_loader is None or name.startswith('__'):
+            raise AttributeError('%r object has no attribute %r' % (
+                self.__class__.__name__, name))
+        self.load_lazy()
+        return getattr(self, name)
+
+    @property
+    def is_lazy(self):
+        """are the arrays of the result still in the OP2?"""
+        return '_lazy_loader' in self.__dict__
+
+    def load_lazy(self):
+        """loads the arrays of a lazy result"""
+        lazy_loader = self.__dict__.get('_lazy_loader')
+        if lazy_loader is not None:
+            lazy_loader(self)
+            self.__dict__.pop('_lazy_loader', None)
+
     def object_attributes(self, mode='public', keys_to_skip=None):
         if keys_to_skip is None:
             keys_to_skip = []
@@ -139,6 +160,81 @@ class BaseScalarObject(Op2Codes):
             class_name, self.isubcase, shape, headers_str))
         return msg
 
+    def cast_arrays(self, result_dtype=None, index_dtype=None):
+        """
+        Casts the arrays that were sized by ``build()``
+
+        Parameters
+        ----------
+        result_dtype : str; default=None -> no change
+            the dtype of the float arrays (e.g., data); {float16, float32, float64}
+            the complex arrays use the smallest complex dtype that holds it
+            (float16/float32 -> complex64, float64 -> complex128)
+        index_dtype : str; default=None -> no change
+            the dtype of the int arrays (e.g., node_gridtype, element_node);
+            {int32, int64}
+        """
+        for name, array in list(iteritems(self.__dict__)):
+            # the times stay as float32/int32 (e.g., mode numbers)
+            if not isinstance(array, np.ndarray) or name == '_times':
+                continue
+            kind = array.dtype.kind
+            if kind == 'f' and result_dtype is not None:
+                dtype = result_dtype
+            elif kind == 'c' and result_dtype is not None:
+                dtype = 'complex128' if result_dtype == 'float64' else 'complex64'
+            elif kind == 'i' and index_dtype is not None:
+                dtype = index_dtype
+            else:
+                continue
+            if array.dtype != dtype:
+                setattr(self, name, array.astype(dtype))
+
+    def compact_time_invariant_arrays(self):
+        """
+        Stores the SORT1 id arrays that are sized per time step (e.g., the
+        node_element of the grid point forces) once if they don't change
+        between time steps.  The arrays keep their shape, but become
+        read-only broadcast views of the first time step.
+
+        .. note:: called by read_op2(..., compact_ids=True)
+        """
+        data = self.__dict__.get('data')
+        if not isinstance(data, np.ndarray) or data.ndim < 2 or not self.is_sort1:
+            return
+        ntimes, ntotal = data.shape[:2]
+        if ntimes < 2:
+            return
+        for name, array in list(iteritems(self.__dict__)):
+            if (name == 'data' or not isinstance(array, np.ndarray) or
+                    array.dtype.kind not in 'iuUS' or array.shape[:2] != (ntimes, ntotal) or
+                    0 in array.strides):
+                continue
+            if (array == array[0]).all():
+                setattr(self, name, np.broadcast_to(array[0].copy(), array.shape))
+
+    def get_nbytes(self):
+        """
+        Gets the memory used by the arrays of the result, where an
+        array that's stored once (see compact_time_invariant_arrays)
+        is counted once
+        """
+        nbytes = 0
+        for array in itervalues(self.__dict__):
+            if not isinstance(array, np.ndarray):
+                continue
+            nvalues = 1
+            for size, stride in zip(array.shape, array.strides):
+                if stride:
+                    nvalues *= size
+            nbytes += nvalues * array.itemsize
+        return nbytes
+
+    def _get_memory_stats(self):
+        """gets the memory line of get_stats"""
+        nbytes = self.get_nbytes()
+        return ['  memory: %i bytes (%.3f MB)\n' % (nbytes, nbytes / 1024.**2)]
+
     def _build_dataframe_transient_header(self):
         """builds the header for the Pandas DataFrame/table"""
         assert isinstance(self.name, (text_type, binary_type)), 'name=%s type=%s' % (self.name, type(self.name))
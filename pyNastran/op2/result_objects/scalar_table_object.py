@@ -132,6 +132,7 @@ class ScalarTableArray(ScalarObject):  # displacement style table
                       [int(i) for i in self.data.shape], self.data.dtype))
         msg.append('  gridTypes\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     @property
@@ -208,6 +208,7 @@ class TableArray(ScalarObject):  # displacement style table
         msg.append('  node_gridtype.shape = %s\n' % str(self.node_gridtype.shape).replace('L', ''))
         #msg.append('  gridTypes\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     @property
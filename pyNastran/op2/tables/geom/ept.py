@@ -395,8 +395,8 @@ class EPT(GeomCommon):
         Word 7 repeats until (-1) occurs
         """
         #strs = numpy.core.defchararray.reshapesplit(data, sep=",")
-        ints = np.fromstring(data[n:], self._endian + 'i')
-        floats = np.fromstring(data[n:], self._endian + 'f')
+        ints = np.frombuffer(data[n:], self._endian + 'i')
+        floats = np.frombuffer(data[n:], self._endian + 'f')
         iminus1 = np.where(ints == -1)[0]
 
         istart = [0] + list(iminus1[:-1] + 1)
@@ -635,6 +635,8 @@ class EPT(GeomCommon):
         """
         PCOMP(2706,27,287) - the marker for Record 22
         """
+        if self.use_vector:
+            return self._read_pcomp_vector(data, n)
         nproperties = 0
         s1 = Struct(b(self._endian + '2i3fi2f'))
         s2 = Struct(b(self._endian + 'i2fi'))
@@ -686,6 +688,70 @@ class EPT(GeomCommon):
         self.card_count['PCOMP'] = nproperties
         return n
 
+    def _read_pcomp_vector(self, data, n):
+        """
+        vectorized version of ``_read_pcomp``
+
+        The entries have a variable length, so the headers are found by
+        walking the nlayers and the layers are then sliced in bulk.
+        """
+        nwords = (len(data) - n) // 4
+        ints = np.frombuffer(data, dtype=self.idtype, count=nwords, offset=n)
+        floats = np.frombuffer(data, dtype=self.fdtype, count=nwords, offset=n)
+
+        # (pid, nlayers, z0, nsm, sb, ft, Tref, ge) + nlayers * (mid, t, theta, sout)
+        iheaders = []
+        nlayers_list = []
+        i = 0
+        while i < nwords - 8:
+            nlayers = abs(int(ints[i + 1]))
+            assert 0 < nlayers < 100, 'pid=%s nlayers=%s' % (ints[i], ints[i + 1])
+            iheaders.append(i)
+            nlayers_list.append(nlayers)
+            i += 8 + 4 * nlayers
+        n += 4 * i
+
+        iheader = np.array(iheaders, dtype='int32')
+        nlayers = np.array(nlayers_list, dtype='int32')
+        nproperties = len(iheader)
+        nlayers_total = nlayers.sum()
+        ilayer0 = np.cumsum(nlayers) - nlayers
+        ilayer = (np.repeat(iheader + 8, nlayers) +
+                  4 * (np.arange(nlayers_total) - np.repeat(ilayer0, nlayers)))
+
+        is_symmetrical = ints[iheader + 1] < 0
+        if self.save_card_arrays:
+            self._add_card_arrays('PCOMP', nproperties, {
+                'pid' : ints[iheader], 'nlayers' : nlayers,
+                'is_symmetrical' : is_symmetrical,
+                'z0' : floats[iheader + 2], 'nsm' : floats[iheader + 3],
+                'sb' : floats[iheader + 4], 'ft' : ints[iheader + 5],
+                'tref' : floats[iheader + 6], 'ge' : floats[iheader + 7],
+                # (nlayers_total, ) arrays; use nlayers to split them
+                'mid' : ints[ilayer], 't' : floats[ilayer + 1],
+                'theta' : floats[ilayer + 2], 'sout' : ints[ilayer + 3],})
+            return n
+
+        mids = ints[ilayer].tolist()
+        thicknesses = floats[ilayer + 1].tolist()
+        thetas = floats[ilayer + 2].tolist()
+        souts = ints[ilayer + 3].tolist()
+        for pid, z0, nsm, sb, ft, tref, ge, is_sym, j0, nlayersi in zip(
+                ints[iheader].tolist(), floats[iheader + 2].tolist(),
+                floats[iheader + 3].tolist(), floats[iheader + 4].tolist(),
+                ints[iheader + 5].tolist(), floats[iheader + 6].tolist(),
+                floats[iheader + 7].tolist(), is_symmetrical.tolist(),
+                ilayer0.tolist(), nlayers_list):
+            j1 = j0 + nlayersi
+            data_in = [
+                pid, z0, nsm, sb, ft, tref, ge,
+                'SYM' if is_sym else 'NO',
+                mids[j0:j1], thicknesses[j0:j1], thetas[j0:j1], souts[j0:j1]]
+            prop = PCOMP.add_op2_data(data_in)
+            self._add_op2_property(prop)
+        self.card_count['PCOMP'] = nproperties
+        return n
+
     def _read_pcompg(self, data, n):
         self.log.info('skipping PCOMPG in EPT\n')
         return len(data)
@@ -1042,6 +1108,8 @@ class EPT(GeomCommon):
         """
         PSHELL(2302,23,283) - the marker for Record 51
         """
+        if self.use_vector:
+            return self._read_pshell_vector(data, n)
         ntotal = 44  # 11*4
         s = Struct(b(self._endian + 'iififi4fi'))
         nproperties = (len(data) - n) // ntotal
@@ -1062,6 +1130,33 @@ class EPT(GeomCommon):
         self.card_count['PSHELL'] = nproperties
         return n
 
+    def _read_pshell_vector(self, data, n):
+        """vectorized version of ``_read_pshell``"""
+        ints, floats = self._get_record_arrays(data, n, 11)
+        nproperties = len(ints)
+        n += nproperties * 44
+
+        # (pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4)
+        columns = [
+            ints[:, 0], ints[:, 1], floats[:, 2], ints[:, 3], floats[:, 4],
+            ints[:, 5], floats[:, 6], floats[:, 7], floats[:, 8], floats[:, 9],
+            ints[:, 10]]
+        if self.save_card_arrays:
+            names = ['pid', 'mid1', 't', 'mid2', 'twelveIt3', 'mid3', 'tst',
+                     'nsm', 'z1', 'z2', 'mid4']
+            self._add_card_arrays('PSHELL', nproperties, dict(zip(names, columns)))
+            return n
+
+        is_big = ints[:, [0, 1, 3, 5, 10]].max(axis=1) > 1e8
+        for out, is_bigi in zip(zip(*[column.tolist() for column in columns]), is_big.tolist()):
+            prop = PSHELL.add_op2_data(out)
+            if is_bigi:
+                self.big_properties[out[0]] = prop
+            else:
+                self._add_op2_property(prop)
+        self.card_count['PSHELL'] = nproperties
+        return n
+
     def _read_psolid(self, data, n):
         """
         PSOLID(2402,24,281) - the marker for Record 52
@@ -106,6 +106,8 @@ class GEOM1(GeomCommon):
         """
         (1701,17,6) - the marker for Record 1
         """
+        if self.use_vector:
+            return self._read_cord1_vector(data, n, CORD1C, [1, 2], [1, 2])
         s = Struct(b(self._endian + '6i'))
         nentries = (len(data) - n) // 24
         for i in range(nentries):
@@ -127,6 +129,8 @@ class GEOM1(GeomCommon):
         """
         (1801,18,5) - the marker for Record 2
         """
+        if self.use_vector:
+            return self._read_cord1_vector(data, n, CORD1R, [1], [1])
         s = Struct(b(self._endian + '6i'))
         nentries = (len(data) - n) // 24
         for i in range(nentries):
@@ -148,6 +152,8 @@ class GEOM1(GeomCommon):
         """
         (1901,19,7) - the marker for Record 3
         """
+        if self.use_vector:
+            return self._read_cord1_vector(data, n, CORD1S, [3], [1], allow_overwrites=True)
         s = Struct(b(self._endian + '6i'))
         nentries = (len(data) - n) // 24
         for i in range(nentries):
@@ -169,6 +175,8 @@ class GEOM1(GeomCommon):
         """
         (2001,20,9) - the marker for Record 4
         """
+        if self.use_vector:
+            return self._read_cord2_vector(data, n, CORD2C, [2], [2])
         s = Struct(b(self._endian + '4i9f'))
         nentries = (len(data) - n) // 52
         for i in range(nentries):
@@ -190,6 +198,8 @@ class GEOM1(GeomCommon):
         """
         (2101,21,8) - the marker for Record 5
         """
+        if self.use_vector:
+            return self._read_cord2_vector(data, n, CORD2R, [1], [2])
         nentries = (len(data) - n) // 52
         for i in range(nentries):
             edata = data[n:n + 52]  # 13*4
@@ -212,6 +222,8 @@ class GEOM1(GeomCommon):
         """
         (2201,22,10) - the marker for Record 6
         """
+        if self.use_vector:
+            return self._read_cord2_vector(data, n, CORD2S, None, None)
         s = Struct(b(self._endian + '4i9f'))
         nentries = (len(data) - n) // 52
         for i in range(nentries):
@@ -227,6 +239,53 @@ class GEOM1(GeomCommon):
         self.increase_card_count('CORD2S', nentries)
         return n
 
+    def _read_cord1_vector(self, data, n, coord_class, flags1, flags2,
+                           allow_overwrites=False):
+        """vectorized version of the CORD1R/CORD1C/CORD1S readers"""
+        ints = self._get_record_arrays(data, n, 6)[0]
+        nentries = len(ints)
+        n += nentries * 24
+
+        # (cid, flag1, flag2, g1, g2, g3)
+        assert np.in1d(ints[:, 1], flags1).all(), ints[:, 1]
+        assert np.in1d(ints[:, 2], flags2).all(), ints[:, 2]
+        cids = ints[:, 0]
+        nids = ints[:, 3:]
+        if self.save_card_arrays:
+            self._add_card_arrays(coord_class.type, nentries, {
+                'cid' : cids, 'nids' : nids})
+            return n
+
+        for cid, (g1, g2, g3) in zip(cids.tolist(), nids.tolist()):
+            coord = coord_class.add_op2_data([cid, g1, g2, g3])
+            self._add_coord_object(coord, allow_overwrites=allow_overwrites)
+        self.increase_card_count(coord_class.type, nentries)
+        return n
+
+    def _read_cord2_vector(self, data, n, coord_class, flags1, flags2):
+        """vectorized version of the CORD2R/CORD2C/CORD2S readers"""
+        ints, floats = self._get_record_arrays(data, n, 13)
+        nentries = len(ints)
+        n += nentries * 52
+
+        # (cid, flag1, flag2, rid, a1, a2, a3, b1, b2, b3, c1, c2, c3)
+        if flags1 is not None:
+            assert np.in1d(ints[:, 1], flags1).all(), ints[:, 1]
+            assert np.in1d(ints[:, 2], flags2).all(), ints[:, 2]
+        cids = ints[:, 0]
+        rids = ints[:, 3]
+        if self.save_card_arrays:
+            self._add_card_arrays(coord_class.type, nentries, {
+                'cid' : cids, 'rid' : rids,
+                'e1' : floats[:, 4:7], 'e2' : floats[:, 7:10], 'e3' : floats[:, 10:]})
+            return n
+
+        for cid, rid, abc in zip(cids.tolist(), rids.tolist(), floats[:, 4:].tolist()):
+            coord = coord_class.add_op2_data([cid, rid] + abc)
+            self._add_coord_object(coord, allow_overwrites=True)
+        self.increase_card_count(coord_class.type, nentries)
+        return n
+
     def _read_cord3g(self, data, n):
         """
         (14301,143,651) - the marker for Record 7
@@ -248,6 +307,8 @@ class GEOM1(GeomCommon):
 
     def _read_grid(self, data, n):  # 21.8 sec, 18.9
         """(4501,45,1) - the marker for Record 17"""
+        if self.use_vector:
+            return self._read_grid_vector(data, n)
         s = Struct(b(self._endian + 'ii3f3i'))
         ntotal = 32
         nentries = (len(data) - n) // ntotal
@@ -279,6 +340,40 @@ class GEOM1(GeomCommon):
         self.increase_card_count('GRID', nentries - nfailed)
         return n
 
+    def _read_grid_vector(self, data, n):
+        """vectorized version of ``_read_grid``"""
+        ints, floats = self._get_record_arrays(data, n, 8)
+        nentries = len(ints)
+        n += nentries * 32
+
+        # (nid, cp, x1, x2, x3, cd, ps, seid)
+        inid = ints[:, 0] < 10000000
+        nfailed = nentries - inid.sum()
+        if nfailed:
+            ints = ints[inid, :]
+            floats = floats[inid, :]
+        nids = ints[:, 0]
+        cps = ints[:, 1]
+        xyz = floats[:, 2:5]
+        cds = ints[:, 5]
+        pss = ints[:, 6]
+        seids = ints[:, 7]
+        if self.save_card_arrays:
+            self._add_card_arrays('GRID', nentries - nfailed, {
+                'nid' : nids, 'cp' : cps, 'xyz' : xyz, 'cd' : cds,
+                'ps' : pss, 'seid' : seids})
+            return n
+
+        xyz = xyz.astype('float64')
+        for nid, cp, xyzi, cd, ps, seid in zip(nids.tolist(), cps.tolist(), xyz,
+                                               cds.tolist(), pss.tolist(), seids.tolist()):
+            # cd can be < 0
+            if ps == 0:
+                ps = ''
+            self.nodes[nid] = GRID(nid, xyzi, cp, cd, ps, seid)
+        self.increase_card_count('GRID', nentries - nfailed)
+        return n
+
     def _read_seqgp(self, data, n):
         """(5301,53,4) - the marker for Record 27"""
         s = Struct(b(self._endian + '2i'))
@@ -6,6 +6,7 @@ defines readers for BDF objects in the OP2 GEOM2/GEOM2S table
 from struct import unpack, Struct
 from six import b
 from six.moves import range
+import numpy as np
 
 from pyNastran.bdf.cards.elements.elements import CGAP, PLOTEL
 from pyNastran.bdf.cards.elements.damper import (CDAMP1, CDAMP2, CDAMP3,
@@ -314,6 +315,8 @@ class GEOM2(GeomCommon):
         16 W3B RS T3 component of offset vector from GB
         F:\work\pyNastran\pyNastran\master2\pyNastran\bdf\test\nx_spike\out_sebload1.op2
         """
+        if self.use_vector:
+            return self._read_cbar_vector(data, n)
         nelements = (len(data) - n) // 64
         for i in range(nelements):
             edata = data[n:n + 64]  # 16*4
@@ -348,6 +351,37 @@ class GEOM2(GeomCommon):
         self.card_count['CBAR'] = nelements
         return n
 
+    def _read_cbar_vector(self, data, n):
+        """vectorized version of ``_read_cbar``"""
+        ints, floats = self._get_record_arrays(data, n, 16)
+        nelements = len(ints)
+        n += nelements * 64
+
+        # per DMAP: F = FE bit-wise AND with 3
+        fe = ints[:, 7]
+        f = fe & 3
+        if (f == 3).any():
+            raise RuntimeError('invalid f value...f=%s' % f[f == 3][0])
+        assert np.array_equal(f, fe), 'f=%s fe=%s' % (f, fe)
+        if self.save_card_arrays:
+            is_g0 = f == 2
+            self._add_card_arrays('CBAR', nelements, {
+                'eid' : ints[:, 0], 'pid' : ints[:, 1], 'nids' : ints[:, 2:4],
+                'f' : f, 'x' : np.where(is_g0[:, np.newaxis], np.nan, floats[:, 4:7]),
+                'g0' : np.where(is_g0, ints[:, 4], 0),
+                'pa' : ints[:, 8], 'pb' : ints[:, 9],
+                'wa' : floats[:, 10:13], 'wb' : floats[:, 13:],})
+            return n
+
+        for main, pins, offsets, fi, x, g0 in zip(ints[:, :4].tolist(), ints[:, 8:10].tolist(),
+                                                  floats[:, 10:].tolist(), f.tolist(),
+                                                  floats[:, 4:7].tolist(), ints[:, 4].tolist()):
+            orientation = [fi, g0] if fi == 2 else [fi] + x
+            elem = CBAR.add_op2_data([main + pins + offsets, orientation])
+            self.add_op2_element(elem)
+        self.card_count['CBAR'] = nelements
+        return n
+
     def _read_cbarao(self, data, n):
         """
         CBARAO(4001,40,275) - the marker for Record 9
@@ -387,6 +421,8 @@ class GEOM2(GeomCommon):
         """
         CBEAM(5408,54,261) - the marker for Record 10
         """
+        if self.use_vector:
+            return self._read_cbeam_vector(data, n)
         nelements = (len(data) - n) // 72
         for i in range(nelements):
             edata = data[n:n + 72]  # 18*4
@@ -423,6 +459,36 @@ class GEOM2(GeomCommon):
         self.card_count['CBEAM'] = nelements
         return n
 
+    def _read_cbeam_vector(self, data, n):
+        """vectorized version of ``_read_cbeam``"""
+        ints, floats = self._get_record_arrays(data, n, 18)
+        nelements = len(ints)
+        n += nelements * 72
+
+        # per DMAP: F = FE bit-wise AND with 3
+        f = ints[:, 9] & 3
+        if (f == 3).any():
+            raise RuntimeError('invalid f value...f=%r' % f[f == 3][0])
+        if self.save_card_arrays:
+            is_g0 = f == 2
+            self._add_card_arrays('CBEAM', nelements, {
+                'eid' : ints[:, 0], 'pid' : ints[:, 1], 'nids' : ints[:, 2:4],
+                'sa' : ints[:, 4], 'sb' : ints[:, 5],
+                'f' : f, 'x' : np.where(is_g0[:, np.newaxis], np.nan, floats[:, 6:9]),
+                'g0' : np.where(is_g0, ints[:, 6], 0),
+                'pa' : ints[:, 10], 'pb' : ints[:, 11],
+                'wa' : floats[:, 12:15], 'wb' : floats[:, 15:],})
+            return n
+
+        for main, pins, offsets, fi, x, g0 in zip(ints[:, :6].tolist(), ints[:, 10:12].tolist(),
+                                                  floats[:, 12:].tolist(), f.tolist(),
+                                                  floats[:, 6:9].tolist(), ints[:, 6].tolist()):
+            orientation = [fi, g0] if fi == 2 else [fi] + x
+            elem = CBEAM.add_op2_data([main + pins + offsets, orientation], fi)
+            self.add_op2_element(elem)
+        self.card_count['CBEAM'] = nelements
+        return n
+
     def _read_cbeamp(self, data, n):
         """
         CBEAMP(11401,114,9016) - the marker for Record 11
@@ -500,6 +566,8 @@ class GEOM2(GeomCommon):
         """
         CBUSH(2608,26,60) - the marker for Record 13
         """
+        if self.use_vector:
+            return self._read_cbush_vector(data, n)
         nelements = (len(data) - n) // 56
         struct_obj1 = Struct(b(self._endian + '4i iii i ifi3f'))
         struct_obj2 = Struct(b(self._endian + '4i fff i ifi3f'))
@@ -537,6 +605,45 @@ class GEOM2(GeomCommon):
         self.card_count['CBUSH'] = nelements
         return n
 
+    def _read_cbush_vector(self, data, n):
+        """vectorized version of ``_read_cbush``"""
+        ints, floats = self._get_record_arrays(data, n, 14)
+        nelements = len(ints)
+        n += nelements * 56
+
+        # f=-1: use the element cid; f=0/1: x; f=2: g0
+        f = ints[:, 7]
+        is_valid = np.in1d(f, [-1, 0, 1, 2])
+        if not is_valid.all():
+            raise RuntimeError('invalid f value...f=%r' % f[~is_valid][0])
+        if self.save_card_arrays:
+            is_x = (f == 0) | (f == 1)
+            self._add_card_arrays('CBUSH', nelements, {
+                'eid' : ints[:, 0], 'pid' : ints[:, 1], 'nids' : ints[:, 2:4],
+                'f' : f, 'x' : np.where(is_x[:, np.newaxis], floats[:, 4:7], np.nan),
+                'g0' : np.where(f == 2, ints[:, 4], 0),
+                'cid' : ints[:, 8], 's' : floats[:, 9], 'ocid' : ints[:, 10],
+                'si' : floats[:, 11:],})
+            return n
+
+        for (eid, pid, ga, gb), fi, x, g0, cid, s, ocid, si in zip(
+                ints[:, :4].tolist(), f.tolist(), floats[:, 4:7].tolist(), ints[:, 4].tolist(),
+                ints[:, 8].tolist(), floats[:, 9].tolist(), ints[:, 10].tolist(),
+                floats[:, 11:].tolist()):
+            if fi in [0, 1]:
+                g0 = None
+            else:
+                x = [None, None, None]
+                if fi == -1:
+                    g0 = None
+            if cid == -1:
+                cid = None
+            data_in = [[eid, pid, ga, gb, cid, s, ocid, si], x, g0]
+            elem = CBUSH.add_op2_data(data_in, fi)
+            self.add_op2_element(elem)
+        self.card_count['CBUSH'] = nelements
+        return n
+
     def _read_cbush1d(self, data, n):
         """
         CBUSH1D(5608,56,218) - the marker for Record 14
@@ -862,6 +969,8 @@ class GEOM2(GeomCommon):
         """
         CHEXA(7308,73,253) - the marker for Record 45
         """
+        if self.use_vector:
+            return self._read_solid_vector(data, n, 'CHEXA', 22, 8, CHEXA8, CHEXA20)
         s = Struct(b(self._endian + '22i'))
         ntotal = 88  # 22*4
         nelements = (len(data) - n) // ntotal
@@ -885,6 +994,40 @@ class GEOM2(GeomCommon):
         self.card_count['CHEXA'] = nelements
         return n
 
+    def _read_solid_vector(self, data, n, card_name, nwords, nnodes,
+                           element_small, element_big):
+        """
+        vectorized version of the CHEXA/CPENTA/CTETRA readers
+
+        Parameters
+        ----------
+        card_name : str
+            the card name (e.g., 'CHEXA')
+        nwords : int
+            the number of words in an entry; [eid, pid, nids]
+        nnodes : int
+            the number of corner nodes
+        element_small / element_big : class
+            the linear/quadratic element (e.g., CHEXA8/CHEXA20)
+        """
+        ints = self._get_record_arrays(data, n, nwords)[0]
+        nelements = len(ints)
+        n += nelements * nwords * 4
+        if self.save_card_arrays:
+            self._add_card_arrays(card_name, nelements, {
+                'eid' : ints[:, 0], 'pid' : ints[:, 1], 'nids' : ints[:, 2:]})
+            return n
+
+        is_big = ints[:, 2 + nnodes:].sum(axis=1) > 0
+        for out, is_bigi in zip(ints.tolist(), is_big.tolist()):
+            if is_bigi:
+                elem = element_big.add_op2_data(out)
+            else:
+                elem = element_small.add_op2_data(out[:2 + nnodes])
+            self.add_op2_element(elem)
+        self.card_count[card_name] = nelements
+        return n
+
 # CHEXA20F
 # CHEXAFD
 # CHEXAL
@@ -1097,7 +1240,9 @@ class GEOM2(GeomCommon):
         assert n is not None
         for elem in elements:
             add_method(elem)
-        self.card_count[card_name] = nelements
+        if card_name not in self.card_arrays:
+            # the cards that are stored as arrays are counted by _add_card_arrays
+            self.card_count[card_name] = nelements
         return n
 
     def _read_conv_nx(self, data, n):
@@ -1218,6 +1363,8 @@ class GEOM2(GeomCommon):
         CPENT15F(16500,165,9999) - the marker for Record 65
         CPENT6FD(16000,160,9999) - the marker for Record 66
         """
+        if self.use_vector:
+            return self._read_solid_vector(data, n, 'CPENTA', 17, 6, CPENTA6, CPENTA15)
         s = Struct(b(self._endian + '17i'))
         nelements = (len(data) - n) // 68
         for i in range(nelements):
@@ -1280,6 +1427,8 @@ class GEOM2(GeomCommon):
         """
         common method for CQUAD4, CQUADR
         """
+        if self.use_vector:
+            return self._run_cquad4_vector(data, n, element)
         nelements = (len(data) - n) // 56
         s = Struct(b(self._endian + '6iffii4f'))
         if self.is_debug_file:
@@ -1302,6 +1451,29 @@ class GEOM2(GeomCommon):
         self.card_count[element.type] = nelements
         return n
 
+    def _run_cquad4_vector(self, data, n, element):
+        """vectorized version of ``run_cquad4``"""
+        ints, floats = self._get_record_arrays(data, n, 14)
+        nelements = len(ints)
+        n += nelements * 56
+
+        # (eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag,
+        #  t1, t2, t3, t4)
+        if self.save_card_arrays:
+            self._add_card_arrays(element.type, nelements, {
+                'eid' : ints[:, 0], 'pid' : ints[:, 1], 'nids' : ints[:, 2:6],
+                'theta' : floats[:, 6], 'zoffset' : floats[:, 7], 'tflag' : ints[:, 9],
+                'thickness' : floats[:, 10:],})
+            return n
+
+        for main, theta_zoffs, tflag, thickness in zip(ints[:, :6].tolist(), floats[:, 6:8].tolist(),
+                                                       ints[:, 9].tolist(), floats[:, 10:].tolist()):
+            data_init = main + theta_zoffs + [tflag] + thickness
+            elem = element.add_op2_data(data_init)
+            self.add_op2_element(elem)
+        self.card_count[element.type] = nelements
+        return n
+
 # CQUAD4FD
 
     def _read_cquad8(self, data, n):
@@ -1482,6 +1654,8 @@ class GEOM2(GeomCommon):
         CTETR10F(16600,166,9999) - the marker for Record 90
         CTETR4FD(16100,161,9999) - the marker for Record 91
         """
+        if self.use_vector:
+            return self._read_solid_vector(data, n, 'CTETRA', 12, 4, CTETRA4, CTETRA10)
         s = Struct(b(self._endian + '12i'))
         nelements = (len(data) - n)// 48  # 12*4
         for i in range(nelements):
@@ -1510,6 +1684,8 @@ class GEOM2(GeomCommon):
         """
         CTRIA3(5959,59,282)    - the marker for Record 94
         """
+        if self.use_vector:
+            return self._read_ctria3_vector(data, n)
         ntotal = 52  # 13*4
         s = Struct(b(self._endian + '5iff3i3f'))
         nelements = (len(data) - n)// 52  # 13*4
@@ -1530,6 +1706,29 @@ class GEOM2(GeomCommon):
         return n
 
 
+    def _read_ctria3_vector(self, data, n):
+        """vectorized version of ``_read_ctria3``"""
+        ints, floats = self._get_record_arrays(data, n, 13)
+        nelements = len(ints)
+        n += nelements * 52
+
+        # (eid, pid, n1, n2, n3, theta, zoffs, blank1, blank2, tflag,
+        #  t1, t2, t3)
+        if self.save_card_arrays:
+            self._add_card_arrays('CTRIA3', nelements, {
+                'eid' : ints[:, 0], 'pid' : ints[:, 1], 'nids' : ints[:, 2:5],
+                'theta' : floats[:, 5], 'zoffset' : floats[:, 6], 'tflag' : ints[:, 9],
+                'thickness' : floats[:, 10:],})
+            return n
+
+        for main, theta_zoffs, tflag, thickness in zip(ints[:, :5].tolist(), floats[:, 5:7].tolist(),
+                                                       ints[:, 9].tolist(), floats[:, 10:].tolist()):
+            data_in = main + theta_zoffs + [tflag] + thickness
+            elem = CTRIA3.add_op2_data(data_in)
+            self.add_op2_element(elem)
+        self.card_count['CTRIA3'] = nelements
+        return n
+
 # CTRIAFD - 95
 
     def _read_ctria6(self, data, n):
@@ -101,9 +101,9 @@ class GEOM3(GeomCommon):
         NX/MSC
         """
         ntotal = 28  # 7*4
-        ints = np.fromstring(data[n:], dtype='int32')
-        floats = np.fromstring(data[n:], dtype='float32')
-        strings = np.fromstring(data[n:], dtype='|S4')
+        ints = np.frombuffer(data[n:], dtype='int32')
+        floats = np.frombuffer(data[n:], dtype='float32')
+        strings = np.frombuffer(data[n:], dtype='|S4')
         i_minus_1s = np.where(ints == -1)[0]
 
         i0 = 0
@@ -130,6 +130,8 @@ class GEOM3(GeomCommon):
         """
         FORCE(4201,42,18) - the marker for Record 3
         """
+        if self.use_vector:
+            return self._read_force_card_vector(data, n)
         ntotal = 28  # 7*4
         nentries = (len(data) - n) // ntotal
         s = Struct(b(self._endian + 'iiiffff'))
@@ -144,6 +146,26 @@ class GEOM3(GeomCommon):
         self.card_count['FORCE'] = nentries
         return n
 
+    def _read_force_card_vector(self, data, n):
+        """vectorized version of ``_read_force``"""
+        ints, floats = self._get_record_arrays(data, n, 7)
+        nentries = len(ints)
+        n += nentries * 28
+
+        # (sid, g, cid, f, n1, n2, n3)
+        if self.save_card_arrays:
+            self._add_card_arrays('FORCE', nentries, {
+                'sid' : ints[:, 0], 'nid' : ints[:, 1], 'cid' : ints[:, 2],
+                'mag' : floats[:, 3], 'xyz' : floats[:, 4:],})
+            return n
+
+        xyz = floats[:, 4:].astype('float64')
+        for (sid, g, cid), f, xyzi in zip(ints[:, :3].tolist(), floats[:, 3].tolist(), xyz):
+            force = FORCE(sid, g, f, cid=cid, xyz=xyzi)
+            self._add_load_object(force)
+        self.card_count['FORCE'] = nentries
+        return n
+
     def _read_force1(self, data, n):
         """
         FORCE1(4001,40,20) - the marker for Record 4
@@ -444,6 +466,8 @@ class GEOM3(GeomCommon):
         13 SDRL(2) CHAR4 Load set on element SURF or LINE
         15 LDIR(2) CHAR4 Load direction
         """
+        if self.use_vector:
+            return self._read_pload4_vector(data, n, 16)
         ntotal = 64  # 16*4
         nentries = (len(data) - n) // ntotal
         assert (len(data) - n) % ntotal == 0
@@ -484,6 +508,8 @@ class GEOM3(GeomCommon):
         9  CID         I Coordinate system identification number
         10 N(3)       RS Components of a vector coordinate system defined by CID
         """
+        if self.use_vector:
+            return self._read_pload4_vector(data, n, 12)
         ntotal = 48  # 12*4
         nentries = (len(data) - n) // ntotal
         assert (len(data) - n) % ntotal == 0
@@ -506,6 +532,54 @@ class GEOM3(GeomCommon):
         self.card_count['PLOAD4'] = nentries
         return n, loads
 
+    def _read_pload4_vector(self, data, n, nwords):
+        """
+        vectorized version of the MSC (nwords=16) and NX (nwords=12)
+        PLOAD4 readers
+        """
+        ntotal = 4 * nwords
+        assert (len(data) - n) % ntotal == 0
+        ints, floats = self._get_record_arrays(data, n, nwords)
+        nentries = len(ints)
+
+        # (sid, eid, p1, p2, p3, p4, g1, g34, cid, n1, n2, n3,
+        #  surf_or_line, line_load_dir)
+        arrays = {
+            'sid' : ints[:, 0], 'eid' : ints[:, 1], 'pressures' : floats[:, 2:6],
+            'g1' : ints[:, 6], 'g34' : ints[:, 7], 'cid' : ints[:, 8],
+            'nvector' : floats[:, 9:12],}
+        if nwords == 16:
+            strings = np.frombuffer(data, dtype='S8', count=nentries * 8,
+                                    offset=n).reshape(nentries, 8)
+            surf_or_line = np.char.decode(np.char.rstrip(strings[:, 6]), 'latin1')
+            line_load_dir = np.char.decode(np.char.rstrip(strings[:, 7]), 'latin1')
+
+            # forces NX pload4 function to get called if it should be
+            assert np.in1d(surf_or_line, ['SURF', 'LINE']).all()
+            assert np.in1d(line_load_dir, ['LINE', 'X', 'Y', 'Z', 'TANG', 'NORM']).all()
+            arrays['surf_or_line'] = surf_or_line
+            arrays['line_load_dir'] = line_load_dir
+            surf_or_line = surf_or_line.tolist()
+            line_load_dir = line_load_dir.tolist()
+        else:
+            surf_or_line = line_load_dir = [None] * nentries
+        n += nentries * ntotal
+
+        loads = []
+        if self.save_card_arrays:
+            self._add_card_arrays('PLOAD4', nentries, arrays)
+            return n, loads
+
+        for (sid, eid), pressures, (g1, g34, cid), nvector, surf, ldir in zip(
+                ints[:, :2].tolist(), floats[:, 2:6].tolist(), ints[:, 6:9].tolist(),
+                floats[:, 9:12].tolist(), surf_or_line, line_load_dir):
+            load = PLOAD4.add_op2_data(
+                [sid, eid, pressures, g1, g34, cid, nvector, surf, ldir])
+            load.validate()
+            loads.append(load)
+        self.card_count['PLOAD4'] = nentries
+        return n, loads
+
     def _read_ploadx(self, data, n):
         self.log.info('skipping PLOADX in GEOM4\n')
         return len(data)
@@ -159,7 +159,7 @@ class GEOM4(GeomCommon):
         ndata = len(data)
         #nfields = (ndata - n) // 4
         #fmt = '%ii' % nfields
-        out = np.fromstring(data[n:], self.idtype)
+        out = np.frombuffer(data[n:], self.idtype)
         #print(out)
         izero = np.where(out == -1)[0]
         if len(izero) == 0:
@@ -215,7 +215,7 @@ class GEOM4(GeomCommon):
         ndata = len(data)
         #nfields = (ndata - n) // 4
         #fmt = '%ii' % nfields
-        out = np.fromstring(data[n:], self.idtype)
+        out = np.frombuffer(data[n:], self.idtype)
         #print(out)
         iminus1 = np.where(out == -1)[0]
         if len(iminus1) == 0:
@@ -344,7 +344,7 @@ class GEOM4(GeomCommon):
         MPCADD(4891,60,83) - Record 17
         """
         nentries = (len(data) - n) // 4
-        datai = np.fromstring(data[n:], self.idtype)
+        datai = np.frombuffer(data[n:], self.idtype)
         _read_spcadd_mpcadd(self, 'MPCADD', datai)
         return len(data)
 
@@ -434,8 +434,8 @@ class GEOM4(GeomCommon):
         6 ALPHA RS Thermal expansion coefficient
         7 UNDEF none Not used
         """
-        idata = np.fromstring(data[n:], self.idtype)
-        #fdata = np.fromstring(data[n:], self.fdtype)
+        idata = np.frombuffer(data[n:], self.idtype)
+        #fdata = np.frombuffer(data[n:], self.fdtype)
 
         i = 0
         nelements = 0
@@ -487,7 +487,7 @@ class GEOM4(GeomCommon):
                   4, 4, 123,    40000, 40001, 40010, 40011, 40020, 40021, 40030, 40031, 40040, 40041, 40050, 40051, -1, 0.0,
                   5, 5, 123,    50000, 50001, 50010, 50011, 50020, 50021, 50030, 50031, 50040, 50041, 50050, 50051, -1, 0.0)
         """
-        idata = np.fromstring(data[n:], self.idtype)
+        idata = np.frombuffer(data[n:], self.idtype)
         iminus1 = np.where(idata == -1)[0]
         if idata[-1] == -1:
             is_alpha = False
@@ -496,7 +496,7 @@ class GEOM4(GeomCommon):
         else:
             is_alpha = True
             i = np.hstack([[0], iminus1[:-1]+1])
-            fdata = np.fromstring(data[n:], self.fdtype)
+            fdata = np.frombuffer(data[n:], self.fdtype)
             j = np.hstack([iminus1[:-1], len(idata)-2])
 
         #print('i=%s' % i)
@@ -564,8 +564,8 @@ class GEOM4(GeomCommon):
 
     def _read_rbe3(self, data, n):
         """RBE3(7101,71,187) - Record 25"""
-        idata = np.fromstring(data[n:], self.idtype)
-        fdata = np.fromstring(data[n:], self.fdtype)
+        idata = np.frombuffer(data[n:], self.idtype)
+        fdata = np.frombuffer(data[n:], self.fdtype)
         read_rbe3s_from_idata_fdata(self, idata, fdata)
         return n
 
@@ -807,7 +807,7 @@ class GEOM4(GeomCommon):
         """
         #nentries = 0
         #nints = (len(data) - n) // 4
-        idata = np.fromstring(data[n:], self.idtype)
+        idata = np.frombuffer(data[n:], self.idtype)
         if not idata[-1] == -1:
             idata = np.hstack([idata, -1])
         iminus1 = np.where(idata == -1)[0]
@@ -873,7 +873,7 @@ class GEOM4(GeomCommon):
         """
         #nentries = 0
         #nints = (len(data) - n) // 4
-        idata = np.fromstring(data[n:], self.idtype)
+        idata = np.frombuffer(data[n:], self.idtype)
         if not idata[-1] == -1:
             idata = np.hstack([idata, -1])
         iminus1 = np.where(idata == -1)[0]
@@ -881,46 +881,70 @@ class GEOM4(GeomCommon):
 
         i = np.hstack([[0], iminus1[:-1]+1])
         j = np.hstack([iminus1[:-1], -1])
+        cards = []
         for ii, jj in zip(i, j):
             outi = idata[ii:jj]
-            self._add_spc1_card(outi)
+            cards.extend(self._split_spc1_card(outi))
+
+        if self.use_vector and self.save_card_arrays:
+            if cards:
+                sids, components, nids = zip(*cards)
+                self._add_card_arrays('SPC1', len(cards), {
+                    'sid' : np.array(sids, dtype=self.idtype),
+                    'components' : np.array(components, dtype=self.idtype),
+                    'nnodes' : np.array([len(nidsi) for nidsi in nids], dtype='int32'),
+                    # (sum(nnodes), ) array; use nnodes to split it
+                    'nids' : np.hstack(nids),})
+            return len(data)
+
+        for sid, components, nids in cards:
+            in_data = [sid, components, nids.tolist()]
+            constraint = SPC1.add_op2_data(in_data)
+            self._add_constraint_spc_object(constraint)
+            self.increase_card_count('SPC1', 1)
         return len(data)
 
-    def _add_spc1_card(self, out):
-        """helper method for ``_read_spc1``"""
-        sid, components = out[:2]
-        thru_flag = out[2]
-        if thru_flag == 0:  # repeat 4 to end
-            nids = out[3:].tolist()
-            thru_check = False
-        elif thru_flag == 1:
-            n1 = out[3]
-            n2 = out[4]
-            nids = list(range(n1, n2+1))
-            thru_check = True
-        else:
-            raise NotImplementedError('SPC1; thru_flag=%s' % thru_flag)
+    def _split_spc1_card(self, out):
+        """
+        helper method for ``_read_spc1``
 
-        assert -1 not in out, out.tolist()
-        if self.is_debug_file:
-            self.binary_debug.write('SPC1: sid=%s components=%s thru_flag=%s' % (
-                sid, components, thru_flag))
-            self.binary_debug.write('   nids=%s\n' % str(nids))
-        if len(nids) == 0:
-            #self.log.warning('skipping SPC1 because its empty...%s' % out)
-            return
-        in_data = [sid, components, nids]
-        constraint = SPC1.add_op2_data(in_data)
-        self._add_constraint_spc_object(constraint)
-        self.increase_card_count('SPC1', 1)
-        if thru_check and len(out) > 5:
+        Splits an entry into [(sid, components, nids), ...], where a THRU
+        entry may be followed by more SPC1s
+        """
+        cards = []
+        while True:
+            sid, components = out[:2].tolist()
+            thru_flag = out[2]
+            if thru_flag == 0:  # repeat 4 to end
+                nids = out[3:]
+                thru_check = False
+            elif thru_flag == 1:
+                n1 = out[3]
+                n2 = out[4]
+                nids = np.arange(n1, n2+1, dtype=out.dtype)
+                thru_check = True
+            else:
+                raise NotImplementedError('SPC1; thru_flag=%s' % thru_flag)
+
+            assert -1 not in out, out.tolist()
+            if self.is_debug_file:
+                self.binary_debug.write('SPC1: sid=%s components=%s thru_flag=%s' % (
+                    sid, components, thru_flag))
+                self.binary_debug.write('   nids=%s\n' % str(nids.tolist()))
+            if len(nids) == 0:
+                #self.log.warning('skipping SPC1 because its empty...%s' % out)
+                break
+            cards.append((sid, components, nids))
+            if not (thru_check and len(out) > 5):
+                break
             #card = out[5:]
-            self._add_spc1_card(out[5:])
+            out = out[5:]
+        return cards
 
     def _read_spcadd(self, data, n):
         """SPCADD(5491,59,13) - Record 46"""
         nentries = (len(data) - n) // 4
-        datai = np.fromstring(data[n:], self.idtype)
+        datai = np.frombuffer(data[n:], self.idtype)
         _read_spcadd_mpcadd(self, 'SPCADD', datai)
         return len(data)
 
@@ -1,4 +1,5 @@
 from struct import Struct
+import numpy as np
 
 class SuppressLogging(object):
     def __init__(self):
@@ -32,12 +33,69 @@ class GeomCommon(object):
         self.binary_debug = SuppressFileIO()
         #self.log = SuppressLogging()
 
+        #: stores the vectorized cards (e.g., GRID, CQUAD4, PSHELL) as
+        #: columnar arrays in card_arrays instead of creating card objects;
+        #: requires use_vector=True
+        self.save_card_arrays = False
+
+        #: card_arrays[card_name][column_name] = (n, ...) ndarray
+        #: e.g., card_arrays['GRID']['xyz'] = (nnodes, 3) float32 ndarray
+        self.card_arrays = {}
+
     def _read_fake(self, data, n):
         self.log.info('skipping %s in %s' % (self.card_name, self.table_name))
         #if (self.card_name == '' or '?' in self.card_name) and data:
             #self.show_data(data)
         return len(data)
 
+    def _get_record_arrays(self, data, n, nwords):
+        """
+        Gets int/float views of a record of fixed length entries
+
+        Parameters
+        ----------
+        data : bytes
+            the record
+        n : int
+            the byte offset of the first entry
+        nwords : int
+            the number of words in an entry
+
+        Returns
+        -------
+        ints / floats : (nentries, nwords) int/float ndarray
+            views of the entries
+        """
+        nentries = (len(data) - n) // (4 * nwords)
+        ints = np.frombuffer(data, dtype=self.idtype, count=nentries * nwords,
+                             offset=n).reshape(nentries, nwords)
+        floats = np.frombuffer(data, dtype=self.fdtype, count=nentries * nwords,
+                               offset=n).reshape(nentries, nwords)
+        return ints, floats
+
+    def _add_card_arrays(self, card_name, nentries, arrays):
+        """
+        Stores the columnar arrays of a card
+
+        Parameters
+        ----------
+        card_name : str
+            the card name (e.g., 'GRID')
+        nentries : int
+            the number of cards
+        arrays : dict[column_name] = ndarray
+            the columns; a card that's read from multiple tables
+            (e.g., GEOM1 and GEOM1S) is stacked
+        """
+        # the columns are copied, so the record may be freed
+        arrays = {name : np.array(array) for name, array in arrays.items()}
+        if card_name in self.card_arrays:
+            arrays0 = self.card_arrays[card_name]
+            arrays = {name : np.concatenate([arrays0[name], array])
+                      for name, array in arrays.items()}
+        self.card_arrays[card_name] = arrays
+        self.increase_card_count(card_name, nentries)
+
     def increase_card_count(self, name, count_num=1):
         msg = 'this should be overwritten; name=%s count_num=%s' % (name, count_num)
         raise NotImplementedError(msg)
@@ -8,6 +8,8 @@ from struct import Struct
 from six import b
 from six.moves import range
 
+import numpy as np
+
 from pyNastran.bdf.cards.materials import (CREEP, MAT1, MAT2, MAT3, MAT4, MAT5,
                                            MAT8, MAT9, MAT10, MAT11, MATHP)
 from pyNastran.bdf.cards.material_deps import MATS1, MATT1, MATT4, MATT5
@@ -91,6 +93,8 @@ class MPT(GeomCommon):
         """
         MAT1(103,1,77) - record 2
         """
+        if self.use_vector:
+            return self._read_mat1_vector(data, n)
         ntotal = 48  # 12*4
         s = Struct(b(self._endian + 'i10fi'))
         nmaterials = (len(data) - n) // ntotal
@@ -104,6 +108,27 @@ class MPT(GeomCommon):
         self.card_count['MAT1'] = nmaterials
         return n
 
+    def _read_mat1_vector(self, data, n):
+        """vectorized version of ``_read_mat1``"""
+        ints, floats = self._get_record_arrays(data, n, 12)
+        nmaterials = len(ints)
+        n += nmaterials * 48
+        if self.save_card_arrays:
+            arrays = {name : floats[:, i] for i, name in enumerate(
+                ['e', 'g', 'nu', 'rho', 'a', 'tref', 'ge', 'St', 'Sc', 'Ss'], start=1)}
+            arrays['mid'] = ints[:, 0]
+            arrays['mcsid'] = ints[:, 11]
+            self._add_card_arrays('MAT1', nmaterials, arrays)
+            return n
+
+        for mid, props, mcsid in zip(ints[:, 0].tolist(), floats[:, 1:11].tolist(),
+                                     ints[:, 11].tolist()):
+            #(mid, E, G, nu, rho, A, tref, ge, St, Sc, Ss, mcsid) = out
+            mat = MAT1.add_op2_data([mid] + props + [mcsid])
+            self.add_op2_material(mat)
+        self.card_count['MAT1'] = nmaterials
+        return n
+
     def _read_mat2(self, data, n):
         """
         MAT2(203,2,78) - record 3
@@ -184,6 +209,8 @@ class MPT(GeomCommon):
         """
         MAT8(2503,25,288) - record 7
         """
+        if self.use_vector:
+            return self._read_mat8_vector(data, n)
         s = Struct(b(self._endian + 'i18f'))
         nmaterials = (len(data) - n) // 76
         for i in range(nmaterials):
@@ -196,6 +223,27 @@ class MPT(GeomCommon):
         self.card_count['MAT8'] = nmaterials
         return n
 
+    def _read_mat8_vector(self, data, n):
+        """vectorized version of ``_read_mat8``"""
+        ints, floats = self._get_record_arrays(data, n, 19)
+        nmaterials = len(ints)
+        n += nmaterials * 76
+        if self.save_card_arrays:
+            arrays = {name : floats[:, i] for i, name in enumerate(
+                ['e11', 'e22', 'nu12', 'g12', 'g1z', 'g2z', 'rho', 'a1', 'a2',
+                 'tref', 'Xt', 'Xc', 'Yt', 'Yc', 'S', 'ge', 'F12', 'strn'], start=1)}
+            arrays['mid'] = ints[:, 0]
+            self._add_card_arrays('MAT8', nmaterials, arrays)
+            return n
+
+        for mid, props in zip(ints[:, 0].tolist(), floats[:, 1:].tolist()):
+            #(mid, E1, E2, nu12, G12, G1z, G2z, rho, a1, a2,
+            # tref, Xt, Xc, Yt, Yc, S, ge, f12, strn) = out
+            mat = MAT8.add_op2_data([mid] + props)
+            self.add_op2_material(mat)
+        self.card_count['MAT8'] = nmaterials
+        return n
+
     def _read_mat9(self, data, n):
         """
         MAT9(2603,26,300) - record 9
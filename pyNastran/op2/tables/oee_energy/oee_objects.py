@@ -309,6 +309,7 @@ class RealStrainEnergyArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         #msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -646,6 +647,7 @@ class ComplexStrainEnergyArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         #msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -8,7 +8,7 @@ from struct import Struct
 from six import b
 from six.moves import range
 import numpy as np
-from numpy import fromstring, vstack, sin, cos, radians, array
+from numpy import frombuffer, vstack, sin, cos, radians, array
 from numpy import hstack, zeros
 
 from pyNastran.op2.op2_helper import polar_to_real_imag
@@ -391,16 +391,16 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
 
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 9)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 9)
                     s = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
                     #print(s)
                     #print('itime = ', obj.itime)
                     #print('---------')
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -484,14 +484,14 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                     eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 9)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 9)
                     obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                     #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
@@ -525,14 +525,14 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
-                        strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 10)
+                        strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 10)
                         obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                     #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux, zed]
@@ -605,10 +605,10 @@ class OEF(OP2Common):
                         ielement2 = obj.itotal + nelements
                         itotal2 = ielement2
 
-                        floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                         obj._times[obj.itime] = dt
                         if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                             eids = ints[:, 0] // 10
                             assert eids.min() > 0, eids.min()
                             obj.element[itotal:itotal2] = eids
@@ -668,10 +668,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                         eids = ints[:, 0] // 10
                         nids = ints[:, 2]
                         assert eids.min() > 0, eids.min()
@@ -744,11 +744,11 @@ class OEF(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     floats2 = floats[:, 2:].reshape(nelements * nnodes, 7)
                     obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     ints2 = ints[:, 2:].reshape(nelements * nnodes, 7)
                     eids = ints[:, 0] // 10
                     parent = ints[:, 1]
@@ -817,8 +817,8 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         eids = ints[:, 0] // 10
@@ -900,8 +900,8 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         eids = ints[:, 0] // 10
@@ -1097,10 +1097,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1149,10 +1149,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1207,10 +1207,10 @@ class OEF(OP2Common):
                     #itotal2 = obj.itotal + nelements
                     #ielement2 = obj.ielement + nelements
 
-                    #floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
+                    #floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
                     #obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                        #ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        #ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         #eids = ints[:, 0] // 10
                         #assert eids.min() > 0, eids.min()
                         #assert 0 not in eids, eids
@@ -1258,10 +1258,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 100)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 100)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 100)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 100)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1324,10 +1324,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 177)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 177)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 177)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 177)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1487,10 +1487,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 2)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 2)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1532,10 +1532,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1590,10 +1590,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1636,10 +1636,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1701,10 +1701,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1729,7 +1729,6 @@ class OEF(OP2Common):
             elif self.format_code in [2, 3] and self.num_wide == 17: # imag
                 slot = self.cbar_force
 
-                # TODO: vectorize
                 ntotal = 68  # 17*4
                 nelements = ndata // ntotal
 
@@ -1739,41 +1738,62 @@ class OEF(OP2Common):
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
-                s = Struct(b(self._endian + 'i16f'))
-                for i in range(nelements):
-                    edata = data[n:n + 68]
-
-                    out = s.unpack(edata)
-                    (eid_device,
-                     bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
-                     bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
-                    eid = eid_device // 10
-                    if is_magnitude_phase:
-                        bm1a = polar_to_real_imag(bm1ar, bm1ai)
-                        bm2a = polar_to_real_imag(bm2ar, bm2ai)
-                        bm1b = polar_to_real_imag(bm1br, bm1bi)
-                        bm2b = polar_to_real_imag(bm2br, bm2bi)
-                        ts1 = polar_to_real_imag(ts1r, ts1i)
-                        ts2 = polar_to_real_imag(ts2r, ts2i)
-                        af = polar_to_real_imag(afr, afi)
-                        trq = polar_to_real_imag(trqr, trqi)
-                    else:
-                        bm1a = complex(bm1ar, bm1ai)
-                        bm2a = complex(bm2ar, bm2ai)
-                        bm1b = complex(bm1br, bm1bi)
-                        bm2b = complex(bm2br, bm2bi)
-                        ts1 = complex(ts1r, ts1i)
-                        ts2 = complex(ts2r, ts2i)
-                        af = complex(afr, afi)
-                        trq = complex(trqr, trqi)
-
-                    #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                    #print "%s" % (self.get_element_type(self.element_type)), data_in
-                    #eid = obj.add_new_eid(out)
-                    obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
-                    n += ntotal
+                if self.use_vector and is_vectorized:
+                    n = nelements * 4 * self.num_wide
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements
+
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element[itotal:itotal2] = eids
+
+                    #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                    isave1 = [1, 2, 3, 4, 5, 6, 7, 8]
+                    isave2 = [9, 10, 11, 12, 13, 14, 15, 16]
+                    real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                    obj.ielement = itotal2
+                else:
+                    s = Struct(b(self._endian + 'i16f'))
+                    for i in range(nelements):
+                        edata = data[n:n + 68]
+
+                        out = s.unpack(edata)
+                        (eid_device,
+                         bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
+                         bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
+                        if self.is_debug_file:
+                            self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
+                        eid = eid_device // 10
+                        if is_magnitude_phase:
+                            bm1a = polar_to_real_imag(bm1ar, bm1ai)
+                            bm2a = polar_to_real_imag(bm2ar, bm2ai)
+                            bm1b = polar_to_real_imag(bm1br, bm1bi)
+                            bm2b = polar_to_real_imag(bm2br, bm2bi)
+                            ts1 = polar_to_real_imag(ts1r, ts1i)
+                            ts2 = polar_to_real_imag(ts2r, ts2i)
+                            af = polar_to_real_imag(afr, afi)
+                            trq = polar_to_real_imag(trqr, trqi)
+                        else:
+                            bm1a = complex(bm1ar, bm1ai)
+                            bm2a = complex(bm2ar, bm2ai)
+                            bm1b = complex(bm1br, bm1bi)
+                            bm2b = complex(bm2br, bm2bi)
+                            ts1 = complex(ts1r, ts1i)
+                            ts2 = complex(ts2r, ts2i)
+                            af = complex(afr, afi)
+                            trq = complex(trqr, trqi)
+
+                        #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                        #print "%s" % (self.get_element_type(self.element_type)), data_in
+                        #eid = obj.add_new_eid(out)
+                        obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
+                        n += ntotal
             else:
                 msg = self.code_information()
                 return self._not_implemented_or_skip(data, ndata, msg)
@@ -1799,10 +1819,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1853,15 +1873,15 @@ class OEF(OP2Common):
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
-                if is_vectorized:
+                if self.use_vector and is_vectorized:
                     n = nelements * 4 * self.num_wide
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[ielement:ielement2] = eids
@@ -1898,10 +1918,10 @@ class OEF(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2014,7 +2034,8 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(
+                            nelements, numwide_real).copy()
                         # Nastran makes this a 4 for CQUAD4s instead
                         # of 0 like the bilinear stress element...
                         ints[:, 2] = 0
@@ -2025,7 +2046,7 @@ class OEF(OP2Common):
                         obj.element_node[istart:iend, 0] = eids2
                         obj.element_node[istart:iend, 1] = nids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     results = floats[:, 2:].reshape(nlayers, 9)[:, 1:]
                     #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
                     obj.data[obj.itime, istart:iend, :] = results
@@ -2072,10 +2093,11 @@ class OEF(OP2Common):
                     ielement2 = obj.ielement + nelements
                     itotal2 = obj.itotal + nelements * nnodes_all
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(
+                            nelements, numwide_imag).copy()
                         ints[:, 2] = 0
                         ints2 = ints[:, 2:].reshape(nelements * nnodes_all, 17)
 
@@ -2179,26 +2201,31 @@ class OEF(OP2Common):
                 ntotal = 36
                 nelements = ndata // ntotal
 
-                s1 = Struct(b('i8sifffif'))
-                s2 = Struct(b('i8sifffff'))
-                for i in range(nelements):
-                    edata = data[n:n+ntotal]  # 4*9
-                    out = s1.unpack(edata)
-
-                    # i    8s              i        f
-                    (eid, failure_theory, ply_id, failure_index_for_ply,
-                     six, seven, flag, nine,
-                     #failure_index_for_bonding,
-                     #failure_index_for_element,
-                     #flag,
-                     #direct_stress_or_strain,
-                     #interlaminar_stress,
-                     #max_of_fb_fp_for_all_plies
-                    ) = out
-                    if flag != -1:
-                        out = s2.unpack(edata)
-                    #print(out)
-                    n += 36
+                # the failure indices aren't saved, so only the debug file
+                # needs the records to be unpacked
+                if self.is_debug_file:
+                    s1 = Struct(b(self._endian + 'i8sifffif'))
+                    s2 = Struct(b(self._endian + 'i8sifffff'))
+                    for i in range(nelements):
+                        edata = data[n:n+ntotal]  # 4*9
+                        out = s1.unpack(edata)
+
+                        # i    8s              i        f
+                        (eid, failure_theory, ply_id, failure_index_for_ply,
+                         six, seven, flag, nine,
+                         #failure_index_for_bonding,
+                         #failure_index_for_element,
+                         #flag,
+                         #direct_stress_or_strain,
+                         #interlaminar_stress,
+                         #max_of_fb_fp_for_all_plies
+                        ) = out
+                        if flag != -1:
+                            out = s2.unpack(edata)
+                        self.binary_debug.write('OEF_Composite - %s\n' % str(out))
+                        n += 36
+                else:
+                    n = nelements * ntotal
 
 
                 ## TODO: add
@@ -2294,10 +2321,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2352,10 +2379,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 33)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 33)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 33)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 33)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2454,10 +2481,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2504,10 +2531,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2554,10 +2581,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15)
                         eids = ints[:, 0] // 10
                         nids_a = ints[:, 1]
                         nids_b = ints[:, 8]
@@ -2623,10 +2650,10 @@ class OEF(OP2Common):
                     # 21     22     23     24     25    26
                     # bm1Br, bm2Br, ts1Br, ts2Br, afBr, trqBr,
                     # bm1Bi, bm2Bi, ts1Bi, ts2Bi, afBi, trqBi
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 27)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 27)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 27)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 27)
                         eids = ints[:, 0] // 10
                         nids_a = ints[:, 1]
                         nids_b = ints[:, 14]
@@ -2742,10 +2769,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2787,10 +2814,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 16)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 16)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 16)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 16)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2883,10 +2910,10 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
-                    results = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                     #[fx, fy, fz, mx, my, mz]
                     obj.data[obj.itime, istart:iend, :] = results[:, 1:]
@@ -2902,7 +2929,6 @@ class OEF(OP2Common):
                         obj.add(dt, eid, fx, fy, fz, mx, my, mz)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 13:  # imag
-                # TODO: vectorize
                 ntotal = 52  # 13*4
                 nelements = ndata // ntotal
                 result_name = 'cbush_force'
@@ -2911,37 +2937,57 @@ class OEF(OP2Common):
                 if auto_return:
                     return nelements * self.num_wide * 4
 
-                s = Struct(b(self._endian + 'i12f'))
-
                 obj = self.obj
-                for i in range(nelements):
-                    edata = data[n:n + 52]
+                if self.use_vector and is_vectorized:
+                    n = nelements * 4 * self.num_wide
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements
 
-                    out = s.unpack(edata)
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
-                    (eid_device,
-                     fxr, fyr, fzr, mxr, myr, mzr,
-                     fxi, fyi, fzi, mxi, myi, mzi) = out
-                    eid = eid_device // 10
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element[itotal:itotal2] = eids
 
-                    if is_magnitude_phase:
-                        fx = polar_to_real_imag(fxr, fxi)
-                        mx = polar_to_real_imag(mxr, mxi)
-                        fy = polar_to_real_imag(fyr, fyi)
-                        my = polar_to_real_imag(myr, myi)
-                        fz = polar_to_real_imag(fzr, fzi)
-                        mz = polar_to_real_imag(mzr, mzi)
-                    else:
-                        fx = complex(fxr, fxi)
-                        mx = complex(mxr, mxi)
-                        fy = complex(fyr, fyi)
-                        my = complex(myr, myi)
-                        fz = complex(fzr, fzi)
-                        mz = complex(mzr, mzi)
-
-                    obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
-                    n += ntotal
+                    #[fx, fy, fz, mx, my, mz]
+                    isave1 = [1, 2, 3, 4, 5, 6]
+                    isave2 = [7, 8, 9, 10, 11, 12]
+                    real_imag = apply_mag_phase(floats, is_magnitude_phase, isave1, isave2)
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                    obj.ielement = itotal2
+                else:
+                    s = Struct(b(self._endian + 'i12f'))
+                    for i in range(nelements):
+                        edata = data[n:n + 52]
+
+                        out = s.unpack(edata)
+                        if self.is_debug_file:
+                            self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
+                        (eid_device,
+                         fxr, fyr, fzr, mxr, myr, mzr,
+                         fxi, fyi, fzi, mxi, myi, mzi) = out
+                        eid = eid_device // 10
+
+                        if is_magnitude_phase:
+                            fx = polar_to_real_imag(fxr, fxi)
+                            mx = polar_to_real_imag(mxr, mxi)
+                            fy = polar_to_real_imag(fyr, fyi)
+                            my = polar_to_real_imag(myr, myi)
+                            fz = polar_to_real_imag(fzr, fzi)
+                            mz = polar_to_real_imag(mzr, mzi)
+                        else:
+                            fx = complex(fxr, fxi)
+                            mx = complex(mxr, mxi)
+                            fy = complex(fyr, fyi)
+                            my = complex(myr, myi)
+                            fz = complex(fzr, fzi)
+                            mz = complex(mzr, mzi)
+
+                        obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
+                        n += ntotal
             #elif self.format_code == 2 and self.num_wide == 7:
                 #self.log.warning(self.code_information())
                 #asdf
@@ -2999,26 +3045,28 @@ class OEF(OP2Common):
                         return nelements * self.num_wide * 4
 
                     obj = self.obj
-                    if self.use_vector and is_vectorized and 0:
-                        # self.itime = 0
-                        # self.ielement = 0
-                        # self.itotal = 0
-                        #self.ntimes = 0
-                        #self.nelements = 0
+                    if self.use_vector and is_vectorized:
                         n = nelements * self.num_wide * 4
 
                         istart = obj.itotal
-                        iend = istart + nelements
+                        iend = istart + nelements * nnodes
                         obj._times[obj.itime] = dt
 
+                        # [eid_device, parent, coord, icord, theta, _] + nnodes *
+                        # [vugrid, mfx, mfy, mfxy, ai, bi, ci, bmx, bmy, bmxy, syz, szx, di]
                         if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                             eids = ints[:, 0] // 10
-                            obj.element_node[istart:iend] = eids_nids
-                        results = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
-
-                        #[fx, fy, fz, mx, my, mz]
-                        obj.data[obj.itime, istart:iend, :] = results[:, 1:]
+                            assert eids.min() > 0, eids.min()
+                            ints2 = ints[:, 6:].reshape(nelements * nnodes, 13)
+                            obj.element_node[istart:iend, 0] = np.repeat(eids, nnodes)
+                            obj.element_node[istart:iend, 1] = ints2[:, 0]
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                        floats2 = floats[:, 6:].reshape(nelements * nnodes, 13)
+
+                        #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
+                        obj.data[obj.itime, istart:iend, :] = floats2[:, [1, 2, 3, 7, 8, 9, 10, 11]]
+                        obj.itotal = iend
                     else:
                         # 6+n*13
                         s1 = Struct(b(self._endian + '3i4s2i')) # 6
@@ -3145,7 +3193,8 @@ class OEF(OP2Common):
                         obj._times[obj.itime] = dt
 
                         if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                            ints = frombuffer(data, dtype=self.idtype).reshape(
+                                nelements, numwide_real).copy()
                             ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all)
                             ints1[:, 0] = 0.
                             nids = ints1.ravel()
@@ -3166,9 +3215,9 @@ class OEF(OP2Common):
                                 obj.float_mask = float_mask1
 
                         if obj.nonlinear_factor is not None:
-                            results = fromstring(data, dtype=self.fdtype)[obj.float_mask]
+                            results = frombuffer(data, dtype=self.fdtype)[obj.float_mask]
                         else:
-                            floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                            floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                             floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
                             results = floats1[:, 1:].reshape(nlayers, 8)
 
@@ -3342,8 +3391,8 @@ class OEF(OP2Common):
                     itotal2 = itotal + nelements * 2
 
                     # 20 values
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 20)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 20)[:, 4:]
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 20)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 20)[:, 4:]
                     ints2 = ints[:, 4:].reshape(nelements * 2, 8)
                     assert floats.shape[1] == 16, floats.shape
 
@@ -3447,7 +3496,7 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 32)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 32)
 
                         eids = ints[:, 0] // 10
                         eids2 = np.repeat(eids, 2)
@@ -3462,7 +3511,7 @@ class OEF(OP2Common):
                         obj.parent_coord[ielement:ielement2, 1] = parent
                         obj.parent_coord[ielement:ielement2, 1] = coord
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 32)[:, 4:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 32)[:, 4:]
                     assert floats.shape[1] == 28, floats.shape
                     # skipping [form1, form2]
                     floats2 = floats.reshape(nelements*2, 14)
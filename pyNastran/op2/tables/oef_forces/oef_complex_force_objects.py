@@ -150,6 +150,7 @@ class ComplexRodForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -386,6 +387,7 @@ class ComplexCShearForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -615,6 +617,7 @@ class ComplexSpringDamperForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -832,6 +835,7 @@ class ComplexViscForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -1047,6 +1051,7 @@ class ComplexPlateForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -1291,6 +1296,7 @@ class ComplexPlate2ForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -1479,17 +1485,11 @@ class ComplexCBarForceArray(ScalarObject):
                     for ieid, eid in enumerate(self.element):
                         t1 = self.data[itime, ieid, :]
                         t2 = table.data[itime, ieid, :]
-                        (s1a1, s2a1, s3a1, s4a1, axial1, s2a1, s2b1, s2c1, s2d1) = t1
-                        (s1a2, s2a2, s3a2, s4a2, axial2, s2a2, s2b2, s2c2, s2d2) = t2
-                        #d = t1 - t2
-                        if not allclose([s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real],
-                                        [s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real], atol=0.0001):
+                        if not allclose(t1, t2, atol=0.0001):
                         #if not np.array_equal(t1, t2):
-                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n' % (
-                                eid,
-                                s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real,
-                                s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real,
-                                )
+                            # (bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
+                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s)\n' % (
+                                (eid,) + tuple(t1) + tuple(t2))
                             i += 1
                         if i > 10:
                             print(msg)
@@ -1531,6 +1531,7 @@ class ComplexCBarForceArray(ScalarObject):
         msg.append('  is_sort1=%s is_sort2=%s\n' % (self.is_sort1, self.is_sort2))
         msg.append('  CBAR\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -1825,6 +1826,7 @@ class ComplexCBeamForceArray(ScalarObject):
         msg.append('  is_sort1=%s is_sort2=%s\n' % (self.is_sort1, self.is_sort2))
         msg.append('  CBEAM\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -2088,6 +2090,7 @@ class ComplexCBendForceArray(ScalarObject):  # 69-CBEND
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -2307,6 +2310,7 @@ class ComplexSolidPressureForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -2527,6 +2531,7 @@ class ComplexCBushForceArray(ScalarObject):
         # msg.append('  is_sort1=%s is_sort2=%s\n' % (self.is_sort1, self.is_sort2))
         msg.append('  CBUSH\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -2852,6 +2857,7 @@ class ComplexCBeamForceVUArray(ScalarObject):  # 191-VUBEAM
         msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
         msg.append('  element type: %s\n' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_element_index(self, eids):
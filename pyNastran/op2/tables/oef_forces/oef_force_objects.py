@@ -142,6 +142,7 @@ class FailureIndices(RealForceObject):
         msg.append('  data.shape = %s\n' % str(self.data.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -312,6 +313,7 @@ class RealSpringDamperForceArray(RealForceObject):
         msg.append('  element.shape = %s\n' % str(self.element.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -543,6 +545,7 @@ class RealRodForceArray(RealForceObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True):
@@ -805,6 +808,7 @@ class RealCBeamForceArray(ScalarObject):
         msg.append('  is_sort1=%s is_sort2=%s\n' % (self.is_sort1, self.is_sort2))
         msg.append('  CBEAM\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
@@ -1062,6 +1066,7 @@ class RealCShearForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s',
@@ -1231,6 +1236,7 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
@@ -1475,6 +1481,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         msg.append('  element.shape = %s\n' % str(self.element.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True):
@@ -1707,6 +1714,7 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True):
@@ -1949,6 +1957,7 @@ class RealCBarForceArray(ScalarObject):  # 34-CBAR
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def eid_to_element_node_index(self, eids):
@@ -2163,6 +2172,7 @@ class RealConeAxForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s',
@@ -2339,6 +2349,7 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def eid_to_element_node_index(self, eids):
@@ -2554,6 +2565,7 @@ class RealCGapForceArray(ScalarObject):  # 38-CGAP
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s',
@@ -2703,6 +2715,7 @@ class RealBendForceArray(RealForceObject):  # 69-CBEND
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s',
@@ -2935,6 +2948,7 @@ class RealSolidPressureForceArray(ScalarObject):  # 77-PENTA_PR,78-TETRA_PR
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f06, header=None, page_stamp='PAGE %s',
@@ -3228,6 +3242,7 @@ class RealCBeamForceVUArray(ScalarObject):  # 191-VUBEAM
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_element_index(self, eids):
@@ -3435,6 +3450,7 @@ class RealCBushForceArray(ScalarObject):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self):
@@ -3635,6 +3651,7 @@ class RealForceVU2DArray(RealForceObject):  # 189-VUQUAD, 190-VUTRIA
         msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True):
@@ -169,6 +169,7 @@ class ComplexBarArray(OES_Object):
 
         msg.append('  CBAR\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -187,6 +187,7 @@ class ComplexBeamArray(OES_Object):
 
         msg.append('  CBEAM\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s', page_num=1,
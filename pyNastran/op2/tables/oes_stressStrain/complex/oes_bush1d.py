@@ -139,6 +139,7 @@ class ComplexCBush1DArray(OES_Object):
         msg.append('  data.shape = %s\n' % str(self.data.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_element_index(self, eids):
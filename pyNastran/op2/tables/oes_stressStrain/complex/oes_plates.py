@@ -104,6 +104,7 @@ class ComplexTriaxStressArray(OES_Object):
         msg.append('  data.shape = %s\n' % str(self.data.shape).replace('L', ''))
         msg.append('  %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def add_new_eid_sort1(self, dt, eid, node_id, fdr, oxx, oyy, txy):
@@ -318,6 +319,7 @@ class ComplexPlateArray(OES_Object):
         msg.append('  data.shape = %s\n' % str(self.data.shape).replace('L', ''))
         msg.append('  %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f06, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
@@ -139,6 +139,7 @@ class ComplexSpringDamperArray(OES_Object):
         #msg.append('  element type: %s\n' % self.element_type)
         msg.append('  element name: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_f06_header(self, is_mag_phase=True, is_sort1=True):
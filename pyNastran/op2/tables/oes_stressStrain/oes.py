@@ -9,7 +9,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from struct import Struct
 from six import b
 from six.moves import range
-from numpy import fromstring, radians, sin, cos, vstack, repeat, array
+from numpy import frombuffer, radians, sin, cos, vstack, repeat, array
 import numpy as np
 
 from pyNastran.op2.op2_interface.op2_common import OP2Common, apply_mag_phase
@@ -1018,10 +1018,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1063,10 +1063,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1124,7 +1124,6 @@ class OES(OP2Common):
             slot = getattr(self, result_name)
 
             if self.format_code == 1 and self.num_wide == 111:  # real
-                # TODO: vectorize
                 ntotal = 444 # 44 + 10*40  (11 nodes)
 
                 if self.is_stress:
@@ -1143,30 +1142,60 @@ class OES(OP2Common):
 
                 nnodes = 10  # 11-1
                 ntotal = self.num_wide * 4
-                n1 = 44
-                n2 = 40
-                s1 = Struct(b(self._endian + 'ii9f'))
-                s2 = Struct(b(self._endian + 'i9f'))
                 nelements = ndata // ntotal
-                for i in range(nelements):
-                    edata = data[n:n+n1]
-                    n += n1
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * 11
+                    ielement = obj.ielement
+                    ielement2 = ielement + nelements
 
-                    out = s1.unpack(edata)
-                    eid_device = out[0]
-                    eid = eid_device // 10
-                    if self.is_debug_file:
-                        self.binary_debug.write('CBEAM-2 - eid=%i out=%s\n' % (eid, str(out)))
+                    # chop off eid
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
+                    floats2 = floats.reshape(nelements * 11, 10)
 
-                    #(grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
-                    obj.add_new_eid(dt, eid, out[1:])
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 111)
+                        eids = ints[:, 0] // 10
+                        eids2 = repeat(eids, 11)
 
-                    for inode in range(nnodes):
-                        edata = data[n:n+n2]
-                        n += n2
-                        out = s2.unpack(edata)
-                        # (grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
-                        obj.add_sort1(dt, eid, out)
+                        ints2 = ints[:, 1:].reshape(nelements * 11, 10)
+                        nids = ints2[:, 0]
+                        assert eids.min() > 0, eids.min()
+                        obj.element_node[itotal:itotal2, 0] = eids2
+                        obj.element_node[itotal:itotal2, 1] = nids
+
+                    #  0    1   2    3    4    5    6     7     8    9
+                    # grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc
+                    obj.xxb[itotal:itotal2] = floats2[:, 1]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                    obj.itotal = itotal2
+                    obj.ielement = ielement2
+                else:
+                    n1 = 44
+                    n2 = 40
+                    s1 = Struct(b(self._endian + 'ii9f'))
+                    s2 = Struct(b(self._endian + 'i9f'))
+                    for i in range(nelements):
+                        edata = data[n:n+n1]
+                        n += n1
+
+                        out = s1.unpack(edata)
+                        eid_device = out[0]
+                        eid = eid_device // 10
+                        if self.is_debug_file:
+                            self.binary_debug.write('CBEAM-2 - eid=%i out=%s\n' % (eid, str(out)))
+
+                        #(grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
+                        obj.add_new_eid(dt, eid, out[1:])
+
+                        for inode in range(nnodes):
+                            edata = data[n:n+n2]
+                            n += n2
+                            out = s2.unpack(edata)
+                            # (grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
+                            obj.add_sort1(dt, eid, out)
             elif self.format_code in [2, 3] and self.num_wide == 111:  # imag and random?
                 # definitely complex results for MSC Nastran 2016.1
 
@@ -1195,12 +1224,12 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements * 11
 
                     # chop off eid
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
                     floats2 = floats.reshape(nelements * 11, 10)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 111)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 111)
                         eids = ints[:, 0] // 10
                         eids2 = array([eids] * 11, dtype='int32').T.ravel()
 
@@ -1321,11 +1350,11 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                     itime = obj.itime
                     obj._times[itime] = dt
                     if itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1362,10 +1391,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1452,10 +1481,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 2)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 2)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1494,10 +1523,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1586,11 +1615,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 16)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 16)
                         eids = ints[:, 0] // 10
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 16)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 16)
 
                     #[s1a, s2a, s3a, s4a, axial, smaxa, smina, margin_tension,
                     # s1b, s2b, s3b, s4b,        smaxb, sminb, margin_compression]
@@ -1640,10 +1669,10 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements
                     ielement2 = itotal2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 19)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 19)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 19)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 19)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1774,7 +1803,7 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         # (eid_device, cid, abcd, nnodes)
-                        ints = fromstring(data, dtype=self.idtype)
+                        ints = frombuffer(data, dtype=self.idtype)
                         try:
                             ints1 = ints.reshape(nelements, numwide_real)
                         except ValueError:
@@ -1803,7 +1832,7 @@ class OES(OP2Common):
                         obj.element_cid[itotal:itotali, 0] = eids
                         obj.element_cid[itotal:itotali, 1] = cids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
                     # 1     9    15   2    10   16  3   11  17   8
                     #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
                     #isave = [1, 9, 15, 2, 10, 16, 3, 11, 17, 8]
@@ -1904,11 +1933,11 @@ class OES(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes_expected
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 4:].reshape(nelements * nnodes_expected, 13)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_imag)
                         ints1 = ints[:, 4:].reshape(nelements * nnodes_expected, 13)
                         eids = ints[:, 0] // 10
                         cids = ints[:, 1]
@@ -2079,14 +2108,14 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements * nnodes_expected
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype)
+                        ints = frombuffer(data, dtype=self.idtype)
                         ints1 = ints.reshape(nelements, numwide_real)
                         eids = ints1[:, 0] // 10
                         eids = np.vstack([eids, eids]).T.ravel()
                         assert eids.min() > 0, eids.min()
                         obj.element_node[itotal:itotal2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 1:]
 
                     #fd, sx, sy, txy, angle, major, minor, max_shear
                     floats1 = floats.reshape(nelements * nnodes_expected, 8)
@@ -2134,11 +2163,11 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15 * nnodes_all)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15 * nnodes_all)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15 * nnodes_all)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15 * nnodes_all).copy()
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
                         ints1 = ints.reshape(nelements * nnodes_all, 15)
@@ -2268,7 +2297,7 @@ class OES(OP2Common):
 
                     itime = obj.itime
                     if itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         #ilayers = ints[:, 1]
                         ints2 = ints[:, 1:].reshape(nlayers, 8)
@@ -2279,7 +2308,7 @@ class OES(OP2Common):
                         #obj.element_node[itotal:iend, 1] = 0
                         #print('obj.element_node\n', obj.element_node)
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     floats1 = floats[:, 1:].reshape(nlayers, 8)
                     obj.data[obj.itime, itotal:iend, :] = floats1
                     obj._times[obj.itime] = dt
@@ -2321,11 +2350,11 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15)
                     floats1 = floats[:, 1:].reshape(nelements * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15).copy()
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
                         ints1 = ints.reshape(nelements, 15)
@@ -2489,7 +2518,7 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real).copy()
                         ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all)
                         ints1[:, 0] = 0.
                         nids = ints1.ravel()
@@ -2510,9 +2539,9 @@ class OES(OP2Common):
                             obj.float_mask = float_mask1
 
                     if obj.nonlinear_factor is not None:
-                        results = fromstring(data, dtype=self.fdtype)[obj.float_mask]
+                        results = frombuffer(data, dtype=self.fdtype)[obj.float_mask]
                     else:
-                        floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                         floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
                         results = floats1[:, 1:].reshape(nlayers, 8)
 
@@ -2594,12 +2623,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 2:].reshape(nelements * nnodes_all, 15)
                     floats2 = floats1[:, 1:].reshape(nelements * nnodes_all * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_imag).copy()
                         ints[:, 2] = 0  # set center node to 0
                         ints1 = ints[:, 2:].reshape(nelements * nnodes_all, 15)
                         eids = ints[:, 0] // 10
@@ -2747,11 +2776,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         obj.element_node[ielement:ielement2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13).copy()
 
                     #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
                     #print(ints)
@@ -2821,9 +2850,9 @@ class OES(OP2Common):
 
                     if obj.itime == 0:
                         try:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, 25)
+                            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 25)
                         except ValueError:
-                            values = fromstring(data, dtype=self.idtype)
+                            values = frombuffer(data, dtype=self.idtype)
 
                         eids = ints[:, 0] // 10
                         #eids2 = vstack([eids, eids]).T.ravel()
@@ -2833,7 +2862,7 @@ class OES(OP2Common):
                          #print(obj.element_node[:10, :])
                         #aaa
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 25)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 25)[:, 1:]
                     floats2 = floats.reshape(nelements * 2, 12)
                     #print('a', floats2.shape)
                     #print('b', obj.data[obj.itime, ielement:ielement2, :].shape)
@@ -2941,13 +2970,13 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 11)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
                         eids = ints[:, 0] // 10
                         nids = ints[:, 1]
                         obj.element_layer[istart:iend, 0] = eids
                         obj.element_layer[istart:iend, 1] = nids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 11)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                     #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 2:]
                 else:
@@ -3050,12 +3079,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 33)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 33)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 8)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 33)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 33).copy()
                         ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 8)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
@@ -3128,12 +3157,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 9)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_imag).copy()
                         ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 9)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
@@ -3234,11 +3263,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     #[tx, ty, tz, rx, ry, rz]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
@@ -3274,10 +3303,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -3356,13 +3385,13 @@ class OES(OP2Common):
                     obj._times[itime] = dt
 
                     if 1: #obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                         eids = ints[:, 0] // 10
                         fail = ints[:, 7]
                         obj.element[itotal:itotal2] = eids
                         obj.is_failed[itime, itotal:itotal2, 0] = fail
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                     #[xxx, fe, ue, ve, ao, ae, ep, xxx]
                     obj.data[itime, itotal:itotal2, :] = floats[:, 1:7]
 
@@ -3406,11 +3435,11 @@ class OES(OP2Common):
                     obj._times[itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         obj.element[itotal:itotal2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     #[fer, uer, aor, aer,
                     # fei, uei, aoi, aei]
                     isave1 = [1, 3, 5, 7]
@@ -3500,10 +3529,10 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     #[axial_stress, equiv_stress, total_strain,
                     # eff_plastic_creep_strain, eff_creep_strain, linear_torsional_stresss]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
@@ -3562,12 +3591,12 @@ class OES(OP2Common):
                     ielement2 = obj.ielement + nelements
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                     #[force, stress]
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
@@ -3628,11 +3657,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 11)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
                         eids = ints[:, 0] // 10
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 11)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                     # skipping [form1, form2]
                     #[cpx, shy, shz, au, shv, shw, slv, slp]
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:9]
@@ -3689,38 +3718,64 @@ class OES(OP2Common):
                     #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
 
-                struct1 = Struct(b(self._endian + '2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f'))  # 2 + 6*8 + 1 = 51
-                for i in range(nelements):  # num_wide=51
-                    edata = data[n:n + 204]
-                    out = struct1.unpack(edata)
+                if self.use_vector and is_vectorized:
+                    n = nelements * ntotal
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements * 8
+                    ielement = obj.ielement
+                    ielement2 = ielement + nelements
 
-                    if self.is_debug_file:
-                        self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
-
-                    #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
-                    #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
-                    #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
-                    #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
-                    #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
-                    #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
-                    #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
-                    #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
-                    # A
-                    assert out[3-1] == b'   C', out[3-1]
-                    assert out[9-1] == b'   D', out[9-1]
-                    assert out[15-1] == b'   E', out[15-1]
-                    assert out[21-1] == b'   F', out[21-1]
-
-                    # B
-                    assert out[28-1] == b'   C', out[28-1]
-                    assert out[34-1] == b'   D', out[34-1]
-                    assert out[40-1] == b'   E', out[40-1]
-                    assert out[46-1] == b'   F', out[46-1]
-
-                    eid_device = out[0]
-                    eid = eid_device // 10
-                    obj.add_new_eid_sort1(dt, eid, out)
-                    n += 204
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 51)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+
+                        # the C, D, E, F points of end A (grid_a) and B (grid_b)
+                        nids = ints[:, [1, 1, 1, 1, 26, 26, 26, 26]]
+                        obj.element_node[itotal:itotal2, 0] = repeat(eids, 8)
+                        obj.element_node[itotal:itotal2, 1] = nids.ravel()
+                        obj.element_node[itotal:itotal2, 2] = np.tile(np.arange(8), nelements)
+
+                    # drop the grids; each point is [C, long, eqs, te, eps, ecs]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 51)
+                    floats2 = np.hstack([floats[:, 2:26], floats[:, 27:]]).reshape(nelements * 8, 6)
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 1:]
+                    obj.itotal = itotal2
+                    obj.ielement = ielement2
+                else:
+                    struct1 = Struct(b(self._endian + '2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f'))  # 2 + 6*8 + 1 = 51
+                    for i in range(nelements):  # num_wide=51
+                        edata = data[n:n + 204]
+                        out = struct1.unpack(edata)
+
+                        if self.is_debug_file:
+                            self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
+
+                        #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
+                        #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
+                        #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
+                        #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
+                        #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
+                        #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
+                        #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
+                        #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
+                        # A
+                        assert out[3-1] == b'   C', out[3-1]
+                        assert out[9-1] == b'   D', out[9-1]
+                        assert out[15-1] == b'   E', out[15-1]
+                        assert out[21-1] == b'   F', out[21-1]
+
+                        # B
+                        assert out[28-1] == b'   C', out[28-1]
+                        assert out[34-1] == b'   D', out[34-1]
+                        assert out[40-1] == b'   E', out[40-1]
+                        assert out[46-1] == b'   F', out[46-1]
+
+                        eid_device = out[0]
+                        eid = eid_device // 10
+                        obj.add_new_eid_sort1(dt, eid, out)
+                        n += 204
 
             elif self.format_code == 1 and self.num_wide == numwide_random:  # random
                 msg = self.code_information()
@@ -3779,31 +3834,36 @@ class OES(OP2Common):
                 #else:
                     #self.create_transient_object(self.nonlinearPlateStrain, NonlinearSolid)
 
-                n = 0
-                s1 = Struct(b(self._endian + 'i4s'))
-                s2 = Struct(b(self._endian + 'i15f'))
                 nelements = ndata // ntotal
-                for i in range(nelements):  # 2+16*9 = 146 -> 146*4 = 584
-                    edata = data[n:n+8]
-                    n += 8
+                if not self.is_debug_file:
+                    # the results aren't saved, so only the debug file
+                    # needs the records to be unpacked
+                    n = nelements * ntotal
+                else:
+                    n = 0
+                    s1 = Struct(b(self._endian + 'i4s'))
+                    s2 = Struct(b(self._endian + 'i15f'))
+                    for i in range(nelements):  # 2+16*9 = 146 -> 146*4 = 584
+                        edata = data[n:n+8]
+                        n += 8
 
-                    out = s1.unpack(edata)
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
-                    (eid_device, ctype) = out
-                    eid = eid_device // 10
-
-                    for i in range(nnodes):
-                        edata = data[n:n+64]
-                        n += 64
-                        out = s2.unpack(edata)
+                        out = s1.unpack(edata)
                         if self.is_debug_file:
-                            self.binary_debug.write('%s-%sB - %s\n' % (etype, self.element_type, str(out)))
+                            self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
+                        (eid_device, ctype) = out
+                        eid = eid_device // 10
 
-                        assert len(out) == 16
-                        (grid,
-                         sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
-                         ex, ey, ez, exy, eyz, exz) = out
+                        for i in range(nnodes):
+                            edata = data[n:n+64]
+                            n += 64
+                            out = s2.unpack(edata)
+                            if self.is_debug_file:
+                                self.binary_debug.write('%s-%sB - %s\n' % (etype, self.element_type, str(out)))
+
+                            assert len(out) == 16
+                            (grid,
+                             sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
+                             ex, ey, ez, exy, eyz, exz) = out
             else:
                 #msg = self.code_information()
                 msg = "format_code=%s numwide=%s numwide_real=%s numwide_random=%s" % (
@@ -3857,11 +3917,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
@@ -3995,16 +4055,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 30)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 30)
                     ints2 = ints[:, 2:].reshape(nelements * 7, 7)
 
-                    #strings = fromstring(data, dtype=???)
+                    #strings = frombuffer(data, dtype=???)
                     eids = ints[:, 0] // 10
                     nids = ints2[:, 0]
                     obj.element[istart:iend] = eids
 
                     # dropping off eid and the string word (some kind of Type)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 30)[:, 2:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 30)[:, 2:]
                     floats2 = floats.reshape(nelements * 7, 7)
                     #[oxx, oyy, txy, angle, majorp, minorp]
                     obj.data[obj.itime, istart:iend, :] = floats2[:, 1:]
@@ -4071,36 +4131,41 @@ class OES(OP2Common):
 
             if self.format_code == 1 and self.num_wide == numwide_real:  # real???
                 ntotal = numwide_real * 4
-                s2 = Struct(b(self._endian + '3i4s2i'))
-                s3 = Struct(b(self._endian + 'i16f'))
                 nelements = ndata // ntotal
-                for i in range(nelements):
-                    out = s2.unpack(data[n:n + 24])
-                    (eid_device, parent, coord, icord, theta, itype) = out
-                    n += 24
-                    eid = eid_device // 10
-                    edata = data[n:n + 68]
-                    out = s3.unpack(edata)  # len=17*4
-                    n += 68
-
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
-
-                    #obj.add_new_node(dt, eid, parent, coord, icord, theta, itype)
-                    #obj.add_new_eid(eType, dt, eid, parent, coord, icord, theta, itype)
-                    for node_id in range(nnodes - 1):  # nodes pts
+                if not self.is_debug_file:
+                    # the results aren't saved, so only the debug file
+                    # needs the records to be unpacked
+                    n = nelements * ntotal
+                else:
+                    s2 = Struct(b(self._endian + '3i4s2i'))
+                    s3 = Struct(b(self._endian + 'i16f'))
+                    for i in range(nelements):
+                        out = s2.unpack(data[n:n + 24])
+                        (eid_device, parent, coord, icord, theta, itype) = out
+                        n += 24
+                        eid = eid_device // 10
                         edata = data[n:n + 68]
+                        out = s3.unpack(edata)  # len=17*4
                         n += 68
-                        out = s3.unpack(edata)
+
                         if self.is_debug_file:
-                            self.binary_debug.write('              %s\n' % (str(out)))
-
-                        (vuid, dummy, dummy2, msx, msy, mxy, dummy3, dummy4, dummy5,
-                         bcx, bcy, bcxy, tyz, tzx, dummy6, dummy7, dummy8) = out
-                        #obj.add(vuid, dummy, dummy2, msx, msy, mxy,
-                                     #dummy3, dummy4, dummy5,
-                                     #bcx, bcy, bcxy, tyz, tzx,
-                                     #dummy6, dummy7, dummy8)
+                            self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
+
+                        #obj.add_new_node(dt, eid, parent, coord, icord, theta, itype)
+                        #obj.add_new_eid(eType, dt, eid, parent, coord, icord, theta, itype)
+                        for node_id in range(nnodes - 1):  # nodes pts
+                            edata = data[n:n + 68]
+                            n += 68
+                            out = s3.unpack(edata)
+                            if self.is_debug_file:
+                                self.binary_debug.write('              %s\n' % (str(out)))
+
+                            (vuid, dummy, dummy2, msx, msy, mxy, dummy3, dummy4, dummy5,
+                             bcx, bcy, bcxy, tyz, tzx, dummy6, dummy7, dummy8) = out
+                            #obj.add(vuid, dummy, dummy2, msx, msy, mxy,
+                                         #dummy3, dummy4, dummy5,
+                                         #bcx, bcy, bcxy, tyz, tzx,
+                                         #dummy6, dummy7, dummy8)
             elif self.num_wide == numwide_imag:
                 ntotal = numwide_imag * 4
                 nelements = ndata // ntotal
@@ -4210,15 +4275,15 @@ class OES(OP2Common):
                 obj._times[obj.itime] = dt
 
                 if obj.itime == 0:
-                    print(fromstring(data, dtype=self.idtype).size)
+                    print(frombuffer(data, dtype=self.idtype).size)
                     print('nelements=%s numwide=%s' % (nelements, numwide_real))
                     print('ndata=', ndata)
                     print('self.element_name=%s' % self.element_name)
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     eids = ints[:, 0] // 10
                     obj.element[istart:iend] = eids
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                 results = floats[:, 1:]
                 print('results.shape', results.shape)
 
@@ -4289,13 +4354,13 @@ class OES(OP2Common):
                 #obj._times[obj.itime] = dt
 
                 #if obj.itime == 0:
-                    #print(fromstring(data, dtype=self.idtype).size)
+                    #print(frombuffer(data, dtype=self.idtype).size)
                     #print('nelements=%s numwide=%s' % (nelements, numwide_real))
-                    #ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    #ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     #eids = ints[:, 0] // 10
                     ##obj.element[istart:iend] = eids
 
-                #floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                #floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                 #print('floats[:, 2:].shape', floats[:, 2:].shape)
                 #print('nnelements=%s nnodes=%s numwide//nodes=%s' % (nelements, nnodes, (numwide_real-2) / nnodes))
                 #results = floats[:, 2:].reshape(nelements, nnodes * 6)
@@ -4374,7 +4439,7 @@ class OES(OP2Common):
                     self.log.error(msg)
                     raise
                 #self.obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_obj()
 
             else:  # not vectorized
                 auto_return = True
@@ -4413,7 +4478,7 @@ class OES(OP2Common):
                     self.log.error(msg)
                     raise
                 #self.obj.update_data_code(self.data_code)
-                self.obj.build()
+                self._build_obj()
 
             else:  # not vectorized
                 auto_return = True
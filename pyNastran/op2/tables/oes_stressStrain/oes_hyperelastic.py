@@ -235,6 +235,7 @@ class HyperelasticQuadArray(OES_Object):
         msg.append('  element type: %s\n' % self.element_name)
         msg.append('  s_code: %s\n  ' % self.s_code)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_element_index(self, eids):
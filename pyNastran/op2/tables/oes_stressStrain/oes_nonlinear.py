@@ -235,6 +235,7 @@ class RealNonlinearPlateArray(OES_Object):
         msg.append('  data.shape=%s\n' % str(self.data.shape))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def write_f06(self, f, header=None, page_stamp='PAGE %s', page_num=1, is_mag_phase=False, is_sort1=True):
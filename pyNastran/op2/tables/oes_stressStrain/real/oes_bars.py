@@ -201,6 +201,7 @@ class RealBarArray(OES_Object):
         msg.append('  element.shape = %s\n' % str(self.element.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def get_element_index(self, eids):
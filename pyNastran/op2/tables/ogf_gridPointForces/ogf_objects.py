@@ -690,6 +690,7 @@ class RealGridPointForcesArray(ScalarObject):
         msg.append('  data.shape=%s\n' % str(self.data.shape))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     #def get_element_index(self, eids):
@@ -1180,6 +1181,7 @@ class ComplexGridPointForcesArray(ScalarObject):
         msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
         msg.append('  element type: %s\n  ' % self.element_name)
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     #def get_element_index(self, eids):
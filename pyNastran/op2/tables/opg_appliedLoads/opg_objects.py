@@ -54,6 +54,7 @@ class AppliedLoadsVectorArray(ScalarObject):
                    % ([int(i) for i in self.data.shape], self.data.dtype))
         msg.append('  sources, eids\n  ')
         msg += self.get_data_code()
+        msg += self._get_memory_stats()
         return msg
 
     def add_sort1(self, node_id, eid, source, v1, v2, v3, v4, v5, v6):
@@ -3,7 +3,7 @@ import os
 import unittest
 #import warnings
 
-from six import iteritems
+from six import iteritems, itervalues
 import numpy as np
 try:
     import pandas
@@ -17,11 +17,12 @@ except ImportError:
     is_pandas = False
 
 import pyNastran
-from pyNastran.utils.log import get_logger
+from pyNastran.utils.log import get_logger, SimpleLogger
 
 from pyNastran.bdf.bdf import BDF
 from pyNastran.op2.op2 import OP2, FatalError, read_op2
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
+from pyNastran.op2.op2_interface.op2_toc import get_op2_toc
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2
 
@@ -197,6 +198,7 @@ class TestOP2(Tester):
             quiet=True, check_memory=False,
             stop_on_failure=True, dev=False)
         op2.save()
+        os.remove('model.obj')
 
     def test_bdf_op2_elements_02(self):
         """tests a large number of elements and results in SOL 103-modes"""
@@ -332,6 +334,268 @@ class TestOP2(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_op2_in_memory(self):
+        """the table-4s are only read on the array filling pass, but the results are the same"""
+        log = get_logger(level='warning')
+        for folder, fname in [('solid_bending', 'solid_bending.op2'),
+                              ('sol_101_elements', 'transient_solid_shell_bar.op2')]:
+            op2_filename = os.path.join(MODEL_PATH, folder, fname)
+            op2 = read_op2(op2_filename, debug=False, log=log)
+
+            op2_memory = OP2(debug=False, log=log)
+            read_modes = []
+            read_subtable_results = op2_memory._read_subtable_results
+            def _read_subtable_results(table4_parser, record_len):
+                """tracks the passes that read a table-4"""
+                read_modes.append((op2_memory.read_mode, op2_memory.table_name))
+                return read_subtable_results(table4_parser, record_len)
+            op2_memory._read_subtable_results = _read_subtable_results
+            op2_memory.read_op2(op2_filename, in_memory=True)
+            del op2_memory._read_subtable_results
+
+            # the table-4s of the result tables are sized from the table
+            # of contents on pass 1
+            toc = op2_memory._toc
+            result_tables = set(toc.table_names[toc.pairs['itable']].tolist())
+            assert len(op2_memory._toc_size_pairs) > 0
+            pass1_tables = [table_name for read_mode, table_name in read_modes
+                            if read_mode == 1 and table_name in result_tables]
+            pass2_tables = [table_name for read_mode, table_name in read_modes
+                            if read_mode == 2 and table_name in result_tables]
+            assert len(pass1_tables) == 0, pass1_tables
+            assert len(pass2_tables) > 0, pass2_tables
+            assert op2_memory.op2_equal(op2)
+            assert op2_memory.get_op2_stats() == op2.get_op2_stats()
+            assert op2_memory._mmap_view is None
+            assert not hasattr(op2_memory, 'f')
+
+    def test_op2_mmap(self):
+        """the records are views of the memory-mapped file"""
+        for folder, fname in [('sol_101_elements', 'freq_solid_shell_bar.op2'),
+                              ('elements', 'loadstep_elements.op2')]:
+            op2_filename = os.path.join(MODEL_PATH, folder, fname)
+            op2 = read_op2(op2_filename, debug=False)
+            op2_mmap = read_op2(op2_filename, debug=False, use_mmap=True)
+            assert op2_mmap.op2_equal(op2)
+            assert op2_mmap.get_op2_stats() == op2.get_op2_stats()
+            assert op2_mmap._mmap_view is None
+            assert not hasattr(op2_mmap, 'f')
+
+    def test_op2_lazy(self):
+        """the result arrays are read on first access"""
+        log = get_logger(level='warning')
+        for folder, fname in [('sol_101_elements', 'transient_solid_shell_bar.op2'),
+                              ('elements', 'static_elements.op2')]:
+            op2_filename = os.path.join(MODEL_PATH, folder, fname)
+            op2 = read_op2(op2_filename, debug=False, log=log)
+            op2_lazy = read_op2(op2_filename, debug=False, log=log, lazy=True)
+
+            displacements = op2_lazy.displacements[1]
+            assert displacements.is_lazy
+            assert 'data' not in displacements.__dict__
+            assert displacements.ntimes == op2.displacements[1].ntimes
+            assert displacements.data.shape == op2.displacements[1].data.shape
+            assert not displacements.is_lazy
+            assert op2_lazy.op2_equal(op2)
+            assert op2_lazy.get_op2_stats() == op2.get_op2_stats()
+
+        op2_lazy = read_op2(op2_filename, debug=False, log=log, lazy=True, subcases=[1],
+                            use_mmap=True)
+        assert op2_lazy.op2_equal(op2)
+
+    def test_op2_vectorized_parity(self):
+        """the vectorized OES/OEF readers match the struct based readers"""
+        log = get_logger(level='warning')
+        for folder, fname in [('beam_modes', 'beam_modes_m1.op2'),
+                              ('elements', 'static_elements.op2'),
+                              ('elements', 'freq_elements.op2'),
+                              ('elements', 'modes_complex_elements.op2'),
+                              ('sol_101_elements', 'transient_solid_shell_bar.op2')]:
+            op2_filename = os.path.join(MODEL_PATH, folder, fname)
+            op2 = read_op2(op2_filename, debug=False, log=log)
+
+            op2_nv = OP2(debug=False, log=log)
+            op2_nv.use_vector = False
+            op2_nv.read_op2(op2_filename)
+            assert op2.op2_equal(op2_nv)
+
+            for result_name in ['cbeam_stress', 'cbeam_strain']:
+                for key, result in iteritems(getattr(op2, result_name)):
+                    result_nv = getattr(op2_nv, result_name)[key]
+                    assert np.array_equal(result.element_node, result_nv.element_node)
+                    if result.is_real:
+                        assert np.array_equal(result.xxb, result_nv.xxb)
+                    assert np.array_equal(result.data, result_nv.data)
+
+            for key, result in iteritems(op2.cbar_force):
+                result_nv = op2_nv.cbar_force[key]
+                assert np.array_equal(result.element, result_nv.element)
+                assert np.array_equal(result.data, result_nv.data)
+
+    def test_op2_result_ids(self):
+        """the result rows are filtered by node/element id while they're read"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+
+        model = OP2(debug=False, log=log)
+        model.set_result_ids(nodes=[5, 1, 3], elements=[14, 6],
+                             by_result_type={'crod_stress' : [15]})
+        model.read_op2(op2_filename)
+        displacements = model.displacements[1]
+        assert np.array_equal(displacements.node_gridtype[:, 0], [1, 3, 5])
+        assert np.array_equal(displacements.data, op2.displacements[1].data[:, [0, 2, 4], :])
+        assert np.array_equal(model.crod_force[1].element, [14])
+        assert np.array_equal(model.crod_stress[1].element, [15])
+
+        cquad4_stress = op2.cquad4_stress[1]
+        i = cquad4_stress.element_node[:, 0] == 6
+        assert np.array_equal(model.cquad4_stress[1].element_node, cquad4_stress.element_node[i])
+        assert np.array_equal(model.cquad4_stress[1].data, cquad4_stress.data[:, i, :])
+        assert len(model.ctetra_stress) == 0
+
+        model.set_result_ids()
+        assert model._result_ids is None
+
+    def test_op2_nprocs(self):
+        """the results are read by worker processes"""
+        log = get_logger(level='warning')
+        for folder, fname in [('sol_101_elements', 'transient_solid_shell_bar.op2'),
+                              ('elements', 'freq_elements.op2')]:
+            op2_filename = os.path.join(MODEL_PATH, folder, fname)
+            op2 = read_op2(op2_filename, debug=False, log=log)
+            op2_nprocs = read_op2(op2_filename, debug=False, log=log, nprocs=2)
+            assert op2_nprocs.op2_equal(op2)
+            assert op2_nprocs.get_op2_stats() == op2.get_op2_stats()
+            for result_type in op2.get_table_types():
+                result = getattr(op2, result_type)
+                result_nprocs = getattr(op2_nprocs, result_type)
+                assert list(result.keys()) == list(result_nprocs.keys()), result_type
+                for obj in itervalues(result_nprocs):
+                    assert not getattr(obj, 'is_lazy', False), obj
+
+    def test_op2_result_dtype(self):
+        """the result/id arrays are downcast and the time invariant ids are stored once"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_16 = read_op2(op2_filename, debug=False, log=log,
+                          result_dtype='float16', index_dtype='int64')
+
+        displacements = op2.displacements[1]
+        displacements_16 = op2_16.displacements[1]
+        assert displacements_16.data.dtype == np.float16
+        assert displacements_16.node_gridtype.dtype == np.int64
+        assert np.array_equal(displacements_16.node_gridtype, displacements.node_gridtype)
+        assert np.allclose(displacements_16.data, displacements.data, rtol=1e-3, atol=1e-4)
+        assert displacements_16.get_nbytes() < displacements.get_nbytes()
+        assert op2_16.cquad4_stress[1].data.dtype == np.float16
+        assert op2_16.cquad4_stress[1].element_node.dtype == np.int64
+        assert '  memory: ' in ''.join(displacements.get_stats())
+
+        # the node/element ids of the grid point forces are the same for
+        # each time step
+        gpforce = op2.grid_point_forces[1]
+        assert gpforce.node_element.strides[0] != 0
+        assert gpforce.node_element.flags.writeable
+        op2_compact = read_op2(op2_filename, debug=False, log=log, compact_ids=True)
+        gpforce_compact = op2_compact.grid_point_forces[1]
+        assert gpforce_compact.node_element.strides[0] == 0
+        assert not gpforce_compact.node_element.flags.writeable
+        assert np.array_equal(gpforce_compact.node_element, gpforce.node_element)
+        ntimes = gpforce_compact.data.shape[0]
+        assert gpforce_compact.node_element.shape[0] == ntimes
+        assert gpforce_compact.get_nbytes() < gpforce.get_nbytes()
+        assert op2_compact.op2_equal(op2)
+
+        op2_lazy = read_op2(op2_filename, debug=False, log=log, lazy=True,
+                            result_dtype='float16')
+        assert op2_lazy.displacements[1].data.dtype == np.float16
+
+        with self.assertRaises(ValueError):
+            read_op2(op2_filename, debug=False, log=log, result_dtype='int32')
+
+    def test_op2_result_dtype_overflow(self):
+        """the results that overflow float16 are logged"""
+        messages = []
+        log = SimpleLogger(level='warning',
+                           log_func=lambda typ, msg: messages.append((typ, msg)))
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        op2_16 = read_op2(op2_filename, debug=False, log=log, result_dtype='float16')
+        assert not np.isfinite(op2_16.spc_forces[1].data).all()
+
+        warnings = [msg for typ, msg in messages
+                    if typ == 'WARNING' and 'result_dtype=float16' in msg]
+        assert any('spc_forces[' in msg and '(RealSPCForcesArray)' in msg
+                   for msg in warnings), warnings
+        for msg in warnings:
+            assert 'displacements[' not in msg, msg
+
+        del messages[:]
+        read_op2(op2_filename, debug=False, log=log)
+        assert not [msg for typ, msg in messages if 'result_dtype=float16' in msg], messages
+
+    def test_op2_toc(self):
+        """tests the table of contents and jumping over the unread subcases"""
+        op2_filename = os.path.join(MODEL_PATH, 'pload4', 'chexa.op2')
+        toc_filename = os.path.join(MODEL_PATH, 'pload4', 'chexa.test_op2.toc')
+        if os.path.exists(toc_filename):
+            os.remove(toc_filename)
+
+        log = get_logger(level='warning')
+        toc = get_op2_toc(op2_filename, toc_filename=toc_filename, log=log)
+        assert toc.npairs == 48, toc.npairs
+        assert np.array_equal(np.unique(toc.pairs['isubcase']), np.arange(1, 25))
+        pairs = toc.get_pairs(table_name=b'OUGV1', isubcase=2)
+        assert len(pairs['offset3']) == 1, pairs
+        assert pairs['record_len'][0] > 0
+        str(toc)
+
+        toc2 = get_op2_toc(op2_filename, toc_filename=toc_filename, log=log)
+        for name, values in toc.pairs.items():
+            assert np.array_equal(toc2.pairs[name], values), name
+        assert np.array_equal(toc2.table_starts, toc.table_starts)
+
+        op2 = read_op2(op2_filename, subcases=[2, 5], debug=False, log=log)
+        for tocs in [toc_filename, toc, True]:
+            op2_toc = read_op2(op2_filename, subcases=[2, 5], debug=False, log=log,
+                               toc=tocs)
+            assert len(op2_toc._toc_skip_pairs) == 44, len(op2_toc._toc_skip_pairs)
+            assert len(op2_toc._toc_size_pairs) == 48, len(op2_toc._toc_size_pairs)
+            assert op2_toc.op2_equal(op2)
+            assert op2_toc.get_op2_stats() == op2.get_op2_stats()
+        os.remove(toc_filename)
+
+    def test_op2_toc_filters(self):
+        """the TOC jumps over the excluded results and the unrequested times"""
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements',
+                                    'transient_solid_shell_bar.op2')
+        log = get_logger(level='warning')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        times = np.unique(op2.displacements[1]._times)
+
+        op2_times = OP2(debug=False, log=log)
+        op2_times.set_transient_times({1: [times[1] + 1e-4, times[5]]})
+        op2_times.read_op2(op2_filename, toc=True)
+        assert len(op2_times._toc_skip_pairs) > 0
+        for result in [op2_times.displacements[1], op2_times.ctetra_stress[1],
+                       op2_times.cquad4_force[1]]:
+            assert np.array_equal(np.unique(result._times), times[[1, 5]]), result._times
+
+        op2_results = OP2(debug=False, log=log)
+        op2_results.remove_results(['stress', 'element_forces'])
+        op2_results.read_op2(op2_filename, toc=True)
+        assert len(op2_results._toc_skip_tables) == 2, op2_results._toc_skip_tables
+        assert len(op2_results.ctetra_stress) == 0
+        assert len(op2_results.cquad4_force) == 0
+        assert len(op2_results.ctetra_strain) == 1
+
+        op2 = OP2(debug=False, log=log)
+        op2.remove_results(['stress', 'element_forces'])
+        op2.read_op2(op2_filename)
+        assert op2_results.op2_equal(op2)
+        assert op2_results.get_op2_stats() == op2.get_op2_stats()
+
     def test_op2_solid_bending_01(self):
         folder = os.path.join(MODEL_PATH, 'solid_bending')
         op2_filename = os.path.join(folder, 'solid_bending.op2')
@@ -416,6 +680,36 @@ class TestOP2(Tester):
         op2.write_f06(f06_filename)
         os.remove(f06_filename)
 
+    def test_op2_solid_shell_bar_geom_vectorized(self):
+        """the vectorized geometry readers match the struct based readers"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2_geom(op2_filename, debug=False, log=log, xref=False)
+
+        op2_nv = OP2Geom(debug=False, log=log)
+        op2_nv.use_vector = False
+        op2_nv.read_op2(op2_filename)
+        assert op2.card_count == op2_nv.card_count
+        for name in ['nodes', 'coords', 'elements', 'properties', 'materials']:
+            cards = getattr(op2, name)
+            cards_nv = getattr(op2_nv, name)
+            assert sorted(cards) == sorted(cards_nv), name
+            for key, card in iteritems(cards):
+                assert card.write_card() == cards_nv[key].write_card(), card
+        for sid, loads in iteritems(op2.loads):
+            assert [load.write_card() for load in loads] == [
+                load.write_card() for load in op2_nv.loads[sid]]
+
+        op2_arrays = read_op2_geom(op2_filename, debug=False, log=log, card_arrays=True)
+        assert len(op2_arrays.nodes) == 0
+        grids = op2_arrays.card_arrays['GRID']
+        xyz = np.array([op2.nodes[nid].xyz for nid in grids['nid']])
+        assert np.array_equal(grids['xyz'], xyz)
+        pcomps = op2_arrays.card_arrays['PCOMP']
+        assert pcomps['nlayers'].sum() == len(pcomps['mid'])
+        for card_name, arrays in iteritems(op2_arrays.card_arrays):
+            assert op2_arrays.card_count[card_name] == op2.card_count[card_name], card_name
+
     def test_op2_mode_solid_shell_bar_01_geom(self):
         """tests reading op2 geometry"""
         folder = os.path.join(MODEL_PATH, 'sol_101_elements')